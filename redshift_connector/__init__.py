@@ -2,10 +2,14 @@ import logging
 import typing
 
 from redshift_connector import plugin
+from redshift_connector.bulk_load import parallel_insert
 from redshift_connector.config import (
     DEFAULT_PROTOCOL_VERSION,
     ClientProtocolVersion,
+    CopyFileFormat,
     DbApiParamstyle,
+    NumpyArrayLayout,
+    ResultBufferMode,
 )
 from redshift_connector.core import BINARY, Connection, Cursor
 from redshift_connector.error import (
@@ -21,9 +25,11 @@ from redshift_connector.error import (
     NotSupportedError,
     OperationalError,
     ProgrammingError,
+    QueryTimeoutError,
     Warning,
 )
 from redshift_connector.iam_helper import IamHelper
+from redshift_connector.object_store import LocalObjectStore, ObjectStore, S3ObjectStore
 from redshift_connector.objects import (
     Binary,
     Date,
@@ -41,6 +47,7 @@ from redshift_connector.pg_types import (
     PGTsvector,
     PGVarchar,
 )
+from redshift_connector.pool import ConnectionPool, PoolStats
 from redshift_connector.redshift_property import RedshiftProperty
 from redshift_connector.utils import (
     DriverInfo,
@@ -53,6 +60,9 @@ globals().update(RedshiftOID.__members__)
 
 from .version import __version__
 
+if typing.TYPE_CHECKING:
+    from ssl import SSLContext
+
 logging.getLogger(__name__).addHandler(logging.NullHandler())
 _logger: logging.Logger = logging.getLogger(__name__)
 
@@ -174,6 +184,7 @@ def connect(
     provider_name: typing.Optional[str] = None,
     scope: typing.Optional[str] = None,
     numeric_to_float: typing.Optional[bool] = False,
+    binary_parameters: typing.Optional[bool] = False,
     is_serverless: typing.Optional[bool] = False,
     serverless_acct_id: typing.Optional[str] = None,
     serverless_work_group: typing.Optional[str] = None,
@@ -184,6 +195,7 @@ def connect(
     issuer_url: typing.Optional[str] = None,
     token: typing.Optional[str] = None,
     token_type: typing.Optional[str] = None,
+    ssl_context: typing.Optional["SSLContext"] = None,
 ) -> Connection:
     """
     Establishes a :class:`Connection` to an Amazon Redshift cluster. This function validates user input, optionally authenticates using an identity provider plugin, then constructs a :class:`Connection` object.
@@ -283,6 +295,8 @@ def connect(
         Scope for BrowserAzureOauth2CredentialsProvider authentication.
     numeric_to_float: Optional[str]
         Specifies if NUMERIC datatype values will be converted from ``decimal.Decimal`` to ``float``. By default NUMERIC values are received as ``decimal.Decimal``.
+    binary_parameters: Optional[bool]
+        Specifies if ``datetime.date`` and ``datetime.time`` parameters are sent in binary format rather than as text. Only used with the binary client protocol. Default value is False.
     is_serverless: Optional[bool]
         Redshift end-point is serverless or provisional. Default value false.
     serverless_acct_id: Optional[str]
@@ -309,6 +323,8 @@ def connect(
         The secret access key for the IAM role or IAM user configured for IAM database authentication. Can also be used with IdpTokenAuthPlugin for identity-enhanced credentials flow.
     session_token : Optional[str]
         The session token for temporary AWS credentials. Required when using temporary credentials with IAM authentication or IdpTokenAuthPlugin identity-enhanced credentials flow.
+    ssl_context : Optional[ssl.SSLContext]
+        The SSL context used to establish the SSL connection in place of the one created by the driver, which trusts the system CAs and the Amazon Redshift CA bundle. The host name is checked if ``check_hostname`` is set on the context. Connections created by the driver share one context per ``sslmode``.
     Returns
     -------
     A Connection object associated with the specified Amazon Redshift cluster: :class:`Connection`
@@ -350,6 +366,7 @@ def connect(
     info.put("login_to_rp", login_to_rp)
     info.put("max_prepared_statements", max_prepared_statements)
     info.put("numeric_to_float", numeric_to_float)
+    info.put("binary_parameters", binary_parameters)
     info.put("partner_sp_id", partner_sp_id)
     info.put("password", password)
     info.put("port", port)
@@ -369,6 +386,7 @@ def connect(
     info.put("ssl", ssl)
     info.put("ssl_insecure", ssl_insecure)
     info.put("sslmode", sslmode)
+    info.put("ssl_context", ssl_context)
     info.put("tcp_keepalive", tcp_keepalive)
     info.put("tcp_keepalive_idle", tcp_keepalive_idle)
     info.put("tcp_keepalive_interval", tcp_keepalive_interval)
@@ -380,6 +398,15 @@ def connect(
     info.put("user_name", user)
     info.put("web_identity_token", web_identity_token)
 
+    return Connection(**_connection_arguments(info))
+
+
+def _connection_arguments(info: RedshiftProperty) -> typing.Dict[str, typing.Any]:
+    """
+    Validates the connection properties given to :func:`connect`, authenticating using IAM or an identity provider
+    plugin if requested, and returns the arguments of :class:`Connection` opening the connection. Also used by
+    :func:`redshift_connector.aio.connect`.
+    """
     warning_message = """
     !!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!! WARNING !!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
     ****************************************************************************************************************************************
@@ -438,36 +465,38 @@ def connect(
     _logger.debug(mask_secure_info_in_props(info))
     _logger.debug(make_divider_block())
 
-    return Connection(
-        user=info.user_name,
-        host=info.host,
-        database=info.db_name,
-        port=info.port,
-        password=info.password,
-        source_address=info.source_address,
-        unix_sock=info.unix_sock,
-        ssl=info.ssl,
-        sslmode=info.sslmode,
-        timeout=info.timeout,
-        max_prepared_statements=info.max_prepared_statements,
-        tcp_keepalive=info.tcp_keepalive,
-        tcp_keepalive_idle=info.tcp_keepalive_idle,
-        tcp_keepalive_interval=info.tcp_keepalive_interval,
-        tcp_keepalive_count=info.tcp_keepalive_count,
-        application_name=info.application_name,
-        client_protocol_version=info.client_protocol_version,
-        database_metadata_current_db_only=info.database_metadata_current_db_only,
-        credentials_provider=info.credentials_provider,
-        provider_name=info.provider_name,
-        web_identity_token=info.web_identity_token,
-        numeric_to_float=info.numeric_to_float,
-        identity_namespace=info.identity_namespace,
-        token_type=info.token_type,
-        idc_client_display_name=info.idc_client_display_name,
-        access_key_id=info.access_key_id,
-        secret_access_key=info.secret_access_key,
-        session_token=info.session_token,
-    )
+    return {
+        "user": info.user_name,
+        "host": info.host,
+        "database": info.db_name,
+        "port": info.port,
+        "password": info.password,
+        "source_address": info.source_address,
+        "unix_sock": info.unix_sock,
+        "ssl": info.ssl,
+        "sslmode": info.sslmode,
+        "ssl_context": info.ssl_context,
+        "timeout": info.timeout,
+        "max_prepared_statements": info.max_prepared_statements,
+        "tcp_keepalive": info.tcp_keepalive,
+        "tcp_keepalive_idle": info.tcp_keepalive_idle,
+        "tcp_keepalive_interval": info.tcp_keepalive_interval,
+        "tcp_keepalive_count": info.tcp_keepalive_count,
+        "application_name": info.application_name,
+        "client_protocol_version": info.client_protocol_version,
+        "database_metadata_current_db_only": info.database_metadata_current_db_only,
+        "credentials_provider": info.credentials_provider,
+        "provider_name": info.provider_name,
+        "web_identity_token": info.web_identity_token,
+        "numeric_to_float": info.numeric_to_float,
+        "binary_parameters": info.binary_parameters,
+        "identity_namespace": info.identity_namespace,
+        "token_type": info.token_type,
+        "idc_client_display_name": info.idc_client_display_name,
+        "access_key_id": info.access_key_id,
+        "secret_access_key": info.secret_access_key,
+        "session_token": info.session_token,
+    }
 
 
 apilevel: str = "2.0"
@@ -498,10 +527,13 @@ __all__: typing.Any = [
     "DataError",
     "DatabaseError",
     "connect",
+    "parallel_insert",
+    "ConnectionPool",
     "InterfaceError",
     "ProgrammingError",
     "Error",
     "OperationalError",
+    "QueryTimeoutError",
     "IntegrityError",
     "InternalError",
     "NotSupportedError",
@@ -510,6 +542,9 @@ __all__: typing.Any = [
     "ArrayContentNotSupportedError",
     "Connection",
     "Cursor",
+    "ObjectStore",
+    "S3ObjectStore",
+    "LocalObjectStore",
     "Binary",
     "Date",
     "DateFromTicks",
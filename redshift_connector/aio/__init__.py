@@ -0,0 +1,10 @@
+"""
+An asyncio interface to Amazon Redshift. Connections are opened using :func:`connect`, whose statements are executed
+with the same wire protocol messages and decoded with the same handlers as :class:`redshift_connector.Connection`,
+while waiting on the server yields to the event loop.
+"""
+
+from redshift_connector.aio.connection import AsyncConnection, connect
+from redshift_connector.aio.cursor import AsyncCursor
+
+__all__ = ["AsyncConnection", "AsyncCursor", "connect"]
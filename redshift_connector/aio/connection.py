@@ -0,0 +1,447 @@
+import asyncio
+import logging
+import socket
+import sys
+import typing
+from os import getpid
+
+import redshift_connector
+from redshift_connector.config import DEFAULT_READ_BUFFER_SIZE
+from redshift_connector.core import (
+    BIND,
+    CLOSE,
+    ERROR_RESPONSE,
+    READY_FOR_QUERY,
+    STATEMENT,
+    SYNC,
+    SYNC_MSG,
+    TERMINATE_MSG,
+    Connection,
+    _enable_tcp_keepalive,
+    _redshift_ssl_context,
+)
+from redshift_connector.cursor import Cursor
+from redshift_connector.error import InterfaceError, OperationalError, ProgrammingError
+from redshift_connector.redshift_property import RedshiftProperty
+from redshift_connector.utils import i_unpack, ii_pack
+from redshift_connector.utils.message_reader import _CODES
+
+if typing.TYPE_CHECKING:
+    from ssl import SSLContext
+
+    from redshift_connector.aio.cursor import AsyncCursor
+
+_logger: logging.Logger = logging.getLogger(__name__)
+
+# the properties of RedshiftProperty holding the arguments of connect() named differently
+_PROPERTY_NAMES: typing.Dict[str, str] = {"database": "db_name", "principal_arn": "principal", "user": "user_name"}
+
+
+async def connect(**kwargs) -> "AsyncConnection":
+    """
+    Establishes an :class:`AsyncConnection` to an Amazon Redshift cluster. Takes the same arguments as
+    :func:`redshift_connector.connect`, which are validated in the same way. Authentication using IAM or an identity
+    provider plugin runs in the default executor of the event loop, as it makes blocking requests.
+
+    Returns
+    -------
+    An AsyncConnection object associated with the specified Amazon Redshift cluster: :class:`AsyncConnection`
+    """
+    from inspect import signature
+
+    parameters = signature(redshift_connector.connect).parameters
+    info: RedshiftProperty = RedshiftProperty()
+    for name, value in kwargs.items():
+        if name not in parameters:
+            raise TypeError("connect() got an unexpected keyword argument '{}'".format(name))
+        info.put(_PROPERTY_NAMES.get(name, name), value)
+    if not info.application_name:
+        # the module awaiting this coroutine
+        info.put("application_name", sys._getframe(1).f_globals.get("__name__"))
+
+    if info.iam or info.credentials_provider:
+        arguments: typing.Dict[str, typing.Any] = await asyncio.get_running_loop().run_in_executor(
+            None, redshift_connector._connection_arguments, info
+        )
+    else:
+        arguments = redshift_connector._connection_arguments(info)
+    return await AsyncConnection._open(**arguments)
+
+
+class _AsyncSession(Connection):
+    """
+    The protocol state of an :class:`AsyncConnection`, which reuses the message handlers, parameter encoding and
+    prepared statement cache of :class:`Connection` without opening a socket. Messages are written to a buffer sent by
+    the :class:`AsyncConnection`, which passes the messages it receives to the handlers of the session.
+    """
+
+    def __init__(self: "_AsyncSession", **kwargs) -> None:
+        self._init_params: typing.Dict[str, bytes] = self._init_session(**kwargs)
+        self._outgoing: bytearray = bytearray()
+        self._write: typing.Callable = self._outgoing.extend
+        self._flush: typing.Callable = lambda: None
+        self._sock = None
+
+    def close_prepared_statement(self: "_AsyncSession", statement_name_bin: bytes) -> None:
+        # the response is handled along with the response to the messages already sent
+        _logger.debug("Send Close message for statement %s to BE", statement_name_bin)
+        self._send_message(CLOSE, STATEMENT + statement_name_bin)
+        self._write(SYNC_MSG)
+
+
+class AsyncConnection:
+    """
+    A connection to an Amazon Redshift cluster driven by asyncio, returned by :func:`redshift_connector.aio.connect`.
+    Statements are executed using the same wire protocol messages as :class:`Connection`, whose message handlers
+    decode the responses, while waiting on the server yields to the event loop. Many connections can thereby execute
+    statements concurrently on a single event loop.
+
+    A connection executes one statement at a time, so statements executed concurrently on the same connection wait
+    for one another. A connection whose response is not read in full, e.g. as the task awaiting it was cancelled, is
+    closed, as the next response could not be told apart from the remainder of the previous one.
+    """
+
+    def __init__(
+        self: "AsyncConnection", session: _AsyncSession, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        self._session: _AsyncSession = session
+        self._reader: asyncio.StreamReader = reader
+        self._writer: typing.Optional[asyncio.StreamWriter] = writer
+        self._lock: asyncio.Lock = asyncio.Lock()
+        # bytes received following the last complete message
+        self._buffer: bytes = b""
+        # the number of ReadyForQuery messages yet to be received, one per Sync message sent
+        self._pending_syncs: int = 0
+        session._sock = writer
+
+    @classmethod
+    async def _open(
+        cls: typing.Type["AsyncConnection"],
+        host: str = "localhost",
+        port: int = 5439,
+        source_address: typing.Optional[str] = None,
+        unix_sock: typing.Optional[str] = None,
+        ssl: bool = True,
+        sslmode: str = "verify-ca",
+        ssl_context: typing.Optional["SSLContext"] = None,
+        timeout: typing.Optional[int] = None,
+        tcp_keepalive: typing.Optional[bool] = True,
+        tcp_keepalive_idle: typing.Optional[int] = None,
+        tcp_keepalive_interval: typing.Optional[int] = None,
+        tcp_keepalive_count: typing.Optional[int] = None,
+        **kwargs,
+    ) -> "AsyncConnection":
+        """
+        Opens a connection given the arguments of :class:`Connection`. ``timeout`` bounds the time taken to open the
+        connection and start up the session.
+        """
+        session: _AsyncSession = _AsyncSession(**kwargs)
+
+        async def start() -> "AsyncConnection":
+            reader, writer = await _open_streams(
+                host,
+                port,
+                source_address,
+                unix_sock,
+                ssl,
+                sslmode,
+                ssl_context,
+                tcp_keepalive,
+                tcp_keepalive_idle,
+                tcp_keepalive_interval,
+                tcp_keepalive_count,
+            )
+            conn: AsyncConnection = cls(session, reader, writer)
+            try:
+                _logger.debug("Sending start-up parameters to BE")
+                writer.write(session._startup_packet(session._init_params))
+                # the start-up packet is answered by a ReadyForQuery message once the session started
+                conn._pending_syncs = 1
+                await conn._receive(None, startup=True)
+            except:
+                conn._abort()
+                raise
+            session._finish_startup()
+            return conn
+
+        try:
+            if timeout is None:
+                return await start()
+            return await asyncio.wait_for(start(), timeout)
+        except asyncio.TimeoutError as timeout_error:
+            raise OperationalError("connection time out", timeout_error)
+        except socket.error as e:
+            raise InterfaceError("communication error", e)
+
+    async def __aenter__(self: "AsyncConnection") -> "AsyncConnection":
+        return self
+
+    async def __aexit__(self: "AsyncConnection", exc_type, exc_value, traceback) -> None:
+        # the connection is already closed if reading a response failed
+        if not self.closed:
+            await self.close()
+
+    @property
+    def autocommit(self: "AsyncConnection") -> bool:
+        return self._session.autocommit
+
+    @autocommit.setter
+    def autocommit(self: "AsyncConnection", value: bool) -> None:
+        self._session.autocommit = value
+
+    @property
+    def in_transaction(self: "AsyncConnection") -> bool:
+        return self._session.in_transaction
+
+    @property
+    def closed(self: "AsyncConnection") -> bool:
+        return self._writer is None
+
+    def cursor(self: "AsyncConnection") -> "AsyncCursor":
+        """Creates an :class:`AsyncCursor` object bound to this connection.
+
+        Returns
+        -------
+        An AsyncCursor object associated with the current AsyncConnection: :class:`AsyncCursor`
+        """
+        from redshift_connector.aio.cursor import AsyncCursor
+
+        return AsyncCursor(self)
+
+    async def commit(self: "AsyncConnection") -> None:
+        """Commits the current database transaction."""
+        _logger.debug("AsyncConnection.commit()")
+        await self._execute(self._session._cursor, "commit", None)
+
+    async def rollback(self: "AsyncConnection") -> None:
+        """Rolls back the current database transaction."""
+        _logger.debug("AsyncConnection.rollback()")
+        if not self.in_transaction:
+            _logger.debug("not in transaction")
+            return
+        await self._execute(self._session._cursor, "rollback", None)
+
+    async def ping(self: "AsyncConnection") -> None:
+        """Checks the connection is usable, as :meth:`Connection.ping` does.
+
+        Raises
+        ------
+        InterfaceError: If the connection is closed, or the server closed it.
+        """
+        async with self._lock:
+            self._check_open()
+            self._session._write(SYNC_MSG)
+            await self._send()
+            await self._receive(self._session._cursor)
+
+    async def close(self: "AsyncConnection") -> None:
+        """Closes the database connection."""
+        _logger.debug("AsyncConnection.close()")
+        writer: typing.Optional[asyncio.StreamWriter] = self._writer
+        if writer is None:
+            raise InterfaceError("connection is closed")
+        self._writer = self._session._sock = None
+        try:
+            _logger.debug("Sending Terminate message to BE")
+            writer.write(TERMINATE_MSG)
+            writer.close()
+            await writer.wait_closed()
+        except socket.error:
+            pass
+
+    def _check_open(self: "AsyncConnection") -> None:
+        if self._writer is None:
+            raise InterfaceError("connection is closed")
+
+    def _abort(self: "AsyncConnection") -> None:
+        """
+        Closes the connection without waiting, once its state is no longer known.
+        """
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = self._session._sock = None
+
+    async def _execute(
+        self: "AsyncConnection", cursor: Cursor, operation: str, vals, begin_transaction: bool = False
+    ) -> None:
+        """
+        Executes ``operation`` with the parameters ``vals``, receiving its result into ``cursor``. When
+        ``begin_transaction`` is set, a transaction is begun first unless one is open or autocommit is enabled.
+        """
+        async with self._lock:
+            self._check_open()
+            if begin_transaction and not self._session.in_transaction and not self._session.autocommit:
+                await self._execute_statement(cursor, "begin transaction", None)
+            await self._execute_statement(cursor, operation, vals)
+
+    async def _execute_statement(self: "AsyncConnection", cursor: Cursor, operation: str, vals) -> None:
+        # mirrors Connection.execute, yielding to the event loop while waiting on the server
+        session: _AsyncSession = self._session
+        pid: int = getpid()
+        statements_to_close: typing.List[bytes] = []
+        cache, key, statement, args, params = session._statement_args(cursor.paramstyle, pid, operation, vals)
+
+        ps: typing.Optional[typing.Dict[str, typing.Any]] = session._cached_prepared_statement(cursor, cache, key)
+        if ps is None:
+            ps = session._send_prepare(cursor, pid, statement, params)
+            await self._send()
+            await self._receive(cursor)
+            session._complete_prepared_statement(cache, key, ps, params, statements_to_close)
+        session._reset_result(cursor)
+
+        _logger.debug("Sending Bind message to BE")
+        session._send_message(BIND, session._make_bind(ps, args))
+        session.send_EXECUTE(cursor)
+        _logger.debug("Sending Sync message to BE")
+        session._write(SYNC_MSG)
+        # prepared statements evicted from the cache are closed within the same round trip
+        for statement_name_bin in statements_to_close:
+            session.close_prepared_statement(statement_name_bin)
+        await self._send()
+        await self._receive(cursor)
+
+    async def _send(self: "AsyncConnection") -> None:
+        """
+        Sends the messages written to the session, counting the Sync messages among them.
+        """
+        outgoing: bytearray = self._session._outgoing
+        if len(outgoing) == 0:
+            return
+        idx: int = 0
+        while idx < len(outgoing):
+            if outgoing[idx] == SYNC[0]:
+                self._pending_syncs += 1
+            idx += 1 + i_unpack(outgoing, idx + 1)[0]
+        writer: typing.Optional[asyncio.StreamWriter] = self._writer
+        if writer is None:
+            outgoing.clear()
+            raise InterfaceError("connection is closed")
+        writer.write(bytes(outgoing))
+        outgoing.clear()
+        await writer.drain()
+
+    async def _receive(self: "AsyncConnection", cursor: typing.Optional[Cursor], startup: bool = False) -> None:
+        """
+        Passes the messages received to the handlers of the session until a ReadyForQuery message was received for
+        each Sync message sent, raising the error received from the server, if any. Messages written by the handlers,
+        e.g. authentication responses, are sent once the messages received so far were handled.
+        """
+        session: _AsyncSession = self._session
+        session.error = None
+        try:
+            while self._pending_syncs > 0:
+                for code, data in await self._read_messages():
+                    session.message_types[code](data, cursor)
+                    if code == READY_FOR_QUERY:
+                        self._pending_syncs -= 1
+                    elif startup and code == ERROR_RESPONSE:
+                        # the server closes the connection once the start-up failed
+                        self._pending_syncs = 0
+                await self._send()
+        except BaseException:
+            self._abort()
+            raise
+        if session.error is not None:
+            raise session.error
+
+    async def _read_messages(self: "AsyncConnection") -> typing.List[typing.Tuple[bytes, bytes]]:
+        """
+        Returns the code and content of every complete message received, waiting for data until there is at least one.
+        """
+        messages: typing.List[typing.Tuple[bytes, bytes]] = []
+        while len(messages) == 0:
+            received: bytes = await self._reader.read(DEFAULT_READ_BUFFER_SIZE)
+            if len(received) == 0:
+                raise InterfaceError(
+                    "BrokenPipe: server socket closed. Please check that client side networking configurations such "
+                    "as Proxies, firewalls, VPN, etc. are not affecting your network connection."
+                )
+            data: bytes = self._buffer + received if len(self._buffer) > 0 else received
+            end: int = len(data)
+            start: int = 0
+            while end - start >= 5:
+                next_start: int = start + 1 + i_unpack(data, start + 1)[0]
+                if next_start > end:
+                    break
+                messages.append((_CODES[data[start]], data[start + 5 : next_start]))
+                start = next_start
+            self._buffer = data[start:]
+        return messages
+
+
+async def _open_streams(
+    host: str,
+    port: int,
+    source_address: typing.Optional[str],
+    unix_sock: typing.Optional[str],
+    ssl: bool,
+    sslmode: str,
+    ssl_context: typing.Optional["SSLContext"],
+    tcp_keepalive: typing.Optional[bool],
+    tcp_keepalive_idle: typing.Optional[int],
+    tcp_keepalive_interval: typing.Optional[int],
+    tcp_keepalive_count: typing.Optional[int],
+) -> typing.Tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+    """
+    Opens the socket of a connection as :class:`Connection` does, requesting SSL before the TLS handshake is made by
+    asyncio.
+    """
+    loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+    if unix_sock is None and host is not None:
+        _logger.debug("creating tcp/ip socket")
+        sock: socket.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        if source_address is not None:
+            sock.bind((source_address, 0))
+    elif unix_sock is not None:
+        if not hasattr(socket, "AF_UNIX"):
+            raise InterfaceError("attempt to connect to unix socket on unsupported platform")
+        _logger.debug("creating af_unix socket")
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    else:
+        raise ProgrammingError("one of host or unix_sock must be provided")
+
+    try:
+        sock.setblocking(False)
+        if unix_sock is None:
+            response = await loop.getaddrinfo(host, port, family=socket.AF_INET)
+            if not response:
+                raise InterfaceError("Unable to determine ip for host %s port %s", host, port)
+            _logger.debug("Attempting to create connection socket with address %s", response[0][4])
+            await loop.sock_connect(sock, response[0][4])
+        else:
+            _logger.debug("connecting to socket with unix socket")
+            await loop.sock_connect(sock, unix_sock)
+        _logger.debug("Connection socket established")
+        if tcp_keepalive:
+            _enable_tcp_keepalive(sock, tcp_keepalive_idle, tcp_keepalive_interval, tcp_keepalive_count)
+
+        server_hostname: typing.Optional[str] = None
+        if ssl is True:
+            if ssl_context is None:
+                ssl_context = _redshift_ssl_context(sslmode)
+            _logger.debug("Sending SSLRequestMessage to BE")
+            await loop.sock_sendall(sock, ii_pack(8, 80877103))
+            resp: bytes = await loop.sock_recv(sock, 1)
+            if resp != b"S":
+                _logger.debug("Server response code when attempting to establish ssl connection: %s", resp)
+                raise InterfaceError("Server refuses SSL")
+
+            if sslmode in ("verify-ca", "verify-full"):
+                _logger.debug("applying sslmode=%s to socket", sslmode)
+                # the host name is checked if the context requires it, as it does for verify-full, while an empty
+                # server_hostname disables hostname checking
+                server_hostname = host if ssl_context.check_hostname else ""
+            else:
+                _logger.debug("unknown sslmode=%s is ignored", sslmode)
+                ssl_context = None
+        else:
+            ssl_context = None
+
+        if ssl_context is None:
+            return await asyncio.open_connection(sock=sock, limit=DEFAULT_READ_BUFFER_SIZE)
+        return await asyncio.open_connection(
+            sock=sock, ssl=ssl_context, server_hostname=server_hostname, limit=DEFAULT_READ_BUFFER_SIZE
+        )
+    except:
+        sock.close()
+        raise
@@ -0,0 +1,123 @@
+import typing
+
+from redshift_connector.cursor import Cursor
+from redshift_connector.error import InterfaceError
+
+if typing.TYPE_CHECKING:
+    from redshift_connector.aio.connection import AsyncConnection
+
+
+class AsyncCursor:
+    """
+    A cursor of an :class:`AsyncConnection`, returned by :meth:`AsyncConnection.cursor`. The rows of a result set are
+    received in full by :meth:`execute` and decoded as :class:`Cursor` does, after which they are fetched without
+    waiting on the server.
+
+    Parameters
+    ----------
+    connection : :class:`AsyncConnection`
+        The connection to associate with this cursor.
+    paramstyle : Optional[str]
+        The DB-API paramstyle to use with this cursor.
+    """
+
+    def __init__(self: "AsyncCursor", connection: "AsyncConnection", paramstyle: typing.Optional[str] = None) -> None:
+        self._connection: typing.Optional["AsyncConnection"] = connection
+        # receives the result of each statement
+        self._cursor: Cursor = Cursor(connection._session, paramstyle)
+
+    async def __aenter__(self: "AsyncCursor") -> "AsyncCursor":
+        return self
+
+    async def __aexit__(self: "AsyncCursor", exc_type, exc_value, traceback) -> None:
+        await self.close()
+
+    def __aiter__(self: "AsyncCursor") -> "AsyncCursor":
+        return self
+
+    async def __anext__(self: "AsyncCursor") -> typing.List:
+        try:
+            return next(self._cursor)
+        except StopIteration:
+            raise StopAsyncIteration
+
+    @property
+    def paramstyle(self: "AsyncCursor") -> str:
+        return self._cursor.paramstyle
+
+    @paramstyle.setter
+    def paramstyle(self: "AsyncCursor", value: str) -> None:
+        self._cursor.paramstyle = value
+
+    @property
+    def arraysize(self: "AsyncCursor") -> int:
+        return self._cursor.arraysize
+
+    @arraysize.setter
+    def arraysize(self: "AsyncCursor", value: int) -> None:
+        self._cursor.arraysize = value
+
+    @property
+    def description(self: "AsyncCursor") -> typing.Optional[typing.List[typing.Optional[typing.Tuple]]]:
+        return self._cursor.description
+
+    @property
+    def rowcount(self: "AsyncCursor") -> int:
+        return self._cursor.rowcount
+
+    @property
+    def redshift_rowcount(self: "AsyncCursor") -> int:
+        return self._cursor.redshift_rowcount
+
+    async def execute(self: "AsyncCursor", operation: str, args=None) -> "AsyncCursor":
+        """Executes a database operation, as :meth:`Cursor.execute` does.
+
+        Parameters
+        ----------
+        operation : str The SQL statement to execute.
+        args : If :data:`paramstyle` is ``qmark``, ``numeric``, or ``format``, this argument should be an array of
+            parameters to bind into the statement. If :data:`paramstyle` is ``named``, the argument should be a dict
+            mapping of parameters. If the :data:`paramstyle` is ``pyformat``, the argument value may be either an
+            array or a mapping.
+
+        Returns
+        -------
+        The AsyncCursor object used for executing the specified database operation: :class:`AsyncCursor`
+        """
+        if self._connection is None:
+            raise InterfaceError("Cursor closed")
+        self._cursor.truncated_row_desc.cache_clear()
+        await self._connection._execute(self._cursor, operation, args, begin_transaction=True)
+        return self
+
+    async def fetchone(self: "AsyncCursor") -> typing.Optional[typing.List]:
+        """Fetch the next row of a query result set.
+
+        Returns
+        -------
+        A row as a sequence of field values, or ``None`` if no more rows are available:typing.Optional[typing.List]
+        """
+        return self._cursor.fetchone()
+
+    async def fetchmany(self: "AsyncCursor", num: typing.Optional[int] = None) -> typing.Tuple:
+        """Fetches the next set of rows of a query result, as :meth:`Cursor.fetchmany` does.
+
+        Returns
+        -------
+        A sequence of rows, which is empty if no more rows are available:typing.Tuple
+        """
+        return self._cursor.fetchmany(num)
+
+    async def fetchall(self: "AsyncCursor") -> typing.Tuple:
+        """Fetches all remaining rows of a query result.
+
+        Returns
+        -------
+        A sequence of rows:typing.Tuple
+        """
+        return self._cursor.fetchall()
+
+    async def close(self: "AsyncCursor") -> None:
+        """Closes the cursor."""
+        self._cursor.close()
+        self._connection = None
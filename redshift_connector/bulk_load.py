@@ -0,0 +1,226 @@
+import logging
+import queue
+import re
+import threading
+import typing
+import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from redshift_connector.config import (
+    DEFAULT_PARALLEL_INSERT_CONNECTIONS,
+    DEFAULT_PARALLEL_INSERT_PARTITION_SIZE,
+    MAX_BIND_PARAMETERS,
+    MULTI_ROW_INSERT_BATCH_SIZES,
+)
+from redshift_connector.error import InterfaceError
+
+if typing.TYPE_CHECKING:
+    import pandas  # type: ignore
+
+    from redshift_connector.core import Connection
+
+_logger: logging.Logger = logging.getLogger(__name__)
+
+# seconds a thread waits on the partition queue before checking whether another thread failed
+_POLL_INTERVAL: float = 0.1
+
+
+def parallel_insert(
+    table: str,
+    rows: typing.Union[typing.Iterable[typing.Sequence], "pandas.DataFrame"],
+    column_names: typing.Optional[typing.List[str]] = None,
+    num_connections: int = DEFAULT_PARALLEL_INSERT_CONNECTIONS,
+    partition_size: int = DEFAULT_PARALLEL_INSERT_PARTITION_SIZE,
+    batch_size: typing.Optional[int] = None,
+    staging_table: bool = True,
+    **kwargs,
+) -> int:
+    """
+    Inserts rows into a table using several connections concurrently.
+
+    ``num_connections`` connections are opened by passing ``kwargs`` to :func:`redshift_connector.connect`. The rows
+    are split into partitions of ``partition_size`` rows, which are inserted by a pool of one thread per connection as
+    the rows are read, so only a few partitions are held in memory at a time. Rows of an iterable are inserted using
+    :meth:`Cursor.insert_data_bulk`, and partitions of a :class:`pandas.DataFrame` using
+    :meth:`Cursor.write_dataframe`, both of which use multi-row INSERT statements.
+
+    The load is committed as a whole. If ``staging_table`` is True, the rows are inserted into a table created like
+    ``table`` in the same schema, which is copied into ``table`` and dropped in a single transaction once all
+    partitions were inserted. This requires permission to create tables in that schema. If ``staging_table`` is False,
+    the rows are inserted into ``table`` directly, and the transactions of all connections are committed once all
+    partitions were inserted. A failure while committing may then leave the partitions of some connections committed.
+    If inserting any partition fails, no rows are committed, the staging table is dropped and the error is raised.
+
+    Parameters
+    ----------
+    table : str The name of an existing table, optionally qualified by its schema
+    rows : Iterable[Sequence] | :class:`pandas.DataFrame` The rows to insert. The values of each row of an iterable
+        are those of ``column_names`` in order. The columns of a DataFrame are those of ``table`` in order.
+    column_names : Optional[List[str]] The columns of ``table`` to insert rows of an iterable into. Must be None for a
+        DataFrame.
+    num_connections : int The number of connections inserting rows concurrently. Default value is 4.
+    partition_size : int The number of rows inserted by a connection at a time. Default value is 10000.
+    batch_size : Optional[int] The number of rows per INSERT statement used for rows of an iterable. Default value is
+        ``None``, which uses the largest of ``MULTI_ROW_INSERT_BATCH_SIZES`` within the bind parameter limit.
+    staging_table : bool If the rows are inserted into a staging table. Default value is ``True``.
+    kwargs : The arguments of :func:`redshift_connector.connect` used to open each connection.
+
+    Returns
+    -------
+    The number of rows inserted: int
+    """
+    from redshift_connector import connect
+
+    if num_connections < 1:
+        raise InterfaceError("num_connections must be greater than 0")
+    if partition_size < 1:
+        raise InterfaceError("partition_size must be greater than 0")
+    is_dataframe: bool = hasattr(rows, "iloc")
+    if is_dataframe:
+        if column_names is not None:
+            raise InterfaceError("column_names must be None when inserting a pandas.DataFrame")
+    elif not column_names:
+        raise InterfaceError("column_names must be given when inserting an iterable of rows")
+    elif batch_size is None:
+        batch_size = next(
+            (size for size in MULTI_ROW_INSERT_BATCH_SIZES if size * len(column_names) <= MAX_BIND_PARAMETERS), 1
+        )
+
+    target: str = re.sub(r"[-;/'\"\s]", "", table)
+    destination: str = target
+    if staging_table:
+        destination = "{}_staging_{}".format(target, uuid.uuid4().hex[:12])
+
+    connections: typing.List["Connection"] = []
+    try:
+        for _ in range(num_connections):
+            connections.append(connect(**kwargs))
+        for conn in connections:
+            conn.autocommit = False
+
+        if staging_table:
+            with connections[0].cursor() as cursor:
+                cursor.execute("create table {} (like {})".format(destination, target))
+            connections[0].commit()
+
+        try:
+            num_rows: int = _insert_partitions(
+                connections, destination, rows, column_names, partition_size, batch_size, is_dataframe
+            )
+            for conn in connections:
+                conn.commit()
+            if staging_table:
+                columns: str = "*" if column_names is None else ", ".join(column_names)
+                with connections[0].cursor() as cursor:
+                    cursor.execute(
+                        "insert into {} {}select {} from {}".format(
+                            target, "" if column_names is None else "({}) ".format(columns), columns, destination
+                        )
+                    )
+                    cursor.execute("drop table {}".format(destination))
+                connections[0].commit()
+        except:
+            for conn in connections:
+                try:
+                    conn.rollback()
+                except Exception as e:
+                    _logger.debug("Failed to roll back a parallel insert connection: %s", e)
+            if staging_table:
+                try:
+                    with connections[0].cursor() as cursor:
+                        cursor.execute("drop table if exists {}".format(destination))
+                    connections[0].commit()
+                except Exception as e:
+                    _logger.warning("Failed to drop staging table %s: %s", destination, e)
+            raise
+    finally:
+        for conn in connections:
+            try:
+                conn.close()
+            except Exception as e:
+                _logger.debug("Failed to close a parallel insert connection: %s", e)
+
+    _logger.debug("Inserted %s rows into %s using %s connections", num_rows, target, num_connections)
+    return num_rows
+
+
+def _insert_partitions(
+    connections: typing.List["Connection"],
+    table: str,
+    rows: typing.Union[typing.Iterable[typing.Sequence], "pandas.DataFrame"],
+    column_names: typing.Optional[typing.List[str]],
+    partition_size: int,
+    batch_size: typing.Optional[int],
+    is_dataframe: bool,
+) -> int:
+    """
+    Reads the partitions of ``rows`` in the calling thread and inserts them into ``table`` from one thread per
+    connection, without committing. Returns the number of rows inserted, or raises the error of a failed thread once all
+    threads stopped.
+    """
+    partitions: queue.Queue = queue.Queue(maxsize=2 * len(connections))
+    failed: threading.Event = threading.Event()
+
+    def take() -> typing.Iterator:
+        while not failed.is_set():
+            try:
+                partition = partitions.get(timeout=_POLL_INTERVAL)
+            except queue.Empty:
+                continue
+            if partition is None:
+                return
+            yield partition
+
+    def insert(conn: "Connection") -> int:
+        try:
+            with conn.cursor() as cursor:
+                if is_dataframe:
+                    num_rows: int = 0
+                    for partition in take():
+                        cursor.write_dataframe(partition, table)
+                        num_rows += len(partition.index)
+                    return num_rows
+                cursor.insert_data_bulk(
+                    None,
+                    table,
+                    None,
+                    typing.cast(typing.List[str], column_names),
+                    batch_size=typing.cast(int, batch_size),
+                    rows=(row for partition in take() for row in partition),
+                )
+                return cursor.bulk_insert_stats.rows if cursor.bulk_insert_stats is not None else 0
+        except:
+            failed.set()
+            raise
+
+    def put(partition) -> bool:
+        while not failed.is_set():
+            try:
+                partitions.put(partition, timeout=_POLL_INTERVAL)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    with ThreadPoolExecutor(max_workers=len(connections), thread_name_prefix="redshift_connector_insert") as executor:
+        futures: typing.List[Future] = [executor.submit(insert, conn) for conn in connections]
+        try:
+            if is_dataframe:
+                df: "pandas.DataFrame" = typing.cast("pandas.DataFrame", rows)
+                for start in range(0, len(df.index), partition_size):
+                    if not put(df.iloc[start : start + partition_size]):
+                        break
+            else:
+                iterator: typing.Iterator[typing.Sequence] = iter(typing.cast(typing.Iterable[typing.Sequence], rows))
+                while True:
+                    partition: typing.List[typing.Sequence] = [row for _, row in zip(range(partition_size), iterator)]
+                    if not partition or not put(partition):
+                        break
+            for _ in connections:
+                if not put(None):
+                    break
+        except:
+            failed.set()
+            raise
+        # raises the error of a failed thread, if any
+        return sum(future.result() for future in futures)
@@ -29,6 +29,21 @@ class ClientProtocolVersion(IntEnum):
 
 DEFAULT_PROTOCOL_VERSION: int = ClientProtocolVersion.BINARY.value
 DEFAULT_MAX_PREPARED_STATEMENTS: int = 1000
+DEFAULT_FETCH_SIZE: int = 10000
+DEFAULT_READ_BUFFER_SIZE: int = 1 << 20
+DEFAULT_READ_QUEUE_SIZE: int = 8
+DEFAULT_PIPELINE_SIZE: int = 1000
+# the maximum number of bind parameters of a prepared statement
+MAX_BIND_PARAMETERS: int = 32767
+# rows per statement of INSERT statements rewritten by Cursor.executemany, few so their prepared statements are reused
+MULTI_ROW_INSERT_BATCH_SIZES: typing.Tuple[int, ...] = (1024, 128, 16, 1)
+# connections and rows per partition used by redshift_connector.parallel_insert
+DEFAULT_PARALLEL_INSERT_CONNECTIONS: int = 4
+DEFAULT_PARALLEL_INSERT_PARTITION_SIZE: int = 10000
+# rows per file staged by Cursor.copy_from_dataframe
+DEFAULT_COPY_PART_ROWS: int = 1000000
+# the maximum number of connections of a redshift_connector.pool.ConnectionPool
+DEFAULT_POOL_MAX_SIZE: int = 10
 DRIVER_DISCOVERY_VERSION: int = 1
 
 
@@ -44,6 +59,35 @@ class DbApiParamstyle(Enum):
         return list(map(lambda p: p.value, cls))  # type: ignore
 
 
+class ResultBufferMode(Enum):
+    ROWS = "rows"
+    COLUMNAR = "columnar"
+    LAZY = "lazy"
+
+    @classmethod
+    def list(cls) -> typing.List[str]:
+        return list(map(lambda p: p.value, cls))  # type: ignore
+
+
+class NumpyArrayLayout(Enum):
+    ROWS = "rows"
+    STRUCTURED = "structured"
+    COLUMNS = "columns"
+
+    @classmethod
+    def list(cls) -> typing.List[str]:
+        return list(map(lambda p: p.value, cls))  # type: ignore
+
+
+class CopyFileFormat(Enum):
+    CSV = "csv"
+    PARQUET = "parquet"
+
+    @classmethod
+    def list(cls) -> typing.List[str]:
+        return list(map(lambda p: p.value, cls))  # type: ignore
+
+
 min_int2: int = -(2**15)
 max_int2: int = 2**15
 min_int4: int = -(2**31)
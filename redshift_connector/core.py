@@ -1,28 +1,35 @@
+import functools
 import logging
 import os
+import re
 import socket
+import sys
+import threading
 import typing
+import weakref
 from collections import OrderedDict, deque
 from copy import deepcopy
+from datetime import date
 from datetime import datetime as Datetime
+from datetime import time
 from datetime import timedelta as Timedelta
 from decimal import Decimal
 from hashlib import md5
-from itertools import count
+from itertools import count, repeat
 from os import getpid
-from struct import pack
+from struct import Struct, pack
 from typing import TYPE_CHECKING
 from warnings import warn
 
-from packaging import version
-from scramp import ScramClient  # type: ignore
-
 from redshift_connector.config import (
     DEFAULT_MAX_PREPARED_STATEMENTS,
+    DEFAULT_PIPELINE_SIZE,
     DEFAULT_PROTOCOL_VERSION,
     DRIVER_DISCOVERY_VERSION,
+    MAX_BIND_PARAMETERS,
     ClientProtocolVersion,
     DbApiParamstyle,
+    ResultBufferMode,
     _client_encoding,
     max_int2,
     max_int4,
@@ -53,19 +60,24 @@ from redshift_connector.utils import (
     FC_TEXT,
     NULL,
     NULL_BYTE,
+    BackgroundMessageReader,
+    ColumnarResultBuffer,
     DriverInfo,
-    array_check_dimensions,
-    array_dim_lengths,
-    array_find_first_element,
-    array_flatten,
-    array_has_null,
+    LazyResultBuffer,
+    MessageReader,
+    SpillingResultBuffer,
     array_recv_binary,
     array_recv_text,
+    array_scan,
     bh_unpack,
+    bool_send,
     cccc_unpack,
     ci_unpack,
+    compile_row_decoder,
+    d_pack,
     date_in,
     date_recv_binary,
+    date_send_integer,
     float_array_recv,
     geographyhex_recv,
     h_pack,
@@ -81,6 +93,7 @@ from redshift_connector.utils import (
     numeric_in_binary,
     numeric_to_float_binary,
     numeric_to_float_in,
+    numpy_array_send,
 )
 from redshift_connector.utils import py_types as PY_TYPES
 from redshift_connector.utils import q_pack
@@ -89,15 +102,15 @@ from redshift_connector.utils import (
     text_recv,
     time_in,
     time_recv_binary,
+    time_send_integer,
     timetz_in,
     timetz_recv_binary,
     varbytehex_recv,
-    walk_array,
 )
 from redshift_connector.utils.oids import RedshiftOID
 
 if TYPE_CHECKING:
-    from ssl import SSLSocket
+    from ssl import SSLContext, SSLSession, SSLSocket
 
 # Copyright (c) 2007-2009, Mathieu Fenniak
 # Copyright (c) The Contributors
@@ -309,6 +322,13 @@ NO_DATA: bytes = b"n"
 PARAMETER_DESCRIPTION: bytes = b"t"
 NOTIFICATION_RESPONSE: bytes = b"A"
 EMPTY_QUERY_RESPONSE: bytes = b"I"
+# the maximum number of encoding plans held by Connection.make_params
+_MAX_PARAM_PLANS: int = 1024
+_READY_FOR_QUERY_CODES: typing.FrozenSet[bytes] = frozenset((READY_FOR_QUERY,))
+# messages ending the response to an Execute message sent with a row limit
+_PORTAL_STOP_CODES: typing.FrozenSet[bytes] = frozenset(
+    (PORTAL_SUSPENDED, COMMAND_COMPLETE, EMPTY_QUERY_RESPONSE, ERROR_RESPONSE)
+)
 
 BIND: bytes = b"B"
 PARSE: bytes = b"P"
@@ -333,6 +353,8 @@ FLUSH_MSG: bytes = create_message(FLUSH)
 SYNC_MSG: bytes = create_message(SYNC)
 TERMINATE_MSG: bytes = create_message(TERMINATE)
 EXECUTE_MSG: bytes = create_message(EXECUTE, NULL_BYTE + i_pack(0))
+# an Execute message of a portal which does not exist, failing the transaction it is sent in
+_ABORT_MSG: bytes = create_message(EXECUTE, b"redshift_connector_abort" + NULL_BYTE + i_pack(0))
 
 # DESCRIBE constants
 STATEMENT: bytes = b"S"
@@ -357,7 +379,341 @@ IDLE: bytes = b"I"
 IDLE_IN_TRANSACTION: bytes = b"T"
 IDLE_IN_FAILED_TRANSACTION: bytes = b"E"
 
-arr_trans: typing.Mapping[int, typing.Optional[str]] = dict(zip(map(ord, "[] 'u"), ["{", "}", None, None, None]))
+# the struct packing the length and value of each element of arrays of fixed width types, by send function
+_ARRAY_FIXED_WIDTH_SENDS: typing.Dict[typing.Callable, typing.Tuple[Struct, int]] = {
+    h_pack: (Struct("!ih"), 2),
+    i_pack: (Struct("!ii"), 4),
+    q_pack: (Struct("!iq"), 8),
+    d_pack: (Struct("!id"), 8),
+    bool_send: (Struct("!i?"), 1),
+}
+# characters requiring an element of an array literal to be quoted
+_ARRAY_TEXT_SPECIAL: typing.Pattern = re.compile(r'[{},"\\\s]')
+
+
+def _check_array_homogenous(types: typing.Set[type], typ: type) -> None:
+    for element_type in types:
+        if not issubclass(element_type, typ):
+            raise ArrayContentNotHomogenousError("not all array elements are of type " + str(typ))
+
+
+def _array_text_element(text: str) -> str:
+    if text == "" or text.upper() == "NULL" or _ARRAY_TEXT_SPECIAL.search(text):
+        return '"' + text.replace("\\", "\\\\").replace('"', '\\"') + '"'
+    return text
+
+
+def _send_encoded(value, payload: bytes, send_func: typing.Callable) -> typing.Callable:
+    """
+    Returns a send function returning ``payload``, the parameter ``value`` encoded while it was inspected, when first
+    given ``value`` itself, and the result of ``send_func`` otherwise. Neither ``value`` nor ``payload`` is referenced
+    once returned, so the send function held by a cached prepared statement does not keep them alive.
+    """
+    pending: typing.List = [value, payload]
+
+    def send(arr) -> bytes:
+        if arr is pending[0]:
+            encoded: bytes = pending[1]
+            pending[0] = pending[1] = None
+            return encoded
+        return send_func(arr)
+
+    return send
+
+
+# the versions of _TypeMap instances, unique across instances so a version identifies a mapping and its content
+_type_map_versions: typing.Iterator[int] = count()
+
+
+class _TypeMap(dict):
+    """
+    A dict of ``Connection.py_types`` or ``Connection.inspect_funcs``, whose ``version`` changes whenever it is
+    modified, so that the parameter encoding plans of :meth:`Connection.make_params` made from it are discarded once it
+    was customized in place.
+    """
+
+    def __init__(self: "_TypeMap", *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.version: int = next(_type_map_versions)
+
+    def __setitem__(self: "_TypeMap", key, value) -> None:
+        super().__setitem__(key, value)
+        self.version = next(_type_map_versions)
+
+    def __delitem__(self: "_TypeMap", key) -> None:
+        super().__delitem__(key)
+        self.version = next(_type_map_versions)
+
+    def __ior__(self: "_TypeMap", other) -> "_TypeMap":
+        self.update(other)
+        return self
+
+    def clear(self: "_TypeMap") -> None:
+        super().clear()
+        self.version = next(_type_map_versions)
+
+    def pop(self: "_TypeMap", *args):
+        self.version = next(_type_map_versions)
+        return super().pop(*args)
+
+    def popitem(self: "_TypeMap"):
+        self.version = next(_type_map_versions)
+        return super().popitem()
+
+    def setdefault(self: "_TypeMap", key, default=None):
+        self.version = next(_type_map_versions)
+        return super().setdefault(key, default)
+
+    def update(self: "_TypeMap", *args, **kwargs) -> None:
+        super().update(*args, **kwargs)
+        self.version = next(_type_map_versions)
+
+
+_REDSHIFT_CA_BUNDLE: str = os.path.join(os.path.dirname(os.path.abspath(__file__)), "files", "redshift-ca-bundle.crt")
+
+# the TLS session of the last connection to each host and port, per SSL context, for the next connection to resume
+_ssl_sessions: "weakref.WeakKeyDictionary[SSLContext, typing.Dict[typing.Tuple[str, int], SSLSession]]" = (
+    weakref.WeakKeyDictionary()
+)
+_ssl_sessions_lock: threading.Lock = threading.Lock()
+
+
+@functools.lru_cache(maxsize=None)
+def _redshift_ssl_context(sslmode: str, ca_path: str = _REDSHIFT_CA_BUNDLE) -> "SSLContext":
+    """
+    Returns an SSL context requiring the server certificate to be signed by a trusted CA, trusting the system CAs and
+    the CA bundle at ``ca_path``, the Amazon Redshift CA bundle shipped with this package by default. Hostname checking
+    is enabled for sslmode ``verify-full``.
+
+    Loading the CA certificates is costly, so a context is created once per sslmode and CA bundle and shared by all
+    connections of the process. It must not be modified.
+    """
+    from ssl import CERT_REQUIRED, SSLContext
+
+    # ssl_context = ssl.create_default_context()
+
+    ssl_context: SSLContext = SSLContext()
+    ssl_context.verify_mode = CERT_REQUIRED
+    ssl_context.load_default_certs()
+    _logger.debug("try to load Redshift CA certs from location %s", ca_path)
+    ssl_context.load_verify_locations(ca_path)
+    if sslmode == "verify-full":
+        ssl_context.check_hostname = True
+    return ssl_context
+
+
+def _get_ssl_session(ssl_context: "SSLContext", host: str, port: int) -> typing.Optional["SSLSession"]:
+    """
+    Returns the TLS session last established by ``ssl_context`` with ``host`` and ``port``, if any.
+    """
+    with _ssl_sessions_lock:
+        return _ssl_sessions.get(ssl_context, {}).get((host, port))
+
+
+def _put_ssl_session(ssl_context: "SSLContext", host: str, port: int, sock: "SSLSocket") -> None:
+    """
+    Stores the TLS session of ``sock`` for the next connection to ``host`` and ``port`` using ``ssl_context`` to
+    resume, skipping the full handshake. With TLS 1.3 the session is sent by the server following the handshake, so
+    this is called once the first server response was read.
+    """
+    ssl_session: typing.Optional["SSLSession"] = sock.session
+    if ssl_session is None or not (ssl_session.has_ticket or ssl_session.id):
+        return
+    with _ssl_sessions_lock:
+        _ssl_sessions.setdefault(ssl_context, {})[(host, port)] = ssl_session
+
+
+def _enable_tcp_keepalive(
+    sock: socket.socket,
+    tcp_keepalive_idle: typing.Optional[int],
+    tcp_keepalive_interval: typing.Optional[int],
+    tcp_keepalive_count: typing.Optional[int],
+) -> None:
+    """
+    Enables TCP keepalives on ``sock``, applying the given keepalive parameters where supported by the platform.
+    """
+    _logger.debug("enabling tcp keepalive on socket")
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+
+    # Set TCP keepalive parameters if supported by platform and values are defined
+    if tcp_keepalive_idle is not None:
+        # Mac OS X uses TCP_KEEPALIVE instead of TCP_KEEPIDLE
+        if hasattr(socket, "TCP_KEEPIDLE"):
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, tcp_keepalive_idle)
+            _logger.debug(f"Set TCP_KEEPIDLE to {tcp_keepalive_idle}")
+        elif hasattr(socket, "TCP_KEEPALIVE"):  # macOS/BSD
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPALIVE, tcp_keepalive_idle)
+            _logger.debug(f"Set TCP_KEEPALIVE to {tcp_keepalive_idle}")
+        else:
+            _logger.warning("Neither TCP_KEEPIDLE nor TCP_KEEPALIVE supported on this platform")
+
+    if tcp_keepalive_interval is not None:
+        if hasattr(socket, "TCP_KEEPINTVL"):
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, tcp_keepalive_interval)
+            _logger.debug(f"Set TCP_KEEPINTVL to {tcp_keepalive_interval}")
+        else:
+            _logger.warning("TCP_KEEPINTVL not supported on this platform")
+
+    if tcp_keepalive_count is not None:
+        if hasattr(socket, "TCP_KEEPCNT"):
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPCNT, tcp_keepalive_count)
+            _logger.debug(f"Set TCP_KEEPCNT to {tcp_keepalive_count}")
+        else:
+            _logger.warning("TCP_KEEPCNT not supported on this platform")
+
+
+class _Pipeline:
+    """
+    Sends the Bind and Execute messages of parameter sets on a connection without waiting for the response to each,
+    reading responses once ``pipeline_size`` parameter sets were sent. A single Sync message ends the pipeline, so
+    when no transaction is in progress all parameter sets run in one implicit transaction, committed by :meth:`sync`
+    or rolled back as a whole if a parameter set fails or :meth:`abort` is called. Errors raised by the server hold
+    the index of the failed parameter set under the ``"parameter_set_index"`` key of their first argument. Used by
+    :meth:`Connection.executemany` and :meth:`Connection.executemany_encoded`.
+    """
+
+    def __init__(self: "_Pipeline", conn: "Connection", cursor: Cursor, pipeline_size: int) -> None:
+        if pipeline_size < 1:
+            raise InterfaceError("pipeline_size must be greater than 0")
+        if conn._suspended_portal_cursor is not None:
+            # the connection can only serve one extended-query cycle at a time
+            conn.close_portal()
+        if conn._background_read_cursor is not None:
+            conn.finish_background_read()
+        conn._reset_result(cursor)
+        self._conn: "Connection" = conn
+        self._cursor: Cursor = cursor
+        self._pipeline_size: int = pipeline_size
+        # prepared statements evicted from the statement cache or invalidated by a command, closed once the pipeline
+        # ended
+        self._statements_to_close: typing.List[bytes] = []
+        # whether the parameter sets run in an implicit transaction rather than in a transaction begun beforehand
+        self._implicit: bool = not conn.in_transaction
+        # the number of parameter sets sent, and the index of the first of them whose response was not read
+        self._num_sent: int = 0
+        self._pending_index: int = 0
+        # whether messages were sent since the last Sync message
+        self._pending_sync: bool = False
+        self._row_count: int = 0
+        self._counted: bool = True
+        conn._pipeline = self
+
+    def statement(
+        self: "_Pipeline",
+        cache: typing.Dict[str, typing.Any],
+        pid: int,
+        key: typing.Tuple,
+        statement: str,
+        params: typing.Tuple,
+    ) -> typing.Dict[str, typing.Any]:
+        """
+        Returns the prepared statement of ``statement`` for the parameters ``params``, held by ``cache`` under ``key``,
+        once the responses to the parameter sets sent were read, so that rows they return are decoded by the prepared
+        statement they are bound to. A statement not cached is prepared using Parse and Describe messages only.
+        """
+        self.read_responses()
+        conn: "Connection" = self._conn
+        ps: typing.Optional[typing.Dict[str, typing.Any]] = conn._cached_prepared_statement(self._cursor, cache, key)
+        if ps is None:
+            ps = conn._send_prepare(self._cursor, pid, statement, params, sync=False)
+            self._pending_sync = True
+            conn._handle_describe_messages(self._cursor)
+            if conn.error is not None:
+                self._fail(conn.error, self._num_sent)
+            conn._complete_prepared_statement(cache, key, ps, params, self._statements_to_close)
+        return ps
+
+    def send(self: "_Pipeline", bind: bytes) -> None:
+        """
+        Sends the Bind message of content ``bind`` followed by an Execute message, reading the responses to the
+        parameter sets sent once ``pipeline_size`` of them were not read.
+        """
+        self._conn._write(create_message(BIND, bind))
+        self._conn._write(EXECUTE_MSG)
+        self._pending_sync = True
+        self._num_sent += 1
+        if self._num_sent - self._pending_index == self._pipeline_size:
+            self.read_responses()
+
+    def read_responses(self: "_Pipeline") -> None:
+        """
+        Sends a Flush message and reads the responses to the parameter sets sent whose response was not read.
+        """
+        num_pending: int = self._num_sent - self._pending_index
+        if num_pending == 0:
+            return
+        self._conn._write(FLUSH_MSG)
+        self._conn._flush()
+        completed, count = self._conn._handle_pipelined_messages(self._cursor, num_pending)
+        self._count(count)
+        if self._conn.error is not None:
+            self._fail(self._conn.error, self._pending_index + completed)
+        self._pending_index += completed
+
+    def sync(self: "_Pipeline") -> None:
+        """
+        Sends the Sync message ending the pipeline and reads the remaining responses, setting the row count of the
+        cursor to the total number of rows affected.
+        """
+        try:
+            if self._pending_sync:
+                completed, count = self._end()
+                self._count(count)
+                if self._conn.error is not None:
+                    raise self._conn._with_parameter_set_index(self._conn.error, self._pending_index + completed)
+            self._cursor._row_count = self._row_count if self._counted and self._num_sent > 0 else -1
+            self._cursor._redshift_row_count = self._cursor._row_count
+        finally:
+            self._close()
+
+    def abort(self: "_Pipeline", error: Exception) -> Exception:
+        """
+        Ends the pipeline following ``error``, raised by the driver while parameter sets are sent, and returns the
+        error to raise. The parameter sets sent are not committed: an implicit transaction is failed by an Execute
+        message of a portal which does not exist, sent ahead of the Sync message. The error of a parameter set which
+        failed takes precedence over ``error``.
+        """
+        try:
+            if self._pending_sync:
+                num_pending: int = self._num_sent - self._pending_index
+                if self._implicit:
+                    self._conn._write(_ABORT_MSG)
+                completed, _ = self._end()
+                if completed < num_pending and self._conn.error is not None:
+                    return self._conn._with_parameter_set_index(self._conn.error, self._pending_index + completed)
+            return self._conn._with_parameter_set_index(error, self._num_sent)
+        finally:
+            self._close()
+
+    def _fail(self: "_Pipeline", error: Exception, index: int) -> typing.NoReturn:
+        """
+        Ends the pipeline following ``error``, received from the server for the parameter set of index ``index``.
+        """
+        try:
+            self._end()
+        finally:
+            self._close()
+        raise self._conn._with_parameter_set_index(error, index)
+
+    def _end(self: "_Pipeline") -> typing.Tuple[int, int]:
+        self._pending_sync = False
+        self._conn._write(SYNC_MSG)
+        self._conn._flush()
+        return self._conn._handle_pipelined_messages(self._cursor)
+
+    def _close(self: "_Pipeline") -> None:
+        """
+        Detaches the pipeline from the connection once it ended, and closes the prepared statements to close.
+        """
+        self._conn._pipeline = None
+        statements: typing.List[bytes] = self._statements_to_close
+        self._statements_to_close = []
+        for stmt in statements:
+            self._conn.close_prepared_statement(stmt)
+
+    def _count(self: "_Pipeline", count: int) -> None:
+        self._row_count += max(count, 0)
+        self._counted = self._counted and count != -1
 
 
 class Connection:
@@ -372,6 +728,30 @@ class Connection:
     ProgrammingError = property(lambda self: self._getError(ProgrammingError))
     NotSupportedError = property(lambda self: self._getError(NotSupportedError))
 
+    # The cursor whose (unnamed) portal was suspended by the server after reaching the row limit of an
+    # Execute message. While set, the connection is mid extended-query cycle and the remaining rows are
+    # fetched on demand by the cursor. See ``Cursor.execute(stream_rows=True)``.
+    _suspended_portal_cursor: typing.Optional[Cursor] = None
+
+    # When enabled, responses to statements are read by :func:`Connection.handle_messages_chunked_socket_read`.
+    # See ``Cursor.execute(chunked_socket_read=True)``.
+    chunked_socket_read: bool = False
+    _message_reader: typing.Optional[MessageReader] = None
+
+    # The cursor whose response is being read by a background thread, and the reader. While set, the connection
+    # is mid extended-query cycle and the messages read ahead are handled as the cursor fetches rows. See
+    # ``Cursor.execute(background_read=True)``.
+    _background_read_cursor: typing.Optional[Cursor] = None
+    _background_reader: typing.Optional[BackgroundMessageReader] = None
+
+    # The pipeline of parameter sets open on the connection, if any. While set, prepared statements invalidated by a
+    # command are closed once the pipeline ended, as the Sync message closing each would end it part way.
+    _pipeline: typing.Optional[_Pipeline] = None
+    # encoding plans of Connection.make_params, keyed by the types of the values, and the versions of the mappings
+    # they were made from
+    _param_plans: typing.Optional[typing.Dict[typing.Tuple[type, ...], typing.Tuple]] = None
+    _param_plans_source: typing.Optional[typing.Tuple[int, int]] = None
+
     def __enter__(self: "Connection") -> "Connection":
         return self
 
@@ -382,6 +762,31 @@ class Connection:
         warn("DB-API extension connection.%s used" % error.__name__, stacklevel=3)
         return error
 
+    @property
+    def py_types(self: "Connection") -> typing.Dict:
+        """
+        The type OID, format code and send function of bind parameters, keyed by their Python type. May be modified in
+        place or replaced, taking effect for the next statement executed.
+        """
+        return self._py_types
+
+    @py_types.setter
+    def py_types(self: "Connection", value: typing.Dict) -> None:
+        self._py_types: _TypeMap = value if isinstance(value, _TypeMap) else _TypeMap(value)
+
+    @property
+    def inspect_funcs(self: "Connection") -> typing.Dict[type, typing.Callable]:
+        """
+        The functions returning the type OID, format code and send function of a bind parameter value, keyed by the
+        Python types whose parameters depend on the value. May be modified in place or replaced, taking effect for the
+        next statement executed.
+        """
+        return self._inspect_funcs
+
+    @inspect_funcs.setter
+    def inspect_funcs(self: "Connection", value: typing.Dict[type, typing.Callable]) -> None:
+        self._inspect_funcs: _TypeMap = value if isinstance(value, _TypeMap) else _TypeMap(value)
+
     @property
     def client_os_version(self: "Connection") -> str:
         from platform import platform as CLIENT_PLATFORM
@@ -430,12 +835,14 @@ class Connection:
         provider_name: typing.Optional[str] = None,
         web_identity_token: typing.Optional[str] = None,
         numeric_to_float: bool = False,
+        binary_parameters: bool = False,
         identity_namespace: typing.Optional[str] = None,
         token_type: typing.Optional[str] = None,
         idc_client_display_name: typing.Optional[str] = None,
         access_key_id: typing.Optional[str] = None,
         secret_access_key: typing.Optional[str] = None,
         session_token: typing.Optional[str] = None,
+        ssl_context: typing.Optional["SSLContext"] = None,
     ):
         """
         Creates a :class:`Connection` to an Amazon Redshift cluster. For more information on establishing a connection to an Amazon Redshift cluster using `federated API access <https://aws.amazon.com/blogs/big-data/federated-api-access-to-amazon-redshift-using-an-amazon-redshift-connector-for-python/>`_ see our examples page.
@@ -484,6 +891,8 @@ class Connection:
             A web identity token used for authentication via Redshift Native IDP Integration
         numeric_to_float: bool
             Specifies if NUMERIC datatype values will be converted from ``decimal.Decimal`` to ``float``. By default NUMERIC values are received as ``decimal.Decimal``.
+        binary_parameters: bool
+            Specifies if ``datetime.date`` and ``datetime.time`` parameters are sent in binary format rather than as text. Only used with the binary client protocol. Default value is False.
         identity_namespace: Optional[str]
             The identity namespace to be used with IdC auth plugin. Default value is None.
         token_type: Optional[str]
@@ -496,129 +905,52 @@ class Connection:
             The AWS secret access key for identity-enhanced credentials flow with IdpTokenAuthPlugin.
         session_token: Optional[str]
             The AWS session token for identity-enhanced credentials flow with IdpTokenAuthPlugin.
+        ssl_context: Optional[ssl.SSLContext]
+            The SSL context used in place of the one shared by connections using the same ``sslmode``. The host name is checked if ``check_hostname`` is set on the context.
         """
-        self.merge_socket_read = True
-
-        _client_encoding = "utf8"
-        self._commands_with_count: typing.Tuple[bytes, ...] = (
-            b"INSERT",
-            b"DELETE",
-            b"UPDATE",
-            b"MOVE",
-            b"FETCH",
-            b"COPY",
-            b"SELECT",
-        )
-        self.notifications: deque = deque(maxlen=100)
-        self.notices: deque = deque(maxlen=100)
-        self.parameter_statuses: deque = deque(maxlen=100)
-        self.max_prepared_statements: int = int(self.get_max_prepared_statement(max_prepared_statements))
-        self._run_cursor: Cursor = Cursor(self, paramstyle=DbApiParamstyle.NAMED.value)
-        self._client_protocol_version: int = client_protocol_version
-        self._database = database
-        self.py_types = deepcopy(PY_TYPES)
-        self.redshift_types = deepcopy(REDSHIFT_TYPES)
-        self._database_metadata_current_db_only: bool = database_metadata_current_db_only
-        self.numeric_to_float: bool = numeric_to_float
-
-        # based on _client_protocol_version value, we must use different conversion functions
-        # for receiving some datatypes
-        self._enable_protocol_based_conversion_funcs()
-
-        self.web_identity_token = web_identity_token
-
-        if user is None:
-            raise InterfaceError("The 'user' connection parameter cannot be None")
-
-        redshift_native_auth: bool = False
-
         if application_name is None or application_name == "":
 
             def get_calling_module() -> str:
-                import inspect
-
                 module_name: str = ""
-                stack: typing.List[inspect.FrameInfo] = inspect.stack()
                 try:
                     # get_calling_module  -> init -> connect -> init -> calling module
-                    start: int = min(4, len(stack) - 1)
-                    parent = stack[start][0]
-                    calling_module = inspect.getmodule(parent)
-
-                    if calling_module:
-                        module_name = calling_module.__name__
+                    frame = sys._getframe()
+                    for _ in range(4):
+                        if frame.f_back is None:
+                            break
+                        frame = frame.f_back
+                    module_name = frame.f_globals.get("__name__", "")
                 except:
                     pass
-                finally:
-                    del parent
-                    del stack
 
                 return module_name
 
             application_name = get_calling_module()
-        init_params: typing.Dict[str, typing.Optional[typing.Union[str, bytes]]] = {
-            "user": "",
-            "database": database,
-            "application_name": application_name,
-            "client_protocol_version": str(self._client_protocol_version),
-            "driver_version": DriverInfo.driver_full_name(),
-            "os_version": self.client_os_version,
-            "driver_discovery_version": str(DRIVER_DISCOVERY_VERSION),
-        }
-
-        if credentials_provider:
-            init_params["plugin_name"] = credentials_provider
-
-            if credentials_provider.split(".")[-1] in (
-                "BasicJwtCredentialsProvider",
-                "BrowserAzureOAuth2CredentialsProvider",
-            ):
-                redshift_native_auth = True
-                init_params["idp_type"] = "AzureAD"
-
-            if credentials_provider.split(".")[-1] in (
-                "IdpTokenAuthPlugin",
-                "BrowserIdcAuthPlugin",
-            ):
-                redshift_native_auth = True
-                self.set_idc_plugins_params(init_params, credentials_provider,
-                    identity_namespace, token_type, idc_client_display_name,
-                    access_key_id, secret_access_key, session_token
-                )
-
-            if redshift_native_auth and provider_name:
-                init_params["provider_name"] = provider_name
-
-        if not redshift_native_auth or user:
-            init_params["user"] = user
-
-        _logger.debug(make_divider_block())
-        _logger.debug("Building Redshift wire protocol start-up packet")
-        _logger.debug(init_params)
-        _logger.debug(make_divider_block())
-
-        for k, v in tuple(init_params.items()):
-            if isinstance(v, str):
-                init_params[k] = v.encode("utf8")
-            elif v is None:
-                del init_params[k]
-            elif not isinstance(v, (bytes, bytearray)):
-                raise InterfaceError("The parameter " + k + " can't be of type " + str(type(v)) + ".")
-
-        if "user" in init_params:
-            self.user: bytes = typing.cast(bytes, init_params["user"])
-        else:
-            self.user = b""
-
-        if isinstance(password, str):
-            self.password: bytes = password.encode("utf8")
-        else:
-            self.password = password
-
-        self.autocommit: bool = False
-        self._xid = None
+        init_params: typing.Dict[str, bytes] = self._init_session(
+            user=user,
+            password=password,
+            database=database,
+            application_name=application_name,
+            max_prepared_statements=max_prepared_statements,
+            client_protocol_version=client_protocol_version,
+            database_metadata_current_db_only=database_metadata_current_db_only,
+            credentials_provider=credentials_provider,
+            provider_name=provider_name,
+            web_identity_token=web_identity_token,
+            numeric_to_float=numeric_to_float,
+            binary_parameters=binary_parameters,
+            identity_namespace=identity_namespace,
+            token_type=token_type,
+            idc_client_display_name=idc_client_display_name,
+            access_key_id=access_key_id,
+            secret_access_key=secret_access_key,
+            session_token=session_token,
+        )
 
-        self._caches: typing.Dict = {}
+        # the address connected to, and the socket options, are reused to send cancel requests
+        self._address: typing.Union[typing.Tuple[str, int], str, None] = None
+        self._source_address: typing.Optional[str] = source_address
+        self._timeout: typing.Optional[int] = timeout
 
         # Create the TCP/Ip socket and connect to specific database
         # if there already has a socket, it will not create new connection when run connect again
@@ -645,30 +977,19 @@ class Connection:
                 hostport: typing.Tuple[str, int] = Connection.__get_host_address_info(host, port)
                 _logger.debug("Attempting to create connection socket with address %s", hostport)
                 self._usock.connect(hostport)
+                self._address = hostport
             elif unix_sock is not None:
                 _logger.debug("connecting to socket with unix socket")
                 self._usock.connect(unix_sock)
+                self._address = unix_sock
 
             _logger.debug("Connection socket established")
             # For Redshift, we the default ssl approve is True
             # create ssl connection with Redshift CA certificates and check the hostname
             if ssl is True:
                 try:
-                    from ssl import CERT_REQUIRED, SSLContext
-
-                    # ssl_context = ssl.create_default_context()
-
-                    path = os.path.abspath(__file__)
-                    if os.name == "nt":
-                        path = "\\".join(path.split("\\")[:-1]) + "\\files\\redshift-ca-bundle.crt"
-                    else:
-                        path = "/".join(path.split("/")[:-1]) + "/files/redshift-ca-bundle.crt"
-
-                    ssl_context: SSLContext = SSLContext()
-                    ssl_context.verify_mode = CERT_REQUIRED
-                    ssl_context.load_default_certs()
-                    _logger.debug("try to load Redshift CA certs from location %s", path)
-                    ssl_context.load_verify_locations(path)
+                    if ssl_context is None:
+                        ssl_context = _redshift_ssl_context(sslmode)
 
                     # Int32(8) - Message length, including self.
                     # Int32(80877103) - The SSL request code.
@@ -679,15 +1000,18 @@ class Connection:
                         _logger.debug("Server response code when attempting to establish ssl connection: %s", resp)
                         raise InterfaceError("Server refuses SSL")
 
-                    if sslmode == "verify-ca":
+                    if sslmode in ("verify-ca", "verify-full"):
                         _logger.debug("applying sslmode=%s to socket", sslmode)
-                        self._usock = ssl_context.wrap_socket(self._usock)
-                    elif sslmode == "verify-full":
-                        _logger.debug("applying sslmode=%s to socket and force check_hostname", sslmode)
-                        ssl_context.check_hostname = True
-                        self._usock = ssl_context.wrap_socket(self._usock, server_hostname=host)
+                        # the host name is checked if the context requires it, as it does for verify-full
+                        self._usock = ssl_context.wrap_socket(
+                            self._usock,
+                            server_hostname=host if ssl_context.check_hostname else None,
+                            session=_get_ssl_session(ssl_context, host, port),
+                        )
+                        _logger.debug("TLS session reused: %s", self._usock.session_reused)
                     else:
                         _logger.debug("unknown sslmode=%s is ignored", sslmode)
+                        ssl_context = None
                     _logger.debug("Socket SSL details: %s", self._usock.cipher())  # type: ignore
 
                 except ImportError:
@@ -695,34 +1019,7 @@ class Connection:
 
             self._sock = self._usock.makefile(mode="rwb")
             if tcp_keepalive:
-                _logger.debug("enabling tcp keepalive on socket")
-                self._usock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
-
-                # Set TCP keepalive parameters if supported by platform and values are defined
-                if tcp_keepalive_idle is not None:
-                    # Mac OS X uses TCP_KEEPALIVE instead of TCP_KEEPIDLE
-                    if hasattr(socket, "TCP_KEEPIDLE"):
-                        self._usock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, tcp_keepalive_idle)
-                        _logger.debug(f"Set TCP_KEEPIDLE to {tcp_keepalive_idle}")
-                    elif hasattr(socket, "TCP_KEEPALIVE"):  # macOS/BSD
-                        self._usock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPALIVE, tcp_keepalive_idle)
-                        _logger.debug(f"Set TCP_KEEPALIVE to {tcp_keepalive_idle}")
-                    else:
-                        _logger.warning("Neither TCP_KEEPIDLE nor TCP_KEEPALIVE supported on this platform")
-
-                if tcp_keepalive_interval is not None:
-                    if hasattr(socket, "TCP_KEEPINTVL"):
-                        self._usock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, tcp_keepalive_interval)
-                        _logger.debug(f"Set TCP_KEEPINTVL to {tcp_keepalive_interval}")
-                    else:
-                        _logger.warning("TCP_KEEPINTVL not supported on this platform")
-
-                if tcp_keepalive_count is not None:
-                    if hasattr(socket, "TCP_KEEPCNT"):
-                        self._usock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPCNT, tcp_keepalive_count)
-                        _logger.debug(f"Set TCP_KEEPCNT to {tcp_keepalive_count}")
-                    else:
-                        _logger.warning("TCP_KEEPCNT not supported on this platform")
+                _enable_tcp_keepalive(self._usock, tcp_keepalive_idle, tcp_keepalive_interval, tcp_keepalive_count)
 
         except socket.timeout as timeout_error:
             self._usock.close()
@@ -738,67 +1035,14 @@ class Connection:
         self._flush: typing.Callable = self._sock.flush
         self._read: typing.Callable = self._sock.read
         self._write: typing.Callable = self._sock.write
-        self._backend_key_data: typing.Optional[bytes] = None
-
-        trans_tab = dict(zip(map(ord, "{}"), "[]"))
-        glbls = {"Decimal": Decimal}
-
-        self.inspect_funcs: typing.Dict[type, typing.Callable] = {
-            Datetime: self.inspect_datetime,
-            list: self.array_inspect,
-            tuple: self.array_inspect,
-            int: self.inspect_int,
-        }
-
-        # it's a dictionary whose key is type of message,
-        # value is the corresponding function to process message
-        self.message_types: typing.Dict[bytes, typing.Callable] = {
-            NOTICE_RESPONSE: self.handle_NOTICE_RESPONSE,
-            AUTHENTICATION_REQUEST: self.handle_AUTHENTICATION_REQUEST,
-            PARAMETER_STATUS: self.handle_PARAMETER_STATUS,
-            BACKEND_KEY_DATA: self.handle_BACKEND_KEY_DATA,
-            READY_FOR_QUERY: self.handle_READY_FOR_QUERY,
-            ROW_DESCRIPTION: self.handle_ROW_DESCRIPTION,
-            ERROR_RESPONSE: self.handle_ERROR_RESPONSE,
-            EMPTY_QUERY_RESPONSE: self.handle_EMPTY_QUERY_RESPONSE,
-            DATA_ROW: self.handle_DATA_ROW,
-            COMMAND_COMPLETE: self.handle_COMMAND_COMPLETE,
-            PARSE_COMPLETE: self.handle_PARSE_COMPLETE,
-            BIND_COMPLETE: self.handle_BIND_COMPLETE,
-            CLOSE_COMPLETE: self.handle_CLOSE_COMPLETE,
-            PORTAL_SUSPENDED: self.handle_PORTAL_SUSPENDED,
-            NO_DATA: self.handle_NO_DATA,
-            PARAMETER_DESCRIPTION: self.handle_PARAMETER_DESCRIPTION,
-            NOTIFICATION_RESPONSE: self.handle_NOTIFICATION_RESPONSE,
-        }
-
-        # Int32 - Message length, including self.
-        # Int32(196608) - Protocol version number.  Version 3.0.
-        # Any number of key/value pairs, terminated by a zero byte:
-        #   String - A parameter name (user, database, or options)
-        #   String - Parameter value
-
-        # Conduct start-up communication with database
-        # Message's first part is the protocol version - Int32(196608)
-        protocol: int = 196608
-        val: bytearray = bytearray(i_pack(protocol))
-
-        # Message include parameters name and value (user, database, application_name)
-        for k, v in init_params.items():
-            val.extend(k.encode("ascii") + NULL_BYTE + typing.cast(bytes, v) + NULL_BYTE)
-        val.append(0)
 
         _logger.debug("Sending start-up parameters to BE")
         # Use write and flush function to write the content of the buffer
         # and then send the message to the database
-        self._write(i_pack(len(val) + 4))
-        self._write(val)
+        self._write(self._startup_packet(init_params))
         self._flush()
 
-        self._cursor: Cursor = self.cursor()
-
         code = None
-        self.error: typing.Optional[Exception] = None
         _logger.debug("Awaiting BE response to start-up parameters")
         # When driver send the start-up message to database, DB will respond multi messages to driver
         # whose format is same with the message that driver sent to DB.
@@ -828,32 +1072,226 @@ class Connection:
             _logger.debug("Error occurred during start up communication: %s", self.error)
             raise self.error
 
-        # if we didn't receive a server_protocol_version from the server, default to
-        # using BASE_SERVER as the server is likely lacking this functionality due to
-        # being out of date
-        if (
-            self._client_protocol_version > ClientProtocolVersion.BASE_SERVER
-            and not (b"server_protocol_version", str(self._client_protocol_version).encode()) in self.parameter_statuses
-        ):
-            _logger.debug("Server_protocol_version not received from server")
-            self._client_protocol_version = ClientProtocolVersion.BASE_SERVER
-            self._enable_protocol_based_conversion_funcs()
-
-        self.in_transaction = False
+        if ssl is True and ssl_context is not None:
+            _put_ssl_session(ssl_context, host, port, typing.cast("SSLSocket", self._usock))
+        self._finish_startup()
         _logger.debug("Connection.__init__ completed")
 
-    def _enable_protocol_based_conversion_funcs(self: "Connection"):
-        if self._client_protocol_version >= ClientProtocolVersion.BINARY.value:
-            _logger.debug("Enabling binary protocol data conversion functions")
-            self.redshift_types[RedshiftOID.NUMERIC] = (FC_BINARY, numeric_in_binary)
-            self.redshift_types[RedshiftOID.DATE] = (FC_BINARY, date_recv_binary)
-            self.redshift_types[RedshiftOID.GEOGRAPHY] = (FC_BINARY, geographyhex_recv)  # GEOGRAPHY
-            self.redshift_types[RedshiftOID.TIME] = (FC_BINARY, time_recv_binary)
-            self.redshift_types[RedshiftOID.TIMETZ] = (FC_BINARY, timetz_recv_binary)
-            self.redshift_types[RedshiftOID.CHAR_ARRAY] = (FC_BINARY, array_recv_binary)  # CHAR[]
-            self.redshift_types[RedshiftOID.SMALLINT_ARRAY] = (FC_BINARY, array_recv_binary)  # INT2[]
-            self.redshift_types[RedshiftOID.INTEGER_ARRAY] = (FC_BINARY, array_recv_binary)  # INT4[]
-            self.redshift_types[RedshiftOID.TEXT_ARRAY] = (FC_BINARY, array_recv_binary)  # TEXT[]
+    def _init_session(
+        self: "Connection",
+        user: str,
+        password: str,
+        database: str,
+        application_name: typing.Optional[str],
+        max_prepared_statements: int = DEFAULT_MAX_PREPARED_STATEMENTS,
+        client_protocol_version: int = DEFAULT_PROTOCOL_VERSION,
+        database_metadata_current_db_only: bool = True,
+        credentials_provider: typing.Optional[str] = None,
+        provider_name: typing.Optional[str] = None,
+        web_identity_token: typing.Optional[str] = None,
+        numeric_to_float: bool = False,
+        binary_parameters: bool = False,
+        identity_namespace: typing.Optional[str] = None,
+        token_type: typing.Optional[str] = None,
+        idc_client_display_name: typing.Optional[str] = None,
+        access_key_id: typing.Optional[str] = None,
+        secret_access_key: typing.Optional[str] = None,
+        session_token: typing.Optional[str] = None,
+    ) -> typing.Dict[str, bytes]:
+        """
+        Sets up the state of the connection which precedes opening its socket, returning the parameters of the
+        start-up packet. Takes the arguments of :class:`Connection` of the same name. Also used by
+        :class:`redshift_connector.aio.AsyncConnection`, which opens its socket using asyncio.
+        """
+        self.merge_socket_read = True
+
+        _client_encoding = "utf8"
+        self._commands_with_count: typing.Tuple[bytes, ...] = (
+            b"INSERT",
+            b"DELETE",
+            b"UPDATE",
+            b"MOVE",
+            b"FETCH",
+            b"COPY",
+            b"SELECT",
+        )
+        self.notifications: deque = deque(maxlen=100)
+        self.notices: deque = deque(maxlen=100)
+        self.parameter_statuses: deque = deque(maxlen=100)
+        self.max_prepared_statements: int = int(self.get_max_prepared_statement(max_prepared_statements))
+        self._run_cursor: Cursor = Cursor(self, paramstyle=DbApiParamstyle.NAMED.value)
+        self._client_protocol_version: int = client_protocol_version
+        self._database = database
+        self.py_types = deepcopy(PY_TYPES)
+        self.redshift_types = deepcopy(REDSHIFT_TYPES)
+        self._database_metadata_current_db_only: bool = database_metadata_current_db_only
+        self.numeric_to_float: bool = numeric_to_float
+        self.binary_parameters: bool = binary_parameters
+
+        # based on _client_protocol_version value, we must use different conversion functions
+        # for receiving some datatypes
+        self._enable_protocol_based_conversion_funcs()
+
+        self.web_identity_token = web_identity_token
+
+        if user is None:
+            raise InterfaceError("The 'user' connection parameter cannot be None")
+
+        redshift_native_auth: bool = False
+
+        init_params: typing.Dict[str, typing.Optional[typing.Union[str, bytes]]] = {
+            "user": "",
+            "database": database,
+            "application_name": application_name,
+            "client_protocol_version": str(self._client_protocol_version),
+            "driver_version": DriverInfo.driver_full_name(),
+            "os_version": self.client_os_version,
+            "driver_discovery_version": str(DRIVER_DISCOVERY_VERSION),
+        }
+
+        if credentials_provider:
+            init_params["plugin_name"] = credentials_provider
+
+            if credentials_provider.split(".")[-1] in (
+                "BasicJwtCredentialsProvider",
+                "BrowserAzureOAuth2CredentialsProvider",
+            ):
+                redshift_native_auth = True
+                init_params["idp_type"] = "AzureAD"
+
+            if credentials_provider.split(".")[-1] in (
+                "IdpTokenAuthPlugin",
+                "BrowserIdcAuthPlugin",
+            ):
+                redshift_native_auth = True
+                self.set_idc_plugins_params(init_params, credentials_provider,
+                    identity_namespace, token_type, idc_client_display_name,
+                    access_key_id, secret_access_key, session_token
+                )
+
+            if redshift_native_auth and provider_name:
+                init_params["provider_name"] = provider_name
+
+        if not redshift_native_auth or user:
+            init_params["user"] = user
+
+        _logger.debug(make_divider_block())
+        _logger.debug("Building Redshift wire protocol start-up packet")
+        _logger.debug(init_params)
+        _logger.debug(make_divider_block())
+
+        for k, v in tuple(init_params.items()):
+            if isinstance(v, str):
+                init_params[k] = v.encode("utf8")
+            elif v is None:
+                del init_params[k]
+            elif not isinstance(v, (bytes, bytearray)):
+                raise InterfaceError("The parameter " + k + " can't be of type " + str(type(v)) + ".")
+
+        if "user" in init_params:
+            self.user: bytes = typing.cast(bytes, init_params["user"])
+        else:
+            self.user = b""
+
+        if isinstance(password, str):
+            self.password: bytes = password.encode("utf8")
+        else:
+            self.password = password
+
+        self.autocommit: bool = False
+        self._xid = None
+
+        self._caches: typing.Dict = {}
+
+        self._backend_key_data: typing.Optional[bytes] = None
+
+        trans_tab = dict(zip(map(ord, "{}"), "[]"))
+        glbls = {"Decimal": Decimal}
+
+        self.inspect_funcs = {
+            Datetime: self.inspect_datetime,
+            list: self.array_inspect,
+            tuple: self.array_inspect,
+            int: self.inspect_int,
+        }
+
+        # it's a dictionary whose key is type of message,
+        # value is the corresponding function to process message
+        self.message_types: typing.Dict[bytes, typing.Callable] = {
+            NOTICE_RESPONSE: self.handle_NOTICE_RESPONSE,
+            AUTHENTICATION_REQUEST: self.handle_AUTHENTICATION_REQUEST,
+            PARAMETER_STATUS: self.handle_PARAMETER_STATUS,
+            BACKEND_KEY_DATA: self.handle_BACKEND_KEY_DATA,
+            READY_FOR_QUERY: self.handle_READY_FOR_QUERY,
+            ROW_DESCRIPTION: self.handle_ROW_DESCRIPTION,
+            ERROR_RESPONSE: self.handle_ERROR_RESPONSE,
+            EMPTY_QUERY_RESPONSE: self.handle_EMPTY_QUERY_RESPONSE,
+            DATA_ROW: self.handle_DATA_ROW,
+            COMMAND_COMPLETE: self.handle_COMMAND_COMPLETE,
+            PARSE_COMPLETE: self.handle_PARSE_COMPLETE,
+            BIND_COMPLETE: self.handle_BIND_COMPLETE,
+            CLOSE_COMPLETE: self.handle_CLOSE_COMPLETE,
+            PORTAL_SUSPENDED: self.handle_PORTAL_SUSPENDED,
+            NO_DATA: self.handle_NO_DATA,
+            PARAMETER_DESCRIPTION: self.handle_PARAMETER_DESCRIPTION,
+            NOTIFICATION_RESPONSE: self.handle_NOTIFICATION_RESPONSE,
+        }
+
+        self._cursor: Cursor = self.cursor()
+        self.error: typing.Optional[Exception] = None
+        return typing.cast(typing.Dict[str, bytes], init_params)
+
+    def _startup_packet(self: "Connection", init_params: typing.Dict[str, bytes]) -> bytes:
+        """
+        Returns the start-up packet of the session, holding the parameters returned by :meth:`_init_session`.
+        """
+        # Int32 - Message length, including self.
+        # Int32(196608) - Protocol version number.  Version 3.0.
+        # Any number of key/value pairs, terminated by a zero byte:
+        #   String - A parameter name (user, database, or options)
+        #   String - Parameter value
+
+        # Conduct start-up communication with database
+        # Message's first part is the protocol version - Int32(196608)
+        protocol: int = 196608
+        val: bytearray = bytearray(i_pack(protocol))
+
+        # Message include parameters name and value (user, database, application_name)
+        for k, v in init_params.items():
+            val.extend(k.encode("ascii") + NULL_BYTE + typing.cast(bytes, v) + NULL_BYTE)
+        val.append(0)
+
+        return i_pack(len(val) + 4) + val
+
+    def _finish_startup(self: "Connection") -> None:
+        """
+        Applies the outcome of a successful start-up of the session.
+        """
+        # if we didn't receive a server_protocol_version from the server, default to
+        # using BASE_SERVER as the server is likely lacking this functionality due to
+        # being out of date
+        if (
+            self._client_protocol_version > ClientProtocolVersion.BASE_SERVER
+            and not (b"server_protocol_version", str(self._client_protocol_version).encode()) in self.parameter_statuses
+        ):
+            _logger.debug("Server_protocol_version not received from server")
+            self._client_protocol_version = ClientProtocolVersion.BASE_SERVER
+            self._enable_protocol_based_conversion_funcs()
+
+        self.in_transaction = False
+
+    def _enable_protocol_based_conversion_funcs(self: "Connection"):
+        if self._client_protocol_version >= ClientProtocolVersion.BINARY.value:
+            _logger.debug("Enabling binary protocol data conversion functions")
+            self.redshift_types[RedshiftOID.NUMERIC] = (FC_BINARY, numeric_in_binary)
+            self.redshift_types[RedshiftOID.DATE] = (FC_BINARY, date_recv_binary)
+            self.redshift_types[RedshiftOID.GEOGRAPHY] = (FC_BINARY, geographyhex_recv)  # GEOGRAPHY
+            self.redshift_types[RedshiftOID.TIME] = (FC_BINARY, time_recv_binary)
+            self.redshift_types[RedshiftOID.TIMETZ] = (FC_BINARY, timetz_recv_binary)
+            self.redshift_types[RedshiftOID.CHAR_ARRAY] = (FC_BINARY, array_recv_binary)  # CHAR[]
+            self.redshift_types[RedshiftOID.SMALLINT_ARRAY] = (FC_BINARY, array_recv_binary)  # INT2[]
+            self.redshift_types[RedshiftOID.INTEGER_ARRAY] = (FC_BINARY, array_recv_binary)  # INT4[]
+            self.redshift_types[RedshiftOID.TEXT_ARRAY] = (FC_BINARY, array_recv_binary)  # TEXT[]
             self.redshift_types[RedshiftOID.VARCHAR_ARRAY] = (FC_BINARY, array_recv_binary)  # VARCHAR[]
             self.redshift_types[RedshiftOID.REAL_ARRAY] = (FC_BINARY, array_recv_binary)  # FLOAT4[]
             self.redshift_types[RedshiftOID.OID_ARRAY] = (FC_BINARY, array_recv_binary)  # OID[]
@@ -864,6 +1302,11 @@ class Connection:
                 _logger.debug("Enabling numeric to float binary conversion function")
                 self.redshift_types[RedshiftOID.NUMERIC] = (FC_BINARY, numeric_to_float_binary)
 
+            if self.binary_parameters:
+                _logger.debug("Enabling binary parameter conversion functions")
+                self.py_types[date] = (RedshiftOID.DATE, FC_BINARY, date_send_integer)
+                self.py_types[time] = (RedshiftOID.TIME, FC_BINARY, time_send_integer)
+
         else:  # text protocol
             _logger.debug("Enabling text protocol data conversion functions")
             self.redshift_types[RedshiftOID.NUMERIC] = (FC_TEXT, numeric_in)
@@ -884,6 +1327,13 @@ class Connection:
             if self.numeric_to_float:
                 _logger.debug("Enabling numeric to float text conversion function")
                 self.redshift_types[RedshiftOID.NUMERIC] = (FC_TEXT, numeric_to_float_in)
+
+        if self.py_types[date][1] == FC_BINARY and not (
+            self.binary_parameters and self._client_protocol_version >= ClientProtocolVersion.BINARY.value
+        ):
+            # the server fell back to a protocol not accepting binary parameters
+            for typ in (date, time):
+                self.py_types[typ] = PY_TYPES[typ]
         _logger.debug("connection.redshift_types=%s", str(self.redshift_types))
 
     @property
@@ -1079,8 +1529,8 @@ class Connection:
 
     def handle_PORTAL_SUSPENDED(self: "Connection", data, cursor: Cursor):
         """
-        Handler for PortalSuspend message received via Amazon Redshift wire protocol, represented by b's' code. Currently a
-        no-op.
+        Handler for PortalSuspend message received via Amazon Redshift wire protocol, represented by b's' code. Records
+        the cursor as owning a suspended portal so the remaining rows can be fetched on demand.
 
         PortalSuspended (B)
             Byte1('s')
@@ -1101,6 +1551,7 @@ class Connection:
         None:None
         """
         _logger.debug("PortalSuspend received from BE")
+        self._suspended_portal_cursor = cursor
 
     def handle_PARAMETER_DESCRIPTION(self: "Connection", data, ps):
         """
@@ -1253,6 +1704,9 @@ class Connection:
         None:None
         """
         _logger.debug("Connection.close()")
+        if self._background_reader is not None:
+            self._background_reader.close()
+            self._background_read_cursor = self._background_reader = None
         try:
             # Byte1('X') - Identifies the message as a terminate message.
             # Int32(4) - Message length, including self.
@@ -1271,6 +1725,66 @@ class Connection:
             self._usock.close()
             self._sock = None  # type: ignore
 
+    def ping(self: "Connection") -> None:
+        """Checks the connection is usable by sending a Sync message and
+        reading the ReadyForQuery message the server responds with, which
+        takes a single round trip without running a statement. A suspended
+        portal is closed, and a response read in the background is read to
+        its end first.
+
+        Raises
+        ------
+        InterfaceError: If the connection is closed, or the server closed it.
+        """
+        if self._sock is None:
+            raise InterfaceError("connection is closed")
+        try:
+            # the Sync message would otherwise end the extended query cycle of the suspended portal or background read
+            self.close_portal()
+            self.finish_background_read()
+            self._write(SYNC_MSG)
+            self._flush()
+            self.handle_messages(self._cursor)
+        except socket.error as e:
+            raise InterfaceError("connection is broken: {}".format(e)) from e
+
+    def cancel(self: "Connection") -> None:
+        """Requests the server to cancel the statement running on this
+        connection, if any. The request is sent on a new connection to the
+        server, so may be made from another thread while a statement is
+        executing, which then fails with a :class:`ProgrammingError`. The
+        request has no effect if no statement is running once the server
+        handles it.
+
+        Raises
+        ------
+        InterfaceError: If the connection is closed, or the request could not be sent.
+        """
+        if self._sock is None or self._address is None:
+            raise InterfaceError("connection is closed")
+        if self._backend_key_data is None:
+            raise InterfaceError("cancel is not supported as the server did not send BackendKeyData")
+
+        _logger.debug("Sending CancelRequest to BE")
+        family: int = socket.AF_UNIX if isinstance(self._address, str) else socket.AF_INET
+        sock: socket.socket = socket.socket(family, socket.SOCK_STREAM)
+        try:
+            sock.settimeout(self._timeout)
+            if self._source_address is not None and family == socket.AF_INET:
+                sock.bind((self._source_address, 0))
+            sock.connect(self._address)
+            # Int32(16) - Message length, including self.
+            # Int32(80877102) - The cancel request code.
+            # Int32 - The process ID of the target backend.
+            # Int32 - The secret key for the target backend.
+            sock.sendall(ii_pack(16, 80877102) + self._backend_key_data)
+            # the server closes the connection without responding once it handled the request
+            sock.recv(1)
+        except socket.error as e:
+            raise InterfaceError("communication error", e)
+        finally:
+            sock.close()
+
     def handle_AUTHENTICATION_REQUEST(self: "Connection", data: bytes, cursor: Cursor) -> None:
         """
         Handler for AuthenticationRequest message received via Amazon Redshift wire protocol, represented by
@@ -1347,6 +1861,8 @@ class Connection:
             _logger.debug("BE requested SASL authentication")
             mechanisms: typing.List[str] = [m.decode("ascii") for m in data[4:-1].split(NULL_BYTE)]
 
+            from scramp import ScramClient  # type: ignore
+
             self.auth: ScramClient = ScramClient(mechanisms, self.user.decode("utf8"), self.password.decode("utf8"))
 
             init: bytes = self.auth.get_client_first().encode("utf8")
@@ -1500,70 +2016,133 @@ class Connection:
         return self.py_types[Decimal]
 
     def make_params(self: "Connection", values) -> typing.Tuple[typing.Tuple[int, int, typing.Callable], ...]:
-        params: typing.List[typing.Tuple[int, int, typing.Callable]] = []
-        for value in values:
-            typ: typing.Type = type(value)
+        """
+        Returns the type OID, format code and send function of each of the given bind parameter values.
+
+        The way the parameters of each combination of Python types are resolved is cached as an encoding plan, so
+        values of the same types as previously seen values are resolved without searching ``Connection.py_types`` and
+        ``Connection.inspect_funcs``. Values whose parameter depends on the value itself, e.g. the range of an
+        ``int``, are resolved by the inspect function found for their type. Plans are discarded when
+        ``Connection.py_types`` or ``Connection.inspect_funcs`` is modified or replaced.
+        """
+        plans: typing.Optional[typing.Dict[typing.Tuple[type, ...], typing.Tuple]] = self._param_plans
+        source: typing.Tuple[int, int] = (self._py_types.version, self._inspect_funcs.version)
+        if plans is None or source != self._param_plans_source:
+            plans = self._param_plans = {}
+            self._param_plans_source = source
+
+        types: typing.Tuple[type, ...] = tuple(map(type, values))
+        try:
+            plan, inspected = plans[types]
+        except KeyError:
+            resolved: typing.Tuple[typing.Tuple, ...] = tuple(self._param_plan(value) for value in values)
+            # the parameters of values whose types resolve to the same parameters regardless of the value
+            plan = tuple(entry for entry, _ in resolved)
+            # the inspect functions of values whose parameters depend on the value, and the position of each
+            inspected = tuple((idx, entry) for idx, entry in enumerate(plan) if callable(entry))
+            if len(plans) >= _MAX_PARAM_PLANS:
+                plans.clear()
+            plans[types] = plan, inspected
+            if len(inspected) == 0:
+                return plan
+            # the parameters were resolved along with the plan, so each value is inspected once
+            return tuple(param for _, param in resolved)
+
+        if len(inspected) == 0:
+            return plan
+        params: typing.List = list(plan)
+        values = tuple(values)
+        for idx, inspect_func in inspected:
             try:
-                # 1) check if we have a direct match for this datatype in PY_TYPES mapping
-                params.append(self.py_types[typ])
+                params[idx] = inspect_func(values[idx])
             except KeyError:
+                # the inspect function of the type does not support this value, resolve it regardless of the plan
+                params[idx] = self._param_plan(values[idx])[1]
+        return tuple(params)
+
+    def _param_plan(self: "Connection", value) -> typing.Tuple[
+        typing.Union[typing.Tuple[int, int, typing.Callable], typing.Callable[[typing.Any], typing.Tuple]],
+        typing.Tuple[int, int, typing.Callable],
+    ]:
+        """
+        Returns the plan entry of a bind parameter value, along with its type OID, format code and send function. The
+        plan entry is the type OID, format code and send function if these are the same for all values of its type,
+        otherwise the inspect function returning them for a value of its type.
+        """
+        typ: typing.Type = type(value)
+        try:
+            # 1) check if we have a direct match for this datatype in PY_TYPES mapping
+            return self.py_types[typ], self.py_types[typ]
+        except KeyError:
+            pass
+        try:
+            # 2) if no match was found in 1) check if we have a match in inspect_funcs.
+            # note that inspect_funcs inspect the data value to determine the type.
+            # e.g. if the datatype is a Datetime and has a timezone, we want to map it
+            # to TIMETSTAMPTZ rather than TIMESTAMP.
+            inspect_func: typing.Callable = self.inspect_funcs[typ]
+            return inspect_func, inspect_func(value)
+        except KeyError as e:
+            # 3) if no match was found in 1) nor 2), we again iterate through PY_TYPES but
+            # check if our data is an instance of any datatypes found in PY_TYPES
+            # rather than looking for an exact match as was performed in 1)
+            param: typing.Optional[
+                typing.Union[typing.Tuple[int, int, typing.Callable], typing.Callable[[typing.Any], typing.Tuple]]
+            ] = None
+            # the parameter returned by the inspect function found, if any
+            inspected: typing.Optional[typing.Tuple[int, int, typing.Callable]] = None
+            for k, v in self.py_types.items():
                 try:
-                    # 2) if no match was found in 1) check if we have a match in inspect_funcs.
-                    # note that inspect_funcs inspect the data value to determine the type.
-                    # e.g. if the datatype is a Datetime and has a timezone, we want to map it
-                    # to TIMETSTAMPTZ rather than TIMESTAMP.
-                    params.append(self.inspect_funcs[typ](value))
-                except KeyError as e:
-                    # 3) if no match was found in 1) nor 2), we again iterate through PY_TYPES but
-                    # check if our data is an instance of any datatypes found in PY_TYPES
-                    # rather than looking for an exact match as was performed in 1)
-                    param: typing.Optional[typing.Tuple[int, int, typing.Callable]] = None
-                    for k, v in self.py_types.items():
-                        try:
-                            if isinstance(value, typing.cast(type, k)):
-                                param = v
-                                break
-                        except TypeError:
-                            pass
-
-                    if param is None:
-                        # 4) if no match was found in 1) nor 2) nor 3), we again iterate through
-                        # inspect_funcs but check if our data is an instance of any datatype
-                        # found in inspect_funcs
-                        for k, v in self.inspect_funcs.items():  # type: ignore
-                            try:
-                                if isinstance(value, k):
-                                    v_func: typing.Callable = typing.cast(typing.Callable, v)
-                                    param = v_func(value)
-                                    break
-                            except TypeError:
-                                pass
-                            except KeyError:
-                                pass
-                    elif param[0] == RedshiftOID.DATE:
-                        # 5) if we classified this data as DATE in 3), we perform a secondary check to
-                        # ensure this data was not misclassified in 3). Misclassification occurs in the case
-                        # where data having a type that is a subclass of datetime.date is also a subclass of
-                        # datetime.datetime. For this example, the misclassification leads to the loss of
-                        # time precision in transformed data sent to Redshift on the wire. The simplest
-                        # example of this edge case can be seen in
-                        # https://github.com/aws/amazon-redshift-python-driver/issues/206
-                        # where a pandas Timestamp is misclassified as Redshift DATE in 3).
-                        if isinstance(value, Datetime) and Datetime in self.inspect_funcs:
-                            try:
-                                v_func = typing.cast(typing.Callable, self.inspect_funcs[Datetime])
-                                param = v_func(value)
-                            except TypeError:
-                                pass
-                            except KeyError:
-                                pass
-
-                    if param is None:
-                        raise NotSupportedError("type " + str(e) + " not mapped to pg type")
-                    else:
-                        params.append(param)
+                    if isinstance(value, typing.cast(type, k)):
+                        param = v
+                        break
+                except TypeError:
+                    pass
 
-        return tuple(params)
+            if param is None:
+                # 4) if no match was found in 1) nor 2) nor 3), we again iterate through
+                # inspect_funcs but check if our data is an instance of any datatype
+                # found in inspect_funcs
+                for k, v in self.inspect_funcs.items():  # type: ignore
+                    try:
+                        if isinstance(value, k):
+                            v_func: typing.Callable = typing.cast(typing.Callable, v)
+                            inspected = v_func(value)
+                            param = v_func
+                            break
+                    except TypeError:
+                        pass
+                    except KeyError:
+                        pass
+            elif param[0] == RedshiftOID.DATE:  # type: ignore
+                # 5) if we classified this data as DATE in 3), we perform a secondary check to
+                # ensure this data was not misclassified in 3). Misclassification occurs in the case
+                # where data having a type that is a subclass of datetime.date is also a subclass of
+                # datetime.datetime. For this example, the misclassification leads to the loss of
+                # time precision in transformed data sent to Redshift on the wire. The simplest
+                # example of this edge case can be seen in
+                # https://github.com/aws/amazon-redshift-python-driver/issues/206
+                # where a pandas Timestamp is misclassified as Redshift DATE in 3).
+                if isinstance(value, Datetime) and Datetime in self.inspect_funcs:
+                    try:
+                        v_func = typing.cast(typing.Callable, self.inspect_funcs[Datetime])
+                        inspected = v_func(value)
+                        param = v_func
+                    except TypeError:
+                        pass
+                    except KeyError:
+                        pass
+
+            if param is None and getattr(value, "ndim", 0) > 0 and hasattr(value, "__array_interface__"):
+                # 6) NumPy arrays are sent as arrays, without importing numpy for other values
+                inspected = self.array_inspect(value)
+                param = self.array_inspect
+
+            if param is None:
+                raise NotSupportedError("type " + str(e) + " not mapped to pg type")
+            if inspected is None:
+                inspected = typing.cast(typing.Tuple[int, int, typing.Callable], param)
+            return param, inspected
 
     def handle_ROW_DESCRIPTION(self: "Connection", data, cursor: Cursor) -> None:
         """
@@ -1654,7 +2233,9 @@ class Connection:
 
         _logger.debug(cursor.ps["row_desc"])
 
-    def execute(self: "Connection", cursor: Cursor, operation: str, vals) -> None:
+    def execute(
+        self: "Connection", cursor: Cursor, operation: str, vals, fetch_size: int = 0, background_read: bool = False
+    ) -> None:
         """
         Executes a database operation. Parameters may be provided as a sequence, or as a mapping, depending upon the value of `redshift_connector.paramstyle`.
 
@@ -1663,6 +2244,8 @@ class Connection:
         cursor : :class:`Cursor`
         operation : str The SQL statement to execute.
         vals : If `redshift_connector.paramstyle` is `qmark`, `numeric`, or `format` this argument should be an array of parameters to bind into the statement. If `redshift_connector.paramstyle` is `named` the argument should be a `dict` mapping of parameters. If `redshift_connector.paramstyle` is `pyformat`, the argument value may be either an array or mapping.
+        fetch_size : int The maximum number of rows to receive per Execute message. When greater than 0 the portal is left suspended after the first ``fetch_size`` rows and the remaining rows are fetched on demand by the cursor. Default value is 0, meaning all rows are received before returning.
+        background_read : bool If ``True``, the response is read by a background thread while rows are decoded by the cursor as they are fetched. See :meth:`Connection.fetch_background_rows`. Default value is ``False``.
 
         Returns
         -------
@@ -1670,43 +2253,110 @@ class Connection:
         """
         _logger.debug("Connection.execute()")
 
+        if self._suspended_portal_cursor is not None:
+            # the connection can only serve one extended-query cycle at a time
+            self.close_portal()
+        if self._background_read_cursor is not None:
+            self.finish_background_read()
+
         # get the process ID of the calling process.
         pid: int = getpid()
+        statements_to_close: typing.List[bytes] = []
+        cache, key, statement, args, params = self._statement_args(cursor.paramstyle, pid, operation, vals)
 
-        args: typing.Tuple[typing.Optional[typing.Tuple[str, typing.Any]], ...] = ()
-        # transforms user provided bind parameters to server friendly bind parameters
-        params: typing.Tuple[typing.Optional[typing.Tuple[int, int, typing.Callable]], ...] = ()
-        has_bind_parameters: bool = False if vals is None else True
-        statements_to_close = []
-        # Cache structure for prepared statements:
-        # self._caches[paramstyle][pid] contains:
-        #   - 'statement': stores SQL statements and their parameter processors
-        #   - 'ps': stores prepared statement metadata
-        #   - 'statement_dict': OrderedDict tracking most recently used prepared statements
-        #                      (used when max_prepared_statements is set)
-        # Each statement entry contains (processed_statement, parameter_binding_function)
-        try:
-            cache = self._caches[cursor.paramstyle][pid]
-        except KeyError:
-            try:
-                param_cache = self._caches[cursor.paramstyle]
-            except KeyError:
-                param_cache = self._caches[cursor.paramstyle] = {}
+        ps: typing.Dict[str, typing.Any] = self._prepared_statement(
+            cursor, cache, pid, key, statement, params, statements_to_close
+        )
+        self._reset_result(cursor)
 
-            try:
-                cache = param_cache[pid]
-            except KeyError:
-                cache = param_cache[pid] = {
-                    "statement": {},
-                    "ps": {},
-                    "statement_dict": OrderedDict() if self.max_prepared_statements > 0 else None,
-                }
+        # Byte1('B') - Identifies the Bind command.
+        # Int32 - Message length, including self.
+        # String - Name of the destination portal.
+        # String - Name of the source prepared statement.
+        # Int16 - Number of parameter format codes.
+        # For each parameter format code:
+        #   Int16 - The parameter format code.
+        # Int16 - Number of parameter values.
+        # For each parameter value:
+        #   Int32 - The length of the parameter value, in bytes, not
+        #           including this length.  -1 indicates a NULL parameter
+        #           value, in which no value bytes follow.
+        #   Byte[n] - Value of the parameter.
+        # Int16 - The number of result-column format codes.
+        # For each result-column format code:
+        #   Int16 - The format code.
+        retval: bytearray = self._make_bind(ps, args)
+
+        if fetch_size > 0 or background_read:
+            # Sync must not be sent while the portal is suspended, as it would end an implicit
+            # transaction and the portal along with it. Close evicted statements up front instead.
+            # The same applies while the response is read in the background.
+            for stmt in statements_to_close:
+                self.close_prepared_statement(stmt)
+            statements_to_close.clear()
+
+        # send BIND message which includes name of parepared statement,
+        # name of destination portal and the value of placeholders in prepared statement.
+        # these parameters need to match the prepared statements
+        _logger.debug("Sending Bind message to BE")
+        self._send_message(BIND, retval)
+
+        if fetch_size > 0:
+            # rows are received in chunks of at most fetch_size, the server suspends
+            # the portal between chunks. Sync is sent once the portal is exhausted.
+            self._portal_fetch_size: int = fetch_size
+            cursor._portal_row_count = 0
+            self.send_EXECUTE(cursor, fetch_size)
+            self._flush()
+            self.handle_portal_messages(cursor)
+            return
+
+        self.send_EXECUTE(cursor)
+        _logger.debug("Sending Sync message to BE")
+        self._write(SYNC_MSG)
+        self._flush()
+
+        if background_read:
+            self.error = None
+            self._background_read_cursor = cursor
+            self._background_reader = BackgroundMessageReader(self._get_message_reader(), _READY_FOR_QUERY_CODES)
+            # messages preceding the first rows are handled up front, raising errors of the statement from execute
+            while self._background_read_cursor is cursor and len(cursor._cached_rows) == 0:
+                self.fetch_background_rows(cursor)
+            return
+
+        # handle multi messages including BIND_COMPLETE, DATA_ROW, COMMAND_COMPLETE
+        # READY_FOR_QUERY
+        if self.chunked_socket_read:
+            self.handle_messages_chunked_socket_read(cursor)
+        elif self.merge_socket_read:
+            self.handle_messages_merge_socket_read(cursor)
+        else:
+            self.handle_messages(cursor)
+
+        # Clean up prepared statements after query execution and results are returned
+        for stmt in statements_to_close:
+            self.close_prepared_statement(stmt)
+
+    def _statement_args(
+        self: "Connection", paramstyle: str, pid: int, operation: str, vals
+    ) -> typing.Tuple[typing.Dict[str, typing.Any], typing.Tuple, str, typing.Tuple, typing.Tuple]:
+        """
+        Returns the statement cache of ``paramstyle`` and the process ``pid``, the key of the prepared statement
+        executing ``operation`` with ``vals`` in that cache, the statement converted to the paramstyle of the server,
+        and the arguments to bind along with their parameter encodings.
+        """
+        args: typing.Tuple[typing.Optional[typing.Tuple[str, typing.Any]], ...] = ()
+        # transforms user provided bind parameters to server friendly bind parameters
+        params: typing.Tuple[typing.Optional[typing.Tuple[int, int, typing.Callable]], ...] = ()
+        has_bind_parameters: bool = False if vals is None else True
+        cache = self._statement_cache(paramstyle, pid)
 
         try:
             statement, make_args = cache["statement"][operation]
         except KeyError:
             if has_bind_parameters:
-                statement, make_args = cache["statement"][operation] = convert_paramstyle(cursor.paramstyle, operation)
+                statement, make_args = cache["statement"][operation] = convert_paramstyle(paramstyle, operation)
             else:
                 # use a no-op make_args in lieu of parsing the sql statement
                 statement, make_args = cache["statement"][operation] = operation, lambda p: ()
@@ -1717,193 +2367,210 @@ class Connection:
             # take reference from self.py_types
             params = self.make_params(args)
             _logger.debug("args converted to %s params", len(params))
-        key = operation, params
+        return cache, (operation, params), statement, args, params
 
+    def _reset_result(self: "Connection", cursor: Cursor) -> None:
+        """
+        Clears the result of the previous statement executed by ``cursor``, using the result buffer of its
+        ``buffer_mode`` for the result of the next one.
+        """
+        if cursor.buffer_mode == ResultBufferMode.COLUMNAR.value:
+            if not isinstance(cursor._cached_rows, ColumnarResultBuffer):
+                cursor._cached_rows = ColumnarResultBuffer(cursor)
+        elif cursor.buffer_memory_limit is not None:
+            if not isinstance(cursor._cached_rows, SpillingResultBuffer):
+                cursor._cached_rows = SpillingResultBuffer(cursor)
+        elif cursor.buffer_mode == ResultBufferMode.LAZY.value:
+            if cursor._cached_rows.__class__ is not LazyResultBuffer:
+                cursor._cached_rows = LazyResultBuffer(cursor)
+        elif not isinstance(cursor._cached_rows, deque):
+            cursor._cached_rows = deque()
+        cursor._cached_rows.clear()
+        cursor._row_count = -1
+        cursor._redshift_row_count = -1
+        cursor._portal_closed = False
+
+    def _statement_cache(self: "Connection", paramstyle: str, pid: int) -> typing.Dict[str, typing.Any]:
+        """
+        Returns the cache of statements and prepared statements used with ``paramstyle`` by the process ``pid``.
+        """
+        # Cache structure for prepared statements:
+        # self._caches[paramstyle][pid] contains:
+        #   - 'statement': stores SQL statements and their parameter processors
+        #   - 'ps': stores prepared statement metadata
+        #   - 'statement_dict': OrderedDict tracking most recently used prepared statements
+        #                      (used when max_prepared_statements is set)
+        # Each statement entry contains (processed_statement, parameter_binding_function)
         try:
-            ps = cache["ps"][key]
-            # If statement exists, move it to end of ordered dict (most recently used)
-            if self.max_prepared_statements > 0 and "statement_dict" in cache and key in cache["statement_dict"]:
-                cache["statement_dict"].move_to_end(key)
-            _logger.debug("Using cached prepared statement")
-            cursor.ps = ps
+            cache = self._caches[paramstyle][pid]
         except KeyError:
-            statement_nums: typing.List[int] = [0]
-            for style_cache in self._caches.values():
-                try:
-                    pid_cache = style_cache[pid]
-                    for csh in pid_cache["ps"].values():
-                        statement_nums.append(csh["statement_num"])
-                except KeyError:
-                    pass
-
-            # statement_num is the id of statement increasing from 1
-            statement_num: int = sorted(statement_nums)[-1] + 1
-            # consist of "redshift_connector", statement, process id and statement number.
-            # e.g redshift_connector_statement_11432_2
-            statement_name: str = "_".join(("redshift_connector", "statement", str(pid), str(statement_num)))
-            statement_name_bin: bytes = self.get_statement_name_bin(statement_name)
-
-            # row_desc: list that used to store metadata of rows from DB
-            # param_funcs: type transform function
-            ps = {
-                "statement_name_bin": statement_name_bin,
-                "pid": pid,
-                "statement_num": statement_num,
-                "row_desc": [],
-                "param_funcs": tuple(x[2] for x in params),  # type: ignore
-            }
-            _logger.debug("Prepared Statement object for statement=%s", ps)
-            cursor.ps = ps
-
-            param_fcs: typing.Tuple[typing.Optional[int], ...] = tuple(x[1] for x in params)  # type: ignore
-            _logger.debug("parameter fcs=%s", param_fcs)
-
-            # Byte1('P') - Identifies the message as a Parse command.
-            # Int32 -   Message length, including self.
-            # String -  Prepared statement name. An empty string selects the
-            #           unnamed prepared statement.
-            # String -  The query string.
-            # Int16 -   Number of parameter data types specified (can be zero).
-            # For each parameter:
-            #   Int32 - The OID of the parameter data type.
-            val: typing.Union[bytes, bytearray] = bytearray(statement_name_bin)
-            typing.cast(bytearray, val).extend(statement.encode(_client_encoding) + NULL_BYTE)
-            if len(params) > 32767:
-                raise DataError(
-                    "Prepared statement exceeds bind parameter limit 32767. {} bind parameters were "
-                    "provided. Please retry with fewer bind parameters.".format(len(params))
-                )
-            typing.cast(bytearray, val).extend(h_pack(len(params)))
-            for oid, fc, send_func in params:  # type: ignore
-                # Parse message doesn't seem to handle the -1 type_oid for NULL
-                # values that other messages handle.  So we'll provide type_oid
-                # 705, the PG "unknown" type.
-                typing.cast(bytearray, val).extend(i_pack(705 if oid == -1 else oid))
-
-            # Byte1('D') - Identifies the message as a describe command.
-            # Int32 - Message length, including self.
-            # Byte1 - 'S' for prepared statement, 'P' for portal.
-            # String - The name of the item to describe.
-
-            # PARSE message will notify database to create a prepared statement object
-            _logger.debug("Sending Parse message to BE")
-            self._send_message(PARSE, val)
-            # DESCRIBE message will specify the name of the existing prepared statement
-            # the response will be a parameterDescribing message describe the parameters needed
-            # and a RowDescription message describe the rows will be return(nodata message when no return rows)
-            _logger.debug("Sending Describe message to BE")
-            self._send_message(DESCRIBE, STATEMENT + statement_name_bin)
-            # at completion of query message, driver issue a sync message
-            _logger.debug("Sending Sync message to BE")
-            self._write(SYNC_MSG)
+            try:
+                param_cache = self._caches[paramstyle]
+            except KeyError:
+                param_cache = self._caches[paramstyle] = {}
 
             try:
-                self._flush()
-            except AttributeError as e:
-                if self._sock is None:
-                    raise InterfaceError("connection is closed")
-                else:
-                    raise e
+                cache = param_cache[pid]
+            except KeyError:
+                cache = param_cache[pid] = {
+                    "statement": {},
+                    "ps": {},
+                    "statement_dict": OrderedDict() if self.max_prepared_statements > 0 else None,
+                }
+        return cache
 
+    def _prepared_statement(
+        self: "Connection",
+        cursor: Cursor,
+        cache: typing.Dict[str, typing.Any],
+        pid: int,
+        key: typing.Tuple,
+        statement: str,
+        params: typing.Tuple,
+        statements_to_close: typing.List[bytes],
+    ) -> typing.Dict[str, typing.Any]:
+        """
+        Returns the prepared statement of ``statement`` for the parameters ``params``, held by ``cache`` under ``key``,
+        preparing it if not cached. Prepared statements evicted from the cache are appended to
+        ``statements_to_close``, to be closed by the caller once the statement was executed.
+        """
+        ps: typing.Optional[typing.Dict[str, typing.Any]] = self._cached_prepared_statement(cursor, cache, key)
+        if ps is None:
+            ps = self._send_prepare(cursor, pid, statement, params)
             self.handle_messages(cursor)
+            self._complete_prepared_statement(cache, key, ps, params, statements_to_close)
+        return ps
 
-            # We've got row_desc that allows us to identify what we're
-            # going to get back from this statement.
-            output_fc = tuple(self.redshift_types[f["type_oid"]][0] for f in ps["row_desc"])
-            _logger.debug("output_fc=%s", output_fc)
-
-            ps["input_funcs"] = tuple(f["func"] for f in ps["row_desc"])
-            # Byte1('B') - Identifies the Bind command.
-            # Int32 - Message length, including self.
-            # String - Name of the destination portal.
-            # String - Name of the source prepared statement.
-            # Int16 - Number of parameter format codes.
-            # For each parameter format code:
-            #   Int16 - The parameter format code.
-            # Int16 - Number of parameter values.
-            # For each parameter value:
-            #   Int32 - The length of the parameter value, in bytes, not
-            #           including this length.  -1 indicates a NULL parameter
-            #           value, in which no value bytes follow.
-            #   Byte[n] - Value of the parameter.
-            # Int16 - The number of result-column format codes.
-            # For each result-column format code:
-            #   Int16 - The format code.
-            ps["bind_1"] = (
-                NULL_BYTE
-                + statement_name_bin
-                + h_pack(len(params))
-                + pack("!" + "h" * len(param_fcs), *param_fcs)
-                + h_pack(len(params))
+    def _cached_prepared_statement(
+        self: "Connection", cursor: Cursor, cache: typing.Dict[str, typing.Any], key: typing.Tuple
+    ) -> typing.Optional[typing.Dict[str, typing.Any]]:
+        """
+        Returns the prepared statement held by ``cache`` under ``key``, or ``None`` if it is not cached.
+        """
+        try:
+            ps = cache["ps"][key]
+        except KeyError:
+            return None
+        # If statement exists, move it to end of ordered dict (most recently used)
+        if self.max_prepared_statements > 0 and "statement_dict" in cache and key in cache["statement_dict"]:
+            cache["statement_dict"].move_to_end(key)
+        _logger.debug("Using cached prepared statement")
+        cursor.ps = ps
+        return ps
+
+    def _send_prepare(
+        self: "Connection", cursor: Cursor, pid: int, statement: str, params: typing.Tuple, sync: bool = True
+    ) -> typing.Dict[str, typing.Any]:
+        """
+        Sends the Parse, Describe and Sync messages preparing ``statement`` for the parameters ``params``, returning
+        the prepared statement. Once the response to these messages was handled, the prepared statement is completed
+        by :meth:`_complete_prepared_statement`. The Sync message is not sent if ``sync`` is ``False``, in which case
+        the response is read by :meth:`_handle_describe_messages`.
+        """
+        statement_nums: typing.List[int] = [0]
+        for style_cache in self._caches.values():
+            try:
+                pid_cache = style_cache[pid]
+                for csh in pid_cache["ps"].values():
+                    statement_nums.append(csh["statement_num"])
+            except KeyError:
+                pass
+
+        # statement_num is the id of statement increasing from 1
+        statement_num: int = sorted(statement_nums)[-1] + 1
+        # consist of "redshift_connector", statement, process id and statement number.
+        # e.g redshift_connector_statement_11432_2
+        statement_name: str = "_".join(("redshift_connector", "statement", str(pid), str(statement_num)))
+        statement_name_bin: bytes = self.get_statement_name_bin(statement_name)
+
+        # row_desc: list that used to store metadata of rows from DB
+        # param_funcs: type transform function
+        ps: typing.Dict[str, typing.Any] = {
+            "statement_name_bin": statement_name_bin,
+            "pid": pid,
+            "statement_num": statement_num,
+            "row_desc": [],
+            "param_funcs": tuple(x[2] for x in params),  # type: ignore
+        }
+        _logger.debug("Prepared Statement object for statement=%s", ps)
+        cursor.ps = ps
+
+        param_fcs: typing.Tuple[typing.Optional[int], ...] = tuple(x[1] for x in params)  # type: ignore
+        _logger.debug("parameter fcs=%s", param_fcs)
+
+        # Byte1('P') - Identifies the message as a Parse command.
+        # Int32 -   Message length, including self.
+        # String -  Prepared statement name. An empty string selects the
+        #           unnamed prepared statement.
+        # String -  The query string.
+        # Int16 -   Number of parameter data types specified (can be zero).
+        # For each parameter:
+        #   Int32 - The OID of the parameter data type.
+        val: typing.Union[bytes, bytearray] = bytearray(statement_name_bin)
+        typing.cast(bytearray, val).extend(statement.encode(_client_encoding) + NULL_BYTE)
+        if len(params) > MAX_BIND_PARAMETERS:
+            raise DataError(
+                "Prepared statement exceeds bind parameter limit {}. {} bind parameters were "
+                "provided. Please retry with fewer bind parameters.".format(MAX_BIND_PARAMETERS, len(params))
             )
+        typing.cast(bytearray, val).extend(h_pack(len(params)))
+        for oid, fc, send_func in params:  # type: ignore
+            # Parse message doesn't seem to handle the -1 type_oid for NULL
+            # values that other messages handle.  So we'll provide type_oid
+            # 705, the PG "unknown" type.
+            typing.cast(bytearray, val).extend(i_pack(705 if oid == -1 else oid))
+
+        # Byte1('D') - Identifies the message as a describe command.
+        # Int32 - Message length, including self.
+        # Byte1 - 'S' for prepared statement, 'P' for portal.
+        # String - The name of the item to describe.
+
+        # PARSE message will notify database to create a prepared statement object
+        _logger.debug("Sending Parse message to BE")
+        self._send_message(PARSE, val)
+        # DESCRIBE message will specify the name of the existing prepared statement
+        # the response will be a parameterDescribing message describe the parameters needed
+        # and a RowDescription message describe the rows will be return(nodata message when no return rows)
+        _logger.debug("Sending Describe message to BE")
+        self._send_message(DESCRIBE, STATEMENT + statement_name_bin)
+        # at completion of query message, driver issue a sync message
+        if sync:
+            _logger.debug("Sending Sync message to BE")
+            self._write(SYNC_MSG)
 
-            ps["bind_2"] = h_pack(len(output_fc)) + pack("!" + "h" * len(output_fc), *output_fc)
-
-            if self.max_prepared_statements > 0:
-                # Ensure consistency between ps and statement_dict.
-                # A length mismatch indicates stale keys in statement_dict
-                # (e.g. after DDL/ROLLBACK clears ps but not statement_dict).
-                # We do a full rebuild: clear statement_dict first, then
-                # re-add only keys that exist in ps. This loses the original
-                # LRU ordering, but that's acceptable because the mismatch
-                # only occurs after DDL/ROLLBACK which invalidated all prior
-                # entries anyway — the surviving keys get fresh ordering.
-                if len(cache["ps"]) != len(cache["statement_dict"]):
-                    _logger.debug(
-                        "Consistency repair: rebuilding statement_dict from ps (%d -> %d entries)",
-                        len(cache["statement_dict"]),
-                        len(cache["ps"]),
-                    )
-                    cache["statement_dict"].clear()
-                    for existing_key in cache["ps"]:
-                        cache["statement_dict"][existing_key] = None
-
-                # If cache is full, evict the least recently used statement.
-                # We use a while loop instead of a single pop as a
-                # defense-in-depth measure: if statement_dict contains
-                # stale keys not present in ps (e.g. after DDL/ROLLBACK
-                # clears ps but not statement_dict), we discard them
-                # lazily here rather than crashing with a KeyError.
-                # In normal operation the first pop always finds a valid
-                # key, so this behaves identically to a single-pop eviction
-                # with zero overhead on the happy path.
-                if len(cache["ps"]) >= self.max_prepared_statements:
-                    while cache["statement_dict"]:
-                        oldest_key, _ = cache["statement_dict"].popitem(last=False)
-                        if oldest_key in cache["ps"]:
-                            statements_to_close.append(cache["ps"][oldest_key]["statement_name_bin"])
-                            del cache["ps"][oldest_key]
-                            break
-                        else:
-                            _logger.debug("Eviction discarded stale key from statement_dict: %s", oldest_key)
-                    else:
-                        # statement_dict exhausted — all entries were stale, none
-                        # matched a key in ps. At this point len(statement_dict) == 0
-                        # and no eviction occurred, so the new entry added below will
-                        # temporarily grow ps to max_prepared_statements + 1.
-                        #
-                        # We intentionally do NOT rebuild statement_dict here because
-                        # the next execute() call will detect the length mismatch
-                        # (len(ps) != len(statement_dict)) in the consistency-repair
-                        # check above and rebuild statement_dict from ps automatically.
-                        # That rebuild restores full sync, and the subsequent eviction
-                        # will succeed normally.
-                        _logger.warning(
-                            "Eviction failed: statement_dict exhausted without finding a valid key in ps. "
-                            "ps has %d entries (max_prepared_statements=%d). "
-                            "The next execute() will trigger consistency-repair to restore sync.",
-                            len(cache["ps"]),
-                            self.max_prepared_statements,
-                        )
+        try:
+            self._flush()
+        except AttributeError as e:
+            if self._sock is None:
+                raise InterfaceError("connection is closed")
+            else:
+                raise e
 
-                # Add new statement to cache and queue
-                cache["ps"][key] = ps
-                cache["statement_dict"][key] = None
+        return ps
 
-        cursor._cached_rows.clear()
-        cursor._row_count = -1
-        cursor._redshift_row_count = -1
+    def _complete_prepared_statement(
+        self: "Connection",
+        cache: typing.Dict[str, typing.Any],
+        key: typing.Tuple,
+        ps: typing.Dict[str, typing.Any],
+        params: typing.Tuple,
+        statements_to_close: typing.List[bytes],
+    ) -> None:
+        """
+        Completes the prepared statement ``ps`` sent by :meth:`_send_prepare` using the row description received in
+        response, and caches it under ``key``. Prepared statements evicted from the cache are appended to
+        ``statements_to_close``.
+        """
+        param_fcs: typing.Tuple[typing.Optional[int], ...] = tuple(x[1] for x in params)  # type: ignore
+
+        # We've got row_desc that allows us to identify what we're
+        # going to get back from this statement.
+        output_fc = tuple(self.redshift_types[f["type_oid"]][0] for f in ps["row_desc"])
+        _logger.debug("output_fc=%s", output_fc)
 
+        ps["input_funcs"] = tuple(f["func"] for f in ps["row_desc"])
+        if len(ps["row_desc"]) > 0:
+            ps["row_decoder"] = compile_row_decoder(ps["row_desc"], ps["input_funcs"])
         # Byte1('B') - Identifies the Bind command.
         # Int32 - Message length, including self.
         # String - Name of the destination portal.
@@ -1920,6 +2587,81 @@ class Connection:
         # Int16 - The number of result-column format codes.
         # For each result-column format code:
         #   Int16 - The format code.
+        ps["bind_1"] = (
+            NULL_BYTE
+            + ps["statement_name_bin"]
+            + h_pack(len(params))
+            + pack("!" + "h" * len(param_fcs), *param_fcs)
+            + h_pack(len(params))
+        )
+
+        ps["bind_2"] = h_pack(len(output_fc)) + pack("!" + "h" * len(output_fc), *output_fc)
+
+        if self.max_prepared_statements > 0:
+            # Ensure consistency between ps and statement_dict.
+            # A length mismatch indicates stale keys in statement_dict
+            # (e.g. after DDL/ROLLBACK clears ps but not statement_dict).
+            # We do a full rebuild: clear statement_dict first, then
+            # re-add only keys that exist in ps. This loses the original
+            # LRU ordering, but that's acceptable because the mismatch
+            # only occurs after DDL/ROLLBACK which invalidated all prior
+            # entries anyway — the surviving keys get fresh ordering.
+            if len(cache["ps"]) != len(cache["statement_dict"]):
+                _logger.debug(
+                    "Consistency repair: rebuilding statement_dict from ps (%d -> %d entries)",
+                    len(cache["statement_dict"]),
+                    len(cache["ps"]),
+                )
+                cache["statement_dict"].clear()
+                for existing_key in cache["ps"]:
+                    cache["statement_dict"][existing_key] = None
+
+            # If cache is full, evict the least recently used statement.
+            # We use a while loop instead of a single pop as a
+            # defense-in-depth measure: if statement_dict contains
+            # stale keys not present in ps (e.g. after DDL/ROLLBACK
+            # clears ps but not statement_dict), we discard them
+            # lazily here rather than crashing with a KeyError.
+            # In normal operation the first pop always finds a valid
+            # key, so this behaves identically to a single-pop eviction
+            # with zero overhead on the happy path.
+            if len(cache["ps"]) >= self.max_prepared_statements:
+                while cache["statement_dict"]:
+                    oldest_key, _ = cache["statement_dict"].popitem(last=False)
+                    if oldest_key in cache["ps"]:
+                        statements_to_close.append(cache["ps"][oldest_key]["statement_name_bin"])
+                        del cache["ps"][oldest_key]
+                        break
+                    else:
+                        _logger.debug("Eviction discarded stale key from statement_dict: %s", oldest_key)
+                else:
+                    # statement_dict exhausted — all entries were stale, none
+                    # matched a key in ps. At this point len(statement_dict) == 0
+                    # and no eviction occurred, so the new entry added below will
+                    # temporarily grow ps to max_prepared_statements + 1.
+                    #
+                    # We intentionally do NOT rebuild statement_dict here because
+                    # the next execute() call will detect the length mismatch
+                    # (len(ps) != len(statement_dict)) in the consistency-repair
+                    # check above and rebuild statement_dict from ps automatically.
+                    # That rebuild restores full sync, and the subsequent eviction
+                    # will succeed normally.
+                    _logger.warning(
+                        "Eviction failed: statement_dict exhausted without finding a valid key in ps. "
+                        "ps has %d entries (max_prepared_statements=%d). "
+                        "The next execute() will trigger consistency-repair to restore sync.",
+                        len(cache["ps"]),
+                        self.max_prepared_statements,
+                    )
+
+            # Add new statement to cache and queue
+            cache["ps"][key] = ps
+            cache["statement_dict"][key] = None
+
+    def _make_bind(self: "Connection", ps: typing.Dict[str, typing.Any], args) -> bytearray:
+        """
+        Returns the content of a Bind message binding ``args`` to the prepared statement ``ps``, to the unnamed portal.
+        """
         retval: bytearray = bytearray(ps["bind_1"])
         for value, send_func in zip(args, ps["param_funcs"]):
             if value is None:
@@ -1929,26 +2671,162 @@ class Connection:
                 retval.extend(i_pack(len(val)))
             retval.extend(val)
         retval.extend(ps["bind_2"])
+        return retval
 
-        # send BIND message which includes name of parepared statement,
-        # name of destination portal and the value of placeholders in prepared statement.
-        # these parameters need to match the prepared statements
-        _logger.debug("Sending Bind message to BE")
-        self._send_message(BIND, retval)
-        self.send_EXECUTE(cursor)
-        _logger.debug("Sending Sync message to BE")
-        self._write(SYNC_MSG)
-        self._flush()
-        # handle multi messages including BIND_COMPLETE, DATA_ROW, COMMAND_COMPLETE
-        # READY_FOR_QUERY
-        if self.merge_socket_read:
-            self.handle_messages_merge_socket_read(cursor)
-        else:
-            self.handle_messages(cursor)
+    def executemany(
+        self: "Connection", cursor: Cursor, operation: str, param_sets, pipeline_size: int = DEFAULT_PIPELINE_SIZE
+    ) -> None:
+        """
+        Executes a database operation against each of the given parameter sets, setting the row count of the cursor
+        to the total number of rows affected.
 
-        # Clean up prepared statements after query execution and results are returned
-        for stmt in statements_to_close:
-            self.close_prepared_statement(stmt)
+        Parameter sets are pipelined: their Bind and Execute messages are sent without waiting for the response to
+        each, and responses are read once ``pipeline_size`` parameter sets were sent. The statement is prepared with
+        Parse and Describe messages only, and a single Sync message is sent once all parameter sets were executed, so
+        when autocommit is enabled all parameter sets run in one implicit transaction, rolled back as a whole if one
+        of them fails or the driver raises an error part way, e.g. for a parameter which cannot be encoded. A
+        parameter set whose types differ from those of the previous one is bound to a prepared statement for its
+        types, once the responses to the parameter sets sent before it were read.
+
+        If a parameter set fails, the raised error holds its index in ``param_sets`` under the
+        ``"parameter_set_index"`` key of its first argument, and no further parameter sets are executed.
+
+        Parameters
+        ----------
+        cursor : :class:`Cursor`
+        operation : str The SQL statement to execute.
+        param_sets : A sequence of parameters to execute the statement with, as accepted by :meth:`Connection.execute`.
+        pipeline_size : int The maximum number of parameter sets sent before their responses are read.
+
+        Returns
+        -------
+        None:None
+        """
+        _logger.debug("Connection.executemany()")
+        self._execute_pipelined(cursor, ((operation, vals) for vals in param_sets), pipeline_size)
+
+    def _execute_pipelined(
+        self: "Connection",
+        cursor: Cursor,
+        statements: typing.Iterable[typing.Tuple[str, typing.Any]],
+        pipeline_size: int,
+    ) -> None:
+        """
+        Executes each of ``statements``, pairs of a database operation and the parameters to execute it with, in a
+        single :class:`_Pipeline`. See :meth:`Connection.executemany`.
+        """
+        pipeline: _Pipeline = _Pipeline(self, cursor, pipeline_size)
+        pid: int = getpid()
+        # prepared statement the last parameter set was bound to, and its cache key
+        ps: typing.Dict[str, typing.Any] = {}
+        key: typing.Optional[typing.Tuple] = None
+        try:
+            for operation, vals in statements:
+                cache, vals_key, statement, args, params = self._statement_args(cursor.paramstyle, pid, operation, vals)
+                if vals_key != key:
+                    ps = pipeline.statement(cache, pid, vals_key, statement, params)
+                    key = vals_key
+                pipeline.send(self._make_bind(ps, args))
+        except Exception as e:
+            raise pipeline.abort(e)
+        pipeline.sync()
+
+    def executemany_encoded(
+        self: "Connection",
+        cursor: Cursor,
+        statements: typing.Iterable[typing.Tuple[str, typing.Tuple[typing.Tuple[int, int], ...], bytes]],
+        pipeline_size: int = DEFAULT_PIPELINE_SIZE,
+    ) -> None:
+        """
+        Executes each of ``statements``, triples of a SQL statement, the OID and format code of each of its
+        parameters, and the values of its parameters already encoded as in a Bind message: for each parameter, the
+        length of its value as an Int32, -1 for NULL, followed by the value. Statements use the ``$1`` placeholders of
+        the server rather than the cursor's paramstyle, and are prepared for the given parameter types. Statements are
+        sent in a single :class:`_Pipeline`, and their errors reported as by :meth:`Connection.executemany`.
+
+        Parameters
+        ----------
+        cursor : :class:`Cursor`
+        statements : Iterable[Tuple[str, Tuple[Tuple[int, int], ...], bytes]] The statements to execute, with the type and encoded value of their parameters.
+        pipeline_size : int The maximum number of statements sent before their responses are read.
+
+        Returns
+        -------
+        None:None
+        """
+        _logger.debug("Connection.executemany_encoded()")
+        pipeline: _Pipeline = _Pipeline(self, cursor, pipeline_size)
+        pid: int = getpid()
+        cache: typing.Dict[str, typing.Any] = self._statement_cache(cursor.paramstyle, pid)
+        # prepared statement the last statement was bound to, and its cache key
+        ps: typing.Dict[str, typing.Any] = {}
+        key: typing.Optional[typing.Tuple] = None
+        try:
+            for statement, param_types, values in statements:
+                if (statement, param_types) != key:
+                    params: typing.Tuple = tuple((oid, fc, None) for oid, fc in param_types)
+                    ps = pipeline.statement(cache, pid, (statement, params), statement, params)
+                    key = (statement, param_types)
+                pipeline.send(ps["bind_1"] + values + ps["bind_2"])
+        except Exception as e:
+            raise pipeline.abort(e)
+        pipeline.sync()
+
+    @staticmethod
+    def _with_parameter_set_index(error: Exception, index: int) -> Exception:
+        """
+        Records the index of the parameter set which failed in the message of an error raised by the server, unless an
+        index was recorded already.
+        """
+        if isinstance(error, DatabaseError) and len(error.args) > 0 and isinstance(error.args[0], dict):
+            error.args[0].setdefault("parameter_set_index", index)
+        return error
+
+    def _handle_describe_messages(self: "Connection", cursor: Cursor) -> None:
+        """
+        Reads the response to the Parse and Describe messages sent by :meth:`_send_prepare` without a Sync message, up
+        to the RowDescription or NoData message describing the rows returned by the statement, or an error. An error
+        received is held by ``Connection.error``.
+        """
+        self.error = None
+        code: typing.Optional[bytes] = None
+        while code != ROW_DESCRIPTION and code != NO_DATA and self.error is None:
+            buffer: bytes = self._read(5)
+            if len(buffer) == 0:
+                self._raise_broken_pipe()
+            code, data_len = ci_unpack(buffer)
+            self.message_types[code](self._read(data_len - 4), cursor)
+
+    def _handle_pipelined_messages(
+        self: "Connection", cursor: Cursor, num_sets: typing.Optional[int] = None
+    ) -> typing.Tuple[int, int]:
+        """
+        Reads the responses of pipelined parameter sets, up to ReadyForQuery, or until ``num_sets`` parameter sets
+        completed or one failed if ``num_sets`` is given. An error received is held by ``Connection.error``. Returns
+        the number of parameter sets completed, and the number of rows they affected, or -1 if not known.
+        """
+        self.error = None
+        completed: int = 0
+        row_count: int = 0
+        counted: bool = True
+        code: typing.Optional[bytes] = None
+        while code != READY_FOR_QUERY if num_sets is None else (completed < num_sets and self.error is None):
+            buffer: bytes = self._read(5)
+            if len(buffer) == 0:
+                self._raise_broken_pipe()
+            code, data_len = ci_unpack(buffer)
+            if code == COMMAND_COMPLETE or code == EMPTY_QUERY_RESPONSE:
+                if self.error is None:
+                    completed += 1
+                cursor._row_count = -1
+                self.message_types[code](self._read(data_len - 4), cursor)
+                if cursor._row_count == -1:
+                    counted = False
+                else:
+                    row_count += cursor._row_count
+            else:
+                self.message_types[code](self._read(data_len - 4), cursor)
+        return completed, row_count if counted else -1
 
     def _send_message(self: "Connection", code: bytes, data: bytes) -> None:
         _logger.debug("Sending message with code %s to BE", code)
@@ -1965,7 +2843,7 @@ class Connection:
         except AttributeError:
             raise InterfaceError("connection is closed")
 
-    def send_EXECUTE(self: "Connection", cursor: Cursor) -> None:
+    def send_EXECUTE(self: "Connection", cursor: Cursor, row_limit: int = 0) -> None:
         """
         Sends an Execute message in ordinance with Amazon Redshift wire protocol.
 
@@ -1986,13 +2864,18 @@ class Connection:
         ----------
         :param cursor: `Cursor`
             The `Cursor` object associated with the given statements execution.
+        :param row_limit: int
+            Maximum number of rows to return. Default value is 0, denoting no limit.
 
         Returns
         -------
         None:None
         """
         _logger.debug("Sending Execute message to BE")
-        self._write(EXECUTE_MSG)
+        if row_limit > 0:
+            self._write(create_message(EXECUTE, NULL_BYTE + i_pack(row_limit)))
+        else:
+            self._write(EXECUTE_MSG)
         _logger.debug("Sending Flush message to BE")
         self._write(FLUSH_MSG)
 
@@ -2084,7 +2967,10 @@ class Connection:
             for scache in self._caches.values():
                 for pcache in scache.values():
                     for ps in pcache["ps"].values():
-                        self.close_prepared_statement(ps["statement_name_bin"])
+                        if self._pipeline is not None:
+                            self._pipeline._statements_to_close.append(ps["statement_name_bin"])
+                        else:
+                            self.close_prepared_statement(ps["statement_name_bin"])
                     pcache["ps"].clear()
                     if pcache.get("statement_dict") is not None:
                         pcache["statement_dict"].clear()
@@ -2114,20 +3000,12 @@ class Connection:
         None:None
         """
         _logger.debug("DataRow message received from BE")
-        data_idx: int = 2
-        row: typing.List = []
-        for desc in cursor.truncated_row_desc():
-            vlen: int = i_unpack(data, data_idx)[0]
-            data_idx += 4
-            if vlen == -1:
-                row.append(None)
-            elif desc[0] in (numeric_in_binary, numeric_to_float_binary):
-                row.append(desc[0](data, data_idx, vlen, desc[1]))
-                data_idx += vlen
-            else:
-                row.append(desc[0](data, data_idx, vlen))
-                data_idx += vlen
-        cursor._cached_rows.append(row)
+        # decoding is performed by a function compiled from the row description when the statement was prepared.
+        # See redshift_connector.utils.row_decoder
+        if cursor._cached_rows.__class__ is deque:
+            cursor._cached_rows.append(cursor.ps["row_decoder"](data))
+        else:
+            cursor._cached_rows.append_data_row(data)
 
     def handle_messages(self: "Connection", cursor: Cursor) -> None:
         """
@@ -2148,16 +3026,7 @@ class Connection:
             buffer = self._read(5)
 
             if len(buffer) == 0:
-                if self._usock.timeout is not None:
-                    raise InterfaceError(
-                        "BrokenPipe: server socket closed. We noticed a timeout is set for this connection. Consider "
-                        "raising the timeout or defaulting timeout to none."
-                    )
-                else:
-                    raise InterfaceError(
-                        "BrokenPipe: server socket closed. Please check that client side networking configurations such "
-                        "as Proxies, firewalls, VPN, etc. are not affecting your network connection."
-                    )
+                self._raise_broken_pipe()
 
             code, data_len = ci_unpack(buffer)
             _logger.debug("Message received from BE with code %s length %s ", code, data_len)
@@ -2183,16 +3052,7 @@ class Connection:
         # read 5 bytes of message firstly
         buffer = self._read(5)
         if len(buffer) == 0:
-            if self._usock.timeout is not None:
-                raise InterfaceError(
-                    "BrokenPipe: server socket closed. We noticed a timeout is set for this connection. Consider "
-                    "raising the timeout or defaulting timeout to none."
-                )
-            else:
-                raise InterfaceError(
-                    "BrokenPipe: server socket closed. Please check that client side networking configurations such "
-                    "as Proxies, firewalls, VPN, etc. are not affecting your network connection."
-                )
+            self._raise_broken_pipe()
 
         code, data_len = ci_unpack(buffer)
 
@@ -2212,6 +3072,233 @@ class Connection:
         if self.error is not None:
             raise self.error
 
+    def handle_messages_chunked_socket_read(self: "Connection", cursor: Cursor) -> None:
+        """
+        An optimized version of :func:`Connection.handle_messages` which reads from the socket in large chunks.
+        Received bytes are held by a reusable buffer of the connection, from which every complete message is framed
+        without further reads. See :class:`MessageReader`.
+
+        Once used, all messages received by the connection are read through this buffer.
+
+        Parameters
+        ----------
+        :param cursor: `Cursor`
+            The `Cursor` object associated with the given connection object.
+
+        Returns
+        -------
+        None:None
+        """
+        self.error = None
+        self._handle_buffered_messages(cursor, _READY_FOR_QUERY_CODES)
+
+        if self.error is not None:
+            raise self.error
+
+    def _get_message_reader(self: "Connection") -> MessageReader:
+        if self._message_reader is None:
+            self._message_reader = MessageReader(self._sock.readinto1)
+            self._read = self._message_reader.read
+        return self._message_reader
+
+    def _handle_buffered_messages(self: "Connection", cursor: Cursor, stop_codes: typing.FrozenSet[bytes]) -> bytes:
+        """
+        Handles messages read through the :class:`MessageReader` of the connection until one whose code is in
+        ``stop_codes`` was handled, returning its code. The reader is created on first use, after which all reads of
+        the connection are served from its buffer.
+        """
+        read_messages: typing.Callable = self._get_message_reader().read_messages
+        message_types: typing.Dict[bytes, typing.Callable] = self.message_types
+
+        code: typing.Optional[bytes] = None
+        while code not in stop_codes:
+            messages: typing.List[typing.Tuple[bytes, bytes]] = read_messages(stop_codes)
+            if len(messages) == 0:
+                self._raise_broken_pipe()
+
+            for code, data in messages:
+                message_types[code](data, cursor)
+        return typing.cast(bytes, code)
+
+    def handle_portal_messages(self: "Connection", cursor: Cursor) -> None:
+        """
+        Reads the response to an Execute message sent with a row limit, modifying the connection and cursor. Reading
+        stops once the portal is suspended, leaving the remaining rows on the server. Once the portal is exhausted, or
+        fails, a Sync message is sent to end the extended query cycle.
+
+        Parameters
+        ----------
+        :param cursor: `Cursor`
+            The `Cursor` object associated with the given connection object.
+
+        Returns
+        -------
+        None:None
+        """
+        code = self.error = None
+        rows_before: int = len(cursor._cached_rows)
+
+        if self.chunked_socket_read:
+            code = self._handle_buffered_messages(cursor, _PORTAL_STOP_CODES)
+
+        while code not in _PORTAL_STOP_CODES:
+            buffer = self._read(5)
+
+            if len(buffer) == 0:
+                self._raise_broken_pipe()
+
+            code, data_len = ci_unpack(buffer)
+            _logger.debug("Message received from BE with code %s length %s ", code, data_len)
+            self.message_types[code](self._read(data_len - 4), cursor)
+
+        cursor._portal_row_count += len(cursor._cached_rows) - rows_before
+
+        if code == PORTAL_SUSPENDED:
+            return
+
+        if code == COMMAND_COMPLETE and cursor.ps is not None and len(cursor.ps["row_desc"]) > 0:
+            # the command tag of a portal run in chunks only counts the rows of the final chunk
+            cursor._row_count = cursor._redshift_row_count = cursor._portal_row_count
+
+        error: typing.Optional[Exception] = self.error
+        _logger.debug("Sending Sync message to BE")
+        self._write(SYNC_MSG)
+        self._flush()
+        if self.chunked_socket_read:
+            self.handle_messages_chunked_socket_read(cursor)
+        else:
+            self.handle_messages(cursor)
+
+        if error is not None:
+            raise error
+
+    def fetch_portal_rows(self: "Connection", cursor: Cursor) -> None:
+        """
+        Requests the next chunk of rows from the portal suspended for ``cursor``.
+
+        Parameters
+        ----------
+        :param cursor: `Cursor`
+            The `Cursor` object owning the suspended portal.
+
+        Returns
+        -------
+        None:None
+        """
+        if self._suspended_portal_cursor is not cursor:
+            raise InterfaceError("Cursor does not have a suspended portal")
+        self._suspended_portal_cursor = None
+        self.send_EXECUTE(cursor, self._portal_fetch_size)
+        self._flush()
+        self.handle_portal_messages(cursor)
+
+    def fetch_background_rows(self: "Connection", cursor: Cursor) -> None:
+        """
+        Handles the next batch of messages read by the background thread for ``cursor``, decoding the rows it holds.
+        Waits for the batch to be read if needed.
+
+        Parameters
+        ----------
+        :param cursor: `Cursor`
+            The `Cursor` object whose response is read in the background.
+
+        Returns
+        -------
+        None:None
+        """
+        if self._background_read_cursor is not cursor or self._background_reader is None:
+            raise InterfaceError("Cursor does not have a response read in the background")
+        try:
+            messages: typing.List[typing.Tuple[bytes, bytes]] = self._background_reader.get()
+        except Exception:
+            self._background_read_cursor = self._background_reader = None
+            raise
+        if len(messages) == 0:
+            self._background_read_cursor = self._background_reader = None
+            self._raise_broken_pipe()
+
+        for code, data in messages:
+            self.message_types[code](data, cursor)
+
+        if messages[-1][0] == READY_FOR_QUERY:
+            self._background_read_cursor = self._background_reader = None
+            if self.error is not None:
+                raise self.error
+
+    def finish_background_read(self: "Connection") -> None:
+        """
+        Handles the remaining messages read in the background, discarding rows not yet decoded, so the connection
+        can be used for another statement.
+
+        Returns
+        -------
+        None:None
+        """
+        cursor: typing.Optional[Cursor] = self._background_read_cursor
+        reader: typing.Optional[BackgroundMessageReader] = self._background_reader
+        if cursor is None or reader is None:
+            return
+        self._background_read_cursor = self._background_reader = None
+
+        code: typing.Optional[bytes] = None
+        while code != READY_FOR_QUERY:
+            messages: typing.List[typing.Tuple[bytes, bytes]] = reader.get()
+            if len(messages) == 0:
+                self._raise_broken_pipe()
+            for code, data in messages:
+                if code == DATA_ROW:
+                    cursor._portal_closed = True
+                else:
+                    self.message_types[code](data, cursor)
+
+        if self.error is not None:
+            raise self.error
+
+    def close_portal(self: "Connection") -> None:
+        """
+        Closes the suspended portal, if any, discarding its remaining rows and ending the extended query cycle.
+
+        Close (F)
+            Byte1('C')
+                Identifies the message as a Close command.
+
+            Int32
+                Length of message contents in bytes, including self.
+
+            Byte1
+                'S' to close a prepared statement; or 'P' to close a portal.
+
+            String
+                The name of the prepared statement or portal to close (an empty string selects the unnamed prepared statement or portal).
+
+        Returns
+        -------
+        None:None
+        """
+        cursor: typing.Optional[Cursor] = self._suspended_portal_cursor
+        if cursor is None:
+            return
+        self._suspended_portal_cursor = None
+        cursor._portal_closed = True
+        _logger.debug("Send Close message for unnamed portal to BE")
+        self._send_message(CLOSE, PORTAL + NULL_BYTE)
+        _logger.debug("Sending Sync message to BE")
+        self._write(SYNC_MSG)
+        self._flush()
+        self.handle_messages(cursor)
+
+    def _raise_broken_pipe(self: "Connection") -> None:
+        if self._usock.timeout is not None:
+            raise InterfaceError(
+                "BrokenPipe: server socket closed. We noticed a timeout is set for this connection. Consider "
+                "raising the timeout or defaulting timeout to none."
+            )
+        else:
+            raise InterfaceError(
+                "BrokenPipe: server socket closed. Please check that client side networking configurations such "
+                "as Proxies, firewalls, VPN, etc. are not affecting your network connection."
+            )
+
     def close_prepared_statement(self: "Connection", statement_name_bin: bytes) -> None:
         """
         Handler for Close message received via Amazon Redshift wire protocol, represented by b'C' code. Clears attributes
@@ -2327,6 +3414,8 @@ class Connection:
                 self._client_protocol_version = int(value)
                 self._enable_protocol_based_conversion_funcs()
         elif key == b"server_version":
+            from packaging import version
+
             self._server_version: typing.Union[version.LegacyVersion, version.Version] = version.parse(
                 (value.decode("ascii"))
             )
@@ -2336,9 +3425,33 @@ class Connection:
                 self._commands_with_count = (b"INSERT", b"DELETE", b"UPDATE", b"MOVE", b"FETCH", b"COPY")
 
     def array_inspect(self: "Connection", value):
+        """
+        Returns the array type OID, format code and send function of a list, tuple or NumPy array parameter.
+
+        The dimensions and elements of a list or tuple are gathered in a single pass by :func:`array_scan`, from
+        which the element type, the presence of NULLs and the smallest int type holding all int elements are derived
+        before the array is encoded. NumPy arrays of bool, int and float dtypes are encoded according to their dtype by
+        :func:`numpy_array_send`, other NumPy arrays are converted to lists. The send function returns the array
+        encoded here when first given ``value`` itself, so each parameter is encoded once.
+        """
+        source = value
+        if not isinstance(value, (list, tuple)):
+            numpy_array: typing.Optional[typing.Tuple[int, bytes]] = numpy_array_send(value)
+            if numpy_array is not None:
+                return (
+                    numpy_array[0],
+                    FC_BINARY,
+                    _send_encoded(source, numpy_array[1], lambda arr: self.array_inspect(arr)[2](arr)),
+                )
+            value = value.tolist()
+
+        dims, elements = array_scan(value)
+        types: typing.Set[type] = set(map(type, elements))
+        has_null: bool = type(None) in types
+        types.discard(type(None))
+        first_element = next((v for v in elements if v is not None), None)
         # Check if array has any values. If empty, we can just assume it's an
         # array of strings
-        first_element = array_find_first_element(value)
         if first_element is None:
             oid: int = 25
             # Use binary ARRAY format to avoid having to properly
@@ -2353,26 +3466,16 @@ class Connection:
                 # special int array support -- send as smallest possible array
                 # type
                 typ = int
-                int2_ok, int4_ok, int8_ok = True, True, True
-                for v in array_flatten(value):
-                    if v is None:
-                        continue
-                    if min_int2 < v < max_int2:
-                        continue
-                    int2_ok = False
-                    if min_int4 < v < max_int4:
-                        continue
-                    int4_ok = False
-                    if min_int8 < v < max_int8:
-                        continue
-                    int8_ok = False
-                if int2_ok:
+                _check_array_homogenous(types, typ)
+                ints: typing.List[int] = [v for v in elements if v is not None] if has_null else elements
+                lowest, highest = min(ints), max(ints)
+                if min_int2 < lowest and highest < max_int2:
                     array_oid = 1005  # INT2[]
                     oid, fc, send_func = (21, FC_BINARY, h_pack)
-                elif int4_ok:
+                elif min_int4 < lowest and highest < max_int4:
                     array_oid = 1007  # INT4[]
                     oid, fc, send_func = (23, FC_BINARY, i_pack)
-                elif int8_ok:
+                elif min_int8 < lowest and highest < max_int8:
                     array_oid = 1016  # INT8[]
                     oid, fc, send_func = (20, FC_BINARY, q_pack)
                 else:
@@ -2392,43 +3495,50 @@ class Connection:
                     raise ArrayContentNotSupportedError("oid " + str(oid) + " not supported as array contents")
                 except NotSupportedError:
                     raise ArrayContentNotSupportedError("type " + str(typ) + " not supported as array contents")
-        if fc == FC_BINARY:
+                _check_array_homogenous(types, typ)
 
-            def send_array(arr: typing.List) -> typing.Union[bytes, bytearray]:
-                # check that all array dimensions are consistent
-                array_check_dimensions(arr)
+        if fc == FC_BINARY:
+            # elements of fixed width types are packed by a single struct per element
+            fixed_width: typing.Optional[typing.Tuple[Struct, int]] = _ARRAY_FIXED_WIDTH_SENDS.get(send_func)
 
-                has_null: bool = array_has_null(arr)
-                dim_lengths: typing.List[int] = array_dim_lengths(arr)
-                data: bytearray = bytearray(iii_pack(len(dim_lengths), has_null, oid))
-                for i in dim_lengths:
+            def encode(arr_dims: typing.List[int], arr_elements: typing.List) -> bytes:
+                has_null: bool = None in arr_elements
+                data: bytearray = bytearray(iii_pack(len(arr_dims), has_null, oid))
+                for i in arr_dims:
                     data.extend(ii_pack(i, 1))
-                for v in array_flatten(arr):
+                if fixed_width is not None and not has_null:
+                    element_struct, width = fixed_width
+                    data += b"".join(map(element_struct.pack, repeat(width, len(arr_elements)), arr_elements))
+                    return bytes(data)
+                for v in arr_elements:
                     if v is None:
                         data += i_pack(-1)
-                    elif isinstance(v, typ):
+                    else:
                         inner_data = send_func(v)
                         data += i_pack(len(inner_data))
                         data += inner_data
-                    else:
-                        raise ArrayContentNotHomogenousError("not all array elements are of type " + str(typ))
-                return data
+                return bytes(data)
 
         else:
 
-            def send_array(arr: typing.List) -> typing.Union[bytes, bytearray]:
-                array_check_dimensions(arr)
-                ar: typing.List = deepcopy(arr)
-                for a, i, v in walk_array(ar):
-                    if v is None:
-                        a[i] = "NULL"
-                    elif isinstance(v, typ):
-                        a[i] = send_func(v).decode("ascii")
-                    else:
-                        raise ArrayContentNotHomogenousError("not all array elements are of type " + str(typ))
-                return str(ar).translate(arr_trans).encode("ascii")
-
-        return (array_oid, fc, send_array)
+            def encode(arr_dims: typing.List[int], arr_elements: typing.List) -> bytes:
+                texts: typing.List[str] = [
+                    "NULL" if v is None else _array_text_element(send_func(v).decode("ascii")) for v in arr_elements
+                ]
+                for dim in reversed(arr_dims[1:]):
+                    texts = ["{" + ",".join(texts[i : i + dim]) + "}" for i in range(0, len(texts), dim)]
+                return ("{" + ",".join(texts) + "}").encode("ascii")
+
+        def send_array(arr: typing.Sequence) -> bytes:
+            if not isinstance(arr, (list, tuple)):
+                arr = typing.cast(typing.Any, arr).tolist()
+            arr_dims, arr_elements = array_scan(arr)
+            arr_types: typing.Set[type] = set(map(type, arr_elements))
+            arr_types.discard(type(None))
+            _check_array_homogenous(arr_types, typ)
+            return encode(arr_dims, arr_elements)
+
+        return (array_oid, fc, _send_encoded(source, encode(dims, elements), send_array))
 
     def xid(self: "Connection", format_id, global_transaction_id, branch_qualifier) -> typing.Tuple:
         """Create a Transaction IDs (only global_transaction_id is used in pg)
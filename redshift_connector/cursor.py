@@ -1,9 +1,14 @@
 import functools
 import logging
+import os
 import re
+import threading
+import time
 import typing
+import uuid
 from collections import deque
-from itertools import count, islice
+from concurrent.futures import Future
+from itertools import chain, count, islice
 from typing import TYPE_CHECKING, Optional
 from warnings import warn
 from dataclasses import dataclass
@@ -13,23 +18,49 @@ from redshift_connector.metadataAPIPostProcessor import MetadataAPIPostProcessor
 
 import redshift_connector
 from redshift_connector.config import (
+    DEFAULT_COPY_PART_ROWS,
+    DEFAULT_FETCH_SIZE,
+    DEFAULT_PIPELINE_SIZE,
+    MAX_BIND_PARAMETERS,
+    MULTI_ROW_INSERT_BATCH_SIZES,
     ClientProtocolVersion,
+    CopyFileFormat,
     DbApiParamstyle,
+    NumpyArrayLayout,
+    ResultBufferMode,
     _client_encoding,
     table_type_clauses,
 )
 from redshift_connector.error import (
     MISSING_MODULE_ERROR_MSG,
+    DatabaseError,
     InterfaceError,
     ProgrammingError,
+    QueryTimeoutError,
 )
+from redshift_connector.object_store import ObjectStore, S3ObjectStore
+from redshift_connector.utils.column_util import (
+    EncodedRows,
+    arrow_record_batch,
+    arrow_schema,
+    column_label,
+    dataframe_column,
+    encode_dataframe,
+    numpy_arrays,
+    numpy_structured_array,
+)
+from redshift_connector.utils.copy_util import copy_manifest, copy_statement, serialize_part
+from redshift_connector.utils.result_buffer import BufferedColumn, SpillingResultBuffer
+from redshift_connector.utils.sql_util import InsertTemplate, parse_insert_values
 
 if TYPE_CHECKING:
     from redshift_connector.core import Connection
+    from redshift_connector.utils import ColumnarResultBuffer, LazyResultBuffer
 
     try:
         import numpy  # type: ignore
         import pandas  # type: ignore
+        import pyarrow  # type: ignore
     except:
         pass
 
@@ -240,6 +271,69 @@ TableTypesRow = typing.Tuple[
 ]
 TableTypesResult = typing.Tuple[TableTypesRow, ...]
 
+
+class BulkInsertStats(typing.NamedTuple):
+    """
+    Statistics of the rows inserted by :meth:`Cursor.insert_data_bulk`.
+    """
+
+    rows: int
+    statements: int
+    # the number of distinct INSERT statements executed, each prepared once
+    prepared_statements: int
+    seconds: float
+
+    @property
+    def rows_per_second(self: "BulkInsertStats") -> float:
+        return self.rows / self.seconds if self.seconds > 0 else 0.0
+
+
+class MergeResult(typing.NamedTuple):
+    """
+    The number of rows updated and inserted by :meth:`Cursor.merge_rows`.
+    """
+
+    updated: int
+    inserted: int
+
+
+class _StatementTimer:
+    """
+    Cancels the statement running on ``connection`` using :meth:`Connection.cancel` once ``timeout`` seconds elapsed,
+    unless stopped before.
+    """
+
+    def __init__(self: "_StatementTimer", connection: "Connection", timeout: float) -> None:
+        self._connection: "Connection" = connection
+        # held while the cancel request is sent, so that it is not sent once the timer was stopped
+        self._lock: threading.Lock = threading.Lock()
+        self._stopped: bool = False
+        self.fired: bool = False
+        self._timer: threading.Timer = threading.Timer(timeout, self._fire)
+        self._timer.daemon = True
+        self._timer.start()
+
+    def _fire(self: "_StatementTimer") -> None:
+        with self._lock:
+            if self._stopped:
+                return
+            self.fired = True
+            _logger.debug("Statement timeout elapsed, cancelling statement")
+            try:
+                self._connection.cancel()
+            except Exception as e:
+                _logger.warning("Failed to cancel statement following statement timeout: %s", e)
+
+    def stop(self: "_StatementTimer") -> bool:
+        """
+        Stops the timer, waiting for a cancel request being sent to complete. Returns whether the timer fired.
+        """
+        with self._lock:
+            self._stopped = True
+        self._timer.cancel()
+        return self.fired
+
+
 class Cursor:
     """A cursor object is returned by the :meth:`~Connection.cursor` method of
     a connection. It has the following attributes and methods:
@@ -249,6 +343,36 @@ class Cursor:
         This read/write attribute specifies the number of rows to fetch at a
         time with :meth:`fetchmany`.  It defaults to 1.
 
+    .. attribute:: buffer_mode
+
+        This read/write attribute specifies how rows received for a query
+        are held by the cursor until fetched. ``"rows"``, the default,
+        holds each row as a list. ``"columnar"`` holds one buffer per
+        column, storing values of fixed-width binary columns (INT2, INT4,
+        INT8, FLOAT4, FLOAT8, BOOL, DATE, TIMESTAMP) compactly, and builds
+        rows only as they are fetched. ``"lazy"`` holds each row as
+        received, decoding its values only as they are accessed, so columns
+        of fetched rows which are never read are never decoded. See
+        :class:`ResultBufferMode`.
+
+    .. attribute:: buffer_memory_limit
+
+        This read/write attribute specifies the maximum number of bytes of
+        received rows held in memory by the cursor until fetched. Rows
+        received past this limit are written to a temporary file, and read
+        back as they are fetched. Rows are held as received from the
+        server, and decoded as they are fetched. It defaults to ``None``,
+        which holds all rows in memory. Not supported when ``buffer_mode``
+        is ``"columnar"``.
+
+    .. attribute:: bulk_insert_stats
+
+        This attribute holds the :class:`BulkInsertStats` of the
+        last call to :meth:`insert_data_bulk`: the number of rows inserted,
+        the number of statements executed, the number of distinct
+        statements prepared for them, and the time taken. It is ``None``
+        until :meth:`insert_data_bulk` completes.
+
     .. attribute:: connection
 
         This read-only attribute contains a reference to the connection object
@@ -292,6 +416,11 @@ class Cursor:
         <http://www.python.org/dev/peps/pep-0249/>`_.
     """
 
+    buffer_mode: str = ResultBufferMode.ROWS.value
+    buffer_memory_limit: typing.Optional[int] = None
+    bulk_insert_stats: typing.Optional[BulkInsertStats] = None
+    ps: typing.Optional[typing.Dict[str, typing.Any]] = None
+
     def __init__(self: "Cursor", connection: "Connection", paramstyle=None) -> None:
         """
         A cursor object is returned by the :meth:`~Connection.cursor` method of a connection.
@@ -308,7 +437,13 @@ class Cursor:
         self.ps: typing.Optional[typing.Dict[str, typing.Any]] = None
         self._row_count: int = -1
         self._redshift_row_count: int = -1
-        self._cached_rows: deque = deque()
+        self._cached_rows: typing.Union[
+            deque, "ColumnarResultBuffer", "LazyResultBuffer", SpillingResultBuffer
+        ] = deque()
+        # rows received so far from a portal streamed in chunks, see execute(stream_rows=True)
+        self._portal_row_count: int = 0
+        # set when a streamed portal is closed before all of its rows were fetched
+        self._portal_closed: bool = False
         if paramstyle is None:
             self.paramstyle: str = redshift_connector.paramstyle
         else:
@@ -421,7 +556,18 @@ class Cursor:
     # or mapping and will be bound to variables in the operation.
     # <p>
     # Stability: Part of the DBAPI 2.0 specification.
-    def execute(self: "Cursor", operation, args=None, stream=None, merge_socket_read=False) -> "Cursor":
+    def execute(
+        self: "Cursor",
+        operation,
+        args=None,
+        stream=None,
+        merge_socket_read=False,
+        stream_rows: bool = False,
+        fetch_size: typing.Optional[int] = None,
+        chunked_socket_read: bool = False,
+        background_read: bool = False,
+        timeout: typing.Optional[float] = None,
+    ) -> "Cursor":
         """Executes a database operation.  Parameters may be provided as a
         sequence, or as a mapping, depending upon the value of
         :data:`paramstyle`.
@@ -448,6 +594,33 @@ class Cursor:
 
             .. versionadded:: 1.9.11
 
+        :param stream_rows: bool
+            If ``True``, rows are received from the server in chunks of ``fetch_size`` rows as they are fetched
+            rather than all rows being received before ``execute`` returns, bounding the memory used by large result
+            sets to roughly one chunk. Rows not yet fetched are discarded if another statement is executed on the
+            same connection. :attr:`rowcount` is -1 until all rows have been fetched. Default value is ``False``.
+
+        :param fetch_size: Optional[int]
+            The number of rows received per chunk when ``stream_rows`` is enabled. Default value is 10000.
+
+        :param chunked_socket_read: bool
+            If ``True``, the response is read from the socket in chunks of up to 1 MB, from which each message is
+            framed without a separate read, reducing the per row overhead of large result sets. Takes precedence
+            over ``merge_socket_read``. Default value is ``False``.
+
+        :param background_read: bool
+            If ``True``, the response is read from the socket by a background thread while rows are decoded as they
+            are fetched, overlapping network transfer with decoding. Up to 8 chunks of the response are read ahead
+            of the rows fetched, as with ``chunked_socket_read``. Rows not yet fetched are discarded if another
+            statement is executed on the same connection. Cannot be combined with ``stream_rows``. Default value is
+            ``False``.
+
+        :param timeout: Optional[float]
+            The number of seconds to wait for the statement to complete before it is cancelled using
+            :meth:`Connection.cancel`, upon which :class:`QueryTimeoutError` is raised. Only the time taken by
+            ``execute`` is bounded, rather than fetching rows received later with ``stream_rows`` or
+            ``background_read``. By default there is no timeout.
+
         Returns
         -------
         The Cursor object used for executing the specified database operation: :class:`Cursor`
@@ -458,6 +631,21 @@ class Cursor:
         if self._c._sock is None:
             raise InterfaceError("connection is closed")
 
+        if not stream_rows:
+            fetch_size = 0
+        elif fetch_size is None:
+            fetch_size = DEFAULT_FETCH_SIZE
+        elif fetch_size < 1:
+            raise InterfaceError("fetch_size must be greater than 0")
+
+        if stream_rows and background_read:
+            raise InterfaceError("stream_rows and background_read cannot be combined")
+        if timeout is not None and timeout <= 0:
+            raise InterfaceError("timeout must be greater than 0")
+
+        self._check_buffer_options()
+
+        timer: typing.Optional[_StatementTimer] = None if timeout is None else _StatementTimer(self._c, timeout)
         try:
             self.stream = stream
 
@@ -471,17 +659,49 @@ class Cursor:
             if not self._c.in_transaction and not self._c.autocommit:
                 self._c.execute(self, "begin transaction", None)
             self._c.merge_socket_read = merge_socket_read
-            self._c.execute(self, operation, args)
+            self._c.chunked_socket_read = chunked_socket_read
+            self._c.execute(self, operation, args, fetch_size, background_read)
         except Exception as e:
             try:
                 _logger.debug("Cursor's connection._usock state: %s", str(self._c._usock.__dict__))
                 _logger.debug("Cursor's connection._sock is closed: %s", str(self._c._sock.closed))
             except:
                 pass
+            if (
+                timer is not None
+                and timer.stop()
+                and len(e.args) > 0
+                and isinstance(e.args[0], dict)
+                and e.args[0].get("C") == "57014"
+            ):
+                # query_canceled
+                raise QueryTimeoutError(
+                    "statement did not complete within {} seconds and was cancelled".format(timeout)
+                ) from e
             raise e
+        finally:
+            if timer is not None:
+                timer.stop()
         return self
 
-    def executemany(self: "Cursor", operation, param_sets) -> "Cursor":
+    def _check_buffer_options(self: "Cursor") -> None:
+        if self.buffer_mode not in ResultBufferMode.list():
+            raise InterfaceError(
+                "Invalid buffer_mode {}. Supported values are {}".format(self.buffer_mode, ResultBufferMode.list())
+            )
+        if self.buffer_memory_limit is not None:
+            if self.buffer_memory_limit < 0:
+                raise InterfaceError("buffer_memory_limit must not be negative")
+            elif self.buffer_mode == ResultBufferMode.COLUMNAR.value:
+                raise InterfaceError("buffer_memory_limit is not supported when buffer_mode is columnar")
+
+    def executemany(
+        self: "Cursor",
+        operation,
+        param_sets,
+        pipeline_size: int = DEFAULT_PIPELINE_SIZE,
+        rewrite_inserts: bool = False,
+    ) -> "Cursor":
         """Prepare a database operation, and then execute it against all
         parameter sequences or mappings provided.
 
@@ -494,118 +714,290 @@ class Cursor:
             A sequence of parameters to execute the statement with. The values
             in the sequence should be sequences or mappings of parameters, the
             same as the args argument of the :meth:`execute` method.
+        :param pipeline_size: int
+            The maximum number of parameter sets sent to the server before
+            their responses are read. Parameter sets are sent without waiting
+            for the response of each, so executing many parameter sets takes
+            a few round trips rather than one per parameter set. When
+            autocommit is enabled, the parameter sets run in a single
+            transaction, rolled back as a whole if one of them fails or an
+            error is raised part way, e.g. for a parameter which cannot be
+            encoded. The index of the parameter set which failed is held by
+            the raised error under the ``"parameter_set_index"`` key. Default
+            value is 1000. See :meth:`Connection.executemany`.
+        :param rewrite_inserts: bool
+            If ``True`` and ``operation`` is an INSERT statement of a single
+            row whose VALUES list holds only placeholders, e.g.
+            ``INSERT INTO t (a, b) VALUES (%s, %s)``, parameter sets are
+            inserted using statements of 1024, 128, 16 or 1 rows, reusing
+            the prepared statement of each size. Statements are kept within
+            the limit of 32767 bind parameters. If a statement fails, the
+            raised error holds the index of the first parameter set it
+            inserts. Other statements are executed as usual. Default value
+            is ``False``.
 
         Returns
         -------
         The Cursor object used for executing the specified database operation: :class:`Cursor`
         """
-        rowcounts: typing.List[int] = []
-        redshift_rowcounts: typing.List[int] = []
-        for parameters in param_sets:
-            self.execute(operation, parameters)
-            rowcounts.append(self._row_count)
-            redshift_rowcounts.append(self._redshift_row_count)
+        if self._c is None:
+            raise InterfaceError("Cursor closed")
+        self._check_buffer_options()
 
-        self._row_count = -1 if -1 in rowcounts else sum(rowcounts)
-        self._redshift_row_count = -1 if -1 in redshift_rowcounts else sum(rowcounts)
+        try:
+            self.stream = None
+            self.truncated_row_desc.cache_clear()
+
+            if not self._c.in_transaction and not self._c.autocommit:
+                self._c.execute(self, "begin transaction", None)
+            self._c.merge_socket_read = False
+            self._c.chunked_socket_read = False
+            template: typing.Optional[InsertTemplate] = (
+                parse_insert_values(operation, self.paramstyle) if rewrite_inserts else None
+            )
+            if template is None:
+                self._c.executemany(self, operation, param_sets, pipeline_size)
+            else:
+                self.__insert_many(template, param_sets, pipeline_size)
+        except Exception as e:
+            try:
+                _logger.debug("Cursor's connection._usock state: %s", str(self._c._usock.__dict__))
+                _logger.debug("Cursor's connection._sock is closed: %s", str(self._c._sock.closed))
+            except:
+                pass
+            raise e
         return self
 
+    def __insert_many(self: "Cursor", template: InsertTemplate, param_sets, pipeline_size: int) -> None:
+        """
+        Inserts the rows given by ``param_sets`` using multi-row INSERT statements of the sizes in
+        ``MULTI_ROW_INSERT_BATCH_SIZES`` which are within the bind parameter limit, largest first. All statements are
+        sent in a single pipeline, see :meth:`Connection.executemany`.
+        """
+        rows: typing.List = list(param_sets)
+        batch_sizes: typing.List[int] = [
+            size for size in MULTI_ROW_INSERT_BATCH_SIZES if size * len(template.names) <= MAX_BIND_PARAMETERS
+        ] or [1]
+        statements: typing.Dict[int, str] = {}
+        # the index of the first row inserted by each statement, and the number of rows it inserts
+        batches: typing.List[typing.Tuple[int, int]] = []
+        offset: int = 0
+        for size in batch_sizes:
+            num_batches: int = (len(rows) - offset) // size
+            if num_batches == 0:
+                continue
+            statements[size] = template.statement(size)
+            batches.extend((start, size) for start in range(offset, offset + num_batches * size, size))
+            offset += num_batches * size
+
+        try:
+            typing.cast("Connection", self._c)._execute_pipelined(
+                self,
+                ((statements[size], template.args(rows[start : start + size])) for start, size in batches),
+                pipeline_size,
+            )
+        except DatabaseError as e:
+            if len(e.args) > 0 and isinstance(e.args[0], dict) and "parameter_set_index" in e.args[0]:
+                # the index of the first row inserted by the failed statement
+                e.args[0]["parameter_set_index"] = batches[e.args[0]["parameter_set_index"]][0]
+            raise
+
     def insert_data_bulk(
         self: "Cursor",
-        filename: str,
+        filename: typing.Optional[str],
         table_name: str,
-        parameter_indices: typing.List[int],
+        parameter_indices: typing.Optional[typing.List[int]],
         column_names: typing.List[str],
-        delimiter: str,
+        delimiter: str = ",",
         batch_size: int = 1,
+        max_statement_bytes: typing.Optional[int] = None,
+        rows: typing.Optional[typing.Iterable[typing.Sequence]] = None,
     ) -> "Cursor":
-        """runs a single bulk insert statement into the database.
+        """runs bulk insert statements into the database, streaming rows from
+        a CSV file or any iterable of rows.
         This method is native to redshift_connector.
-         :param filename: str
-             The name of the file to read from.
+
+        Rows are inserted using multi-row INSERT statements of ``batch_size``
+        rows, so a single prepared statement is reused for all full batches.
+        The remaining rows are split into statements whose sizes are powers
+        of two, e.g. 4, 2 and 1 rows for a remainder of 7, whose prepared
+        statements are reused by later calls. Only the rows of one batch are
+        held in memory at a time. Once all rows were inserted, the number of
+        rows and statements and the time taken are held by
+        :attr:`bulk_insert_stats`.
+
+         :param filename: Optional[str]
+             The name of the CSV file to read from, whose first line is a
+             header. Must be ``None`` if ``rows`` is given.
          :param table_name: str
              The name of the table to insert to.
          :param column_names:list
-             The name of the columns in the table to insert to.
+             The name of the columns in the table to insert to. All columns
+             are validated using a single catalog query.
          :param parameter_indices:list
-             The indexes of the columns in the file to insert to.
+             The indexes of the columns in the file to insert to. If None,
+             each row holds the values of ``column_names`` in order.
          :param delimiter: str
-             The delimiter to use when reading the file.
+             The delimiter to use when reading the file. Default value is ``","``.
         :param batch_size: int
             The number of rows to insert per insert statement. Minimum allowed value is 1.
+        :param max_statement_bytes: Optional[int]
+            The maximum number of bytes of parameter values bound to a single
+            statement. A batch is sent early once adding a row would exceed
+            this budget, so statements of very wide rows stay within server
+            limits. The size of str values is counted in bytes of the client
+            encoding, and of values other than str and bytes as 8 bytes.
+            Default value is ``None``, which does not limit the size of a
+            statement.
+        :param rows: Optional[Iterable[Sequence]]
+            The rows to insert, such as a generator, a ``csv.reader`` or a
+            DB-API cursor of another connection, read in place of a CSV file.
+            Default value is ``None``.
          Returns
          -------
          The Cursor object used for executing the specified database operation: :class:`Cursor`
         """
+        if (filename is None) == (rows is None):
+            raise InterfaceError("Exactly one of filename and rows must be given to insert_data_bulk")
         if batch_size < 1:
             raise InterfaceError("batch_size must be greater than 1")
+        if max_statement_bytes is not None and max_statement_bytes < 1:
+            raise InterfaceError("max_statement_bytes must be greater than 0")
+        if parameter_indices is not None and len(column_names) != len(parameter_indices):
+            raise InterfaceError("Column names and parameter indexes must be the same length")
         if not self.__is_valid_table(table_name):
             raise InterfaceError("Invalid table name passed to insert_data_bulk: {}".format(table_name))
         if not self.__has_valid_columns(table_name, column_names):
             raise InterfaceError("Invalid column names passed to insert_data_bulk: {}".format(table_name))
         orig_paramstyle = self.paramstyle
-        import csv
 
-        if len(column_names) != len(parameter_indices):
-            raise InterfaceError("Column names and parameter indexes must be the same length")
+        start_time: float = time.perf_counter()
+        num_columns: int = len(column_names)
         base_stmt = f"INSERT INTO  {table_name} ("
         base_stmt += ", ".join(column_names)
         base_stmt += ") VALUES "
-        sql_param_list_template = "(" + ", ".join(["%s"] * len(parameter_indices)) + ")"
+        sql_param_list_template = "(" + ", ".join(["%s"] * num_columns) + ")"
+        # the INSERT statement of each number of rows
+        statements: typing.Dict[int, str] = {}
+        num_rows: int = 0
+        num_statements: int = 0
+
+        def insert(values: typing.List, rows: int) -> None:
+            nonlocal num_rows, num_statements
+            offset: int = 0
+            # a full batch is inserted by one statement, fewer rows by statements of decreasing powers of two
+            sizes: typing.List[int] = [rows]
+            if rows < batch_size:
+                sizes = [1 << bit for bit in reversed(range(rows.bit_length())) if rows >> bit & 1]
+            for size in sizes:
+                if size not in statements:
+                    statements[size] = base_stmt + ", ".join([sql_param_list_template] * size) + ";"
+                self.execute(statements[size], values[offset : offset + size * num_columns])
+                offset += size * num_columns
+                num_statements += 1
+            num_rows += rows
+
         try:
-            with open(filename) as csv_file:
-                reader = csv.reader(csv_file, delimiter=delimiter)
-                next(reader)
-                values_list: typing.List[str] = []
-                row_count = 0
-                for row in reader:
-                    if row_count == batch_size:
-                        sql_param_lists = [sql_param_list_template] * row_count
-                        insert_stmt = base_stmt + ", ".join(sql_param_lists) + ";"
-                        self.execute(insert_stmt, values_list)
-                        row_count = 0
+            # the statements use the FORMAT i.e. %s paramstyle, then the cursor reverts to its original paramstyle
+            self.paramstyle = DbApiParamstyle.FORMAT.value
+            values_list: typing.List = []
+            row_count: int = 0
+            batch_bytes: int = 0
+            for row in self.__bulk_rows(filename, rows, delimiter):
+                if parameter_indices is None:
+                    if len(row) != num_columns:
+                        raise InterfaceError(
+                            "Row holds {} values, but {} column names were given".format(len(row), num_columns)
+                        )
+                    row_values: typing.Sequence = row
+                else:
+                    row_values = [row[column_index] for column_index in parameter_indices]
+
+                if max_statement_bytes is not None:
+                    row_bytes: int = 0
+                    for value in row_values:
+                        if isinstance(value, str):
+                            row_bytes += 4 + len(value.encode(_client_encoding))
+                        elif isinstance(value, (bytes, bytearray)):
+                            row_bytes += 4 + len(value)
+                        elif value is not None:
+                            row_bytes += 4 + 8
+                    if row_count > 0 and batch_bytes + row_bytes > max_statement_bytes:
+                        insert(values_list, row_count)
                         values_list.clear()
-
-                    for column_index in parameter_indices:
-                        values_list.append(row[column_index])
-
-                    row_count += 1
-
-                if row_count:
-                    sql_param_lists = [sql_param_list_template] * row_count
-                    insert_stmt = base_stmt + ", ".join(sql_param_lists) + ";"
-                    self.execute(insert_stmt, values_list)
-
-        except Exception as e:
-            raise e
+                        row_count, batch_bytes = 0, 0
+                    batch_bytes += row_bytes
+
+                values_list.extend(row_values)
+                row_count += 1
+                if row_count == batch_size:
+                    insert(values_list, row_count)
+                    values_list.clear()
+                    row_count, batch_bytes = 0, 0
+
+            if row_count:
+                insert(values_list, row_count)
         finally:
             # reset paramstyle to it's original value
             self.paramstyle = orig_paramstyle
 
+        self.bulk_insert_stats = BulkInsertStats(
+            num_rows, num_statements, len(statements), time.perf_counter() - start_time
+        )
+        _logger.debug(
+            "insert_data_bulk inserted %s rows using %s statements in %.3f seconds (%.0f rows per second)",
+            num_rows,
+            num_statements,
+            self.bulk_insert_stats.seconds,
+            self.bulk_insert_stats.rows_per_second,
+        )
         return self
 
+    @staticmethod
+    def __bulk_rows(
+        filename: typing.Optional[str], rows: typing.Optional[typing.Iterable[typing.Sequence]], delimiter: str
+    ) -> typing.Iterator[typing.Sequence]:
+        """
+        Yields ``rows`` if given, else the rows of the CSV file named ``filename`` following its header.
+        """
+        if rows is not None:
+            yield from rows
+            return
+        import csv
+
+        with open(typing.cast(str, filename)) as csv_file:
+            reader = csv.reader(csv_file, delimiter=delimiter)
+            next(reader, None)
+            yield from reader
+
     def __has_valid_columns(self: "Cursor", table: str, columns: typing.List[str]) -> bool:
+        if len(columns) == 0:
+            return True
         split_table_name: typing.List[str] = table.split(".")
-        q: str = "select 1 from pg_catalog.svv_all_columns where table_name = ? and column_name = ?"
+        # a single query returns a row only if all columns exist
+        q: str = "select 1 from pg_catalog.svv_all_columns where table_name = ? and column_name in ({})".format(
+            ", ".join(["?"] * len(columns))
+        )
+        params: typing.List[str]
         if len(split_table_name) == 2:
             q += " and schema_name = ?"
-            param_list = [[split_table_name[1], c, split_table_name[0]] for c in columns]
+            params = [split_table_name[1], *columns, split_table_name[0]]
         else:
-            param_list = [[split_table_name[0], c] for c in columns]
+            params = [split_table_name[0], *columns]
+        q += " having count(distinct column_name) = {}".format(len(set(columns)))
         temp = self.paramstyle
         self.paramstyle = DbApiParamstyle.QMARK.value
         try:
-            for params in param_list:
-                self.execute(q, params)
-                res = self.fetchone()
-                if res is None:
-                    raise InterfaceError(
-                        "Invalid column name. No results were returned when performing column name validity check. Query: {} Parameters: {}".format(
-                            q, params
-                        )
+            self.execute(q, params)
+            res = self.fetchone()
+            if res is None:
+                raise InterfaceError(
+                    "Invalid column name. No results were returned when performing column name validity check. Query: {} Parameters: {}".format(
+                        q, params
                     )
-                if typing.cast(typing.List[int], res)[0] != 1:
-                    raise InterfaceError("Invalid column name: {} specified for table: {}".format(params[1], table))
+                )
+            if typing.cast(typing.List[int], res)[0] != 1:
+                raise InterfaceError("Invalid column names: {} specified for table: {}".format(columns, table))
         except:
             raise
         finally:
@@ -703,6 +1095,19 @@ class Cursor:
         -------
         None:None
         """
+        if self._c is not None and self._c._suspended_portal_cursor is self:
+            try:
+                self._c.close_portal()
+            except Exception as e:
+                _logger.debug("Failed to close the streamed portal of the cursor: %s", e)
+        if self._c is not None and self._c._background_read_cursor is self:
+            try:
+                self._c.finish_background_read()
+            except Exception as e:
+                _logger.debug("Failed to finish reading the response of the cursor: %s", e)
+        if isinstance(self._cached_rows, SpillingResultBuffer):
+            # deletes the temporary file holding rows not fetched
+            self._cached_rows.close()
         self._c = None
 
     def __iter__(self: "Cursor") -> "Cursor":
@@ -734,13 +1139,160 @@ class Cursor:
                 raise ProgrammingError("A query hasn't been issued.")
             elif len(self.ps["row_desc"]) == 0:
                 raise ProgrammingError("no result set")
+            elif self._fetch_more_rows():
+                return next(self)
             else:
                 raise StopIteration()
 
+    def _fetch_more_rows(self: "Cursor") -> bool:
+        """
+        Requests the next chunk of rows of a result set streamed using ``execute(stream_rows=True)``, or decodes the
+        next chunk of rows read using ``execute(background_read=True)``, once the buffered rows have been consumed.
+
+        Returns
+        -------
+        False if all rows of the result set have been received, otherwise True: bool
+        """
+        if self._c is not None and self._c._suspended_portal_cursor is self:
+            self._c.fetch_portal_rows(self)
+            return True
+        elif self._c is not None and self._c._background_read_cursor is self:
+            self._c.fetch_background_rows(self)
+            return True
+        elif self._portal_closed:
+            raise InterfaceError(
+                "The streamed result set was closed before all rows were fetched. This occurs when another "
+                "statement is executed on the same connection."
+            )
+        return False
+
+    def _fetch_columns(
+        self: "Cursor", num: typing.Optional[int] = None
+    ) -> typing.Iterator[typing.List[BufferedColumn]]:
+        """
+        Retrieves up to ``num`` rows of a query result, or all remaining rows if ``num`` is not given, as the values of
+        each column. One chunk of columns is yielded per batch of rows received from the server.
+        """
+        remaining: typing.Optional[int] = num
+        while remaining is None or remaining > 0:
+            buffered: int = len(self._cached_rows)
+            if buffered == 0:
+                if self._fetch_more_rows():
+                    continue
+                return
+            size: int = buffered if remaining is None else min(buffered, remaining)
+
+            if isinstance(self._cached_rows, deque):
+                rows: typing.List[typing.List] = [self._cached_rows.popleft() for _ in range(size)]
+                columns: typing.List[BufferedColumn] = [(list(values), None) for values in zip(*rows)]
+            else:
+                columns = self._cached_rows.take_columns(size)
+
+            if remaining is not None:
+                remaining -= size
+            yield columns
+
+    def _fetch_column_values(self: "Cursor", num: typing.Optional[int] = None) -> typing.List[BufferedColumn]:
+        """
+        Retrieves up to ``num`` rows of a query result, or all remaining rows if ``num`` is not given, as the values of
+        each column. See :meth:`_fetch_columns`.
+        """
+        ps: typing.Dict[str, typing.Any] = typing.cast(typing.Dict[str, typing.Any], self.ps)
+        chunks: typing.List[typing.List[BufferedColumn]] = list(self._fetch_columns(num))
+        if len(chunks) == 0:
+            return [([], None) for _ in ps["input_funcs"]]
+        elif len(chunks) == 1:
+            return chunks[0]
+
+        result: typing.List[BufferedColumn] = []
+        for cidx in range(len(ps["input_funcs"])):
+            if isinstance(chunks[0][cidx][0], list):
+                result.append((list(chain.from_iterable(chunk[cidx][0] for chunk in chunks)), None))
+            else:
+                result.append(
+                    (
+                        b"".join(typing.cast(bytes, chunk[cidx][0]) for chunk in chunks),
+                        b"".join(typing.cast(bytes, chunk[cidx][1]) for chunk in chunks),
+                    )
+                )
+        return result
+
+    def _check_result_set(self: "Cursor") -> None:
+        if self.ps is None:
+            raise ProgrammingError("A query hasn't been issued.")
+        elif len(self.ps["row_desc"]) == 0:
+            raise ProgrammingError("no result set")
+
+    def fetch_arrow_batches(self: "Cursor") -> typing.Iterator["pyarrow.RecordBatch"]:
+        """
+        Fetches the remaining rows of a query result as :class:`pyarrow.RecordBatch` objects. Values of fixed-width
+        binary columns are converted to Arrow arrays directly from their wire representation when
+        ``Cursor.buffer_mode`` is ``"columnar"``.
+
+        One batch is yielded per chunk of rows received from the server. When used with
+        ``execute(stream_rows=True)``, each chunk holds up to ``fetch_size`` rows, and is requested only once the
+        previous batch has been consumed.
+
+        Returns
+        -------
+        An iterator of `pyarrow.RecordBatch`: Iterator[pyarrow.RecordBatch]
+        """
+        try:
+            import pyarrow  # type: ignore
+        except ModuleNotFoundError:
+            raise ModuleNotFoundError(MISSING_MODULE_ERROR_MSG.format(module="pyarrow"))
+
+        self._check_result_set()
+        return self._arrow_batches()
+
+    def _arrow_batches(self: "Cursor", num: typing.Optional[int] = None) -> typing.Iterator["pyarrow.RecordBatch"]:
+        ps: typing.Dict[str, typing.Any] = typing.cast(typing.Dict[str, typing.Any], self.ps)
+        for columns in self._fetch_columns(num):
+            yield arrow_record_batch(ps["row_desc"], ps["input_funcs"], columns)
+
+    def fetch_arrow_table(self: "Cursor", num: typing.Optional[int] = None) -> "pyarrow.Table":
+        """
+        Fetches a user defined number of rows of a query result as a :class:`pyarrow.Table`. See
+        :meth:`fetch_arrow_batches`.
+
+        Parameters
+        ----------
+        num : Optional[int] The number of rows to retrieve. If unspecified, all rows will be retrieved
+
+        Returns
+        -------
+        A `pyarrow.Table` with one column per column of the query result: pyarrow.Table
+        """
+        try:
+            import pyarrow  # type: ignore
+        except ModuleNotFoundError:
+            raise ModuleNotFoundError(MISSING_MODULE_ERROR_MSG.format(module="pyarrow"))
+
+        self._check_result_set()
+        ps: typing.Dict[str, typing.Any] = typing.cast(typing.Dict[str, typing.Any], self.ps)
+        batches: typing.List["pyarrow.RecordBatch"] = list(self._arrow_batches(num))
+
+        if len(batches) == 0:
+            return arrow_schema(ps["row_desc"], ps["input_funcs"]).empty_table()
+        elif all(batch.schema.equals(batches[0].schema) for batch in batches):
+            return pyarrow.Table.from_batches(batches)
+        else:
+            # the type of columns inferred from their values, e.g. a batch holding only NULL values, may differ
+            # between batches
+            return pyarrow.concat_tables(
+                [pyarrow.Table.from_batches([batch]) for batch in batches], promote_options="permissive"
+            )
+
     def fetch_dataframe(self: "Cursor", num: typing.Optional[int] = None) -> "pandas.DataFrame":
         """
         Fetches a user defined number of rows of a query result as a :class:`pandas.DataFrame`.
 
+        Each column is built as a typed array from the row description of the query result. INT2, INT4 and INT8 columns
+        are given as int64, FLOAT4, FLOAT8 and NUMERIC columns retrieved as float as float64, BOOL columns as bool, and
+        DATE and TIMESTAMP columns as datetime64. Integer and bool columns holding NULL values use the nullable
+        ``Int64`` and ``boolean`` types. The type of other columns is inferred by pandas. When ``Cursor.buffer_mode``
+        is ``"columnar"``, fixed-width binary columns are built directly from their wire representation.
+
         Parameters
         ----------
         num : Optional[int] The number of rows to retrieve. If unspecified, all rows will be retrieved
@@ -760,14 +1312,26 @@ class Cursor:
         except:
             warn("No row description was found. pandas dataframe will be missing column labels.", stacklevel=2)
 
-        if num:
-            fetcheddata: tuple = self.fetchmany(num)
-        else:
-            fetcheddata = self.fetchall()
+        if self.ps is None:
+            if num:
+                fetcheddata: tuple = self.fetchmany(num)
+            else:
+                fetcheddata = self.fetchall()
+
+            result: typing.List = [tuple(column for column in rows) for rows in fetcheddata]
 
-        result: typing.List = [tuple(column for column in rows) for rows in fetcheddata]
+            return pandas.DataFrame(result, columns=columns)
 
-        return pandas.DataFrame(result, columns=columns)
+        self._check_result_set()
+        values: typing.List[BufferedColumn] = self._fetch_column_values(num if num else None)
+        arrays: typing.Dict[int, typing.Any] = {
+            cidx: dataframe_column(column, func)
+            for cidx, (column, func) in enumerate(zip(values, self.ps["input_funcs"]))
+        }
+        df: "pandas.DataFrame" = pandas.DataFrame(arrays, copy=False)
+        if columns is not None:
+            df.columns = columns
+        return df
 
     def __is_valid_table(self: "Cursor", table: str) -> bool:
         split_table_name: typing.List[str] = table.split(".")
@@ -800,6 +1364,13 @@ class Cursor:
         """
         Inserts a :class:`pandas.DataFrame` into a table within the current database.
 
+        The rows are inserted using multi-row INSERT statements of the sizes in ``MULTI_ROW_INSERT_BATCH_SIZES``,
+        pipelined as by :meth:`Cursor.executemany`. Each column is encoded as a whole, using a parameter type chosen
+        from its dtype as described by :func:`redshift_connector.utils.encode_dataframe`. Missing values such as NaN,
+        NaT and ``pandas.NA`` are inserted as NULL. If the values of a column of object dtype are not all sent as the
+        same parameter type, e.g. when mixing str and int values, the rows are instead converted to Python objects
+        and executed one by one.
+
         Parameters
         ----------
         df : :class:`pandas.DataFrame` Contains row values to insert into `table`
@@ -817,8 +1388,9 @@ class Cursor:
         if not self.__is_valid_table(table):
             raise InterfaceError("Invalid table name passed to write_dataframe: {}".format(table))
         sanitized_table_name: str = self.__sanitize_str(table)
-        arrays: list = df.values.tolist()
-        placeholder: str = ", ".join(["%s"] * len(arrays[0]))
+        if len(df.index) == 0:
+            return
+        placeholder: str = ", ".join(["%s"] * len(df.columns))
         sql: str = "insert into {table} values ({placeholder})".format(
             table=sanitized_table_name, placeholder=placeholder
         )
@@ -827,10 +1399,16 @@ class Cursor:
             # force using FORMAT i.e. %s paramstyle for the current statement, then revert the
             # cursor to use the cursor's original paramstyle
             self.paramstyle = DbApiParamstyle.FORMAT.value
-            if len(arrays) == 1:
-                self.execute(sql, arrays[0])
-            elif len(arrays) > 1:
-                self.executemany(sql, arrays)
+            if len(df.index) == 1:
+                self.execute(sql, df.values.tolist()[0])
+            else:
+                rows: typing.Optional[EncodedRows] = encode_dataframe(
+                    df, typing.cast("Connection", self._c).make_params
+                )
+                if rows is None:
+                    self.executemany(sql, df.values.tolist())
+                else:
+                    self.__insert_encoded_rows(sanitized_table_name, rows)
         except:
             raise InterfaceError(
                 "An error occurred when attempting to insert the pandas.DataFrame into ${}".format(table)
@@ -838,23 +1416,402 @@ class Cursor:
         finally:
             self.paramstyle = cursor_paramstyle
 
-    def fetch_numpy_array(self: "Cursor", num: typing.Optional[int] = None) -> "numpy.ndarray":
+    def __insert_encoded_rows(self: "Cursor", table: str, rows: EncodedRows) -> None:
+        """
+        Inserts rows encoded by :func:`encode_dataframe` into ``table`` using multi-row INSERT statements of the sizes in
+        ``MULTI_ROW_INSERT_BATCH_SIZES`` which are within the bind parameter limit, largest first.
+        """
+        if self._c is None:
+            raise InterfaceError("Cursor closed")
+        self._check_buffer_options()
+        self.stream = None
+        self.truncated_row_desc.cache_clear()
+        if not self._c.in_transaction and not self._c.autocommit:
+            self._c.execute(self, "begin transaction", None)
+        self._c.merge_socket_read = False
+        self._c.chunked_socket_read = False
+
+        num_columns: int = len(rows.param_types)
+        batch_sizes: typing.List[int] = [
+            size for size in MULTI_ROW_INSERT_BATCH_SIZES if size * num_columns <= MAX_BIND_PARAMETERS
+        ] or [1]
+        # the statement, parameter types, index of the first row and number of rows of each multi-row INSERT
+        batches: typing.List[typing.Tuple[str, typing.Tuple[typing.Tuple[int, int], ...], int, int]] = []
+        offset: int = 0
+        for size in batch_sizes:
+            num_batches: int = (rows.num_rows - offset) // size
+            if num_batches == 0:
+                continue
+            statement: str = "insert into {} values {}".format(
+                table,
+                ", ".join(
+                    "({})".format(", ".join("${}".format(pidx + 1) for pidx in range(start, start + num_columns)))
+                    for start in range(0, size * num_columns, num_columns)
+                ),
+            )
+            param_types: typing.Tuple[typing.Tuple[int, int], ...] = rows.param_types * size
+            batches.extend(
+                (statement, param_types, start, size) for start in range(offset, offset + num_batches * size, size)
+            )
+            offset += num_batches * size
+
+        self._c.executemany_encoded(
+            self,
+            (
+                (statement, param_types, rows.bind_values(start, start + size))
+                for statement, param_types, start, size in batches
+            ),
+        )
+
+    def copy_from_dataframe(
+        self: "Cursor",
+        df: typing.Union["pandas.DataFrame", typing.Iterable[typing.Sequence]],
+        table: str,
+        staging: typing.Union[str, ObjectStore],
+        column_names: typing.Optional[typing.List[str]] = None,
+        file_format: str = CopyFileFormat.CSV.value,
+        authorization: str = "IAM_ROLE default",
+        rows_per_part: int = DEFAULT_COPY_PART_ROWS,
+        num_workers: typing.Optional[int] = None,
+        cleanup: bool = True,
+    ) -> None:
+        """
+        Loads a :class:`pandas.DataFrame` or an iterable of rows into a table within the current database using a
+        single COPY command.
+
+        The rows are split into parts of ``rows_per_part`` rows, which are serialized to gzip compressed CSV or
+        Parquet files by a pool of ``num_workers`` worker processes and uploaded to ``staging`` as they are
+        serialized, so only a few parts are held in memory at a time. A manifest listing the files is uploaded last,
+        and loaded using ``COPY ... MANIFEST``. The staged files are deleted afterwards, whether the COPY succeeded
+        or not, unless ``cleanup`` is False. Once loaded, :attr:`rowcount` holds the number of rows loaded.
+
+        Parameters
+        ----------
+        df : :class:`pandas.DataFrame` | Iterable[Sequence] The rows to load. The values of each row of an iterable
+            are those of ``column_names`` in order, or of all columns of ``table`` if ``column_names`` is None.
+        table : str Name of an existing table in the current Amazon Redshift database to load the rows into
+        staging : str | :class:`ObjectStore` The object store the files are staged in, or an ``s3://bucket/prefix``
+            URL staging them using an :class:`S3ObjectStore`. The files of each call are staged under a unique prefix.
+        column_names : Optional[List[str]] The columns of ``table`` to load. Default value is ``None``, which loads
+            all columns in order.
+        file_format : str The format of the staged files. One of ``"csv"`` (default) or ``"parquet"``, which requires
+            pyarrow. See :class:`CopyFileFormat`.
+        authorization : str The clause of the COPY command authorizing it to read the staged files, e.g.
+            ``IAM_ROLE 'arn:aws:iam::0123456789012:role/MyRedshiftRole'``. Default value is ``"IAM_ROLE default"``.
+        rows_per_part : int The number of rows of each staged file. Default value is 1000000.
+        num_workers : Optional[int] The number of worker processes serializing files. Default value is ``None``,
+            which uses one per CPU. A value of 1 serializes the files in the calling process.
+        cleanup : bool If the staged files are deleted once loaded. Default value is ``True``.
+
+        Returns
+        -------
+        None: None
+        """
+        if file_format not in CopyFileFormat.list():
+            raise InterfaceError(
+                "Invalid file_format {}. Supported values are {}".format(file_format, CopyFileFormat.list())
+            )
+        if rows_per_part < 1:
+            raise InterfaceError("rows_per_part must be greater than 0")
+        if num_workers is not None and num_workers < 1:
+            raise InterfaceError("num_workers must be greater than 0")
+        if not self.__is_valid_table(table):
+            raise InterfaceError("Invalid table name passed to copy_from_dataframe: {}".format(table))
+        if column_names is not None and not self.__has_valid_columns(table, column_names):
+            raise InterfaceError("Invalid column names passed to copy_from_dataframe: {}".format(table))
+        self.__copy_rows(
+            df,
+            self.__sanitize_str(table),
+            staging,
+            column_names,
+            file_format,
+            authorization,
+            rows_per_part,
+            num_workers,
+            cleanup,
+        )
+
+    def __copy_rows(
+        self: "Cursor",
+        df: typing.Union["pandas.DataFrame", typing.Iterable[typing.Sequence]],
+        table: str,
+        staging: typing.Union[str, ObjectStore],
+        column_names: typing.Optional[typing.List[str]],
+        file_format: str,
+        authorization: str,
+        rows_per_part: int,
+        num_workers: typing.Optional[int],
+        cleanup: bool,
+    ) -> None:
+        """
+        Loads rows into ``table``, whose name was validated and sanitized, through files staged in ``staging``, as
+        described by :meth:`copy_from_dataframe`.
+        """
+        store: ObjectStore = S3ObjectStore.from_url(staging) if isinstance(staging, str) else staging
+
+        parts: typing.Iterator[typing.Union["pandas.DataFrame", typing.List[typing.Sequence]]]
+        if hasattr(df, "iloc"):
+            frame: "pandas.DataFrame" = typing.cast("pandas.DataFrame", df)
+            parts = (frame.iloc[start : start + rows_per_part] for start in range(0, len(frame.index), rows_per_part))
+        else:
+            rows: typing.Iterator[typing.Sequence] = iter(typing.cast(typing.Iterable[typing.Sequence], df))
+            parts = iter(lambda: list(islice(rows, rows_per_part)), [])
+
+        prefix: str = "redshift_connector_copy_{}/".format(uuid.uuid4().hex)
+        extension: str = ".parquet" if file_format == CopyFileFormat.PARQUET.value else ".csv.gz"
+        keys: typing.List[str] = []
+        entries: typing.List[typing.Tuple[str, int]] = []
+        try:
+            for idx, data in enumerate(self.__serialize_parts(parts, file_format, column_names, num_workers)):
+                key: str = "{}part-{:05d}{}".format(prefix, idx, extension)
+                keys.append(key)
+                entries.append((store.put(key, data), len(data)))
+            if len(entries) == 0:
+                self._row_count = self._redshift_row_count = 0
+                return
+            keys.append(prefix + "manifest.json")
+            manifest_url: str = store.put(keys[-1], copy_manifest(entries))
+            _logger.debug("Loading %s staged files into %s", len(entries), table)
+            self.execute(copy_statement(table, manifest_url, file_format, authorization, column_names))
+        finally:
+            if cleanup and len(keys) > 0:
+                try:
+                    store.delete(keys)
+                except Exception as e:
+                    _logger.warning("Failed to delete the files staged under %s: %s", store.url(prefix), e)
+
+    @staticmethod
+    def __serialize_parts(
+        parts: typing.Iterator,
+        file_format: str,
+        column_names: typing.Optional[typing.List[str]],
+        num_workers: typing.Optional[int],
+    ) -> typing.Iterator[bytes]:
+        """
+        Yields the files serialized from ``parts`` by :func:`serialize_part` in order, serializing up to two parts per
+        worker process ahead of the file last yielded.
+        """
+        if num_workers == 1:
+            for part in parts:
+                yield serialize_part(part, file_format, column_names)
+            return
+        from concurrent.futures import ProcessPoolExecutor
+
+        max_workers: int = num_workers or os.cpu_count() or 1
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            pending: typing.Deque[Future] = deque()
+            try:
+                for part in parts:
+                    pending.append(executor.submit(serialize_part, part, file_format, column_names))
+                    if len(pending) >= 2 * max_workers:
+                        yield pending.popleft().result()
+                while pending:
+                    yield pending.popleft().result()
+            finally:
+                for future in pending:
+                    future.cancel()
+
+    def merge_rows(
+        self: "Cursor",
+        table: str,
+        rows: typing.Union["pandas.DataFrame", typing.Iterable[typing.Sequence]],
+        key_columns: typing.List[str],
+        column_names: typing.Optional[typing.List[str]] = None,
+        staging: typing.Optional[typing.Union[str, ObjectStore]] = None,
+        authorization: str = "IAM_ROLE default",
+    ) -> MergeResult:
+        """
+        Inserts rows into a table within the current database, updating the existing rows whose key columns hold the
+        same values instead.
+
+        The rows are loaded into a temporary staging table holding the columns of ``table`` in ``column_names``, using
+        multi-row INSERT statements or, if ``staging`` is given, a COPY command as by :meth:`copy_from_dataframe`.
+        The rows of ``table`` matching a staged row are then updated by a single UPDATE statement, and the other
+        staged rows inserted by a single INSERT statement. The staging table is dropped afterwards. All statements run
+        in one transaction, which is committed if autocommit is enabled, and otherwise left open as for other
+        statements. The key columns of ``rows`` should hold distinct values, and must not hold NULL, which matches no
+        row of ``table``: an :class:`InterfaceError` is raised once the rows were staged if any key column of a row
+        holds NULL, and no row is merged. If all columns are key columns, the matching rows of ``table`` are left as
+        they are.
+
+        Parameters
+        ----------
+        table : str Name of an existing table in the current Amazon Redshift database to merge the rows into
+        rows : :class:`pandas.DataFrame` | Iterable[Sequence] The rows to merge. The values of each row of an iterable
+            are those of ``column_names`` in order.
+        key_columns : List[str] The columns identifying a row of ``table``, which must be in ``column_names``
+        column_names : Optional[List[str]] The columns of ``table`` to merge. Default value is ``None``, which uses the
+            column labels of a DataFrame, and must be given for an iterable.
+        staging : Optional[str | :class:`ObjectStore`] The object store the rows are staged in for a COPY command, as
+            by :meth:`copy_from_dataframe`. Default value is ``None``, which inserts the rows using bind parameters.
+        authorization : str The clause authorizing the COPY command to read the staged files. Default value is
+            ``"IAM_ROLE default"``.
+
+        Returns
+        -------
+        The number of rows updated and inserted: :class:`MergeResult`
+        """
+        if self._c is None:
+            raise InterfaceError("Cursor closed")
+        is_dataframe: bool = hasattr(rows, "iloc")
+        if column_names is None:
+            if not is_dataframe:
+                raise InterfaceError("column_names must be given when merging an iterable of rows")
+            column_names = [str(column) for column in typing.cast("pandas.DataFrame", rows).columns]
+        if len(key_columns) == 0 or not set(key_columns).issubset(column_names):
+            raise InterfaceError("key_columns must be a non-empty subset of the merged columns")
+        if not self.__is_valid_table(table):
+            raise InterfaceError("Invalid table name passed to merge_rows: {}".format(table))
+        if not self.__has_valid_columns(table, column_names):
+            raise InterfaceError("Invalid column names passed to merge_rows: {}".format(table))
+
+        target: str = self.__sanitize_str(table)
+        stage: str = "{}_merge_{}".format(target.split(".")[-1], uuid.uuid4().hex[:12])
+        columns: str = ", ".join(column_names)
+        # columns of the target table are qualified by its name without schema
+        matches: str = " and ".join(
+            "{t}.{c} = {s}.{c}".format(t=target.split(".")[-1], s=stage, c=column) for column in key_columns
+        )
+        updated_columns: typing.List[str] = [column for column in column_names if column not in key_columns]
+
+        autocommit: bool = self._c.autocommit
+        cursor_paramstyle: str = self.paramstyle
+        try:
+            self._c.autocommit = False
+            self.paramstyle = DbApiParamstyle.FORMAT.value
+            self.execute("create temp table {} as select {} from {} limit 0".format(stage, columns, target))
+            if staging is not None:
+                self.__copy_rows(
+                    rows,
+                    stage,
+                    staging,
+                    column_names,
+                    CopyFileFormat.CSV.value,
+                    authorization,
+                    DEFAULT_COPY_PART_ROWS,
+                    None,
+                    True,
+                )
+            else:
+                self.__stage_rows(stage, rows, column_names, is_dataframe)
+
+            # a NULL key matches no row of the table, so the row would be inserted again by each merge
+            self.execute(
+                "select count(*) from {} where {}".format(
+                    stage, " or ".join("{} is null".format(column) for column in key_columns)
+                )
+            )
+            null_keys: int = typing.cast(typing.List[int], self.fetchone())[0]
+            if null_keys > 0:
+                raise InterfaceError("{} rows passed to merge_rows hold NULL in a key column".format(null_keys))
+
+            updated: int = 0
+            if len(updated_columns) > 0:
+                self.execute(
+                    "update {} set {} from {} where {}".format(
+                        target,
+                        ", ".join("{c} = {s}.{c}".format(s=stage, c=column) for column in updated_columns),
+                        stage,
+                        matches,
+                    )
+                )
+                updated = max(self._row_count, 0)
+            self.execute(
+                "insert into {t} ({c}) select {c} from {s} where not exists (select 1 from {t} where {m})".format(
+                    t=target, c=columns, s=stage, m=matches
+                )
+            )
+            inserted: int = max(self._row_count, 0)
+            self.execute("drop table {}".format(stage))
+            if autocommit:
+                self._c.commit()
+        except:
+            if autocommit:
+                self._c.rollback()
+            raise
+        finally:
+            self._c.autocommit = autocommit
+            self.paramstyle = cursor_paramstyle
+
+        _logger.debug("Merged rows into %s: %s updated, %s inserted", target, updated, inserted)
+        self._row_count = self._redshift_row_count = updated + inserted
+        return MergeResult(updated, inserted)
+
+    def __stage_rows(
+        self: "Cursor",
+        stage: str,
+        rows: typing.Union["pandas.DataFrame", typing.Iterable[typing.Sequence]],
+        column_names: typing.List[str],
+        is_dataframe: bool,
+    ) -> None:
+        """
+        Inserts the rows merged by :meth:`merge_rows` into the staging table using multi-row INSERT statements,
+        encoding the columns of a DataFrame as by :meth:`write_dataframe`.
+        """
+        sql: str = "insert into {} values ({})".format(stage, ", ".join(["%s"] * len(column_names)))
+        if is_dataframe:
+            df: "pandas.DataFrame" = typing.cast("pandas.DataFrame", rows)
+            if [str(column) for column in df.columns] != column_names:
+                df = df[column_names]
+            if len(df.index) == 0:
+                return
+            encoded: typing.Optional[EncodedRows] = encode_dataframe(df, typing.cast("Connection", self._c).make_params)
+            if encoded is not None:
+                self.__insert_encoded_rows(stage, encoded)
+                return
+            rows = df.values.tolist()
+        param_sets: typing.List[typing.Sequence] = list(typing.cast(typing.Iterable[typing.Sequence], rows))
+        if len(param_sets) > 0:
+            self.executemany(sql, param_sets, rewrite_inserts=True)
+
+    def fetch_numpy_array(
+        self: "Cursor", num: typing.Optional[int] = None, layout: str = NumpyArrayLayout.ROWS.value
+    ) -> typing.Union["numpy.ndarray", typing.Dict[str, "numpy.ndarray"]]:
         """
         Fetches a user defined number of rows of a query result as a :class:`numpy.ndarray`.
 
+        By default, the rows are given as a 2-D array whose type is inferred by numpy from the values. With
+        ``layout="columns"``, a dictionary of 1-D arrays keyed by column label is returned instead, and with
+        ``layout="structured"`` an array of a structured dtype holding one field per column. The type of these arrays
+        is derived from the row description of the query result: INT2, INT4 and INT8 columns are given as int64,
+        FLOAT4, FLOAT8 and NUMERIC columns retrieved as float as float64, BOOL columns as bool, and DATE and TIMESTAMP
+        columns as datetime64[us]. Columns of other types hold Python objects. NULL values of float and datetime
+        columns are given as NaN and NaT, while integer and bool columns holding NULL values are masked using
+        :class:`numpy.ma.MaskedArray`. When ``Cursor.buffer_mode`` is ``"columnar"``, fixed-width binary columns are
+        read directly from their wire representation without creating a Python object per value.
+
         Parameters
         ----------
         num : int The number of rows to retrieve from the result set.
+        layout : str The layout of the returned arrays. One of ``"rows"`` (default), ``"columns"`` or ``"structured"``. See :class:`NumpyArrayLayout`.
 
         Returns
         -------
-        A `numpy.ndarray` containing the results of a query executed::class:`numpy.ndarray`
+        A `numpy.ndarray` containing the results of a query executed, or a dictionary of `numpy.ndarray` keyed by column label if ``layout`` is ``"columns"``: typing.Union[numpy.ndarray, typing.Dict[str, numpy.ndarray]]
         """
         try:
             import numpy
         except ModuleNotFoundError:
             raise ModuleNotFoundError(MISSING_MODULE_ERROR_MSG.format(module="numpy"))
 
+        if layout not in NumpyArrayLayout.list():
+            raise InterfaceError("Invalid layout {}. Supported values are {}".format(layout, NumpyArrayLayout.list()))
+
+        if layout != NumpyArrayLayout.ROWS.value:
+            self._check_result_set()
+            ps: typing.Dict[str, typing.Any] = typing.cast(typing.Dict[str, typing.Any], self.ps)
+            labels: typing.List[str] = [column_label(field) for field in ps["row_desc"]]
+            if len(set(labels)) != len(labels):
+                raise ProgrammingError(
+                    "Column labels of the result set must be unique to be fetched with layout {}".format(layout)
+                )
+            arrays: typing.Dict[str, "numpy.ndarray"] = numpy_arrays(
+                ps["row_desc"], ps["input_funcs"], self._fetch_column_values(num if num else None)
+            )
+            if layout == NumpyArrayLayout.COLUMNS.value:
+                return arrays
+            return numpy_structured_array(arrays)
+
         if num:
             fetched: typing.Tuple = self.fetchmany(num)
         else:
@@ -68,6 +68,15 @@ class OperationalError(DatabaseError):
     pass
 
 
+class QueryTimeoutError(OperationalError):
+    """
+    Raised when a statement executed with a timeout did not complete within
+    the timeout, and was cancelled.
+    """
+
+    pass
+
+
 class IntegrityError(DatabaseError):
     """
     Generic exception raised when the relational integrity of the database is
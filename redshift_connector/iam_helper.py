@@ -3,9 +3,6 @@ import enum
 import logging
 import typing
 
-from dateutil.tz import tzutc
-from packaging.version import Version
-
 from redshift_connector.auth.aws_credentials_provider import AWSCredentialsProvider
 from redshift_connector.credentials_holder import (
     ABCAWSCredentialsHolder,
@@ -53,6 +50,8 @@ class IamHelper(IdpAuthHelper):
             """
             Determines if user provided connection options and boto3 version support group federation.
             """
+            from packaging.version import Version
+
             return (
                 provider_type
                 in (
@@ -107,6 +106,8 @@ class IamHelper(IdpAuthHelper):
         Helper function to handle connection properties and ensure required parameters are specified.
         Parameters
         """
+        from packaging.version import Version
+
         _logger.debug("IamHelper.set_iam_properties")
         provider_type: IamHelper.IAMAuthenticationType = IamHelper.IAMAuthenticationType.NONE
         info.set_is_cname()
@@ -418,6 +419,7 @@ class IamHelper(IdpAuthHelper):
         import boto3  # type: ignore
         import botocore  # type: ignore
         from botocore.exceptions import ClientError
+        from dateutil.tz import tzutc
 
         client = IamHelper.get_boto3_redshift_client(cred_provider, info)
         cred: typing.Optional[typing.Dict[str, typing.Union[str, datetime.datetime]]] = None
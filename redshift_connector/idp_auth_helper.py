@@ -2,12 +2,13 @@ import logging
 import typing
 from enum import Enum
 
-from packaging.version import Version
-
 from redshift_connector.error import InterfaceError, ProgrammingError
 from redshift_connector.plugin.i_plugin import IPlugin
 from redshift_connector.redshift_property import RedshiftProperty
 
+if typing.TYPE_CHECKING:
+    from packaging.version import Version
+
 logging.getLogger(__name__).addHandler(logging.NullHandler())
 _logger: logging.Logger = logging.getLogger(__name__)
 
@@ -36,10 +37,12 @@ class IdpAuthHelper:
     IDC_PLUGIN: int = 3
 
     @staticmethod
-    def get_pkg_version(module_name: str) -> Version:
+    def get_pkg_version(module_name: str) -> "Version":
         """
         Returns a Version object pertaining to the module name provided.
         """
+        from packaging.version import Version
+
         try:
             from importlib.metadata import version as version
         except ModuleNotFoundError:  # if importlib is not present, fallback to pkg_resources
@@ -62,6 +65,7 @@ class IdpAuthHelper:
         Helper function to handle IAM and Native Auth connection properties and ensure required parameters are specified.
         Parameters
         """
+        from packaging.version import Version
 
         if info is None:
             raise InterfaceError("Invalid connection property setting. info must be specified")
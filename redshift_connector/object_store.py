@@ -0,0 +1,137 @@
+import logging
+import os
+import typing
+from abc import ABC, abstractmethod
+
+from redshift_connector.error import InterfaceError
+
+_logger: logging.Logger = logging.getLogger(__name__)
+
+# the maximum number of keys deleted by a single S3 DeleteObjects request
+_S3_DELETE_BATCH_SIZE: int = 1000
+
+
+class ObjectStore(ABC):
+    """
+    The object store which files loaded by :meth:`Cursor.copy_from_dataframe` are staged in. Subclasses store objects
+    under keys, which are relative paths using ``/`` as separator, and return the URL the COPY command reads each
+    object from.
+    """
+
+    @abstractmethod
+    def url(self: "ObjectStore", key: str) -> str:
+        """
+        Returns the URL of the object stored under ``key``.
+        """
+        pass  # pragma: no cover
+
+    @abstractmethod
+    def put(self: "ObjectStore", key: str, data: bytes) -> str:
+        """
+        Stores ``data`` under ``key``, replacing any object stored under it, and returns the URL of the object.
+        """
+        pass  # pragma: no cover
+
+    @abstractmethod
+    def delete(self: "ObjectStore", keys: typing.Sequence[str]) -> None:
+        """
+        Deletes the objects stored under ``keys``. Keys which no object is stored under are ignored.
+        """
+        pass  # pragma: no cover
+
+
+class S3ObjectStore(ObjectStore):
+    """
+    Stages objects in an Amazon S3 bucket, under an optional prefix.
+
+    Parameters
+    ----------
+    bucket : str The name of the bucket
+    prefix : str The prefix of the key of each object, e.g. ``"staging/"``. Default value is ``""``.
+    client : Optional[botocore.client.S3] The S3 client used. Default value is ``None``, which creates a client using
+        ``boto3.client("s3")``.
+    """
+
+    def __init__(self: "S3ObjectStore", bucket: str, prefix: str = "", client: typing.Optional[typing.Any] = None):
+        self.bucket: str = bucket
+        self.prefix: str = prefix
+        self._client: typing.Optional[typing.Any] = client
+
+    @classmethod
+    def from_url(cls: typing.Type["S3ObjectStore"], url: str) -> "S3ObjectStore":
+        """
+        Returns an :class:`S3ObjectStore` staging objects under a URL of the form ``s3://bucket/prefix``.
+        """
+        if not url.startswith("s3://"):
+            raise InterfaceError("Staging URL must start with s3://: {}".format(url))
+        bucket, _, prefix = url[len("s3://") :].partition("/")
+        if not bucket:
+            raise InterfaceError("Staging URL does not name a bucket: {}".format(url))
+        if prefix and not prefix.endswith("/"):
+            prefix += "/"
+        return cls(bucket, prefix)
+
+    @property
+    def client(self: "S3ObjectStore") -> typing.Any:
+        if self._client is None:
+            import boto3  # type: ignore
+
+            self._client = boto3.client("s3")
+        return self._client
+
+    def url(self: "S3ObjectStore", key: str) -> str:
+        return "s3://{}/{}{}".format(self.bucket, self.prefix, key)
+
+    def put(self: "S3ObjectStore", key: str, data: bytes) -> str:
+        self.client.put_object(Bucket=self.bucket, Key=self.prefix + key, Body=data)
+        return self.url(key)
+
+    def delete(self: "S3ObjectStore", keys: typing.Sequence[str]) -> None:
+        for start in range(0, len(keys), _S3_DELETE_BATCH_SIZE):
+            response: typing.Dict = self.client.delete_objects(
+                Bucket=self.bucket,
+                Delete={
+                    "Objects": [{"Key": self.prefix + key} for key in keys[start : start + _S3_DELETE_BATCH_SIZE]],
+                    "Quiet": True,
+                },
+            )
+            for error in response.get("Errors", ()):
+                _logger.warning("Failed to delete s3://%s/%s: %s", self.bucket, error.get("Key"), error.get("Message"))
+
+
+class LocalObjectStore(ObjectStore):
+    """
+    Stages objects as files of a local directory, e.g. for testing, or for a directory synchronized with a bucket.
+
+    Parameters
+    ----------
+    directory : str The directory the files are written to, which is created if missing
+    url_prefix : Optional[str] The prefix of the URL of each object, e.g. the ``s3://`` URL of a bucket the directory
+        is mounted from. Default value is ``None``, which uses the path of each file.
+    """
+
+    def __init__(self: "LocalObjectStore", directory: str, url_prefix: typing.Optional[str] = None):
+        self.directory: str = directory
+        self.url_prefix: typing.Optional[str] = url_prefix
+
+    def path(self: "LocalObjectStore", key: str) -> str:
+        return os.path.join(self.directory, *key.split("/"))
+
+    def url(self: "LocalObjectStore", key: str) -> str:
+        if self.url_prefix is None:
+            return self.path(key)
+        return self.url_prefix + key
+
+    def put(self: "LocalObjectStore", key: str, data: bytes) -> str:
+        path: str = self.path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "wb") as f:
+            f.write(data)
+        return self.url(key)
+
+    def delete(self: "LocalObjectStore", keys: typing.Sequence[str]) -> None:
+        for key in keys:
+            try:
+                os.remove(self.path(key))
+            except FileNotFoundError:
+                pass
@@ -1,18 +1,55 @@
-from .adfs_credentials_provider import AdfsCredentialsProvider
-from .azure_credentials_provider import AzureCredentialsProvider
-from .browser_azure_credentials_provider import BrowserAzureCredentialsProvider
-from .browser_azure_oauth2_credentials_provider import (
-    BrowserAzureOAuth2CredentialsProvider,
-)
-from .browser_idc_auth_plugin import BrowserIdcAuthPlugin
-from .browser_saml_credentials_provider import BrowserSamlCredentialsProvider
-from .common_credentials_provider import CommonCredentialsProvider
-from .idp_credentials_provider import IdpCredentialsProvider
-from .idp_token_auth_plugin import IdpTokenAuthPlugin
-from .jwt_credentials_provider import (
-    BasicJwtCredentialsProvider,
-    JwtCredentialsProvider,
-)
-from .okta_credentials_provider import OktaCredentialsProvider
-from .ping_credentials_provider import PingCredentialsProvider
-from .saml_credentials_provider import SamlCredentialsProvider
+import importlib
+import typing
+
+if typing.TYPE_CHECKING:
+    from .adfs_credentials_provider import AdfsCredentialsProvider
+    from .azure_credentials_provider import AzureCredentialsProvider
+    from .browser_azure_credentials_provider import BrowserAzureCredentialsProvider
+    from .browser_azure_oauth2_credentials_provider import (
+        BrowserAzureOAuth2CredentialsProvider,
+    )
+    from .browser_idc_auth_plugin import BrowserIdcAuthPlugin
+    from .browser_saml_credentials_provider import BrowserSamlCredentialsProvider
+    from .common_credentials_provider import CommonCredentialsProvider
+    from .idp_credentials_provider import IdpCredentialsProvider
+    from .idp_token_auth_plugin import IdpTokenAuthPlugin
+    from .jwt_credentials_provider import (
+        BasicJwtCredentialsProvider,
+        JwtCredentialsProvider,
+    )
+    from .okta_credentials_provider import OktaCredentialsProvider
+    from .ping_credentials_provider import PingCredentialsProvider
+    from .saml_credentials_provider import SamlCredentialsProvider
+
+# The module defining each plugin. Plugins are imported when first accessed, so importing redshift_connector does not
+# import the dependencies of every plugin.
+_PLUGIN_MODULES: typing.Dict[str, str] = {
+    "AdfsCredentialsProvider": "adfs_credentials_provider",
+    "AzureCredentialsProvider": "azure_credentials_provider",
+    "BrowserAzureCredentialsProvider": "browser_azure_credentials_provider",
+    "BrowserAzureOAuth2CredentialsProvider": "browser_azure_oauth2_credentials_provider",
+    "BrowserIdcAuthPlugin": "browser_idc_auth_plugin",
+    "BrowserSamlCredentialsProvider": "browser_saml_credentials_provider",
+    "CommonCredentialsProvider": "common_credentials_provider",
+    "IdpCredentialsProvider": "idp_credentials_provider",
+    "IdpTokenAuthPlugin": "idp_token_auth_plugin",
+    "BasicJwtCredentialsProvider": "jwt_credentials_provider",
+    "JwtCredentialsProvider": "jwt_credentials_provider",
+    "OktaCredentialsProvider": "okta_credentials_provider",
+    "PingCredentialsProvider": "ping_credentials_provider",
+    "SamlCredentialsProvider": "saml_credentials_provider",
+}
+
+__all__ = list(_PLUGIN_MODULES)
+
+
+def __getattr__(name: str) -> typing.Any:
+    if name not in _PLUGIN_MODULES:
+        raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+    plugin: typing.Any = getattr(importlib.import_module("." + _PLUGIN_MODULES[name], __name__), name)
+    globals()[name] = plugin
+    return plugin
+
+
+def __dir__() -> typing.List[str]:
+    return sorted(set(globals()) | set(_PLUGIN_MODULES))
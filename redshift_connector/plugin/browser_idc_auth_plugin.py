@@ -11,15 +11,15 @@ import webbrowser
 from enum import Enum
 from urllib.parse import urlencode, urlunsplit
 
-import boto3
-from botocore.exceptions import ClientError
-
 from redshift_connector.error import InterfaceError
 from redshift_connector.plugin.common_credentials_provider import (
     CommonCredentialsProvider,
 )
 from redshift_connector.redshift_property import RedshiftProperty
 
+if typing.TYPE_CHECKING:
+    import boto3  # type: ignore
+
 logging.getLogger(__name__).addHandler(logging.NullHandler())
 _logger: logging.Logger = logging.getLogger(__name__)
 
@@ -70,7 +70,7 @@ class BrowserIdcAuthPlugin(CommonCredentialsProvider):
         self.idc_region: typing.Optional[str] = None
         self.issuer_url: typing.Optional[str] = None
         self.redirect_uri: typing.Optional[str] = None
-        self.sso_oidc_client: boto3.client = None
+        self.sso_oidc_client: "boto3.client" = None
         self.auth_code: typing.Optional[str] = None
 
     def add_parameter(
@@ -126,6 +126,8 @@ class BrowserIdcAuthPlugin(CommonCredentialsProvider):
         Returns the IdC token using SSO OIDC APIs.
         :return: str.
         """
+        import boto3  # type: ignore
+
         _logger.debug("BrowserIdcAuthPlugin.get_idc_token")
         try:
             self.check_required_parameters()
@@ -155,6 +157,8 @@ class BrowserIdcAuthPlugin(CommonCredentialsProvider):
         :return: dict
             The register client result from IdC
         """
+        from botocore.exceptions import ClientError  # type: ignore
+
         _logger.debug("BrowserIdcAuthPlugin.register_client")
         register_client_cache_key: str = f"{self.idc_client_display_name}:{self.idc_region}:{self.listen_port}"
 
@@ -264,6 +268,8 @@ class BrowserIdcAuthPlugin(CommonCredentialsProvider):
             The IdC access token obtained from fetching IdC access token.
         :raises InterfaceError: Raised when the IdC access token is not fetched successfully.
         """
+        from botocore.exceptions import ClientError  # type: ignore
+
         _logger.debug("BrowserIdcAuthPlugin.fetch_access_token")
         polling_end_time: float = time.time() + self.idp_response_timeout
         polling_interval_in_sec: int = self.CREATE_TOKEN_INTERVAL
@@ -1,15 +1,15 @@
 import logging
 import typing
 
-import boto3
-from botocore.credentials import Credentials
-
 from redshift_connector.error import InterfaceError
 from redshift_connector.plugin.common_credentials_provider import (
     CommonCredentialsProvider,
 )
 from redshift_connector.redshift_property import RedshiftProperty
 
+if typing.TYPE_CHECKING:
+    from botocore.credentials import Credentials  # type: ignore
+
 logging.getLogger(__name__).addHandler(logging.NullHandler())
 _logger: logging.Logger = logging.getLogger(__name__)
 
@@ -102,7 +102,7 @@ class IdpTokenAuthPlugin(CommonCredentialsProvider):
             and self.session_token is not None
         )
 
-    def _create_aws_credentials(self: "IdpTokenAuthPlugin") -> Credentials:
+    def _create_aws_credentials(self: "IdpTokenAuthPlugin") -> "Credentials":
         """
         Create AWS credentials from AccessKeyID, SecretAccessKey, and SessionToken.
 
@@ -112,6 +112,8 @@ class IdpTokenAuthPlugin(CommonCredentialsProvider):
         Raises:
             InterfaceError: If credential creation fails
         """
+        from botocore.credentials import Credentials  # type: ignore
+
         try:
             _logger.debug("Creating AWS credentials from provided parameters")
             credentials = Credentials(
@@ -129,7 +131,7 @@ class IdpTokenAuthPlugin(CommonCredentialsProvider):
 
     def _get_provisioned_auth_token(
         self: "IdpTokenAuthPlugin",
-        credentials: Credentials,
+        credentials: "Credentials",
         region: str,
         cluster_id: str,
     ) -> str:
@@ -147,6 +149,8 @@ class IdpTokenAuthPlugin(CommonCredentialsProvider):
         Raises:
             InterfaceError: If API call fails or returns empty token
         """
+        import boto3  # type: ignore
+
         try:
             _logger.debug(f"Making GetIdentityCenterAuthToken call for provisioned cluster: cluster_id={cluster_id}, region={region}")
 
@@ -189,7 +193,7 @@ class IdpTokenAuthPlugin(CommonCredentialsProvider):
 
     def _get_serverless_auth_token(
         self: "IdpTokenAuthPlugin",
-        credentials: Credentials,
+        credentials: "Credentials",
         region: str,
         workgroup_id: str,
     ) -> str:
@@ -207,6 +211,8 @@ class IdpTokenAuthPlugin(CommonCredentialsProvider):
         Raises:
             InterfaceError: If API call fails or returns empty token
         """
+        import boto3  # type: ignore
+
         try:
             _logger.debug(f"Making GetIdentityCenterAuthToken call for serverless workgroup: workgroup_id={workgroup_id}, region={region}")
 
@@ -0,0 +1,328 @@
+import logging
+import threading
+import time
+import typing
+from collections import deque
+from contextlib import contextmanager
+
+from redshift_connector.config import DEFAULT_POOL_MAX_SIZE
+from redshift_connector.error import InterfaceError
+
+if typing.TYPE_CHECKING:
+    from redshift_connector.core import Connection
+
+_logger: logging.Logger = logging.getLogger(__name__)
+
+
+class PoolStats(typing.NamedTuple):
+    """
+    Metrics of a :class:`ConnectionPool`, as returned by :attr:`ConnectionPool.stats`.
+    """
+
+    # the number of connections checked out, and held idle by the pool
+    in_use: int
+    idle: int
+    # the number of connections opened and closed by the pool since it was created
+    created: int
+    closed: int
+    # the number of checkouts, and how many of them waited for a connection to be returned
+    checkouts: int
+    waits: int
+    # the total and longest time checkouts waited for a connection to be returned, in seconds
+    wait_seconds: float
+    max_wait_seconds: float
+    # the total time taken to open connections, in seconds
+    creation_seconds: float
+
+    @property
+    def average_creation_seconds(self: "PoolStats") -> float:
+        return self.creation_seconds / self.created if self.created > 0 else 0.0
+
+
+class _PooledConnection:
+    __slots__ = ("conn", "created_at", "released_at")
+
+    def __init__(self: "_PooledConnection", conn: "Connection", created_at: float) -> None:
+        self.conn: "Connection" = conn
+        self.created_at: float = created_at
+        self.released_at: float = created_at
+
+
+class ConnectionPool:
+    """
+    A bounded, thread-safe pool of connections opened by passing the same keyword arguments to
+    :func:`redshift_connector.connect`, so each checkout skips the TCP and TLS handshakes, start-up and authentication
+    of a new connection.
+
+    Connections are checked out using :meth:`acquire` and returned using :meth:`release`, or using the
+    :meth:`connection` context manager. At most ``max_size`` connections are open at a time, and a checkout waits
+    for a connection to be returned once all of them are checked out. The most recently returned idle connection is
+    checked out first, so connections beyond those needed close once idle for ``max_idle_time``.
+
+    Parameters
+    ----------
+    min_size : int The number of connections opened when the pool is created, which are kept open regardless of
+        ``max_idle_time``. Default value is 0.
+    max_size : int The maximum number of open connections. Default value is 10.
+    max_idle_time : Optional[float] The number of seconds after which an idle connection is closed. Default value is
+        ``None``, which keeps idle connections open.
+    max_lifetime : Optional[float] The number of seconds after which a connection is closed once returned, e.g. to
+        pick up rotated credentials. Default value is ``None``, which does not limit the lifetime of a connection.
+    validate : bool If idle connections are checked using :meth:`Connection.ping` when checked out, replacing those
+        found broken. Default value is ``True``.
+    wait_timeout : Optional[float] The default number of seconds a checkout waits for a connection to be returned
+        before raising :class:`InterfaceError`. Default value is ``None``, which waits indefinitely.
+    kwargs : The arguments of :func:`redshift_connector.connect` used to open each connection.
+    """
+
+    def __init__(
+        self: "ConnectionPool",
+        min_size: int = 0,
+        max_size: int = DEFAULT_POOL_MAX_SIZE,
+        max_idle_time: typing.Optional[float] = None,
+        max_lifetime: typing.Optional[float] = None,
+        validate: bool = True,
+        wait_timeout: typing.Optional[float] = None,
+        **kwargs,
+    ) -> None:
+        if max_size < 1:
+            raise InterfaceError("max_size must be greater than 0")
+        if min_size < 0 or min_size > max_size:
+            raise InterfaceError("min_size must be between 0 and max_size")
+        self.min_size: int = min_size
+        self.max_size: int = max_size
+        self.max_idle_time: typing.Optional[float] = max_idle_time
+        self.max_lifetime: typing.Optional[float] = max_lifetime
+        self.validate: bool = validate
+        self.wait_timeout: typing.Optional[float] = wait_timeout
+        self._connect_kwargs: typing.Dict[str, typing.Any] = kwargs
+
+        self._lock: threading.Condition = threading.Condition()
+        # idle connections, the most recently returned last
+        self._idle: typing.Deque[_PooledConnection] = deque()
+        self._in_use: typing.Dict[int, _PooledConnection] = {}
+        # connections open or being opened
+        self._size: int = 0
+        self._closed: bool = False
+
+        self._created: int = 0
+        self._closed_count: int = 0
+        self._checkouts: int = 0
+        self._waits: int = 0
+        self._wait_seconds: float = 0.0
+        self._max_wait_seconds: float = 0.0
+        self._creation_seconds: float = 0.0
+
+        try:
+            for _ in range(min_size):
+                with self._lock:
+                    self._size += 1
+                self._idle.append(self._open())
+        except:
+            self.close()
+            raise
+
+    def __enter__(self: "ConnectionPool") -> "ConnectionPool":
+        return self
+
+    def __exit__(self: "ConnectionPool", exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    @property
+    def stats(self: "ConnectionPool") -> PoolStats:
+        with self._lock:
+            return PoolStats(
+                in_use=len(self._in_use),
+                idle=len(self._idle),
+                created=self._created,
+                closed=self._closed_count,
+                checkouts=self._checkouts,
+                waits=self._waits,
+                wait_seconds=self._wait_seconds,
+                max_wait_seconds=self._max_wait_seconds,
+                creation_seconds=self._creation_seconds,
+            )
+
+    def acquire(self: "ConnectionPool", timeout: typing.Optional[float] = None) -> "Connection":
+        """
+        Checks out a connection, opening one if no idle connection is available and fewer than ``max_size``
+        connections are open, otherwise waiting for one to be returned.
+
+        Parameters
+        ----------
+        timeout : Optional[float] The number of seconds to wait for a connection to be returned. Default value is
+            ``None``, which uses ``wait_timeout``.
+
+        Returns
+        -------
+        A connection, which must be returned using :meth:`release`: :class:`Connection`
+        """
+        if timeout is None:
+            timeout = self.wait_timeout
+        start: float = time.monotonic()
+        waited: bool = False
+        while True:
+            entry: typing.Optional[_PooledConnection] = None
+            expired: typing.List[_PooledConnection] = []
+            try:
+                with self._lock:
+                    while True:
+                        if self._closed:
+                            raise InterfaceError("connection pool is closed")
+                        expired.extend(self._take_expired(time.monotonic()))
+                        if len(self._idle) > 0:
+                            entry = self._idle.pop()
+                            break
+                        if self._size < self.max_size:
+                            self._size += 1
+                            break
+                        remaining: typing.Optional[float] = None
+                        if timeout is not None:
+                            remaining = timeout - (time.monotonic() - start)
+                            if remaining <= 0:
+                                self._record_wait(start, waited)
+                                raise InterfaceError(
+                                    "Timed out after {:.3f} seconds waiting for a connection of the pool".format(
+                                        timeout
+                                    )
+                                )
+                        waited = True
+                        self._lock.wait(remaining)
+            finally:
+                # closes idle connections which expired, outside the lock
+                for stale in expired:
+                    self._close(stale)
+
+            if entry is None:
+                try:
+                    entry = self._open()
+                except:
+                    with self._lock:
+                        self._size -= 1
+                        self._lock.notify()
+                    raise
+            elif self.validate:
+                try:
+                    entry.conn.ping()
+                except Exception as e:
+                    _logger.debug("Discarding a pooled connection which failed validation: %s", e)
+                    self._discard(entry)
+                    continue
+
+            with self._lock:
+                self._in_use[id(entry.conn)] = entry
+                self._checkouts += 1
+                self._record_wait(start, waited)
+            return entry.conn
+
+    def release(self: "ConnectionPool", conn: "Connection") -> None:
+        """
+        Returns a connection checked out by :meth:`acquire` to the pool. A suspended portal is closed, a response read
+        in the background is read to its end, and an open transaction is rolled back first. The connection is closed
+        instead if any of these fails, its lifetime exceeds ``max_lifetime``, or the pool is closed.
+        """
+        with self._lock:
+            entry: typing.Optional[_PooledConnection] = self._in_use.pop(id(conn), None)
+        if entry is None:
+            raise InterfaceError("connection was not checked out from this pool")
+        try:
+            # ends the extended query cycle of a result not fetched to its end before the transaction state is known
+            conn.close_portal()
+            conn.finish_background_read()
+            if conn.in_transaction:
+                conn.rollback()
+        except Exception as e:
+            _logger.debug("Discarding a pooled connection which failed to be reset: %s", e)
+            self._discard(entry)
+            return
+        now: float = time.monotonic()
+        if self.max_lifetime is not None and now - entry.created_at >= self.max_lifetime:
+            self._discard(entry)
+            return
+        with self._lock:
+            if not self._closed:
+                entry.released_at = now
+                self._idle.append(entry)
+                self._lock.notify()
+                return
+        self._discard(entry)
+
+    @contextmanager
+    def connection(self: "ConnectionPool", timeout: typing.Optional[float] = None) -> typing.Iterator["Connection"]:
+        """
+        Checks out a connection using :meth:`acquire` for the duration of a ``with`` block, returning it to the pool
+        using :meth:`release` afterwards.
+        """
+        conn: "Connection" = self.acquire(timeout)
+        try:
+            yield conn
+        finally:
+            self.release(conn)
+
+    def close(self: "ConnectionPool") -> None:
+        """
+        Closes the idle connections of the pool. Connections checked out are closed once returned, and no connection
+        can be checked out afterwards.
+        """
+        with self._lock:
+            self._closed = True
+            idle: typing.List[_PooledConnection] = list(self._idle)
+            self._idle.clear()
+            self._lock.notify_all()
+        for entry in idle:
+            self._discard(entry)
+
+    def _open(self: "ConnectionPool") -> _PooledConnection:
+        from redshift_connector import connect
+
+        start: float = time.monotonic()
+        conn: "Connection" = connect(**self._connect_kwargs)
+        now: float = time.monotonic()
+        with self._lock:
+            self._created += 1
+            self._creation_seconds += now - start
+        _logger.debug("Opened a pooled connection in %.3f seconds", now - start)
+        return _PooledConnection(conn, now)
+
+    def _take_expired(self: "ConnectionPool", now: float) -> typing.List[_PooledConnection]:
+        """
+        Removes the idle connections which exceeded ``max_idle_time`` or ``max_lifetime`` from the pool, keeping
+        ``min_size`` connections open regardless of ``max_idle_time``. Called holding the lock.
+        """
+        expired: typing.List[_PooledConnection] = []
+        for entry in list(self._idle):
+            idle_expired: bool = (
+                self.max_idle_time is not None
+                and now - entry.released_at >= self.max_idle_time
+                and self._size > self.min_size
+            )
+            lifetime_expired: bool = self.max_lifetime is not None and now - entry.created_at >= self.max_lifetime
+            if idle_expired or lifetime_expired:
+                self._idle.remove(entry)
+                self._size -= 1
+                expired.append(entry)
+        if len(expired) > 0:
+            self._lock.notify_all()
+        return expired
+
+    def _record_wait(self: "ConnectionPool", start: float, waited: bool) -> None:
+        # called holding the lock
+        if waited:
+            wait_seconds: float = time.monotonic() - start
+            self._waits += 1
+            self._wait_seconds += wait_seconds
+            self._max_wait_seconds = max(self._max_wait_seconds, wait_seconds)
+
+    def _discard(self: "ConnectionPool", entry: _PooledConnection) -> None:
+        with self._lock:
+            self._size -= 1
+            self._lock.notify()
+        self._close(entry)
+
+    def _close(self: "ConnectionPool", entry: _PooledConnection) -> None:
+        try:
+            entry.conn.close()
+        except Exception as e:
+            _logger.debug("Failed to close a pooled connection: %s", e)
+        with self._lock:
+            self._closed_count += 1
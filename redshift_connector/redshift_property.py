@@ -3,6 +3,9 @@ import typing
 
 from redshift_connector.config import DEFAULT_PROTOCOL_VERSION
 
+if typing.TYPE_CHECKING:
+    from ssl import SSLContext
+
 SERVERLESS_HOST_PATTERN: str = r"(.+)\.(.+).redshift-serverless(-dev)?\.amazonaws\.com(.)*"
 SERVERLESS_WITH_WORKGROUP_HOST_PATTERN: str = r"(.+)\.(.+)\.(.+).redshift-serverless(-dev)?\.amazonaws\.com(.)*"
 IAM_URL_PATTERN: str = r"^(https)://[-a-zA-Z0-9+&@#/%?=~_!:,.']*[-a-zA-Z0-9+&@#/%=~_']"
@@ -109,6 +112,8 @@ class RedshiftProperty:
             self.ssl_insecure: bool = False
             # ssl mode: verify-ca or verify-full.
             self.sslmode: str = "verify-ca"
+            # The SSL context used in place of the one created by the driver.
+            self.ssl_context: typing.Optional["SSLContext"] = None
             # Use this property to enable or disable TCP keepalives.
             self.tcp_keepalive: bool = True
             # Time (in seconds) before sending keepalive probes
@@ -130,6 +135,7 @@ class RedshiftProperty:
             self.provider_name: typing.Optional[str] = None
             self.scope: str = ""
             self.numeric_to_float: bool = False
+            self.binary_parameters: bool = False
             self.is_serverless: bool = False
             self.serverless_acct_id: typing.Optional[str] = None
             self.serverless_work_group: typing.Optional[str] = None
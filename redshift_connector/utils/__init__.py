@@ -4,10 +4,38 @@ from .array_util import (
     array_find_first_element,
     array_flatten,
     array_has_null,
+    array_scan,
+    numpy_array_send,
     walk_array,
 )
+from .column_util import (
+    EncodedRows,
+    arrow_record_batch,
+    arrow_schema,
+    decode_fixed_width,
+    encode_dataframe,
+    fixed_width_to_numpy,
+    numpy_arrays,
+    numpy_structured_array,
+)
+from .copy_util import COPY_NULL, copy_manifest, copy_statement, serialize_part
 from .driver_info import DriverInfo
 from .logging_utils import make_divider_block, mask_secure_info_in_props
+from .message_reader import BackgroundMessageReader, MessageReader
+from .result_buffer import (
+    BufferedColumn,
+    ColumnarResultBuffer,
+    LazyResultBuffer,
+    LazyRow,
+    SpillingResultBuffer,
+)
+from .row_decoder import (
+    FIXED_WIDTH_TYPES,
+    compile_column_decoder,
+    compile_row_decoder,
+    numeric_scale,
+)
+from .sql_util import InsertTemplate, parse_insert_values
 from .type_utils import (
     FC_BINARY,
     FC_TEXT,
@@ -16,10 +44,13 @@ from .type_utils import (
     array_recv_binary,
     array_recv_text,
     bh_unpack,
+    bool_send,
     cccc_unpack,
     ci_unpack,
+    d_pack,
     date_in,
     date_recv_binary,
+    date_send_integer,
     float_array_recv,
     geographyhex_recv,
     h_pack,
@@ -40,6 +71,7 @@ from .type_utils import (
     text_recv,
     time_in,
     time_recv_binary,
+    time_send_integer,
     timetz_in,
     timetz_recv_binary,
     varbytehex_recv,
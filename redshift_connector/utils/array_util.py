@@ -1,6 +1,15 @@
 import typing
+from itertools import chain
 
-from redshift_connector.error import ArrayDimensionsNotConsistentError
+from redshift_connector.config import max_int8
+from redshift_connector.error import (
+    ArrayContentNotSupportedError,
+    ArrayDimensionsNotConsistentError,
+)
+from redshift_connector.utils.type_utils import ii_pack, iii_pack
+
+if typing.TYPE_CHECKING:
+    import numpy  # type: ignore
 
 
 def walk_array(arr: typing.List) -> typing.Generator:
@@ -64,3 +73,67 @@ def array_dim_lengths(arr: typing.List) -> typing.List:
         if isinstance(v0, list):
             retval.extend(array_dim_lengths(v0))
     return retval
+
+
+def array_scan(arr: typing.Sequence) -> typing.Tuple[typing.List[int], typing.List]:
+    """
+    Returns the length of each dimension of an array given as nested lists, and its elements in row-major order.
+
+    The array is walked a single time, one dimension at a time, checking that the sub-lists of each dimension all
+    have the same length and that sub-lists are not mixed with elements. As with :func:`array_flatten`, only lists
+    are treated as sub-arrays.
+    """
+    dims: typing.List[int] = [len(arr)]
+    items: typing.List = list(arr)
+    while len(items) > 0:
+        types: typing.Set[type] = set(map(type, items))
+        if not any(issubclass(typ, list) for typ in types):
+            break
+        if not all(issubclass(typ, list) for typ in types):
+            raise ArrayDimensionsNotConsistentError("array dimensions not consistent")
+        lengths: typing.Set[int] = set(map(len, items))
+        if len(lengths) != 1:
+            raise ArrayDimensionsNotConsistentError("array dimensions not consistent")
+        dims.append(lengths.pop())
+        items = list(chain.from_iterable(items))
+    return dims, items
+
+
+# the element and array type OIDs, and the big-endian element dtype, of NumPy arrays by dtype kind and item size
+_NUMPY_ARRAY_TYPES: typing.Dict[typing.Tuple[str, int], typing.Tuple[int, int, str]] = {
+    ("b", 1): (16, 1000, "?"),  # BOOL[]
+    ("i", 1): (21, 1005, ">i2"),  # INT2[]
+    ("i", 2): (21, 1005, ">i2"),
+    ("i", 4): (23, 1007, ">i4"),  # INT4[]
+    ("i", 8): (20, 1016, ">i8"),  # INT8[]
+    ("u", 1): (21, 1005, ">i2"),
+    ("u", 2): (23, 1007, ">i4"),
+    ("u", 4): (20, 1016, ">i8"),
+    ("u", 8): (20, 1016, ">i8"),
+    ("f", 2): (701, 1022, ">f8"),  # FLOAT8[]
+    ("f", 4): (701, 1022, ">f8"),
+    ("f", 8): (701, 1022, ">f8"),
+}
+
+
+def numpy_array_send(arr: "numpy.ndarray") -> typing.Optional[typing.Tuple[int, bytes]]:
+    """
+    Returns the array type OID and binary representation of a NumPy array of a bool, int or float dtype, encoded
+    according to its dtype without converting its elements to Python objects. Returns None for arrays of other dtypes.
+    """
+    import numpy  # type: ignore
+
+    try:
+        elem_oid, array_oid, dtype = _NUMPY_ARRAY_TYPES[(arr.dtype.kind, arr.dtype.itemsize)]
+    except KeyError:
+        return None
+    if arr.size == 0:
+        return array_oid, iii_pack(0, 0, elem_oid)
+    if arr.dtype.kind == "u" and arr.dtype.itemsize == 8 and arr.max() > max_int8 - 1:
+        raise ArrayContentNotSupportedError("numeric not supported as array contents")
+
+    elements: "numpy.ndarray" = numpy.empty(arr.size, dtype=[("length", ">i4"), ("value", dtype)])
+    elements["length"] = numpy.dtype(dtype).itemsize
+    elements["value"] = arr.ravel()
+    header: bytes = iii_pack(arr.ndim, 0, elem_oid) + b"".join(ii_pack(dim, 1) for dim in arr.shape)
+    return array_oid, header + elements.tobytes()
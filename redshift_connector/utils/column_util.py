@@ -0,0 +1,552 @@
+import typing
+from datetime import datetime, timedelta
+from itertools import chain
+
+from redshift_connector.config import FC_BINARY, _client_encoding, max_int8
+from redshift_connector.utils.oids import RedshiftOID
+from redshift_connector.utils.result_buffer import BufferedColumn
+from redshift_connector.utils.row_decoder import FIXED_WIDTH_TYPES, numeric_scale
+from redshift_connector.utils.type_utils import (
+    bool_recv,
+    date_in,
+    date_recv_binary,
+    float4_recv,
+    float8_recv,
+    i_pack,
+    int2_recv,
+    int4_recv,
+    int8_recv,
+    numeric_in,
+    numeric_in_binary,
+    numeric_to_float_binary,
+    numeric_to_float_in,
+    text_recv,
+    time_in,
+    time_recv_binary,
+    timestamp_recv_integer,
+    timestamptz_recv_integer,
+)
+
+if typing.TYPE_CHECKING:
+    import numpy  # type: ignore
+    import pandas  # type: ignore
+    import pyarrow  # type: ignore
+
+# numpy dtype of the big-endian wire representation of each fixed-width binary type
+WIRE_DTYPES: typing.Dict[typing.Callable, str] = {
+    int2_recv: ">i2",
+    int4_recv: ">i4",
+    int8_recv: ">i8",
+    float4_recv: ">f4",
+    float8_recv: ">f8",
+    bool_recv: "?",
+    date_recv_binary: ">i4",
+    timestamp_recv_integer: ">i8",
+}
+
+# Binary DATE and TIMESTAMP values are relative to 2000-01-01, numpy datetime64 values to 1970-01-01
+_EPOCH_DAYS: int = 10957
+_EPOCH_MICROSECONDS: int = _EPOCH_DAYS * 86400 * 1000000
+# Binary DATE values before the Julian/Gregorian calendar cutoff are adjusted by date_recv_binary
+_MIN_DATE_DAYS: int = -141427
+
+
+def column_label(field: typing.Dict) -> str:
+    return field["label"].decode(_client_encoding)
+
+
+def fixed_width_to_numpy(
+    values: typing.Union[bytes, bytearray],
+    nulls: typing.Optional[typing.Union[bytes, bytearray]],
+    func: typing.Callable,
+) -> typing.Optional[typing.Tuple["numpy.ndarray", typing.Optional["numpy.ndarray"]]]:
+    """
+    Converts the values of a fixed-width binary column, as held by :class:`ColumnarResultBuffer`, into a
+    :class:`numpy.ndarray` of native byte order, and a boolean mask which is True for NULL values. The mask is None
+    when the column holds no NULL values. DATE and TIMESTAMP values are converted to ``datetime64[D]`` and
+    ``datetime64[us]``, respectively.
+
+    Returns None if the values cannot be represented exactly by numpy, in which case they should be decoded using the
+    receive function of the column.
+    """
+    import numpy
+
+    result: "numpy.ndarray" = numpy.frombuffer(values, dtype=WIRE_DTYPES[func])
+    if result.dtype.byteorder == ">":
+        result = result.astype(result.dtype.newbyteorder("="))
+
+    mask: typing.Optional["numpy.ndarray"] = None
+    if nulls is not None:
+        mask = numpy.frombuffer(nulls, dtype="?")
+        if not mask.any():
+            mask = None
+
+    if func is date_recv_binary:
+        if (result < _MIN_DATE_DAYS).any():
+            return None
+        result = (result.astype("i8") + _EPOCH_DAYS).astype("datetime64[D]")
+    elif func is timestamp_recv_integer:
+        result = (result + _EPOCH_MICROSECONDS).astype("datetime64[us]")
+
+    return result, mask
+
+
+def decode_fixed_width(
+    values: typing.Union[bytes, bytearray],
+    nulls: typing.Optional[typing.Union[bytes, bytearray]],
+    func: typing.Callable,
+) -> typing.List:
+    """
+    Decodes the values of a fixed-width binary column, as held by :class:`ColumnarResultBuffer`, into a list of
+    Python objects using the receive function of the column.
+    """
+    width: int = FIXED_WIDTH_TYPES[func]
+    return [
+        None if nulls is not None and nulls[ridx] else func(values, ridx * width, width)
+        for ridx in range(len(values) // width)
+    ]
+
+
+_INTEGER_TYPES: typing.Tuple[typing.Callable, ...] = (int2_recv, int4_recv, int8_recv)
+_FLOAT_TYPES: typing.Tuple[typing.Callable, ...] = (
+    float4_recv,
+    float8_recv,
+    numeric_to_float_binary,
+    numeric_to_float_in,
+)
+_DATETIME_TYPES: typing.Tuple[typing.Callable, ...] = (date_recv_binary, date_in, timestamp_recv_integer)
+_EPOCH_DATETIME: datetime = datetime(1970, 1, 1)
+_EPOCH_ORDINAL: int = _EPOCH_DATETIME.toordinal()
+_MICROSECOND: timedelta = timedelta(microseconds=1)
+
+
+def numpy_column(
+    column: BufferedColumn, func: typing.Callable
+) -> typing.Optional[typing.Tuple["numpy.ndarray", typing.Optional["numpy.ndarray"]]]:
+    """
+    Converts the values of a column into a typed :class:`numpy.ndarray`, and a boolean mask which is True for NULL
+    values, or None when the column holds no NULL values. INT2, INT4 and INT8 columns are given as int64, FLOAT4,
+    FLOAT8 and NUMERIC columns retrieved as float as float64, BOOL columns as bool, and DATE and TIMESTAMP columns as
+    datetime64[us]. Values in the array at the position of NULL values are undefined.
+
+    Returns None for columns of other types.
+    """
+    import numpy
+
+    values, nulls = column
+    mask: typing.Optional["numpy.ndarray"]
+
+    if isinstance(values, list):
+        if not (func in _INTEGER_TYPES or func in _FLOAT_TYPES or func in _DATETIME_TYPES or func is bool_recv):
+            return None
+        mask = None
+        if None in values:
+            mask = numpy.fromiter((v is None for v in values), dtype=bool, count=len(values))
+        if func is timestamp_recv_integer:
+            # converting datetime objects using numpy is several times slower than integer arithmetic
+            return (
+                numpy.array(
+                    [0 if v is None else (v - _EPOCH_DATETIME) // _MICROSECOND for v in values], dtype="i8"
+                ).astype("datetime64[us]"),
+                mask,
+            )
+        elif func in _DATETIME_TYPES:
+            return (
+                numpy.array([0 if v is None else v.toordinal() - _EPOCH_ORDINAL for v in values], dtype="i8")
+                .astype("datetime64[D]")
+                .astype("datetime64[us]"),
+                mask,
+            )
+        if mask is not None:
+            values = [0 if v is None else v for v in values]
+        if func in _INTEGER_TYPES:
+            return numpy.array(values, dtype="i8"), mask
+        elif func in _FLOAT_TYPES:
+            return numpy.array(values, dtype="f8"), mask
+        else:
+            return numpy.array(values, dtype="?"), mask
+
+    converted = fixed_width_to_numpy(values, nulls, func)
+    if converted is None:
+        return numpy_column((decode_fixed_width(values, nulls, func), None), func)
+    result, mask = converted
+    if func in _INTEGER_TYPES:
+        result = result.astype("i8", copy=False)
+    elif func in _FLOAT_TYPES:
+        result = result.astype("f8", copy=False)
+    elif func in _DATETIME_TYPES:
+        result = result.astype("datetime64[us]", copy=False)
+    return result, mask
+
+
+def dataframe_column(column: BufferedColumn, func: typing.Callable) -> typing.Any:
+    """
+    Converts the values of a column into an array used to build a :class:`pandas.DataFrame`, typed as described by
+    :func:`numpy_column`. Integer and bool columns holding NULL values are given using the nullable ``Int64`` and
+    ``boolean`` extension types. NULL values of float and datetime columns are given as NaN and NaT. Columns of
+    other types are given as a list of values, leaving their type to be inferred by pandas.
+    """
+    import pandas  # type: ignore
+
+    converted = numpy_column(column, func)
+    if converted is None:
+        values, nulls = column
+        if isinstance(values, list):
+            return values
+        return decode_fixed_width(values, nulls, func)
+
+    result, mask = converted
+    if mask is None:
+        return result
+    elif func in _INTEGER_TYPES:
+        return pandas.arrays.IntegerArray(result, mask.copy())
+    elif func is bool_recv:
+        return pandas.arrays.BooleanArray(result, mask.copy())
+    return _fill_nulls(result, mask, func)
+
+
+def _fill_nulls(result: "numpy.ndarray", mask: "numpy.ndarray", func: typing.Callable) -> "numpy.ndarray":
+    import numpy
+
+    if func in _FLOAT_TYPES:
+        return numpy.where(mask, numpy.nan, result)
+    return numpy.where(mask, numpy.datetime64("NaT"), result)
+
+
+def numpy_arrays(
+    row_desc: typing.List[typing.Dict],
+    input_funcs: typing.Sequence[typing.Callable],
+    columns: typing.List[BufferedColumn],
+) -> typing.Dict[str, "numpy.ndarray"]:
+    """
+    Converts columns of a result set into a dictionary of 1-D :class:`numpy.ndarray` keyed by column label, typed as
+    described by :func:`numpy_column`. NULL values of float and datetime columns are given as NaN and NaT, and integer
+    and bool columns holding NULL values are given as :class:`numpy.ma.MaskedArray`. Columns of other types are given
+    as arrays of Python objects.
+    """
+    import numpy
+
+    arrays: typing.Dict[str, "numpy.ndarray"] = {}
+    for column, field, func in zip(columns, row_desc, input_funcs):
+        converted = numpy_column(column, func)
+        array: "numpy.ndarray"
+        if converted is None:
+            values: typing.List = column[0] if isinstance(column[0], list) else decode_fixed_width(*column, func)
+            # assigned one by one, as numpy would otherwise build a nested array from values holding sequences
+            array = numpy.empty(len(values), dtype=object)
+            for ridx, value in enumerate(values):
+                array[ridx] = value
+        elif converted[1] is None:
+            array = converted[0]
+        elif func in _INTEGER_TYPES or func is bool_recv:
+            array = numpy.ma.MaskedArray(converted[0], mask=converted[1])
+        else:
+            array = _fill_nulls(converted[0], converted[1], func)
+        arrays[column_label(field)] = array
+    return arrays
+
+
+def numpy_structured_array(arrays: typing.Dict[str, "numpy.ndarray"]) -> "numpy.ndarray":
+    """
+    Combines 1-D arrays, as returned by :func:`numpy_arrays`, into an array of a structured dtype holding one field
+    per column. A :class:`numpy.ma.MaskedArray` is returned if any of the arrays is masked.
+    """
+    import numpy
+
+    num_rows: int = len(next(iter(arrays.values()))) if len(arrays) > 0 else 0
+    result: "numpy.ndarray" = numpy.empty(
+        num_rows, dtype=[(name, array.dtype) for name, array in arrays.items()]  # type: ignore
+    )
+    for name, array in arrays.items():
+        result[name] = numpy.ma.getdata(array)
+
+    if not any(isinstance(array, numpy.ma.MaskedArray) for array in arrays.values()):
+        return result
+    mask: "numpy.ndarray" = numpy.empty(num_rows, dtype=[(name, bool) for name in arrays])
+    for name, array in arrays.items():
+        mask[name] = numpy.ma.getmaskarray(array)
+    return numpy.ma.MaskedArray(result, mask=mask)
+
+
+def arrow_type(field: typing.Dict, func: typing.Callable) -> typing.Optional["pyarrow.DataType"]:
+    """
+    Returns the Arrow type used for a column of the given row description and receive function, or None if the type
+    should be inferred from the values of the column.
+    """
+    import pyarrow  # type: ignore
+
+    types: typing.Dict[typing.Callable, "pyarrow.DataType"] = {
+        int2_recv: pyarrow.int16(),
+        int4_recv: pyarrow.int32(),
+        int8_recv: pyarrow.int64(),
+        float4_recv: pyarrow.float32(),
+        float8_recv: pyarrow.float64(),
+        bool_recv: pyarrow.bool_(),
+        date_recv_binary: pyarrow.date32(),
+        date_in: pyarrow.date32(),
+        timestamp_recv_integer: pyarrow.timestamp("us"),
+        timestamptz_recv_integer: pyarrow.timestamp("us", tz="UTC"),
+        time_recv_binary: pyarrow.time64("us"),
+        time_in: pyarrow.time64("us"),
+        numeric_to_float_binary: pyarrow.float64(),
+        numeric_to_float_in: pyarrow.float64(),
+        text_recv: pyarrow.string(),
+    }
+    if func in types:
+        return types[func]
+    elif func in (numeric_in_binary, numeric_in) and field["type_modifier"] != -1:
+        precision: int = ((field["type_modifier"] - 4) >> 16) & 0xFFFF
+        return pyarrow.decimal128(precision, numeric_scale(field["type_modifier"]))
+    return None
+
+
+def arrow_schema(row_desc: typing.List[typing.Dict], input_funcs: typing.Sequence[typing.Callable]) -> "pyarrow.Schema":
+    """
+    Returns the Arrow schema of a result set. Columns are nullable unless the row description, as sent by servers
+    supporting ``ClientProtocolVersion.EXTENDED_RESULT_METADATA`` or later, specifies otherwise. Columns whose type
+    is inferred from their values are given the null type.
+    """
+    import pyarrow  # type: ignore
+
+    return pyarrow.schema(
+        [
+            pyarrow.field(
+                column_label(field), arrow_type(field, func) or pyarrow.null(), nullable=bool(field.get("nullable", 1))
+            )
+            for field, func in zip(row_desc, input_funcs)
+        ]
+    )
+
+
+def _arrow_array(
+    column: BufferedColumn, func: typing.Callable, data_type: typing.Optional["pyarrow.DataType"]
+) -> "pyarrow.Array":
+    import pyarrow  # type: ignore
+
+    values, nulls = column
+    if func in FIXED_WIDTH_TYPES and not isinstance(values, list):
+        converted = fixed_width_to_numpy(values, nulls, func)
+        if converted is not None:
+            return pyarrow.array(converted[0], mask=converted[1], type=data_type)
+        values = decode_fixed_width(values, nulls, func)
+
+    if data_type is not None:
+        return pyarrow.array(values, type=data_type)
+    try:
+        return pyarrow.array(values)
+    except (pyarrow.ArrowInvalid, pyarrow.ArrowTypeError, pyarrow.ArrowNotImplementedError):
+        # values of types unknown to Arrow, e.g. redshift_connector.interval.Interval, are given as strings
+        return pyarrow.array([None if v is None else str(v) for v in values], type=pyarrow.string())
+
+
+def arrow_record_batch(
+    row_desc: typing.List[typing.Dict],
+    input_funcs: typing.Sequence[typing.Callable],
+    columns: typing.List[BufferedColumn],
+) -> "pyarrow.RecordBatch":
+    """
+    Builds a :class:`pyarrow.RecordBatch` from columns of a result set, as returned by
+    :meth:`ColumnarResultBuffer.take_columns`. Fixed-width binary columns are converted from their wire representation
+    without creating a Python object per value.
+    """
+    import pyarrow  # type: ignore
+
+    arrays: typing.List["pyarrow.Array"] = []
+    fields: typing.List["pyarrow.Field"] = []
+    for column, field, func in zip(columns, row_desc, input_funcs):
+        array: "pyarrow.Array" = _arrow_array(column, func, arrow_type(field, func))
+        arrays.append(array)
+        fields.append(pyarrow.field(column_label(field), array.type, nullable=bool(field.get("nullable", 1))))
+    return pyarrow.RecordBatch.from_arrays(arrays, schema=pyarrow.schema(fields))
+
+
+# OID and big-endian numpy dtype of the binary parameter each numpy dtype is sent as, keyed by kind and item size
+_PARAM_TYPES: typing.Dict[typing.Tuple[str, int], typing.Tuple[int, str]] = {
+    ("b", 1): (RedshiftOID.BOOLEAN, "?"),
+    ("i", 1): (RedshiftOID.SMALLINT, ">i2"),
+    ("i", 2): (RedshiftOID.SMALLINT, ">i2"),
+    ("i", 4): (RedshiftOID.INTEGER, ">i4"),
+    ("i", 8): (RedshiftOID.BIGINT, ">i8"),
+    ("u", 1): (RedshiftOID.SMALLINT, ">i2"),
+    ("u", 2): (RedshiftOID.INTEGER, ">i4"),
+    ("u", 4): (RedshiftOID.BIGINT, ">i8"),
+    ("u", 8): (RedshiftOID.BIGINT, ">i8"),
+    ("f", 2): (RedshiftOID.REAL, ">f4"),
+    ("f", 4): (RedshiftOID.REAL, ">f4"),
+    ("f", 8): (RedshiftOID.FLOAT, ">f8"),
+}
+# binary INTERVAL values hold microseconds, followed by two int16 fields sent as 0 for timedelta values
+_INTERVAL_DTYPE: typing.List[typing.Tuple[str, str]] = [("microseconds", ">i8"), ("days", ">i2"), ("months", ">i2")]
+# the length of a NULL parameter value, which is followed by no value
+_NULL_PARAM: bytes = i_pack(-1)
+
+# the encoded values of a column: big-endian fixed-width values of a numpy array with a boolean mask True for NULL
+# values, or a list holding the encoded value of each row, None for NULL values
+EncodedColumn = typing.Tuple[int, int, typing.Union["numpy.ndarray", typing.List[typing.Optional[bytes]]], typing.Any]
+
+
+class EncodedRows(typing.NamedTuple):
+    """
+    The rows of a :class:`pandas.DataFrame` encoded as Bind parameter values, as returned by :func:`encode_dataframe`.
+    """
+
+    # the OID and format code of the parameter of each column
+    param_types: typing.Tuple[typing.Tuple[int, int], ...]
+    num_rows: int
+    # the encoded parameter values of each column, or of consecutive fixed-width columns, one element per row
+    columns: typing.List[typing.List[bytes]]
+    # the encoded parameter values of all rows, each of length row_width, if no column holds values of varying length
+    data: typing.Optional[bytes]
+    row_width: int
+
+    def bind_values(self: "EncodedRows", start: int, stop: int) -> bytes:
+        """
+        Returns the parameter values binding the rows from ``start`` up to ``stop`` to a multi-row INSERT statement,
+        each value preceded by its length as in a Bind message.
+        """
+        if self.data is not None:
+            return self.data[start * self.row_width : stop * self.row_width]
+        return b"".join(chain.from_iterable(zip(*(column[start:stop] for column in self.columns))))
+
+
+def encode_dataframe(df: "pandas.DataFrame", make_params: typing.Callable) -> typing.Optional[EncodedRows]:
+    """
+    Encodes the rows of a :class:`pandas.DataFrame` as Bind parameter values, one parameter per column, encoding each
+    column as a whole. The type of the parameter of each column is chosen from its dtype: integer, float and bool
+    columns, including their nullable extension dtypes, are sent as INT2, INT4, INT8, FLOAT4, FLOAT8 and BOOL values.
+    ``datetime64`` columns are sent as TIMESTAMP, or TIMESTAMPTZ when timezone aware, and ``timedelta64`` columns as
+    INTERVAL. Values of other columns are encoded one by one using the parameter types returned by ``make_params``, as
+    by :meth:`Connection.make_params`. Missing values such as None, NaN, NaT and ``pandas.NA`` are sent as NULL.
+
+    Returns None if the values of a column are not all sent as the same parameter type.
+    """
+    import numpy
+
+    columns: typing.List[EncodedColumn] = []
+    for _, series in df.items():
+        column: typing.Optional[EncodedColumn] = _encode_series(series, make_params)
+        if column is None:
+            return None
+        columns.append(column)
+    param_types: typing.Tuple[typing.Tuple[int, int], ...] = tuple((oid, fc) for oid, fc, _, _ in columns)
+    num_rows: int = len(df.index)
+
+    encoded: typing.List[typing.List[bytes]] = []
+    # consecutive fixed-width columns without NULL values, whose values are encoded together
+    run: typing.List["numpy.ndarray"] = []
+    for _, _, values, mask in columns:
+        if isinstance(values, numpy.ndarray) and mask is None:
+            run.append(values)
+            continue
+        if len(run) > 0:
+            encoded.append(_split_rows(*_encode_fixed_width(run, num_rows)))
+            run = []
+        if isinstance(values, list):
+            encoded.append([_NULL_PARAM if value is None else i_pack(len(value)) + value for value in values])
+        else:
+            params: typing.List[bytes] = _split_rows(*_encode_fixed_width([values], num_rows))
+            for ridx in numpy.flatnonzero(mask).tolist():
+                params[ridx] = _NULL_PARAM
+            encoded.append(params)
+
+    if len(run) > 0:
+        data, width = _encode_fixed_width(run, num_rows)
+        if len(encoded) == 0:
+            # all rows hold values of the same length, so are sliced from a single buffer
+            return EncodedRows(param_types, num_rows, [], data, width)
+        encoded.append(_split_rows(data, width))
+    return EncodedRows(param_types, num_rows, encoded, None, 0)
+
+
+def _encode_fixed_width(arrays: typing.List["numpy.ndarray"], num_rows: int) -> typing.Tuple[bytes, int]:
+    """
+    Returns the parameter values of fixed-width columns, each value preceded by its length, and the length of the
+    values of each row.
+    """
+    import numpy
+
+    rows: "numpy.ndarray" = numpy.empty(
+        num_rows,
+        dtype=list(
+            chain.from_iterable(
+                (("length{}".format(idx), ">i4"), ("value{}".format(idx), values.dtype))
+                for idx, values in enumerate(arrays)
+            )
+        ),
+    )
+    for idx, values in enumerate(arrays):
+        rows["length{}".format(idx)] = values.dtype.itemsize
+        rows["value{}".format(idx)] = values
+    return rows.tobytes(), rows.dtype.itemsize
+
+
+def _split_rows(data: bytes, width: int) -> typing.List[bytes]:
+    return [data[offset : offset + width] for offset in range(0, len(data), width)]
+
+
+def _encode_series(series: "pandas.Series", make_params: typing.Callable) -> typing.Optional[EncodedColumn]:
+    import numpy
+    import pandas
+
+    mask: typing.Optional["numpy.ndarray"] = series.isna().to_numpy()
+    if not typing.cast("numpy.ndarray", mask).any():
+        mask = None
+
+    oid: int
+    values: "numpy.ndarray"
+    if isinstance(series.dtype, pandas.DatetimeTZDtype):
+        utc: "numpy.ndarray" = series.dt.tz_convert("UTC").dt.tz_localize(None).to_numpy(dtype="datetime64[us]")
+        return (
+            RedshiftOID.TIMESTAMPTZ,
+            FC_BINARY,
+            (utc.view("i8") - _EPOCH_MICROSECONDS).astype(">i8"),
+            mask,
+        )
+
+    # nullable extension dtypes hold values of a numpy dtype
+    dtype: typing.Any = getattr(series.dtype, "numpy_dtype", series.dtype)
+    if isinstance(dtype, numpy.dtype) and dtype.kind == "M":
+        values = series.to_numpy(dtype="datetime64[us]")
+        return RedshiftOID.TIMESTAMP, FC_BINARY, (values.view("i8") - _EPOCH_MICROSECONDS).astype(">i8"), mask
+    elif isinstance(dtype, numpy.dtype) and dtype.kind == "m":
+        values = numpy.zeros(len(series), dtype=_INTERVAL_DTYPE)
+        values["microseconds"] = series.to_numpy(dtype="timedelta64[us]").view("i8")
+        return RedshiftOID.INTERVAL, FC_BINARY, values, mask
+    elif isinstance(dtype, numpy.dtype) and (dtype.kind, dtype.itemsize) in _PARAM_TYPES:
+        oid, wire_dtype = _PARAM_TYPES[(dtype.kind, dtype.itemsize)]
+        values = series.to_numpy(dtype=dtype) if mask is None else series.to_numpy(dtype=dtype, na_value=0)
+        # uint64 values beyond the range of INT8 are encoded one by one
+        if dtype.kind != "u" or dtype.itemsize < 8 or not (values >= max_int8).any():
+            return oid, FC_BINARY, values.astype(wire_dtype), mask
+
+    # values of other types are encoded one by one, and must all be sent as the same parameter type
+    objects: typing.List = series.to_numpy(dtype=object).tolist()
+    if mask is not None:
+        for ridx in numpy.flatnonzero(mask).tolist():
+            objects[ridx] = None
+    types: typing.Set[type] = set(map(type, objects))
+    types.discard(type(None))
+    if len(types) == 0:
+        # no value but NULL, sent as the PG "unknown" type
+        return RedshiftOID.UNKNOWN, FC_BINARY, objects, None
+    elif types == {str}:
+        # the parameter type of str values does not depend on the value
+        oid, fc, send_func = make_params((next(value for value in objects if value is not None),))[0]
+        return oid, fc, [None if value is None else send_func(value) for value in objects], None
+
+    param_type: typing.Optional[typing.Tuple[int, int]] = None
+    encoded: typing.List[typing.Optional[bytes]] = []
+    for value in objects:
+        if value is None:
+            encoded.append(None)
+            continue
+        if isinstance(value, numpy.generic):
+            value = value.item()
+        param_oid, fc, send_func = make_params((value,))[0]
+        if param_type is None:
+            param_type = (param_oid, fc)
+        elif param_type != (param_oid, fc):
+            return None
+        encoded.append(send_func(value))
+    param_type = typing.cast(typing.Tuple[int, int], param_type)
+    return param_type[0], param_type[1], encoded, None
@@ -0,0 +1,91 @@
+import csv
+import gzip
+import io
+import json
+import typing
+
+from redshift_connector.config import CopyFileFormat
+from redshift_connector.error import MISSING_MODULE_ERROR_MSG
+
+if typing.TYPE_CHECKING:
+    import pandas  # type: ignore
+
+# the text of NULL values in staged CSV files
+COPY_NULL: str = "\\N"
+
+
+def serialize_part(
+    rows: typing.Union[typing.Sequence[typing.Sequence], "pandas.DataFrame"],
+    file_format: str,
+    column_names: typing.Optional[typing.Sequence[str]] = None,
+) -> bytes:
+    """
+    Returns the contents of a file loading ``rows`` using the COPY options returned by :func:`copy_statement`, given
+    either a list of rows or a :class:`pandas.DataFrame`. CSV files are gzip compressed and hold NULL values as
+    :data:`COPY_NULL`. The columns of a Parquet file holding a list of rows are named after ``column_names``.
+
+    This function is run by the worker processes of :meth:`Cursor.copy_from_dataframe`.
+    """
+    is_dataframe: bool = hasattr(rows, "iloc")
+    if file_format == CopyFileFormat.PARQUET.value:
+        try:
+            import pyarrow  # type: ignore
+            import pyarrow.parquet  # type: ignore
+        except ModuleNotFoundError:
+            raise ModuleNotFoundError(MISSING_MODULE_ERROR_MSG.format(module="pyarrow"))
+
+        if is_dataframe:
+            table: "pyarrow.Table" = pyarrow.Table.from_pandas(rows, preserve_index=False)
+        else:
+            names: typing.List[str] = (
+                list(column_names) if column_names else ["c{}".format(idx) for idx in range(len(rows[0]))]
+            )
+            table = pyarrow.table({name: list(values) for name, values in zip(names, zip(*rows))})
+        sink: io.BytesIO = io.BytesIO()
+        pyarrow.parquet.write_table(table, sink, compression="snappy")
+        return sink.getvalue()
+
+    text: io.StringIO = io.StringIO()
+    if is_dataframe:
+        typing.cast("pandas.DataFrame", rows).to_csv(text, header=False, index=False, na_rep=COPY_NULL)
+    else:
+        writer = csv.writer(text, lineterminator="\n")
+        for row in rows:
+            writer.writerow([COPY_NULL if value is None else value for value in row])
+    return gzip.compress(text.getvalue().encode("utf-8"), compresslevel=6)
+
+
+def copy_manifest(entries: typing.Sequence[typing.Tuple[str, int]]) -> bytes:
+    """
+    Returns a COPY manifest loading the files at the URLs of ``entries``, given with their size in bytes.
+    """
+    return json.dumps(
+        {
+            "entries": [
+                {"url": url, "mandatory": True, "meta": {"content_length": content_length}}
+                for url, content_length in entries
+            ]
+        }
+    ).encode("utf-8")
+
+
+def copy_statement(
+    table: str,
+    manifest_url: str,
+    file_format: str,
+    authorization: str,
+    column_names: typing.Optional[typing.Sequence[str]] = None,
+) -> str:
+    """
+    Returns a COPY statement loading the files listed by the manifest at ``manifest_url`` into ``table``, serialized
+    by :func:`serialize_part`. ``authorization`` is the clause authorizing the read, e.g. ``IAM_ROLE default``.
+    """
+    statement: str = "copy {}{} from '{}' {} manifest".format(
+        table,
+        " ({})".format(", ".join(column_names)) if column_names else "",
+        manifest_url.replace("'", "''"),
+        authorization,
+    )
+    if file_format == CopyFileFormat.PARQUET.value:
+        return statement + " format as parquet"
+    return statement + " format as csv gzip null as '{}' timeformat 'auto' dateformat 'auto'".format(COPY_NULL)
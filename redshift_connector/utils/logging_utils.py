@@ -21,6 +21,7 @@ def mask_secure_info_in_props(info: "RedshiftProperty") -> "RedshiftProperty":
         "application_name",
         "auth_profile",
         "auto_create",
+        "binary_parameters",
         # "client_id",
         "client_protocol_version",
         # "client_secret",
@@ -0,0 +1,174 @@
+import threading
+import typing
+from queue import Empty, Queue
+
+from redshift_connector.config import DEFAULT_READ_BUFFER_SIZE, DEFAULT_READ_QUEUE_SIZE
+from redshift_connector.utils.type_utils import i_unpack
+
+# single byte message codes, indexed by their value
+_CODES: typing.List[bytes] = [bytes((value,)) for value in range(256)]
+
+
+class MessageReader:
+    """
+    Reads messages of the Amazon Redshift wire protocol into a reusable buffer. Each read from the socket fills as
+    much of the buffer as the received data allows, after which every complete message held by the buffer is framed
+    without further reads. A partial message at the end of the buffer is carried over to the next read. Messages
+    larger than the buffer grow it as needed.
+
+    Parameters
+    ----------
+    readinto : Callable
+        Reads available bytes into the given buffer, returning the number of bytes read, or 0 once the connection was
+        closed. e.g. ``readinto1`` of the file object returned by :meth:`socket.socket.makefile`
+    buffer_size : int
+        The initial size of the buffer in bytes.
+    """
+
+    def __init__(
+        self: "MessageReader",
+        readinto: typing.Callable[[memoryview], typing.Optional[int]],
+        buffer_size: int = DEFAULT_READ_BUFFER_SIZE,
+    ) -> None:
+        self._readinto: typing.Callable[[memoryview], typing.Optional[int]] = readinto
+        self._buffer: bytearray = bytearray(buffer_size)
+        self._view: memoryview = memoryview(self._buffer)
+        # bytes of self._buffer in [_start, _end) were received but not yet consumed
+        self._start: int = 0
+        self._end: int = 0
+
+    def __len__(self: "MessageReader") -> int:
+        return self._end - self._start
+
+    def _fill(self: "MessageReader", size: int) -> bool:
+        """
+        Reads from the socket until at least ``size`` bytes are buffered. Returns False if the connection was closed
+        beforehand.
+        """
+        buffered: int = self._end - self._start
+        if buffered >= size:
+            return True
+
+        if size > len(self._buffer):
+            buffer: bytearray = bytearray(max(size, 2 * len(self._buffer)))
+            buffer[:buffered] = self._view[self._start : self._end]
+            self._buffer, self._view = buffer, memoryview(buffer)
+        elif self._start > 0:
+            # move the unconsumed bytes to the front of the buffer to leave room for as large a read as possible
+            self._view[:buffered] = self._view[self._start : self._end]
+        self._start, self._end = 0, buffered
+
+        while self._end < size:
+            num_read: typing.Optional[int] = self._readinto(self._view[self._end :])
+            if not num_read:
+                return False
+            self._end += num_read
+        return True
+
+    def read(self: "MessageReader", size: int) -> bytes:
+        """
+        Returns the next ``size`` bytes received, or fewer if the connection was closed. May be used in place of the
+        ``read`` method of the socket file object, so messages not handled by :meth:`read_messages` are read from the
+        same buffer.
+        """
+        if not self._fill(size):
+            size = self._end - self._start
+        data: bytes = bytes(self._view[self._start : self._start + size])
+        self._start += size
+        return data
+
+    def read_messages(
+        self: "MessageReader", stop_codes: typing.Container[bytes] = ()
+    ) -> typing.List[typing.Tuple[bytes, bytes]]:
+        """
+        Returns the code and content of every complete message held by the buffer, reading from the socket first if
+        it holds none. Messages following one whose code is in ``stop_codes`` are left in the buffer. An empty list is
+        returned if the connection was closed.
+        """
+        if not self._fill(5) or not self._fill(1 + i_unpack(self._buffer, self._start + 1)[0]):
+            return []
+
+        # a single copy of the buffered bytes is sliced into the content of each message
+        data: bytes = bytes(self._view[self._start : self._end])
+        end: int = len(data)
+        start: int = 0
+        messages: typing.List[typing.Tuple[bytes, bytes]] = []
+        while end - start >= 5:
+            next_start: int = start + 1 + i_unpack(data, start + 1)[0]
+            if next_start > end:
+                break
+            code: bytes = _CODES[data[start]]
+            messages.append((code, data[start + 5 : next_start]))
+            start = next_start
+            if code in stop_codes:
+                break
+        self._start += start
+        return messages
+
+
+class BackgroundMessageReader:
+    """
+    Reads messages through a :class:`MessageReader` on a background thread, until one whose code is in
+    ``stop_codes`` was read. Messages are handed over in batches, as framed by :meth:`MessageReader.read_messages`,
+    through a queue holding up to ``queue_size`` batches. Once the queue is full the thread waits for batches to be
+    taken, bounding the memory used by messages read ahead. The :class:`MessageReader` must not be used by other
+    threads until the last batch was taken.
+
+    Parameters
+    ----------
+    reader : MessageReader
+        The reader of the connection.
+    stop_codes : Container[bytes]
+        The codes of messages ending the response being read.
+    queue_size : int
+        The maximum number of batches of messages read ahead.
+    """
+
+    def __init__(
+        self: "BackgroundMessageReader",
+        reader: MessageReader,
+        stop_codes: typing.Container[bytes],
+        queue_size: int = DEFAULT_READ_QUEUE_SIZE,
+    ) -> None:
+        self._reader: MessageReader = reader
+        self._stop_codes: typing.Container[bytes] = stop_codes
+        self._queue: "Queue[typing.Union[typing.List[typing.Tuple[bytes, bytes]], BaseException]]" = Queue(queue_size)
+        self._closed: bool = False
+        self._thread: threading.Thread = threading.Thread(
+            target=self._run, name="redshift_connector-message-reader", daemon=True
+        )
+        self._thread.start()
+
+    def _run(self: "BackgroundMessageReader") -> None:
+        try:
+            while not self._closed:
+                messages: typing.List[typing.Tuple[bytes, bytes]] = self._reader.read_messages(self._stop_codes)
+                self._queue.put(messages)
+                if len(messages) == 0 or messages[-1][0] in self._stop_codes:
+                    return
+        except BaseException as e:
+            # raised to the consuming thread by get()
+            self._queue.put(e)
+
+    def get(self: "BackgroundMessageReader") -> typing.List[typing.Tuple[bytes, bytes]]:
+        """
+        Returns the next batch of messages, waiting for it to be read if needed. The last batch ends with a message
+        whose code is in ``stop_codes``. An empty list is returned if the connection was closed beforehand, and
+        exceptions raised while reading are raised again.
+        """
+        item: typing.Union[typing.List[typing.Tuple[bytes, bytes]], BaseException] = self._queue.get()
+        if isinstance(item, BaseException):
+            raise item
+        return item
+
+    def close(self: "BackgroundMessageReader") -> None:
+        """
+        Discards the messages read ahead, and stops the thread once the read in progress, if any, returns.
+        """
+        self._closed = True
+        try:
+            while True:
+                # unblocks the thread if it is waiting for room in the queue
+                self._queue.get_nowait()
+        except Empty:
+            pass
@@ -0,0 +1,408 @@
+import mmap
+import tempfile
+import typing
+from collections import deque
+from collections.abc import Sequence
+from functools import partial
+
+from redshift_connector.config import ResultBufferMode
+from redshift_connector.error import InterfaceError
+from redshift_connector.utils.row_decoder import (
+    FIXED_WIDTH_TYPES,
+    compile_column_decoder,
+    numeric_scale,
+)
+from redshift_connector.utils.type_utils import (
+    i_pack,
+    i_unpack,
+    numeric_in_binary,
+    numeric_to_float_binary,
+)
+
+if typing.TYPE_CHECKING:
+    from redshift_connector.cursor import Cursor
+
+# code of the DataRow messages written to the temporary file of SpillingResultBuffer
+_DATA_ROW: bytes = b"D"
+
+# The values of a column held by ColumnarResultBuffer, and its null mask. Values of fixed-width binary columns are
+# bytes holding the big-endian wire representation of each value. Values of other columns are a list, in which case
+# the null mask may be None as NULL values are held as None.
+BufferedColumn = typing.Tuple[
+    typing.Union[bytes, bytearray, typing.List], typing.Optional[typing.Union[bytes, bytearray]]
+]
+
+
+class ColumnarResultBuffer:
+    """
+    Holds the rows of a result set as one buffer per column, rather than as a list per row. Used in place of the
+    ``deque`` of rows held by :class:`Cursor` when ``Cursor.buffer_mode`` is ``"columnar"``.
+
+    Values of fixed-width binary columns are kept as their big-endian wire representation in a ``bytearray``, and
+    all other values are kept decoded in a ``list``. Each column has a null mask holding one byte per row. Rows are
+    only built when retrieved through the DB-API row interface. Supports the subset of ``deque`` operations used by
+    :class:`Cursor` and :class:`Connection`.
+    """
+
+    def __init__(self: "ColumnarResultBuffer", cursor: "Cursor") -> None:
+        self._cursor: "Cursor" = cursor
+        self._decoder: typing.Optional[typing.Callable] = None
+        self._funcs: typing.Sequence[typing.Callable] = ()
+        self._widths: typing.Tuple[int, ...] = ()
+        self._columns: typing.List[typing.Union[bytearray, typing.List]] = []
+        self._nulls: typing.List[bytearray] = []
+        # number of rows appended to, and consumed from, the buffer
+        self._count: int = 0
+        self._pos: int = 0
+
+    def _bind(self: "ColumnarResultBuffer") -> None:
+        ps: typing.Optional[typing.Dict[str, typing.Any]] = self._cursor.ps
+        if ps is None:
+            raise InterfaceError("Cursor is missing prepared statement")
+        if "column_decoder" not in ps:
+            ps["column_decoder"] = compile_column_decoder(ps["row_desc"], ps["input_funcs"])
+        self._decoder = ps["column_decoder"]
+        self._funcs = ps["input_funcs"]
+        self._widths = tuple(FIXED_WIDTH_TYPES.get(func, 0) for func in self._funcs)
+        self._reset()
+
+    def _reset(self: "ColumnarResultBuffer") -> None:
+        self._columns = [bytearray() if width else [] for width in self._widths]
+        self._nulls = [bytearray() for _ in self._widths]
+        self._count = 0
+        self._pos = 0
+
+    def append_data_row(self: "ColumnarResultBuffer", data: bytes) -> None:
+        """
+        Decodes the content of a DataRow message into the buffer.
+        """
+        if self._decoder is None:
+            self._bind()
+        elif self._pos == self._count:
+            # all buffered rows were consumed, e.g. between the chunks of a streamed result set
+            self._reset()
+        typing.cast(typing.Callable, self._decoder)(data, self._columns, self._nulls)
+        self._count += 1
+
+    def _row(self: "ColumnarResultBuffer", ridx: int) -> typing.List:
+        row: typing.List = []
+        for cidx, width in enumerate(self._widths):
+            if self._nulls[cidx][ridx]:
+                row.append(None)
+            elif width:
+                row.append(self._funcs[cidx](self._columns[cidx], ridx * width, width))
+            else:
+                row.append(self._columns[cidx][ridx])
+        return row
+
+    def popleft(self: "ColumnarResultBuffer") -> typing.List:
+        if self._pos == self._count:
+            raise IndexError("pop from an empty buffer")
+        row: typing.List = self._row(self._pos)
+        self._pos += 1
+        return row
+
+    def take_columns(self: "ColumnarResultBuffer", num: typing.Optional[int] = None) -> typing.List[BufferedColumn]:
+        """
+        Removes up to ``num`` rows from the buffer, or all buffered rows if ``num`` is not given, returning them as
+        the values and null mask of each column. When all buffered rows are removed, the storage of the buffer is
+        handed to the caller without being copied.
+        """
+        if self._decoder is None:
+            self._bind()
+        start: int = self._pos
+        end: int = self._count if num is None else min(self._count, start + num)
+        columns: typing.List[BufferedColumn] = []
+
+        if start == 0 and end == self._count:
+            columns = list(zip(self._columns, self._nulls))
+            self._reset()
+            return columns
+
+        for cidx, width in enumerate(self._widths):
+            if width:
+                values: typing.Union[bytes, typing.List] = bytes(self._columns[cidx][start * width : end * width])
+            else:
+                values = self._columns[cidx][start:end]
+            columns.append((values, bytes(self._nulls[cidx][start:end])))
+        self._pos = end
+        return columns
+
+    def clear(self: "ColumnarResultBuffer") -> None:
+        self._decoder = None
+        self._funcs = ()
+        self._widths = ()
+        self._reset()
+
+    def __len__(self: "ColumnarResultBuffer") -> int:
+        return self._count - self._pos
+
+    def __iter__(self: "ColumnarResultBuffer") -> typing.Iterator[typing.List]:
+        for ridx in range(self._pos, self._count):
+            yield self._row(ridx)
+
+
+def _locate_values(data: bytes, num_columns: int) -> typing.List[typing.Tuple[int, int]]:
+    """
+    Returns the offset and length of each value held by the content of a DataRow message. The length of NULL values
+    is -1.
+    """
+    offsets: typing.List[typing.Tuple[int, int]] = []
+    idx: int = 2
+    for _ in range(num_columns):
+        length: int = i_unpack(data, idx)[0]
+        idx += 4
+        offsets.append((idx, length))
+        if length > 0:
+            idx += length
+    return offsets
+
+
+class LazyRow(Sequence):
+    """
+    A row of a result set held as the content of its DataRow message, as returned by :class:`LazyResultBuffer`.
+    Values are decoded when first accessed by index, so columns never accessed are never decoded. Iterating over the
+    row, comparing it or converting it to a string decodes all of its values at once. Supports the read-only
+    operations of a ``list``, and compares equal to a ``list`` holding the same values.
+    """
+
+    __slots__ = ("_data", "_decode_row", "_decoders", "_offsets", "_values")
+
+    def __init__(
+        self: "LazyRow",
+        data: bytes,
+        decode_row: typing.Callable[[bytes], typing.List],
+        decoders: typing.List[typing.Callable[[bytes, int, int], typing.Any]],
+    ) -> None:
+        self._data: bytes = data
+        self._decode_row: typing.Callable[[bytes], typing.List] = decode_row
+        self._decoders: typing.List[typing.Callable[[bytes, int, int], typing.Any]] = decoders
+        # (offset, length) of each value in self._data, located when a value is first accessed by index
+        self._offsets: typing.Optional[typing.List[typing.Tuple[int, int]]] = None
+        # all values of the row, or the values accessed by index so far, keyed by column
+        self._values: typing.Union[typing.List, typing.Dict[int, typing.Any]] = {}
+
+    def _decoded(self: "LazyRow") -> typing.List:
+        if self._values.__class__ is not list:
+            self._values = self._decode_row(self._data)
+        return typing.cast(typing.List, self._values)
+
+    def __len__(self: "LazyRow") -> int:
+        return len(self._decoders)
+
+    def __getitem__(self: "LazyRow", index):
+        values: typing.Union[typing.List, typing.Dict[int, typing.Any]] = self._values
+        if values.__class__ is list:
+            return values[index]
+        elif isinstance(index, slice):
+            return [self[cidx] for cidx in range(*index.indices(len(self)))]
+
+        num_columns: int = len(self)
+        cidx: int = index + num_columns if index < 0 else index
+        if not 0 <= cidx < num_columns:
+            raise IndexError("row index out of range")
+        if cidx not in values:
+            if self._offsets is None:
+                self._offsets = _locate_values(self._data, num_columns)
+            offset, length = self._offsets[cidx]
+            values[cidx] = None if length == -1 else self._decoders[cidx](self._data, offset, length)  # type: ignore
+        return values[cidx]  # type: ignore
+
+    def __iter__(self: "LazyRow") -> typing.Iterator:
+        return iter(self._decoded())
+
+    def __eq__(self: "LazyRow", other: object) -> bool:
+        if isinstance(other, LazyRow):
+            other = other._decoded()
+        return self._decoded() == other
+
+    __hash__ = None  # type: ignore
+
+    def __repr__(self: "LazyRow") -> str:
+        return repr(self._decoded())
+
+
+class LazyResultBuffer:
+    """
+    Holds the rows of a result set as the content of their DataRow messages, deferring decoding until rows are
+    fetched. Used in place of the ``deque`` of rows held by :class:`Cursor` when ``Cursor.buffer_mode`` is
+    ``"lazy"``. Rows are retrieved as :class:`LazyRow`, which decodes each value only when it is accessed. Supports
+    the subset of ``deque`` operations used by :class:`Cursor` and :class:`Connection`.
+    """
+
+    def __init__(self: "LazyResultBuffer", cursor: "Cursor") -> None:
+        self._cursor: "Cursor" = cursor
+        self._rows: typing.Deque[bytes] = deque()
+        self._decode_row: typing.Callable[[bytes], typing.List] = typing.cast(typing.Callable, None)
+        self._decoders: typing.List[typing.Callable[[bytes, int, int], typing.Any]] = []
+
+    def _bind(self: "LazyResultBuffer") -> None:
+        ps: typing.Optional[typing.Dict[str, typing.Any]] = self._cursor.ps
+        if ps is None:
+            raise InterfaceError("Cursor is missing prepared statement")
+        self._decode_row = ps["row_decoder"]
+        self._decoders = [
+            (
+                partial(func, scale=numeric_scale(field["type_modifier"]))
+                if func in (numeric_in_binary, numeric_to_float_binary)
+                else func
+            )
+            for field, func in zip(ps["row_desc"], ps["input_funcs"])
+        ]
+
+    def _row(self: "LazyResultBuffer", data: bytes) -> typing.Any:
+        return LazyRow(data, self._decode_row, self._decoders)
+
+    def _pop_data(self: "LazyResultBuffer") -> bytes:
+        return self._rows.popleft()
+
+    def append_data_row(self: "LazyResultBuffer", data: bytes) -> None:
+        """
+        Holds the content of a DataRow message in the buffer without decoding it.
+        """
+        if len(self._decoders) == 0:
+            self._bind()
+        self._rows.append(data)
+
+    def popleft(self: "LazyResultBuffer") -> typing.Any:
+        if len(self) == 0:
+            raise IndexError("pop from an empty buffer")
+        return self._row(self._pop_data())
+
+    def take_columns(self: "LazyResultBuffer", num: typing.Optional[int] = None) -> typing.List[BufferedColumn]:
+        """
+        Removes up to ``num`` rows from the buffer, or all buffered rows if ``num`` is not given, returning the decoded
+        values of each column. See :meth:`ColumnarResultBuffer.take_columns`.
+        """
+        if len(self._decoders) == 0:
+            self._bind()
+        size: int = len(self) if num is None else min(len(self), num)
+        rows: typing.List[typing.List] = [self._decode_row(self._pop_data()) for _ in range(size)]
+        if len(rows) == 0:
+            return [([], None) for _ in self._decoders]
+        return [(list(values), None) for values in zip(*rows)]
+
+    def clear(self: "LazyResultBuffer") -> None:
+        self._rows.clear()
+        self._decoders = []
+
+    def __len__(self: "LazyResultBuffer") -> int:
+        return len(self._rows)
+
+    def __iter__(self: "LazyResultBuffer") -> typing.Iterator:
+        for data in self._rows:
+            yield self._row(data)
+
+
+class SpillingResultBuffer(LazyResultBuffer):
+    """
+    Holds the rows of a result set as the content of their DataRow messages while their total size is within
+    ``Cursor.buffer_memory_limit`` bytes. Once the limit is reached, further rows are written to a temporary file in
+    the framing of the wire protocol, and are read back through :mod:`mmap` when fetched. Rows are held in memory
+    again once all rows written to the file were fetched. Used in place of the ``deque`` of rows held by
+    :class:`Cursor` when ``Cursor.buffer_memory_limit`` is set. Rows are retrieved as lists, or as :class:`LazyRow`
+    when ``Cursor.buffer_mode`` is ``"lazy"``.
+    """
+
+    def __init__(self: "SpillingResultBuffer", cursor: "Cursor") -> None:
+        super().__init__(cursor)
+        self._lazy: bool = False
+        self._memory_limit: int = 0
+        # total size of the rows held by self._rows
+        self._memory_size: int = 0
+        self._file: typing.Optional[typing.IO[bytes]] = None
+        self._map: typing.Optional[mmap.mmap] = None
+        # the number of rows written to self._file which were not fetched yet, and the offset of the first of them
+        self._spilled_rows: int = 0
+        self._read_offset: int = 0
+
+    def _bind(self: "SpillingResultBuffer") -> None:
+        super()._bind()
+        self._lazy = self._cursor.buffer_mode == ResultBufferMode.LAZY.value
+        self._memory_limit = typing.cast(int, self._cursor.buffer_memory_limit)
+
+    def _row(self: "SpillingResultBuffer", data: bytes) -> typing.Any:
+        if self._lazy:
+            return LazyRow(data, self._decode_row, self._decoders)
+        return self._decode_row(data)
+
+    def append_data_row(self: "SpillingResultBuffer", data: bytes) -> None:
+        """
+        Holds the content of a DataRow message in the buffer, writing it to the temporary file if the rows held in
+        memory would otherwise exceed the memory limit.
+        """
+        if len(self._decoders) == 0:
+            self._bind()
+        if self._spilled_rows == 0 and self._memory_size + len(data) <= self._memory_limit:
+            self._rows.append(data)
+            self._memory_size += len(data)
+            return
+
+        if self._file is None:
+            self._file = tempfile.TemporaryFile(prefix="redshift_connector-")
+        self._file.write(_DATA_ROW + i_pack(len(data) + 4))
+        self._file.write(data)
+        self._spilled_rows += 1
+
+    def _pop_data(self: "SpillingResultBuffer") -> bytes:
+        if len(self._rows) > 0:
+            data: bytes = self._rows.popleft()
+            self._memory_size -= len(data)
+            return data
+
+        file: typing.IO[bytes] = typing.cast(typing.IO[bytes], self._file)
+        if self._map is None or self._read_offset == len(self._map):
+            # map the rows written since the file was last mapped
+            file.flush()
+            if self._map is not None:
+                self._map.close()
+            self._map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        offset: int = self._read_offset
+        end: int = offset + 1 + i_unpack(self._map, offset + 1)[0]
+        data = self._map[offset + 5 : end]
+        self._read_offset = end
+        self._spilled_rows -= 1
+        if self._spilled_rows == 0:
+            self._truncate()
+        return data
+
+    def _truncate(self: "SpillingResultBuffer") -> None:
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        if self._file is not None:
+            self._file.seek(0)
+            self._file.truncate()
+        self._spilled_rows = 0
+        self._read_offset = 0
+
+    def clear(self: "SpillingResultBuffer") -> None:
+        super().clear()
+        self._memory_size = 0
+        self._truncate()
+
+    def close(self: "SpillingResultBuffer") -> None:
+        """
+        Discards the buffered rows and deletes the temporary file.
+        """
+        self.clear()
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __len__(self: "SpillingResultBuffer") -> int:
+        return len(self._rows) + self._spilled_rows
+
+    def __iter__(self: "SpillingResultBuffer") -> typing.Iterator:
+        yield from super().__iter__()
+        if self._spilled_rows == 0:
+            return
+        file: typing.IO[bytes] = typing.cast(typing.IO[bytes], self._file)
+        file.flush()
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as spilled:
+            offset: int = self._read_offset
+            while offset < len(spilled):
+                end: int = offset + 1 + i_unpack(spilled, offset + 1)[0]
+                yield self._row(spilled[offset + 5 : end])
+                offset = end
@@ -0,0 +1,204 @@
+import typing
+from datetime import date
+from decimal import Decimal
+
+from redshift_connector.config import EPOCH, _client_encoding
+from redshift_connector.utils.type_utils import (
+    I_unpack,
+    bool_recv,
+    d_unpack,
+    date_recv_binary,
+    f_unpack,
+    float4_recv,
+    float8_recv,
+    h_unpack,
+    i_unpack,
+    int2_recv,
+    int4_recv,
+    int8_recv,
+    numeric_in_binary,
+    numeric_to_float_binary,
+    oid_recv,
+    q_unpack,
+    text_recv,
+    timestamp_recv_integer,
+)
+
+# Expressions used in place of a call to the corresponding receive function. Each reads the value of length
+# ``vlen`` beginning at offset ``idx`` of ``data``, and must produce the same result as the function it replaces.
+_INLINE_READERS: typing.Dict[typing.Callable, str] = {
+    int2_recv: "h_unpack(data, idx)[0]",
+    int4_recv: "i_unpack(data, idx)[0]",
+    int8_recv: "q_unpack(data, idx)[0]",
+    oid_recv: "I_unpack(data, idx)[0]",
+    float4_recv: "f_unpack(data, idx)[0]",
+    float8_recv: "d_unpack(data, idx)[0]",
+    bool_recv: "data[idx] == 1",
+    text_recv: "str(data[idx : idx + vlen], encoding)",
+}
+
+# Width in bytes of the binary wire representation of values received by these functions. Columns of these types
+# are stored by a columnar decoder as their raw big-endian values, see compile_column_decoder.
+FIXED_WIDTH_TYPES: typing.Dict[typing.Callable, int] = {
+    int2_recv: 2,
+    int4_recv: 4,
+    int8_recv: 8,
+    float4_recv: 4,
+    float8_recv: 8,
+    bool_recv: 1,
+    date_recv_binary: 4,
+    timestamp_recv_integer: 8,
+}
+
+# Binary dates are sent as a count of days relative to EPOCH. Within this range no Julian/Gregorian calendar
+# correction or overflow handling is needed, so the date can be built from its ordinal directly. Values outside of
+# it are passed to date_recv_binary.
+_EPOCH_ORDINAL: int = EPOCH.toordinal()
+_MIN_DATE_DAYS: int = -141427  # 1582-10-15
+_MAX_DATE_DAYS: int = date.max.toordinal() - _EPOCH_ORDINAL
+
+_GLOBALS: typing.Dict[str, typing.Any] = {
+    "h_unpack": h_unpack,
+    "i_unpack": i_unpack,
+    "q_unpack": q_unpack,
+    "I_unpack": I_unpack,
+    "f_unpack": f_unpack,
+    "d_unpack": d_unpack,
+    "encoding": _client_encoding,
+    "Decimal": Decimal,
+    "from_bytes": int.from_bytes,
+    "date_fromordinal": date.fromordinal,
+}
+
+
+def numeric_scale(type_modifier: int) -> int:
+    """
+    Returns the scale of a NUMERIC column, as used by the binary NUMERIC receive functions.
+
+    Parameters
+    ----------
+    type_modifier : int The type modifier of the column, as given by its row description
+
+    Returns
+    -------
+    The scale of the column: int
+    """
+    if type_modifier != -1:
+        return (type_modifier - 4) & 0xFFFF
+    else:
+        return -4 & 0xFFFF
+
+
+def _column_reader(target: str, cidx: int, func: typing.Callable, type_modifier: int) -> typing.List[str]:
+    fallback: str = "f{}(data, idx, vlen)".format(cidx)
+
+    if func in _INLINE_READERS:
+        return ["{} = {}".format(target, _INLINE_READERS[func])]
+    elif func in (numeric_in_binary, numeric_to_float_binary):
+        scale: int = numeric_scale(type_modifier)
+        # values of unexpected length are passed to the receive function, which raises for malformed values
+        raw: str = 'from_bytes(data[idx : idx + vlen], "big", signed=True)'
+        if func is numeric_in_binary:
+            value: str = "Decimal({}).scaleb({})".format(raw, -1 * scale)
+        else:
+            value = "{} * {!r}".format(raw, 10 ** (-1 * scale))
+        return ["{} = {} if vlen == 8 or vlen == 16 else f{}(data, idx, vlen, {})".format(target, value, cidx, scale)]
+    elif func is date_recv_binary:
+        return [
+            "{} = i_unpack(data, idx)[0]".format(target),
+            "{target} = date_fromordinal({target} + {ordinal}) if {lo} <= {target} <= {hi} else {fallback}".format(
+                target=target, ordinal=_EPOCH_ORDINAL, lo=_MIN_DATE_DAYS, hi=_MAX_DATE_DAYS, fallback=fallback
+            ),
+        ]
+    else:
+        return ["{} = {}".format(target, fallback)]
+
+
+def compile_row_decoder(
+    row_desc: typing.List[typing.Dict], input_funcs: typing.Sequence[typing.Callable]
+) -> typing.Callable[[bytes], typing.List]:
+    """
+    Generates a function which decodes the content of a DataRow message into a row of Python values, specialized to
+    the columns of a prepared statement. Reads of fixed-width binary values are inlined and the receive function for
+    each remaining column is bound at compile time, removing the per column dispatch otherwise needed for every row.
+
+    Parameters
+    ----------
+    row_desc : List[Dict] The row description of the prepared statement
+    input_funcs : Sequence[Callable] The receive function used for each column of the row description
+
+    Returns
+    -------
+    A function accepting DataRow message content and returning the decoded row: Callable[[bytes], List]
+    """
+    namespace: typing.Dict[str, typing.Any] = dict(_GLOBALS)
+    lines: typing.List[str] = ["def decode_row(data):", "    idx = 2"]
+
+    for cidx, func in enumerate(input_funcs):
+        namespace["f{}".format(cidx)] = func
+        lines.append("    vlen = i_unpack(data, idx)[0]")
+        lines.append("    idx += 4")
+        lines.append("    if vlen == -1:")
+        lines.append("        c{} = None".format(cidx))
+        lines.append("    else:")
+        for line in _column_reader("c{}".format(cidx), cidx, func, row_desc[cidx]["type_modifier"]):
+            lines.append("        " + line)
+        lines.append("        idx += vlen")
+
+    lines.append("    return [{}]".format(", ".join("c{}".format(cidx) for cidx in range(len(input_funcs)))))
+
+    exec(compile("\n".join(lines), "<row decoder>", "exec"), namespace)
+    return namespace["decode_row"]
+
+
+def compile_column_decoder(
+    row_desc: typing.List[typing.Dict], input_funcs: typing.Sequence[typing.Callable]
+) -> typing.Callable[[bytes, typing.List, typing.List[bytearray]], None]:
+    """
+    Generates a function which decodes the content of a DataRow message into per column storage, rather than a row.
+    The generated function accepts the message content, a list holding the storage of each column, and a list holding
+    a null mask for each column.
+
+    Columns whose receive function is listed in ``FIXED_WIDTH_TYPES`` are stored in a ``bytearray`` holding the
+    big-endian wire representation of each value, with zeroed bytes in place of NULL. All other columns are decoded
+    into a ``list``. The null mask of each column is a ``bytearray`` holding one byte per row, set to 1 for NULL.
+
+    Parameters
+    ----------
+    row_desc : List[Dict] The row description of the prepared statement
+    input_funcs : Sequence[Callable] The receive function used for each column of the row description
+
+    Returns
+    -------
+    A function accepting DataRow message content, column storage, and null masks: Callable[[bytes, List, List[bytearray]], None]
+    """
+    namespace: typing.Dict[str, typing.Any] = dict(_GLOBALS)
+    lines: typing.List[str] = ["def decode_columns(data, columns, nulls):", "    idx = 2"]
+    if len(input_funcs) > 0:
+        lines.append("    {}, = columns".format(", ".join("c{}".format(cidx) for cidx in range(len(input_funcs)))))
+        lines.append("    {}, = nulls".format(", ".join("n{}".format(cidx) for cidx in range(len(input_funcs)))))
+
+    for cidx, func in enumerate(input_funcs):
+        namespace["f{}".format(cidx)] = func
+        width: int = FIXED_WIDTH_TYPES.get(func, 0)
+        lines.append("    vlen = i_unpack(data, idx)[0]")
+        lines.append("    idx += 4")
+        lines.append("    if vlen == -1:")
+        lines.append("        n{}.append(1)".format(cidx))
+        if width:
+            namespace["z{}".format(width)] = bytes(width)
+            lines.append("        c{} += z{}".format(cidx, width))
+        else:
+            lines.append("        c{}.append(None)".format(cidx))
+        lines.append("    else:")
+        lines.append("        n{}.append(0)".format(cidx))
+        if width:
+            lines.append("        c{} += data[idx : idx + vlen]".format(cidx))
+        else:
+            for line in _column_reader("v", cidx, func, row_desc[cidx]["type_modifier"]):
+                lines.append("        " + line)
+            lines.append("        c{}.append(v)".format(cidx))
+        lines.append("        idx += vlen")
+
+    exec(compile("\n".join(lines), "<column decoder>", "exec"), namespace)
+    return namespace["decode_columns"]
@@ -0,0 +1,109 @@
+import re
+import typing
+
+from redshift_connector.config import DbApiParamstyle
+from redshift_connector.error import InterfaceError
+
+# INSERT INTO <table> [(<columns>)] VALUES (<placeholders>), with an optional trailing semicolon
+_INSERT_VALUES_RE: typing.Pattern = re.compile(
+    r"^\s*(insert\s+into\s+[^()';]+?(?:\s*\([^()';]*\))?\s+values)\s*\(((?:[^()';]|%\([^()';]*\)s)*)\)\s*;?\s*$",
+    re.IGNORECASE | re.DOTALL,
+)
+# a single placeholder of each paramstyle, capturing its name or position if any
+_PLACEHOLDER_RES: typing.Dict[str, typing.Pattern] = {
+    DbApiParamstyle.QMARK.value: re.compile(r"\?()"),
+    DbApiParamstyle.NUMERIC.value: re.compile(r":([1-9][0-9]*)"),
+    DbApiParamstyle.NAMED.value: re.compile(r":([A-Za-z_][A-Za-z0-9_]*)"),
+    DbApiParamstyle.FORMAT.value: re.compile(r"%s()"),
+    DbApiParamstyle.PYFORMAT.value: re.compile(r"%s()|%\(([^()]+)\)s"),
+}
+
+
+class InsertTemplate(typing.NamedTuple):
+    """
+    A single row INSERT statement which may be rewritten to insert multiple rows, as returned by
+    :func:`parse_insert_values`.
+    """
+
+    # the statement up to and including the VALUES keyword
+    prefix: str
+    paramstyle: str
+    # the name of the parameter bound to each placeholder of the VALUES list, or None for positional placeholders
+    names: typing.Tuple[typing.Optional[str], ...]
+
+    def statement(self: "InsertTemplate", num_rows: int) -> str:
+        """
+        Returns an INSERT statement inserting ``num_rows`` rows, whose parameters are the values returned by
+        :meth:`args` for the same number of rows.
+        """
+        num_columns: int = len(self.names)
+        if self.paramstyle == DbApiParamstyle.NUMERIC.value:
+            placeholders: typing.List[str] = [":{}".format(idx + 1) for idx in range(num_rows * num_columns)]
+        elif self.paramstyle == DbApiParamstyle.NAMED.value:
+            placeholders = [":p{}".format(idx) for idx in range(num_rows * num_columns)]
+        elif self.paramstyle == DbApiParamstyle.QMARK.value:
+            placeholders = ["?"] * (num_rows * num_columns)
+        else:
+            placeholders = ["%s"] * (num_rows * num_columns)
+        return "{} {}".format(
+            self.prefix,
+            ", ".join(
+                "({})".format(", ".join(placeholders[idx : idx + num_columns]))
+                for idx in range(0, len(placeholders), num_columns)
+            ),
+        )
+
+    def args(
+        self: "InsertTemplate", rows: typing.Sequence[typing.Union[typing.Sequence, typing.Mapping]]
+    ) -> typing.Union[typing.List, typing.Dict[str, typing.Any]]:
+        """
+        Returns the parameters of the statement returned by :meth:`statement` inserting ``rows``, given the parameters
+        of each row as accepted by the single row statement.
+        """
+        values: typing.List = []
+        for row in rows:
+            if self.names[0] is not None:
+                values.extend(row[name] for name in self.names)  # type: ignore
+            elif len(row) != len(self.names):
+                raise InterfaceError(
+                    "Parameter set holds {} values, but the statement has {} parameters".format(
+                        len(row), len(self.names)
+                    )
+                )
+            else:
+                values.extend(row)  # type: ignore
+        if self.paramstyle == DbApiParamstyle.NAMED.value:
+            return {"p{}".format(idx): value for idx, value in enumerate(values)}
+        return values
+
+
+def parse_insert_values(operation: str, paramstyle: str) -> typing.Optional[InsertTemplate]:
+    """
+    Returns an :class:`InsertTemplate` for ``operation`` if it is an INSERT statement whose VALUES list holds only
+    placeholders of ``paramstyle``, each bound to a distinct parameter. Returns None otherwise.
+    """
+    match: typing.Optional[typing.Match] = _INSERT_VALUES_RE.match(operation)
+    if match is None or paramstyle not in _PLACEHOLDER_RES:
+        return None
+    placeholder_re: typing.Pattern = _PLACEHOLDER_RES[paramstyle]
+
+    names: typing.List[typing.Optional[str]] = []
+    for idx, item in enumerate(match.group(2).split(",")):
+        placeholder: typing.Optional[typing.Match] = placeholder_re.fullmatch(item.strip())
+        if placeholder is None:
+            return None
+        name: typing.Optional[str] = next((g for g in placeholder.groups() if g), None)
+        if paramstyle == DbApiParamstyle.NUMERIC.value:
+            if int(typing.cast(str, name)) != idx + 1:
+                return None
+            name = None
+        names.append(name)
+
+    if len(set(names)) != len(names) and names[0] is not None:
+        # a parameter bound to several placeholders
+        return None
+    if len(set(name is None for name in names)) > 1:
+        # positional and named placeholders mixed
+        return None
+    # pyformat statements with named placeholders are rewritten using positional placeholders
+    return InsertTemplate(match.group(1), paramstyle, tuple(names))
@@ -653,6 +653,18 @@ def numeric_out(d: Decimal) -> bytes:
     return str(d).encode(_client_encoding)
 
 
+# days from 0001-01-01 to the epoch of binary DATE values, 2000-01-01
+EPOCH_DATE_ORDINAL: int = EPOCH.toordinal()
+
+
+def date_send_integer(v: date) -> bytes:
+    return i_pack(v.toordinal() - EPOCH_DATE_ORDINAL)
+
+
+def time_send_integer(v: time) -> bytes:
+    return q_pack(((v.hour * 60 + v.minute) * 60 + v.second) * 1000000 + v.microsecond)
+
+
 # def inet_out(v: typing.Union[IPv4Address, IPv6Address, IPv4Network, IPv6Network]) -> bytes:
 #     return str(v).encode(_client_encoding)
 
@@ -105,7 +105,7 @@ with open(os.path.join(this_directory, "README.rst"), encoding="utf-8") as f:
 exec(open("redshift_connector/version.py").read())
 
 optional_deps = {
-    "full": ["numpy", "pandas"],
+    "full": ["numpy", "pandas", "pyarrow>=14"],
 }
 
 setup(
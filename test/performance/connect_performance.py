@@ -0,0 +1,100 @@
+import socket
+import statistics
+import subprocess
+import sys
+import threading
+import time
+import typing
+from struct import unpack
+
+import redshift_connector
+from test.unit.mocks.mock_backend import message, startup_response
+
+"""
+Measures the time taken to import redshift_connector in a new interpreter, as reported by python -X importtime, and
+the time taken to open and close a connection to a loopback server answering the start-up packet as Amazon Redshift
+does, with and without application_name given. No Amazon Redshift cluster is required. Run from the root of the
+repository, optionally passing the number of imports and connections to test:
+
+    python -m test.performance.connect_performance 20 1000
+"""
+
+NUM_IMPORTS: int = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+NUM_CONNECTIONS: int = int(sys.argv[2]) if len(sys.argv) > 2 else 1000
+
+# the start-up response of the loopback server, including the server_version parameter sent by Amazon Redshift
+STARTUP_RESPONSE: bytes = message(b"S", b"server_version\x008.0.2\x00") + startup_response()
+
+
+def import_time() -> typing.Tuple[int, typing.List[typing.Tuple[int, str]]]:
+    """
+    Returns the cumulative microseconds taken to import redshift_connector in a new interpreter, and the self time of
+    each module imported with it.
+    """
+    output: str = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import redshift_connector"],
+        stderr=subprocess.PIPE,
+        universal_newlines=True,
+        check=True,
+    ).stderr
+    modules: typing.List[typing.Tuple[int, str]] = []
+    total: int = 0
+    started: bool = False
+    for line in output.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:") :].split("|")
+        if not self_us.strip().isdigit():
+            continue
+        if name.strip() == "site":
+            # modules imported by the interpreter on start-up precede site
+            started = True
+            continue
+        if started:
+            modules.append((int(self_us), name.strip()))
+            total = int(cumulative_us) if name.strip() == "redshift_connector" else total
+    return total, modules
+
+
+def serve(listener: socket.socket) -> None:
+    while True:
+        conn, _ = listener.accept()
+        with conn:
+            rfile = conn.makefile("rb")
+            length: int = unpack("!i", rfile.read(4))[0]
+            rfile.read(length - 4)
+            conn.sendall(STARTUP_RESPONSE)
+            # reads until the Terminate message was sent and the connection closed
+            while rfile.read(4096):
+                pass
+
+
+def connect_time(port: int, **kwargs) -> float:
+    start: float = time.perf_counter()
+    for _ in range(NUM_CONNECTIONS):
+        redshift_connector.connect(
+            host="127.0.0.1", port=port, user="awsuser", password="my_password", database="dev", ssl=False, **kwargs
+        ).close()
+    return time.perf_counter() - start
+
+
+timings: typing.List[int] = []
+modules: typing.List[typing.Tuple[int, str]] = []
+for _ in range(NUM_IMPORTS):
+    total, modules = import_time()
+    timings.append(total)
+print("import redshift_connector over {} runs: median {:.1f} ms".format(NUM_IMPORTS, statistics.median(timings) / 1000))
+print("slowest modules imported, last run:")
+for self_us, name in sorted(modules, reverse=True)[:10]:
+    print("    {:8.1f} ms {}".format(self_us / 1000, name))
+
+listener: socket.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+listener.bind(("127.0.0.1", 0))
+listener.listen(128)
+threading.Thread(target=serve, args=(listener,), daemon=True).start()
+loopback_port: int = listener.getsockname()[1]
+
+print("Opening and closing {} connections".format(NUM_CONNECTIONS))
+for name, kwargs in (("application_name resolved", {}), ("application_name given", {"application_name": "bench"})):
+    took: float = connect_time(loopback_port, **kwargs)
+    print("{:<28} {:8.2f} s {:8.1f} us/connection".format(name, took, took / NUM_CONNECTIONS * 1e6))
@@ -0,0 +1,83 @@
+import gc
+import sys
+import time
+import tracemalloc
+import typing
+from struct import pack
+
+import pandas  # type: ignore
+
+from redshift_connector import ResultBufferMode
+from redshift_connector.utils.oids import RedshiftOID
+from test.unit.mocks.mock_backend import (
+    BIND_COMPLETE,
+    READY_FOR_QUERY,
+    command_complete,
+    data_row,
+    mock_connection,
+    prepare_response,
+)
+
+"""
+Compares wall time and peak memory of Cursor.fetch_dataframe against the previous implementation, which built the
+pandas.DataFrame from the tuple of rows returned by Cursor.fetchall. Rows are served by a scripted backend, so no
+Amazon Redshift cluster is required. Run from the root of the repository, optionally passing the row counts to test:
+
+    python -m test.performance.fetch_dataframe_performance 1000000 10000000
+"""
+
+ROW_COUNTS: typing.Tuple[int, ...] = tuple(int(arg) for arg in sys.argv[1:]) or (1000000, 10000000)
+
+COLUMNS: typing.Tuple[typing.Tuple[str, int], ...] = (
+    ("c_int4", RedshiftOID.INTEGER),
+    ("c_int8", RedshiftOID.BIGINT),
+    ("c_float8", RedshiftOID.FLOAT),
+    ("c_bool", RedshiftOID.BOOLEAN),
+    ("c_timestamp", RedshiftOID.TIMESTAMP),
+)
+ROW: bytes = data_row(
+    pack("!i", 214748367), pack("!q", 214748367214748367), pack("!d", 1234567.1234567), b"\x01", pack("!q", 0)
+)
+
+
+def previous_fetch_dataframe(cursor) -> pandas.DataFrame:
+    columns = [column[0].lower() for column in cursor.description]
+    result: typing.List = [tuple(column for column in rows) for rows in cursor.fetchall()]
+    return pandas.DataFrame(result, columns=columns)
+
+
+def run(num_rows: int, buffer_mode: str, fetch: typing.Callable, trace_memory: bool) -> typing.Tuple[float, float]:
+    conn, _ = mock_connection(
+        prepare_response(*COLUMNS)
+        + BIND_COMPLETE
+        + ROW * num_rows
+        + command_complete("SELECT {}".format(num_rows).encode())
+        + READY_FOR_QUERY
+    )
+    cursor = conn.cursor()
+    cursor.buffer_mode = buffer_mode
+    gc.collect()
+
+    if trace_memory:
+        tracemalloc.start()
+    start_time: float = time.perf_counter()
+    cursor.execute("select * from perf")
+    df: pandas.DataFrame = fetch(cursor)
+    elapsed: float = time.perf_counter() - start_time
+    peak: int = tracemalloc.get_traced_memory()[1] if trace_memory else 0
+    tracemalloc.stop()
+
+    assert len(df) == num_rows
+    return elapsed, peak / 2**20
+
+
+for num_rows in ROW_COUNTS:
+    print("rows: {}".format(num_rows))
+    for name, buffer_mode, fetch in (
+        ("fetchall + DataFrame", ResultBufferMode.ROWS.value, previous_fetch_dataframe),
+        ("fetch_dataframe rows", ResultBufferMode.ROWS.value, lambda cursor: cursor.fetch_dataframe()),
+        ("fetch_dataframe columnar", ResultBufferMode.COLUMNAR.value, lambda cursor: cursor.fetch_dataframe()),
+    ):
+        elapsed, _ = run(num_rows, buffer_mode, fetch, trace_memory=False)
+        _, peak_mb = run(num_rows, buffer_mode, fetch, trace_memory=True)
+        print("\t{:<26}{:>8.2f} seconds{:>10.1f} MB peak".format(name, elapsed, peak_mb))
@@ -0,0 +1,63 @@
+import sys
+import time
+import typing
+from datetime import datetime as Datetime
+from decimal import Decimal
+
+from test.unit.mocks.mock_backend import mock_connection
+
+"""
+Measures the time taken to encode the bind parameters of the rows of an executemany call, i.e. resolving the type of
+each value with Connection.make_params and building the Bind message, with and without the encoding plans cached by
+Connection.make_params. Rows mix int, str, Decimal and datetime values. No Amazon Redshift cluster is required. Run
+from the root of the repository, optionally passing the row count to test:
+
+    python -m test.performance.make_params_performance 1000000
+"""
+
+NUM_ROWS: int = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+
+ROWS: typing.List[typing.Tuple] = [
+    (
+        idx + 100000,
+        "name {}".format(idx),
+        Decimal("{}.25".format(idx)),
+        Datetime(2024, 1, 1, 12, 0, idx % 60),
+        (idx + 1) << 32,
+    )
+    for idx in range(NUM_ROWS)
+]
+
+
+def resolve_without_plans(conn, values) -> typing.Tuple:
+    params: typing.List = []
+    for value in values:
+        params.append(conn._param_plan(value)[1])
+    return tuple(params)
+
+
+def run(make_params: typing.Callable) -> typing.Tuple[float, float]:
+    conn, _ = mock_connection()
+    params = make_params(conn, ROWS[0])
+    # stands in for the prepared statement the parameters are bound to
+    ps: typing.Dict[str, typing.Any] = {
+        "bind_1": b"\x00statement\x00",
+        "bind_2": b"\x00\x00",
+        "param_funcs": tuple(param[2] for param in params),
+    }
+    start: float = time.perf_counter()
+    for row in ROWS:
+        make_params(conn, row)
+    resolved: float = time.perf_counter()
+    for row in ROWS:
+        conn._make_bind(ps, row)
+    return resolved - start, time.perf_counter() - start
+
+
+print("Encoding {} rows of (int, str, Decimal, datetime, int)".format(NUM_ROWS))
+print("{:<24} {:>12} {:>12}".format("", "make_params", "with Bind"))
+for name, func in (
+    ("without encoding plans", resolve_without_plans),
+    ("with encoding plans", lambda conn, row: conn.make_params(row)),
+):
+    print("{:<24} {:10.2f} s {:10.2f} s".format(name, *run(func)))
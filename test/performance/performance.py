@@ -42,5 +42,24 @@ for val in [True, False]:
     print("Took {0} seconds.".format(time.time() - start_time))
     print("fetch {result} rows".format(result=len(results)))
 
+print("start calculate fetch time by row width")
+for width in [1, 10, 50]:
+    columns: str = ", ".join("c1 as c{idx}".format(idx=idx) for idx in range(width))
+    for merge_socket_read, chunked_socket_read in [(False, False), (True, False), (False, True)]:
+        print(
+            "columns={width} merge_socket_read={merge} chunked_socket_read={chunked}".format(
+                width=width, merge=merge_socket_read, chunked=chunked_socket_read
+            )
+        )
+        start_time = time.time()
+        cursor.execute(
+            "select {columns} from performance".format(columns=columns),
+            merge_socket_read=merge_socket_read,
+            chunked_socket_read=chunked_socket_read,
+        )
+        results = cursor.fetchall()
+        print("Took {0} seconds.".format(time.time() - start_time))
+        print("fetch {result} rows".format(result=len(results)))
+
 cursor.close()
 conn.commit()
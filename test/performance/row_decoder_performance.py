@@ -0,0 +1,81 @@
+import time
+import typing
+from struct import pack
+
+from redshift_connector.utils import (
+    compile_row_decoder,
+    date_recv_binary,
+    i_unpack,
+    numeric_in_binary,
+    numeric_scale,
+    numeric_to_float_binary,
+    text_recv,
+)
+from redshift_connector.utils.type_utils import float8_recv, int4_recv, int8_recv
+
+"""
+Compares the throughput of decoding DataRow messages using a compiled row decoder against the per column dispatch
+loop previously used by Connection.handle_DATA_ROW. No Amazon Redshift cluster is required.
+"""
+
+NUM_ROWS: int = 100000
+COLUMN_COUNTS: typing.Tuple[int, ...] = (1, 5, 10, 25, 50)
+
+# (receive function, type modifier, value) cycled through to build each result shape
+COLUMN_TYPES: typing.Tuple[typing.Tuple[typing.Callable, int, bytes], ...] = (
+    (int4_recv, -1, pack("!i", 214748367)),
+    (int8_recv, -1, pack("!q", 214748367214748367)),
+    (float8_recv, -1, pack("!d", 1234567.1234567)),
+    (date_recv_binary, -1, pack("!i", 7374)),
+    (numeric_in_binary, (18 << 16) + 9 + 4, pack("!q", 123456789123456789)),
+    (text_recv, -1, "abcd¬µ3kt¿abcdÆgda123~Øasd".encode("utf8")),
+)
+
+
+def dispatch_loop(data: bytes, truncated_row_desc: typing.List[typing.Tuple]) -> typing.List:
+    data_idx: int = 2
+    row: typing.List = []
+    for desc in truncated_row_desc:
+        vlen: int = i_unpack(data, data_idx)[0]
+        data_idx += 4
+        if vlen == -1:
+            row.append(None)
+        elif desc[0] in (numeric_in_binary, numeric_to_float_binary):
+            row.append(desc[0](data, data_idx, vlen, desc[1]))
+            data_idx += vlen
+        else:
+            row.append(desc[0](data, data_idx, vlen))
+            data_idx += vlen
+    return row
+
+
+def rows_per_second(func: typing.Callable, messages: typing.List[bytes], *args) -> float:
+    start_time: float = time.perf_counter()
+    for message in messages:
+        func(message, *args)
+    return len(messages) / (time.perf_counter() - start_time)
+
+
+for num_columns in COLUMN_COUNTS:
+    columns = [COLUMN_TYPES[i % len(COLUMN_TYPES)] for i in range(num_columns)]
+    row_desc: typing.List[typing.Dict] = [{"type_modifier": type_modifier} for _, type_modifier, _ in columns]
+    input_funcs: typing.Tuple[typing.Callable, ...] = tuple(func for func, _, _ in columns)
+
+    truncated_row_desc: typing.List[typing.Tuple] = [
+        (func, numeric_scale(type_modifier)) if func is numeric_in_binary else (func,)
+        for func, type_modifier, _ in columns
+    ]
+
+    message: bytes = pack("!h", num_columns) + b"".join(pack("!i", len(value)) + value for _, _, value in columns)
+    messages: typing.List[bytes] = [message] * NUM_ROWS
+
+    decode_row: typing.Callable = compile_row_decoder(row_desc, input_funcs)
+    assert decode_row(message) == dispatch_loop(message, truncated_row_desc)
+
+    before: float = rows_per_second(dispatch_loop, messages, truncated_row_desc)
+    after: float = rows_per_second(decode_row, messages)
+    print(
+        "columns: {}\tdispatch loop: {:.0f} rows/sec\tcompiled: {:.0f} rows/sec\tspeedup: {:.2f}x".format(
+            num_columns, before, after, after / before
+        )
+    )
@@ -0,0 +1,60 @@
+import sys
+import time
+import typing
+
+import numpy as np  # type: ignore
+import pandas as pd  # type: ignore
+
+from redshift_connector.utils import encode_dataframe
+from test.unit.mocks.mock_backend import mock_connection
+
+"""
+Measures the time taken by Cursor.write_dataframe to encode the Bind messages inserting a pandas.DataFrame, i.e.
+converting its rows to Python objects and encoding their values one by one, compared with encoding each column as a
+whole using redshift_connector.utils.encode_dataframe. The frame holds 20 int, float, bool, datetime and str columns,
+with missing values in some of them. No Amazon Redshift cluster is required. Run from the root of the repository,
+optionally passing the row count to test:
+
+    python -m test.performance.write_dataframe_performance 1000000
+"""
+
+NUM_ROWS: int = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+BATCH_SIZE: int = 1024
+
+rng = np.random.default_rng(0)
+columns: typing.Dict[str, typing.Any] = {}
+for idx in range(4):
+    columns["int{}".format(idx)] = rng.integers(0, 1 << 30, NUM_ROWS)
+    columns["float{}".format(idx)] = rng.random(NUM_ROWS)
+    columns["bool{}".format(idx)] = rng.random(NUM_ROWS) > 0.5
+    columns["timestamp{}".format(idx)] = pd.Timestamp("2024-01-01") + pd.to_timedelta(
+        rng.integers(0, 1 << 40, NUM_ROWS), unit="us"
+    )
+    columns["str{}".format(idx)] = pd.Series(rng.integers(0, 1000, NUM_ROWS)).map("value {}".format)
+df: pd.DataFrame = pd.DataFrame(columns)
+df.loc[::10, "float0"] = np.nan
+df.loc[::7, "str0"] = None
+
+conn, _ = mock_connection()
+# stands in for the prepared statements the rows are bound to
+ps: typing.Dict[str, typing.Any] = {"bind_1": b"\x00statement\x00", "bind_2": b"\x00\x00"}
+
+
+def encode_rows() -> None:
+    for row in df.values.tolist():
+        ps["param_funcs"] = tuple(param[2] for param in conn.make_params(row))
+        conn._make_bind(ps, row)
+
+
+def encode_columns() -> None:
+    rows = encode_dataframe(df, conn.make_params)
+    assert rows is not None
+    for start in range(0, NUM_ROWS, BATCH_SIZE):
+        ps["bind_1"] + rows.bind_values(start, min(start + BATCH_SIZE, NUM_ROWS)) + ps["bind_2"]
+
+
+print("Encoding {} rows of {} columns".format(NUM_ROWS, len(df.columns)))
+for name, func in (("one row at a time", encode_rows), ("column-wise", encode_columns)):
+    start: float = time.perf_counter()
+    func()
+    print("{:<20} {:10.2f} s".format(name, time.perf_counter() - start))
@@ -0,0 +1,169 @@
+"""
+Helpers for unit testing wire protocol handling without an Amazon Redshift cluster. Server responses are
+scripted up front as raw protocol messages and served to the driver in order, while everything the driver
+writes is recorded for inspection.
+"""
+
+import io
+import typing
+from struct import pack
+from unittest.mock import MagicMock, patch
+
+from redshift_connector import Connection
+from redshift_connector.config import ClientProtocolVersion
+from redshift_connector.utils.oids import RedshiftOID
+
+
+def message(code: bytes, data: bytes = b"") -> bytes:
+    return code + pack("!i", len(data) + 4) + data
+
+
+def row_description(
+    *columns: typing.Tuple[str, int], extended: bool = True, type_modifiers: typing.Optional[typing.List[int]] = None
+) -> bytes:
+    data: bytearray = bytearray(pack("!h", len(columns)))
+    for idx, (label, type_oid) in enumerate(columns):
+        type_modifier: int = type_modifiers[idx] if type_modifiers is not None else -1
+        data += label.encode("utf8") + b"\x00"
+        data += pack("!ihihih", 0, 0, type_oid, -1, type_modifier, 0)
+        if extended:
+            data += b"public\x00table\x00" + label.encode("utf8") + b"\x00dev\x00"
+            data += pack("!h", 0x1)
+    return message(b"T", bytes(data))
+
+
+def data_row(*values: typing.Optional[bytes]) -> bytes:
+    data: bytearray = bytearray(pack("!h", len(values)))
+    for value in values:
+        if value is None:
+            data += pack("!i", -1)
+        else:
+            data += pack("!i", len(value)) + value
+    return message(b"D", bytes(data))
+
+
+def int4_row(*values: typing.Optional[int]) -> bytes:
+    return data_row(*(None if v is None else pack("!i", v) for v in values))
+
+
+def command_complete(tag: bytes) -> bytes:
+    return message(b"C", tag + b"\x00")
+
+
+def error_response(code: str = "42601", msg: str = "syntax error") -> bytes:
+    return message(b"E", "SERROR\x00C{}\x00M{}\x00\x00".format(code, msg).encode("utf8"))
+
+
+PARSE_COMPLETE: bytes = message(b"1")
+BIND_COMPLETE: bytes = message(b"2")
+CLOSE_COMPLETE: bytes = message(b"3")
+PORTAL_SUSPENDED: bytes = message(b"s")
+NO_DATA: bytes = message(b"n")
+PARAMETER_DESCRIPTION: bytes = message(b"t", pack("!h", 0))
+READY_FOR_QUERY: bytes = message(b"Z", b"I")
+READY_FOR_QUERY_IN_TRANSACTION: bytes = message(b"Z", b"T")
+
+
+def describe_response(
+    *columns: typing.Tuple[str, int], type_modifiers: typing.Optional[typing.List[int]] = None
+) -> bytes:
+    """
+    Response to the Parse, Describe messages sent without a Sync message when executemany prepares a statement.
+    """
+    if columns:
+        description: bytes = row_description(*columns, type_modifiers=type_modifiers)
+    else:
+        description = NO_DATA
+    return PARSE_COMPLETE + PARAMETER_DESCRIPTION + description
+
+
+def prepare_response(
+    *columns: typing.Tuple[str, int], type_modifiers: typing.Optional[typing.List[int]] = None
+) -> bytes:
+    """
+    Response to the Parse, Describe, Sync messages sent when a statement is first prepared.
+    """
+    return describe_response(*columns, type_modifiers=type_modifiers) + READY_FOR_QUERY
+
+
+def startup_response(protocol: int = ClientProtocolVersion.BINARY) -> bytes:
+    return (
+        message(b"R", pack("!i", 0))
+        + message(b"S", b"server_protocol_version\x00" + str(int(protocol)).encode() + b"\x00")
+        + message(b"S", b"client_encoding\x00UTF8\x00")
+        + READY_FOR_QUERY
+    )
+
+
+class MockBackendFile:
+    """
+    Stands in for the file object returned by ``socket.makefile("rwb")``.
+    """
+
+    def __init__(self: "MockBackendFile", data: bytes) -> None:
+        self._in: io.BytesIO = io.BytesIO(data)
+        self.written: bytearray = bytearray()
+        # limits the number of bytes returned by each call to readinto1, as a socket receiving data in pieces would
+        self.chunk_size: typing.Optional[int] = None
+
+    def read(self: "MockBackendFile", n: int = -1) -> bytes:
+        return self._in.read(n)
+
+    def readinto1(self: "MockBackendFile", b: memoryview) -> int:
+        if self.chunk_size is not None:
+            b = b[: self.chunk_size]
+        return self._in.readinto(b)
+
+    def write(self: "MockBackendFile", data: bytes) -> None:
+        self.written += data
+
+    def flush(self: "MockBackendFile") -> None:
+        pass
+
+    def close(self: "MockBackendFile") -> None:
+        pass
+
+    def remaining(self: "MockBackendFile") -> int:
+        return len(self._in.getbuffer()) - self._in.tell()
+
+    def messages_written(self: "MockBackendFile") -> typing.List[typing.Tuple[bytes, bytes]]:
+        """
+        Splits the bytes written by the driver, following the start-up packet, into (code, data) pairs.
+        """
+        result: typing.List[typing.Tuple[bytes, bytes]] = []
+        buf: bytes = bytes(self.written)
+        idx: int = int.from_bytes(buf[0:4], "big")
+        while idx < len(buf):
+            code: bytes = buf[idx : idx + 1]
+            length: int = int.from_bytes(buf[idx + 1 : idx + 5], "big")
+            result.append((code, buf[idx + 5 : idx + 1 + length]))
+            idx += 1 + length
+        return result
+
+
+def mock_connection(
+    server_messages: bytes = b"", protocol: int = ClientProtocolVersion.BINARY, **kwargs
+) -> typing.Tuple[Connection, MockBackendFile]:
+    """
+    Returns a :class:`Connection` which reads ``server_messages`` in response to the statements it executes.
+    """
+    backend: MockBackendFile = MockBackendFile(startup_response(protocol) + server_messages)
+    with patch("socket.socket") as mock_socket:
+        mock_socket_instance = MagicMock()
+        mock_socket_instance.timeout = None
+        mock_socket.return_value = mock_socket_instance
+        mock_socket_instance.makefile.return_value = backend
+        conn: Connection = Connection(
+            user="mock_user",
+            password="mock_password",
+            database="dev",
+            ssl=False,
+            client_protocol_version=protocol,
+            application_name="test",
+            **kwargs
+        )
+    conn.autocommit = True
+    return conn, backend
+
+
+INT4: int = RedshiftOID.INTEGER
@@ -0,0 +1,247 @@
+import asyncio
+import typing
+from collections import deque
+from struct import unpack
+
+import pytest  # type: ignore
+
+from redshift_connector import InterfaceError, ProgrammingError
+from redshift_connector.aio import AsyncConnection, AsyncCursor, connect
+from test.unit.mocks.mock_backend import (
+    BIND_COMPLETE,
+    CLOSE_COMPLETE,
+    INT4,
+    READY_FOR_QUERY,
+    READY_FOR_QUERY_IN_TRANSACTION,
+    command_complete,
+    error_response,
+    int4_row,
+    prepare_response,
+    startup_response,
+)
+
+
+class ScriptedServer:
+    """
+    A loopback server answering the start-up packet of each connection, then each Sync message with the next of the
+    given responses, closing the connection once they ran out. Messages received following the start-up packet are
+    recorded per connection.
+    """
+
+    def __init__(self: "ScriptedServer", *responses: bytes, startup: typing.Optional[bytes] = None) -> None:
+        self.responses: typing.Tuple[bytes, ...] = responses
+        self.startup: bytes = startup_response() if startup is None else startup
+        self.received: typing.List[typing.List[typing.Tuple[bytes, bytes]]] = []
+        self.port: int = 0
+        self._handlers: typing.List[asyncio.Task] = []
+
+    async def __aenter__(self: "ScriptedServer") -> "ScriptedServer":
+        self._server = await asyncio.start_server(self._serve, "127.0.0.1", 0)
+        self.port = self._server.sockets[0].getsockname()[1]
+        return self
+
+    async def __aexit__(self: "ScriptedServer", exc_type, exc_value, traceback) -> None:
+        for handler in self._handlers:
+            if exc_type is None:
+                # waits for the connection to be closed by the client
+                await handler
+            else:
+                handler.cancel()
+        self._server.close()
+        await self._server.wait_closed()
+
+    async def _serve(self: "ScriptedServer", reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self._handlers.append(typing.cast(asyncio.Task, asyncio.current_task()))
+        received: typing.List[typing.Tuple[bytes, bytes]] = []
+        self.received.append(received)
+        responses: typing.Deque[bytes] = deque(self.responses)
+        length: int = unpack("!i", await reader.readexactly(4))[0]
+        await reader.readexactly(length - 4)
+        writer.write(self.startup)
+        try:
+            while True:
+                code, length = unpack("!ci", await reader.readexactly(5))
+                received.append((code, await reader.readexactly(length - 4)))
+                if code == b"S" and len(responses) > 0:
+                    writer.write(responses.popleft())
+                elif code in (b"S", b"X"):
+                    # closes the connection once the responses ran out
+                    break
+        except asyncio.IncompleteReadError:
+            pass
+        writer.close()
+
+    def connect(self: "ScriptedServer", **kwargs) -> typing.Awaitable[AsyncConnection]:
+        return connect(
+            host="127.0.0.1",
+            port=self.port,
+            user="mock_user",
+            password="mock_password",
+            database="dev",
+            ssl=False,
+            **kwargs
+        )
+
+
+def select_response(*values: int) -> bytes:
+    rows: bytes = b"".join(int4_row(value) for value in values)
+    return BIND_COMPLETE + rows + command_complete("SELECT {}".format(len(values)).encode()) + READY_FOR_QUERY
+
+
+PREPARE_INT4: bytes = prepare_response(("?column?", INT4))
+
+
+def codes(messages: typing.List[typing.Tuple[bytes, bytes]]) -> bytes:
+    return b"".join(code for code, _ in messages if code != b"H")
+
+
+def test_execute_and_iterate_rows() -> None:
+    async def run() -> None:
+        async with ScriptedServer(PREPARE_INT4, select_response(1, 2, 3), select_response(4)) as server:
+            async with await server.connect(application_name="test") as conn:
+                conn.autocommit = True
+                async with conn.cursor() as cursor:
+                    await cursor.execute("select x from t where y = %s", (1,))
+                    assert cursor.description[0][:2] == ("?column?", INT4)
+                    assert [row async for row in cursor] == [[1], [2], [3]]
+                    assert cursor.redshift_rowcount == 3
+
+                    # the statement prepared before is reused
+                    assert await (await cursor.execute("select x from t where y = %s", (2,))).fetchall() == ([4],)
+            assert conn.closed
+        assert codes(server.received[0]) == b"PDSBESBESX"
+        assert b"select x from t where y = $1" in server.received[0][0][1]
+
+    asyncio.run(run())
+
+
+def test_error_response_raised_and_connection_reusable() -> None:
+    async def run() -> None:
+        failed: bytes = BIND_COMPLETE + error_response() + READY_FOR_QUERY
+        async with ScriptedServer(prepare_response(), failed, PREPARE_INT4, select_response(7)) as server:
+            conn: AsyncConnection = await server.connect()
+            conn.autocommit = True
+            cursor: AsyncCursor = conn.cursor()
+
+            with pytest.raises(ProgrammingError, match="syntax error"):
+                await cursor.execute("selec 1")
+            await cursor.execute("select 7")
+            assert await cursor.fetchone() == [7]
+            assert await cursor.fetchone() is None
+            await conn.close()
+
+            with pytest.raises(InterfaceError, match="closed"):
+                await cursor.execute("select 7")
+            with pytest.raises(InterfaceError, match="closed"):
+                await conn.close()
+
+    asyncio.run(run())
+
+
+def test_transaction_begun_and_committed() -> None:
+    async def run() -> None:
+        in_transaction: bytes = prepare_response() + BIND_COMPLETE + command_complete(b"INSERT 0 2")
+        async with ScriptedServer(
+            prepare_response(),
+            BIND_COMPLETE + command_complete(b"BEGIN") + READY_FOR_QUERY_IN_TRANSACTION,
+            prepare_response(),
+            in_transaction + READY_FOR_QUERY_IN_TRANSACTION,
+            prepare_response(),
+            BIND_COMPLETE + command_complete(b"COMMIT") + READY_FOR_QUERY,
+        ) as server:
+            async with await server.connect() as conn:
+                cursor: AsyncCursor = conn.cursor()
+                await cursor.execute("insert into t values (1), (2)")
+                assert cursor.rowcount == 2
+                assert conn.in_transaction
+                await conn.commit()
+                assert not conn.in_transaction
+                # nothing is sent when no transaction is open
+                await conn.rollback()
+
+        statements: typing.List[bytes] = [data for code, data in server.received[0] if code == b"P"]
+        assert [statement.split(b"\x00")[1] for statement in statements] == [
+            b"begin transaction",
+            b"insert into t values (1), (2)",
+            b"commit",
+        ]
+
+    asyncio.run(run())
+
+
+def test_concurrent_connections_share_event_loop() -> None:
+    async def query(server: ScriptedServer, value: int) -> typing.Tuple:
+        async with await server.connect() as conn:
+            conn.autocommit = True
+            cursor: AsyncCursor = conn.cursor()
+            await cursor.execute("select %s", (value,))
+            await conn.ping()
+            return await cursor.fetchall()
+
+    async def run() -> None:
+        # every connection of the server receives the same responses
+        async with ScriptedServer(PREPARE_INT4, select_response(5), READY_FOR_QUERY) as server:
+            results = await asyncio.gather(*(query(server, value) for value in range(200)))
+        assert results == [([5],)] * 200
+        assert len(server.received) == 200
+
+    asyncio.run(run())
+
+
+def test_statements_on_one_connection_wait_for_each_other() -> None:
+    async def run() -> None:
+        async with ScriptedServer(PREPARE_INT4, select_response(1), select_response(2)) as server:
+            async with await server.connect() as conn:
+                conn.autocommit = True
+                first, second = conn.cursor(), conn.cursor()
+                await asyncio.gather(first.execute("select 1"), second.execute("select 1"))
+                assert (await first.fetchall(), await second.fetchall()) == (([1],), ([2],))
+
+    asyncio.run(run())
+
+
+def test_evicted_prepared_statements_closed_in_same_round_trip() -> None:
+    async def run() -> None:
+        async with ScriptedServer(
+            PREPARE_INT4,
+            select_response(1),
+            PREPARE_INT4,
+            select_response(2),
+            CLOSE_COMPLETE + READY_FOR_QUERY,
+        ) as server:
+            async with await server.connect(max_prepared_statements=1) as conn:
+                conn.autocommit = True
+                cursor: AsyncCursor = conn.cursor()
+                await cursor.execute("select 1")
+                await cursor.execute("select 2")
+                assert await cursor.fetchall() == ([2],)
+
+        assert codes(server.received[0]) == b"PDSBESPDSBESCSX"
+
+    asyncio.run(run())
+
+
+def test_startup_error_raised() -> None:
+    async def run() -> None:
+        async with ScriptedServer(startup=error_response("28000", "password authentication failed")) as server:
+            with pytest.raises(InterfaceError, match="password authentication failed"):
+                await server.connect()
+
+    asyncio.run(run())
+
+
+def test_connect_rejects_unknown_argument() -> None:
+    with pytest.raises(TypeError, match="hostname"):
+        asyncio.run(connect(hostname="localhost"))
+
+
+def test_closed_server_raises_broken_pipe() -> None:
+    async def run() -> None:
+        async with ScriptedServer() as server:
+            conn: AsyncConnection = await server.connect()
+            conn.autocommit = True
+            with pytest.raises(InterfaceError, match="BrokenPipe"):
+                await conn.cursor().execute("select 1")
+            assert conn.closed
+
+    asyncio.run(run())
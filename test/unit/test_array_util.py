@@ -2,7 +2,12 @@ import typing
 
 import pytest  # type: ignore
 
+from redshift_connector.error import (
+    ArrayContentNotSupportedError,
+    ArrayDimensionsNotConsistentError,
+)
 from redshift_connector.utils import array_util
+from test.utils import numpy_only
 
 walk_array_data: typing.List = [
     (
@@ -81,3 +86,44 @@ array_has_null_data: typing.List = [
 def test_array_has_null(_input) -> None:
     in_val, exp_val = _input
     assert array_util.array_has_null(in_val) is exp_val
+
+
+array_scan_data: typing.List = [
+    ([], ([0], [])),
+    ([1, None, 3], ([3], [1, None, 3])),
+    ([[1, 2], [3, None]], ([2, 2], [1, 2, 3, None])),
+    ([[[1], [2]], [[3], [4]]], ([2, 2, 1], [1, 2, 3, 4])),
+    ([[], []], ([2, 0], [])),
+    ((1, (2, 3)), ([2], [1, (2, 3)])),
+]
+
+
+@pytest.mark.parametrize("_input", array_scan_data)
+def test_array_scan(_input) -> None:
+    in_val, exp_val = _input
+    assert array_util.array_scan(in_val) == exp_val
+
+
+@pytest.mark.parametrize("_input", ([1, [2]], [[1], [1, 2]], [[1], 2], [[[1]], [2]]))
+def test_array_scan_inconsistent_dimensions_raises(_input) -> None:
+    with pytest.raises(ArrayDimensionsNotConsistentError):
+        array_util.array_scan(_input)
+
+
+@numpy_only
+def test_numpy_array_send() -> None:
+    import numpy as np
+
+    from redshift_connector.utils.type_utils import ii_pack, iii_pack
+
+    array_oid, data = array_util.numpy_array_send(np.array([[1, 2], [3, 4]], dtype=np.uint16))
+    assert array_oid == 1007
+    assert data == iii_pack(2, 0, 23) + ii_pack(2, 1) + ii_pack(2, 1) + b"".join(ii_pack(4, i) for i in range(1, 5))
+
+    array_oid, data = array_util.numpy_array_send(np.array([True, False]))
+    assert (array_oid, data) == (1000, iii_pack(1, 0, 16) + ii_pack(2, 1) + b"\x00\x00\x00\x01\x01\x00\x00\x00\x01\x00")
+
+    assert array_util.numpy_array_send(np.array([], dtype=np.float32)) == (1022, iii_pack(0, 0, 701))
+    assert array_util.numpy_array_send(np.array(["a"])) is None
+    with pytest.raises(ArrayContentNotSupportedError):
+        array_util.numpy_array_send(np.array([1 << 63], dtype=np.uint64))
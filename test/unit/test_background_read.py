@@ -0,0 +1,118 @@
+import io
+import time
+import typing
+
+import pytest  # type: ignore
+
+from redshift_connector import InterfaceError, ProgrammingError, ResultBufferMode
+from redshift_connector.utils import BackgroundMessageReader, MessageReader
+from test.unit.mocks.mock_backend import (
+    BIND_COMPLETE,
+    INT4,
+    READY_FOR_QUERY,
+    command_complete,
+    error_response,
+    int4_row,
+    mock_connection,
+    prepare_response,
+)
+
+
+def select_response(num_rows: int) -> bytes:
+    return (
+        prepare_response(("c1", INT4))
+        + BIND_COMPLETE
+        + b"".join(int4_row(i) for i in range(num_rows))
+        + command_complete("SELECT {}".format(num_rows).encode())
+        + READY_FOR_QUERY
+    )
+
+
+@pytest.mark.parametrize("buffer_mode", ResultBufferMode.list())
+def test_background_read_fetches_all_rows(buffer_mode) -> None:
+    conn, backend = mock_connection(select_response(500))
+    backend.chunk_size = 64
+    cursor = conn.cursor()
+    cursor.buffer_mode = buffer_mode
+    cursor.execute("select c1 from t", background_read=True)
+
+    assert [row[0] for row in cursor] == list(range(500))
+    assert cursor.rowcount == 500
+    assert conn._background_read_cursor is None
+    assert backend.remaining() == 0
+
+
+def test_background_read_fetchmany() -> None:
+    conn, backend = mock_connection(select_response(50))
+    backend.chunk_size = 32
+    cursor = conn.cursor()
+    cursor.execute("select c1 from t", background_read=True)
+
+    assert cursor.fetchmany(20) == tuple([i] for i in range(20))
+    assert len(cursor.fetchall()) == 30
+
+
+def test_background_reader_queue_is_bounded() -> None:
+    data: bytes = b"".join(int4_row(i) for i in range(100)) + READY_FOR_QUERY
+    stream: io.BytesIO = io.BytesIO(data)
+    reader: BackgroundMessageReader = BackgroundMessageReader(
+        MessageReader(lambda b: stream.readinto(b[: len(int4_row(0))]), 64), frozenset((b"Z",)), queue_size=2
+    )
+    time.sleep(0.1)
+
+    # the thread waits for batches to be taken once the queue is full
+    assert stream.tell() < len(data)
+    messages: typing.List[typing.Tuple[bytes, bytes]] = []
+    while len(messages) == 0 or messages[-1][0] != b"Z":
+        messages.extend(reader.get())
+    assert len(messages) == 101
+
+
+def test_background_read_error_raised_by_execute() -> None:
+    conn, _ = mock_connection(
+        prepare_response(("c1", INT4)) + BIND_COMPLETE + error_response() + READY_FOR_QUERY + select_response(1)
+    )
+    cursor = conn.cursor()
+
+    with pytest.raises(ProgrammingError, match="syntax error"):
+        cursor.execute("select c1 from t", background_read=True)
+    assert conn._background_read_cursor is None
+
+    cursor.execute("select c1 from t2")
+    assert cursor.fetchall() == ([0],)
+
+
+def test_background_read_finished_by_next_statement() -> None:
+    conn, backend = mock_connection(select_response(1000) + select_response(1))
+    backend.chunk_size = 64
+    cursor = conn.cursor()
+    cursor.execute("select c1 from t", background_read=True)
+    assert cursor.fetchone() == [0]
+
+    other = conn.cursor()
+    other.execute("select c1 from t2")
+
+    assert other.fetchall() == ([0],)
+    assert backend.remaining() == 0
+    with pytest.raises(InterfaceError, match="closed before all rows were fetched"):
+        cursor.fetchall()
+
+
+def test_background_read_finished_by_cursor_close() -> None:
+    conn, backend = mock_connection(select_response(1000) + select_response(1))
+    backend.chunk_size = 64
+    cursor = conn.cursor()
+    cursor.execute("select c1 from t", background_read=True)
+    cursor.close()
+
+    assert conn._background_read_cursor is None
+    cursor = conn.cursor()
+    cursor.execute("select c1 from t2")
+    assert cursor.fetchall() == ([0],)
+
+
+def test_background_read_with_stream_rows_raises() -> None:
+    conn, _ = mock_connection()
+
+    with pytest.raises(InterfaceError, match="cannot be combined"):
+        conn.cursor().execute("select c1 from t", stream_rows=True, background_read=True)
@@ -0,0 +1,142 @@
+import typing
+from unittest.mock import MagicMock
+
+import pytest  # type: ignore
+
+import redshift_connector
+from redshift_connector import InterfaceError, parallel_insert
+from redshift_connector.cursor import BulkInsertStats
+from test.utils import pandas_only
+
+
+class FakeCursor:
+    def __init__(self: "FakeCursor", executed: typing.List[str], fail: bool) -> None:
+        self.executed = executed
+        self.fail = fail
+        self.inserted: typing.List[typing.Tuple[str, typing.Any]] = []
+        self.bulk_insert_stats: typing.Optional[BulkInsertStats] = None
+
+    def __enter__(self: "FakeCursor") -> "FakeCursor":
+        return self
+
+    def __exit__(self: "FakeCursor", *args) -> None:
+        pass
+
+    def execute(self: "FakeCursor", operation: str) -> None:
+        self.executed.append(operation)
+
+    def insert_data_bulk(
+        self: "FakeCursor", filename, table_name, parameter_indices, column_names, batch_size, rows
+    ) -> None:
+        assert filename is None and parameter_indices is None
+        # fails regardless of the partitions taken, which other connections may have taken all of
+        if self.fail:
+            raise InterfaceError("insert failed")
+        inserted: typing.List = list(rows)
+        self.inserted.extend((table_name, row) for row in inserted)
+        self.bulk_insert_stats = BulkInsertStats(len(inserted), 0, 0, 0.0)
+
+    def write_dataframe(self: "FakeCursor", df, table) -> None:
+        self.inserted.append((table, df))
+
+
+def fake_connections(
+    mocker, num_connections: int, fail: typing.Sequence[int] = ()
+) -> typing.Tuple[typing.List[MagicMock], typing.List[FakeCursor], typing.List[str]]:
+    executed: typing.List[str] = []
+    cursors: typing.List[FakeCursor] = [FakeCursor(executed, idx in fail) for idx in range(num_connections)]
+    conns: typing.List[MagicMock] = []
+    for cursor in cursors:
+        conn: MagicMock = MagicMock()
+        conn.cursor.return_value = cursor
+        conns.append(conn)
+    mocker.patch.object(redshift_connector, "connect", side_effect=conns)
+    return conns, cursors, executed
+
+
+def test_parallel_insert_uses_staging_table(mocker) -> None:
+    conns, cursors, executed = fake_connections(mocker, 3)
+    rows: typing.List[typing.List[int]] = [[i, i * 2] for i in range(25)]
+
+    assert parallel_insert("public.t", rows, ["a", "b"], num_connections=3, partition_size=4, host="h") == 25
+
+    assert redshift_connector.connect.call_count == 3  # type: ignore
+    redshift_connector.connect.assert_called_with(host="h")  # type: ignore
+    staging: str = executed[0].split()[2]
+    assert staging.startswith("public.t_staging_")
+    assert executed == [
+        "create table {} (like public.t)".format(staging),
+        "insert into public.t (a, b) select a, b from {}".format(staging),
+        "drop table {}".format(staging),
+    ]
+    inserted = [item for cursor in cursors for item in cursor.inserted]
+    assert {table for table, _ in inserted} == {staging}
+    assert sorted(row for _, row in inserted) == rows
+    for conn in conns:
+        conn.commit.assert_called()
+        conn.rollback.assert_not_called()
+        conn.close.assert_called_once()
+
+
+def test_parallel_insert_without_staging_table(mocker) -> None:
+    conns, cursors, executed = fake_connections(mocker, 2)
+
+    assert (
+        parallel_insert("t", iter([(1,), (2,), (3,)]), ["a"], num_connections=2, partition_size=1, staging_table=False)
+        == 3
+    )
+
+    assert executed == []
+    assert sorted(item for cursor in cursors for item in cursor.inserted) == [("t", (1,)), ("t", (2,)), ("t", (3,))]
+    for conn in conns:
+        conn.commit.assert_called_once()
+
+
+def test_parallel_insert_failure_rolls_back_and_drops_staging_table(mocker) -> None:
+    conns, cursors, executed = fake_connections(mocker, 4, fail=(2,))
+
+    with pytest.raises(InterfaceError, match="insert failed"):
+        parallel_insert("t", ([i] for i in range(1000)), ["a"], partition_size=10)
+
+    staging: str = executed[0].split()[2]
+    assert executed == ["create table {} (like t)".format(staging), "drop table if exists {}".format(staging)]
+    # only the creation of the staging table and its drop are committed
+    assert conns[0].commit.call_count == 2
+    for conn in conns:
+        conn.rollback.assert_called_once()
+        conn.close.assert_called_once()
+    for conn in conns[1:]:
+        conn.commit.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    "args, kwargs, match",
+    (
+        (([[1]],), {}, "column_names must be given"),
+        (([[1]], ["a"]), {"num_connections": 0}, "num_connections"),
+        (([[1]], ["a"]), {"partition_size": 0}, "partition_size"),
+    ),
+)
+def test_parallel_insert_validates_arguments(mocker, args, kwargs, match) -> None:
+    fake_connections(mocker, 4)
+
+    with pytest.raises(InterfaceError, match=match):
+        parallel_insert("t", *args, **kwargs)
+
+    redshift_connector.connect.assert_not_called()  # type: ignore
+
+
+@pandas_only
+def test_parallel_insert_dataframe_partitions(mocker) -> None:
+    import pandas as pd
+
+    conns, cursors, executed = fake_connections(mocker, 2)
+    df = pd.DataFrame({"a": range(10), "b": [str(i) for i in range(10)]})
+
+    assert parallel_insert("t", df, num_connections=2, partition_size=4) == 10
+
+    staging: str = executed[0].split()[2]
+    assert executed[1] == "insert into t select * from {}".format(staging)
+    parts = sorted((item for cursor in cursors for item in cursor.inserted), key=lambda item: item[1].index[0])
+    assert [len(part.index) for _, part in parts] == [4, 4, 2]
+    pd.testing.assert_frame_equal(pd.concat([part for _, part in parts]), df)
@@ -0,0 +1,139 @@
+import socket
+import threading
+import typing
+from struct import pack, unpack
+
+import pytest  # type: ignore
+
+from redshift_connector import Connection, InterfaceError, ProgrammingError, QueryTimeoutError
+from test.unit.mocks.mock_backend import (
+    BIND_COMPLETE,
+    INT4,
+    READY_FOR_QUERY,
+    command_complete,
+    error_response,
+    int4_row,
+    message,
+    prepare_response,
+    startup_response,
+)
+
+BACKEND_KEY_DATA: bytes = pack("!ii", 4321, 8765)
+CANCELLED: bytes = error_response("57014", "Query cancelled on user's request") + READY_FOR_QUERY
+
+
+def select_response(value: int) -> bytes:
+    return BIND_COMPLETE + int4_row(value) + command_complete(b"SELECT 1") + READY_FOR_QUERY
+
+
+class CancellableServer:
+    """
+    A loopback server answering the start-up packet with BackendKeyData, then each Sync message with the next of the
+    given responses. A response of ``None`` is replaced by an error once a CancelRequest was received, standing in for a
+    statement running until it is cancelled. CancelRequests received are recorded as (process ID, secret key).
+    """
+
+    def __init__(self: "CancellableServer", *responses: typing.Optional[bytes]) -> None:
+        self.responses: typing.List[typing.Optional[bytes]] = list(responses)
+        self.cancel_requests: typing.List[typing.Tuple[int, int]] = []
+        self.cancelled: threading.Event = threading.Event()
+        self._listener: socket.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self._listener.bind(("127.0.0.1", 0))
+        self._listener.listen(4)
+        self.port: int = self._listener.getsockname()[1]
+        threading.Thread(target=self._accept, daemon=True).start()
+
+    def _accept(self: "CancellableServer") -> None:
+        while True:
+            try:
+                sock, _ = self._listener.accept()
+            except OSError:
+                return
+            threading.Thread(target=self._serve, args=(sock,), daemon=True).start()
+
+    def _serve(self: "CancellableServer", sock: socket.socket) -> None:
+        with sock, sock.makefile("rb") as rfile:
+            length, code = unpack("!ii", rfile.read(8))
+            if code == 80877102:
+                self.cancel_requests.append(unpack("!ii", rfile.read(8)))
+                self.cancelled.set()
+                return
+            rfile.read(length - 8)
+            sock.sendall(message(b"K", BACKEND_KEY_DATA) + startup_response())
+            while True:
+                header: bytes = rfile.read(5)
+                if len(header) < 5:
+                    return
+                code, length = unpack("!ci", header)
+                rfile.read(length - 4)
+                if code == b"S":
+                    response: typing.Optional[bytes] = self.responses.pop(0)
+                    if response is None:
+                        self.cancelled.wait(5)
+                        response = CANCELLED
+                    sock.sendall(response)
+
+    def connect(self: "CancellableServer") -> Connection:
+        conn: Connection = Connection(
+            user="mock_user", password="mock_password", database="dev", host="127.0.0.1", port=self.port, ssl=False
+        )
+        conn.autocommit = True
+        return conn
+
+    def close(self: "CancellableServer") -> None:
+        self._listener.close()
+
+
+@pytest.fixture
+def server_factory():
+    servers: typing.List[CancellableServer] = []
+
+    def factory(*responses: typing.Optional[bytes]) -> CancellableServer:
+        servers.append(CancellableServer(*responses))
+        return servers[-1]
+
+    yield factory
+    for server in servers:
+        server.close()
+
+
+def test_cancel_sends_backend_key_data(server_factory) -> None:
+    server: CancellableServer = server_factory()
+    conn: Connection = server.connect()
+
+    conn.cancel()
+
+    assert server.cancel_requests == [(4321, 8765)]
+    conn.close()
+    with pytest.raises(InterfaceError, match="closed"):
+        conn.cancel()
+
+
+def test_execute_timeout_cancels_statement(server_factory) -> None:
+    server: CancellableServer = server_factory(
+        prepare_response(("?column?", INT4)), None, select_response(2), select_response(3)
+    )
+    conn: Connection = server.connect()
+    cursor = conn.cursor()
+
+    with pytest.raises(QueryTimeoutError, match="0.1 seconds") as exc_info:
+        cursor.execute("select 1", timeout=0.1)
+    assert isinstance(exc_info.value.__cause__, ProgrammingError)
+    assert server.cancel_requests == [(4321, 8765)]
+
+    # the connection is usable following the cancelled statement
+    assert cursor.execute("select 1", timeout=5).fetchall() == ([2],)
+    assert cursor.execute("select 1").fetchall() == ([3],)
+    assert server.cancel_requests == [(4321, 8765)]
+    conn.close()
+
+
+def test_execute_timeout_not_raised_for_other_errors(server_factory) -> None:
+    server: CancellableServer = server_factory(prepare_response(), BIND_COMPLETE + error_response() + READY_FOR_QUERY)
+    conn: Connection = server.connect()
+
+    with pytest.raises(ProgrammingError, match="syntax error"):
+        conn.cursor().execute("selec 1", timeout=5)
+    with pytest.raises(InterfaceError, match="timeout"):
+        conn.cursor().execute("select 1", timeout=0)
+    conn.close()
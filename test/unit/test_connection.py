@@ -575,3 +575,44 @@ def test_tcp_keepalive_validation(idle, interval, count, expected_error):
     else:
         # Should not raise any exception
         validate_keepalive_values(idle, interval, count)
+
+
+def test_redshift_ssl_context_shared_per_sslmode() -> None:
+    from redshift_connector.core import _redshift_ssl_context
+
+    verify_ca = _redshift_ssl_context("verify-ca")
+    verify_full = _redshift_ssl_context("verify-full")
+
+    assert _redshift_ssl_context("verify-ca") is verify_ca
+    assert _redshift_ssl_context("verify-full") is verify_full
+    assert (verify_ca.check_hostname, verify_full.check_hostname) == (False, True)
+
+
+@pytest.mark.parametrize("check_hostname", [False, True])
+def test_ssl_session_reused_by_next_connection(check_hostname) -> None:
+    from test.unit.mocks.mock_backend import MockBackendFile, startup_response
+
+    ssl_context: mock.MagicMock = mock.MagicMock(check_hostname=check_hostname)
+    sessions: typing.List[mock.MagicMock] = []
+
+    def wrap_socket(sock, server_hostname=None, session=None) -> mock.MagicMock:
+        ssl_sock: mock.MagicMock = mock.MagicMock(timeout=None)
+        ssl_sock.makefile.return_value = MockBackendFile(startup_response())
+        ssl_sock.session = mock.MagicMock(has_ticket=True)
+        sessions.append(ssl_sock.session)
+        return ssl_sock
+
+    ssl_context.wrap_socket.side_effect = wrap_socket
+
+    with patch("socket.socket") as mock_socket:
+        mock_socket.return_value.recv.return_value = b"S"
+        for port in (5439, 5439, 5440):
+            Connection(user="mock_user", password="mock_password", database="dev", port=port, ssl_context=ssl_context)
+
+    server_hostname: typing.Optional[str] = "localhost" if check_hostname else None
+    # the session of the first connection is resumed by the second connection to the same host and port only
+    assert ssl_context.wrap_socket.call_args_list == [
+        mock.call(mock_socket.return_value, server_hostname=server_hostname, session=None),
+        mock.call(mock_socket.return_value, server_hostname=server_hostname, session=sessions[0]),
+        mock.call(mock_socket.return_value, server_hostname=server_hostname, session=None),
+    ]
@@ -0,0 +1,163 @@
+import csv
+import gzip
+import io
+import json
+import os
+import typing
+
+import pytest  # type: ignore
+
+from redshift_connector import InterfaceError, LocalObjectStore, ObjectStore, ProgrammingError, S3ObjectStore
+from redshift_connector.utils import COPY_NULL, copy_statement, serialize_part
+from test.unit.mocks.mock_backend import (
+    BIND_COMPLETE,
+    INT4,
+    READY_FOR_QUERY,
+    command_complete,
+    error_response,
+    int4_row,
+    mock_connection,
+    prepare_response,
+)
+from test.utils import pandas_only
+
+# response to the query checking the table exists
+TABLE_EXISTS: bytes = (
+    prepare_response(("?column?", INT4)) + BIND_COMPLETE + int4_row(1) + command_complete(b"SELECT 1") + READY_FOR_QUERY
+)
+
+
+def copied(num_rows: int) -> bytes:
+    return prepare_response() + BIND_COMPLETE + command_complete("COPY {}".format(num_rows).encode()) + READY_FOR_QUERY
+
+
+class RecordingObjectStore(LocalObjectStore):
+    def __init__(self: "RecordingObjectStore", directory: str) -> None:
+        super().__init__(directory, url_prefix="s3://bucket/stage/")
+        self.objects: typing.Dict[str, bytes] = {}
+
+    def put(self: "RecordingObjectStore", key: str, data: bytes) -> str:
+        self.objects[key] = data
+        return super().put(key, data)
+
+
+def csv_rows(data: bytes) -> typing.List[typing.List[str]]:
+    return list(csv.reader(io.StringIO(gzip.decompress(data).decode("utf-8"))))
+
+
+def test_copy_from_dataframe_iterable_stages_parts_and_manifest(tmp_path) -> None:
+    conn, backend = mock_connection(TABLE_EXISTS + copied(5))
+    store: RecordingObjectStore = RecordingObjectStore(str(tmp_path))
+    cursor = conn.cursor()
+
+    cursor.copy_from_dataframe(
+        ([idx, None if idx == 3 else "v,{}".format(idx)] for idx in range(5)),
+        "public.t",
+        store,
+        rows_per_part=2,
+        num_workers=1,
+    )
+
+    assert cursor.rowcount == 5
+    assert backend.remaining() == 0
+    keys: typing.List[str] = list(store.objects)
+    prefix: str = keys[0].rpartition("/")[0] + "/"
+    assert keys == [prefix + name for name in ("part-00000.csv.gz", "part-00001.csv.gz", "part-00002.csv.gz")] + [
+        prefix + "manifest.json"
+    ]
+    assert [row for key in keys[:3] for row in csv_rows(store.objects[key])] == [
+        ["0", "v,0"],
+        ["1", "v,1"],
+        ["2", "v,2"],
+        ["3", COPY_NULL],
+        ["4", "v,4"],
+    ]
+    assert json.loads(store.objects[keys[3]]) == {
+        "entries": [
+            {"url": "s3://bucket/stage/" + key, "mandatory": True, "meta": {"content_length": len(store.objects[key])}}
+            for key in keys[:3]
+        ]
+    }
+    statement: bytes = [data for code, data in backend.messages_written() if code == b"P"][1]
+    assert copy_statement("public.t", "s3://bucket/stage/" + keys[3], "csv", "IAM_ROLE default").encode() in statement
+    # the staged files are deleted once loaded
+    assert os.listdir(os.path.join(str(tmp_path), prefix[:-1])) == []
+
+
+def test_copy_from_dataframe_deletes_parts_when_copy_fails(tmp_path) -> None:
+    conn, _ = mock_connection(TABLE_EXISTS + prepare_response() + BIND_COMPLETE + error_response() + READY_FOR_QUERY)
+    store: RecordingObjectStore = RecordingObjectStore(str(tmp_path))
+
+    with pytest.raises(ProgrammingError):
+        conn.cursor().copy_from_dataframe([(1,), (2,)], "t", store, num_workers=1)
+
+    assert len(store.objects) == 2
+    assert all(not os.path.exists(store.path(key)) for key in store.objects)
+
+
+def test_copy_from_dataframe_empty_input_does_not_copy(tmp_path) -> None:
+    conn, backend = mock_connection(TABLE_EXISTS)
+    store: RecordingObjectStore = RecordingObjectStore(str(tmp_path))
+    cursor = conn.cursor()
+
+    cursor.copy_from_dataframe(iter(()), "t", store, num_workers=1)
+
+    assert cursor.rowcount == 0
+    assert store.objects == {}
+    assert backend.remaining() == 0
+
+
+@pytest.mark.parametrize(
+    "kwargs, match",
+    (({"file_format": "orc"}, "file_format"), ({"rows_per_part": 0}, "rows_per_part"), ({"num_workers": 0}, "workers")),
+)
+def test_copy_from_dataframe_validates_arguments(tmp_path, kwargs, match) -> None:
+    conn, _ = mock_connection()
+
+    with pytest.raises(InterfaceError, match=match):
+        conn.cursor().copy_from_dataframe([(1,)], "t", LocalObjectStore(str(tmp_path)), **kwargs)
+
+
+@pandas_only
+def test_copy_from_dataframe_serializes_in_worker_processes(tmp_path) -> None:
+    import numpy as np
+    import pandas as pd
+
+    df = pd.DataFrame({"a": range(7), "b": [np.nan if idx == 1 else idx + 0.5 for idx in range(7)]})
+    conn, _ = mock_connection(TABLE_EXISTS + copied(7))
+    store: RecordingObjectStore = RecordingObjectStore(str(tmp_path))
+
+    conn.cursor().copy_from_dataframe(df, "t", store, rows_per_part=3, num_workers=2, cleanup=False)
+
+    parts: typing.List[str] = sorted(key for key in store.objects if key.endswith(".csv.gz"))
+    assert [row for key in parts for row in csv_rows(store.objects[key])] == [
+        [str(idx), COPY_NULL if idx == 1 else str(idx + 0.5)] for idx in range(7)
+    ]
+    assert all(os.path.exists(store.path(key)) for key in store.objects)
+
+
+@pandas_only
+def test_serialize_part_parquet() -> None:
+    pyarrow_parquet = pytest.importorskip("pyarrow.parquet")
+
+    table = pyarrow_parquet.read_table(io.BytesIO(serialize_part([(1, "x"), (2, None)], "parquet", ["a", "b"])))
+
+    assert table.to_pydict() == {"a": [1, 2], "b": ["x", None]}
+
+
+def test_s3_object_store_from_url() -> None:
+    store: S3ObjectStore = S3ObjectStore.from_url("s3://bucket/some/prefix")
+
+    assert (store.bucket, store.prefix) == ("bucket", "some/prefix/")
+    assert store.url("part-00000.csv.gz") == "s3://bucket/some/prefix/part-00000.csv.gz"
+    with pytest.raises(InterfaceError, match="s3://"):
+        S3ObjectStore.from_url("/tmp/staging")
+
+
+def test_object_store_requires_abstract_methods() -> None:
+    class UrlOnlyObjectStore(ObjectStore):
+        def url(self: "UrlOnlyObjectStore", key: str) -> str:
+            return key
+
+    with pytest.raises(TypeError, match="abstract"):
+        UrlOnlyObjectStore()  # type: ignore
@@ -2,7 +2,6 @@ import datetime
 import typing
 from collections import deque
 from io import StringIO
-from math import ceil
 from test.utils import pandas_only
 from unittest.mock import MagicMock, Mock, PropertyMock, mock_open, patch
 
@@ -751,7 +750,132 @@ def test_insert_data_uses_batch_size(mocked_csv, batch_size, mocker) -> None:
         if len(call[1]) == 2 and "INSERT INTO" in call[1][0]:
             actual_insert_stmts_executed += 1
 
-    assert actual_insert_stmts_executed == ceil(3 / batch_size)
+    # full batches, then the remaining rows split into statements whose sizes are powers of two
+    assert actual_insert_stmts_executed == 3 // batch_size + bin(3 % batch_size).count("1")
+
+
+def bulk_insert_calls(spy) -> typing.List[typing.Tuple[str, typing.List]]:
+    return [(call[1][0], call[1][1]) for call in spy.mock_calls if "INSERT INTO" in call[1][0]]
+
+
+def test_insert_data_bulk_streams_iterable_rows(mocker) -> None:
+    mocker.patch("redshift_connector.Cursor.fetchone", return_value=[1])
+    mock_cursor: Cursor = Cursor.__new__(Cursor)
+    spy = mocker.spy(mock_cursor, "execute")
+    mock_cursor._c = Mock()
+    mock_cursor.paramstyle = "qmark"
+
+    mock_cursor.insert_data_bulk(
+        filename=None,
+        rows=((i, "v{}".format(i)) for i in range(15)),
+        table_name="test_table",
+        parameter_indices=None,
+        column_names=["col1", "col2"],
+        batch_size=4,
+    )
+
+    calls = bulk_insert_calls(spy)
+    # three full batches share one statement, the remaining three rows are inserted by statements of 2 and 1 rows
+    assert [statement.count("(%s, %s)") for statement, _ in calls] == [4, 4, 4, 2, 1]
+    assert len({statement for statement, _ in calls[:3]}) == 1
+    assert [value for _, values in calls for value in values] == [
+        value for i in range(15) for value in (i, "v{}".format(i))
+    ]
+    assert mock_cursor.paramstyle == "qmark"
+    stats = mock_cursor.bulk_insert_stats
+    assert stats is not None
+    assert (stats.rows, stats.statements, stats.prepared_statements) == (15, 5, 3)
+
+
+def test_insert_data_bulk_validates_columns_with_one_query(mocker) -> None:
+    mocker.patch("redshift_connector.Cursor.fetchone", return_value=[1])
+    mock_cursor: Cursor = Cursor.__new__(Cursor)
+    spy = mocker.spy(mock_cursor, "execute")
+    mock_cursor._c = Mock()
+    mock_cursor.paramstyle = "qmark"
+
+    mock_cursor.insert_data_bulk(
+        filename=None,
+        rows=[(1, 2, 3)],
+        table_name="test_schema.test_table",
+        parameter_indices=None,
+        column_names=["col1", "col2", "col3"],
+    )
+
+    checks = [call[1] for call in spy.mock_calls if "svv_all_columns" in call[1][0]]
+    assert len(checks) == 1
+    assert checks[0][1] == ["test_table", "col1", "col2", "col3", "test_schema"]
+    assert checks[0][0].endswith("having count(distinct column_name) = 3")
+
+
+def test_insert_data_bulk_max_statement_bytes(mocker) -> None:
+    mocker.patch("redshift_connector.Cursor.fetchone", return_value=[1])
+    mock_cursor: Cursor = Cursor.__new__(Cursor)
+    spy = mocker.spy(mock_cursor, "execute")
+    mock_cursor._c = Mock()
+    mock_cursor.paramstyle = "qmark"
+
+    # each row holds 4 + 96 bytes, so two rows fit within the budget
+    mock_cursor.insert_data_bulk(
+        filename=None,
+        rows=[("x" * 96,)] * 5,
+        table_name="test_table",
+        parameter_indices=[0],
+        column_names=["col1"],
+        batch_size=4,
+        max_statement_bytes=250,
+    )
+
+    assert [statement.count("(%s)") for statement, _ in bulk_insert_calls(spy)] == [2, 2, 1]
+
+
+def test_insert_data_bulk_max_statement_bytes_counts_encoded_str(mocker) -> None:
+    mocker.patch("redshift_connector.Cursor.fetchone", return_value=[1])
+    mock_cursor: Cursor = Cursor.__new__(Cursor)
+    spy = mocker.spy(mock_cursor, "execute")
+    mock_cursor._c = Mock()
+    mock_cursor.paramstyle = "qmark"
+
+    # each row holds 4 + 96 bytes of 48 two-byte characters, so two rows fit within the budget
+    mock_cursor.insert_data_bulk(
+        filename=None,
+        rows=[("\u00e9" * 48,)] * 5,
+        table_name="test_table",
+        parameter_indices=[0],
+        column_names=["col1"],
+        batch_size=4,
+        max_statement_bytes=250,
+    )
+
+    assert [statement.count("(%s)") for statement, _ in bulk_insert_calls(spy)] == [2, 2, 1]
+
+
+@pytest.mark.parametrize("filename,rows", [(None, None), ("mocked_csv", [(1,)])])
+def test_insert_data_bulk_requires_one_source(filename, rows) -> None:
+    mock_cursor: Cursor = Cursor.__new__(Cursor)
+    mock_cursor._c = Mock()
+
+    with pytest.raises(InterfaceError, match="Exactly one of filename and rows"):
+        mock_cursor.insert_data_bulk(
+            filename=filename, rows=rows, table_name="test_table", parameter_indices=None, column_names=["col1"]
+        )
+
+
+def test_insert_data_bulk_row_length_mismatch_raises(mocker) -> None:
+    mocker.patch("redshift_connector.Cursor.fetchone", return_value=[1])
+    mock_cursor: Cursor = Cursor.__new__(Cursor)
+    mock_cursor._c = Mock()
+    mock_cursor.paramstyle = "qmark"
+
+    with pytest.raises(InterfaceError, match="Row holds 1 values, but 2 column names were given"):
+        mock_cursor.insert_data_bulk(
+            filename=None,
+            rows=[(1, 2), (3,)],
+            table_name="test_table",
+            parameter_indices=None,
+            column_names=["col1", "col2"],
+        )
+    assert mock_cursor.paramstyle == "qmark"
 
 
 max_params = 32767
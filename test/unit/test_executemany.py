@@ -0,0 +1,218 @@
+import typing
+
+import pytest  # type: ignore
+
+from redshift_connector import IntegrityError, InterfaceError, NotSupportedError, ProgrammingError
+from test.unit.mocks.mock_backend import (
+    BIND_COMPLETE,
+    CLOSE_COMPLETE,
+    READY_FOR_QUERY,
+    READY_FOR_QUERY_IN_TRANSACTION,
+    command_complete,
+    describe_response,
+    error_response,
+    mock_connection,
+    prepare_response,
+)
+
+INSERT: str = "insert into t values (%s)"
+INSERTED: bytes = BIND_COMPLETE + command_complete(b"INSERT 0 1")
+
+
+def codes_written(backend) -> typing.List[bytes]:
+    return [code for code, _ in backend.messages_written()]
+
+
+def test_executemany_pipelines_parameter_sets() -> None:
+    conn, backend = mock_connection(describe_response() + INSERTED * 5 + READY_FOR_QUERY)
+    cursor = conn.cursor()
+    cursor.executemany(INSERT, [(i,) for i in range(5)])
+
+    assert cursor.rowcount == 5
+    assert backend.remaining() == 0
+    # the statement is prepared without a Sync message, then all parameter sets are sent under a single Sync message
+    assert codes_written(backend) == [b"P", b"H", b"D", b"H"] + [b"B", b"E"] * 5 + [b"S"]
+
+
+def test_executemany_reads_responses_every_pipeline_size_sets() -> None:
+    conn, backend = mock_connection(describe_response() + INSERTED * 5 + READY_FOR_QUERY)
+    cursor = conn.cursor()
+    cursor.executemany(INSERT, [(i,) for i in range(5)], pipeline_size=2)
+
+    assert cursor.rowcount == 5
+    assert backend.remaining() == 0
+    codes: typing.List[bytes] = codes_written(backend)
+    assert codes[codes.index(b"B") :] == [b"B", b"E", b"B", b"E", b"H"] * 2 + [b"B", b"E", b"S"]
+
+
+def test_executemany_prepares_statement_for_changed_parameter_types() -> None:
+    conn, backend = mock_connection(
+        describe_response() + INSERTED + describe_response() + INSERTED * 2 + READY_FOR_QUERY
+    )
+    cursor = conn.cursor()
+    cursor.executemany(INSERT, [(1,), ("a",), ("b",)])
+
+    assert cursor.rowcount == 3
+    assert backend.remaining() == 0
+    # the response to the first parameter set is read before the statement is prepared again, in the same pipeline
+    assert codes_written(backend) == [b"P", b"H", b"D", b"H", b"B", b"E", b"H", b"P", b"H", b"D", b"H"] + [
+        b"B",
+        b"E",
+    ] * 2 + [b"S"]
+
+
+def test_executemany_closes_statements_invalidated_by_ddl_once_pipeline_ended() -> None:
+    created: bytes = BIND_COMPLETE + command_complete(b"CREATE TABLE")
+    conn, backend = mock_connection(
+        describe_response() + created * 3 + READY_FOR_QUERY + CLOSE_COMPLETE + READY_FOR_QUERY
+    )
+    cursor = conn.cursor()
+    cursor.executemany("create table t (c int)", [[]] * 3, pipeline_size=2)
+
+    assert cursor.rowcount == -1
+    assert backend.remaining() == 0
+    assert conn._pipeline is None
+    # the invalidated statement is closed under its own Sync message once the pipeline ended, not part way through
+    codes: typing.List[bytes] = codes_written(backend)
+    assert codes[codes.index(b"B") :] == [b"B", b"E", b"B", b"E", b"H", b"B", b"E", b"S", b"C", b"H", b"S"]
+
+
+def test_executemany_error_reports_parameter_set_index() -> None:
+    conn, backend = mock_connection(
+        describe_response()
+        + INSERTED * 3
+        + BIND_COMPLETE
+        + error_response("23505", "duplicate key")
+        + READY_FOR_QUERY
+        + BIND_COMPLETE
+        + command_complete(b"INSERT 0 1")
+        + READY_FOR_QUERY
+    )
+    cursor = conn.cursor()
+
+    with pytest.raises(IntegrityError, match="duplicate key") as exc_info:
+        cursor.executemany(INSERT, [(i,) for i in range(5)])
+    assert exc_info.value.args[0]["parameter_set_index"] == 3
+
+    # the connection is ready for the next statement
+    cursor.execute(INSERT, (5,))
+    assert cursor.rowcount == 1
+    assert backend.remaining() == 0
+
+
+def test_executemany_error_within_pipeline_size_sets() -> None:
+    conn, backend = mock_connection(
+        describe_response() + INSERTED * 2 + BIND_COMPLETE + error_response() + READY_FOR_QUERY
+    )
+    cursor = conn.cursor()
+
+    with pytest.raises(ProgrammingError, match="syntax error") as exc_info:
+        cursor.executemany(INSERT, [(i,) for i in range(10)], pipeline_size=3)
+    assert exc_info.value.args[0]["parameter_set_index"] == 2
+    assert backend.remaining() == 0
+    # no parameter set is sent once one failed
+    assert codes_written(backend).count(b"B") == 3
+    assert codes_written(backend).count(b"S") == 1
+
+
+def test_executemany_error_of_first_parameter_set() -> None:
+    conn, _ = mock_connection(describe_response() + BIND_COMPLETE + error_response() + READY_FOR_QUERY)
+
+    with pytest.raises(ProgrammingError) as exc_info:
+        conn.cursor().executemany(INSERT, [(1,), (2,)])
+    assert exc_info.value.args[0]["parameter_set_index"] == 0
+
+
+def test_executemany_prepare_error_reports_parameter_set_index() -> None:
+    conn, backend = mock_connection(describe_response() + INSERTED + error_response() + READY_FOR_QUERY)
+
+    with pytest.raises(ProgrammingError) as exc_info:
+        conn.cursor().executemany(INSERT, [(1,), ("a",)])
+    assert exc_info.value.args[0]["parameter_set_index"] == 1
+    assert backend.remaining() == 0
+    assert codes_written(backend)[-1] == b"S"
+
+
+def test_executemany_client_error_rolls_back_parameter_sets_sent() -> None:
+    conn, backend = mock_connection(
+        describe_response()
+        + INSERTED * 2
+        + error_response("34000", 'portal "redshift_connector_abort" does not exist')
+        + READY_FOR_QUERY
+    )
+
+    with pytest.raises(NotSupportedError, match="not mapped"):
+        conn.cursor().executemany(INSERT, [(1,), (2,), (object(),)])
+    assert backend.remaining() == 0
+    # the implicit transaction is failed by an Execute message ahead of the Sync message, rather than committed
+    messages: typing.List[typing.Tuple[bytes, bytes]] = backend.messages_written()
+    assert [code for code, _ in messages[-2:]] == [b"E", b"S"]
+    assert messages[-2][1].startswith(b"redshift_connector_abort\x00")
+
+
+def test_executemany_client_error_in_transaction_keeps_transaction() -> None:
+    conn, backend = mock_connection(
+        prepare_response()
+        + BIND_COMPLETE
+        + command_complete(b"BEGIN")
+        + READY_FOR_QUERY_IN_TRANSACTION
+        + describe_response()
+        + INSERTED
+        + READY_FOR_QUERY_IN_TRANSACTION
+    )
+    conn.autocommit = False
+
+    with pytest.raises(NotSupportedError, match="not mapped"):
+        conn.cursor().executemany(INSERT, [(1,), (object(),)])
+    assert backend.remaining() == 0
+    # the transaction begun by the cursor is left for the caller to commit or roll back
+    assert codes_written(backend)[-3:] == [b"B", b"E", b"S"]
+
+
+def test_executemany_invalid_pipeline_size_raises() -> None:
+    conn, _ = mock_connection()
+
+    with pytest.raises(InterfaceError, match="pipeline_size"):
+        conn.cursor().executemany(INSERT, [(1,)], pipeline_size=0)
+
+
+def test_executemany_rewrite_inserts() -> None:
+    conn, backend = mock_connection(
+        describe_response()
+        + BIND_COMPLETE
+        + command_complete(b"INSERT 0 1024")
+        + describe_response()
+        + BIND_COMPLETE
+        + command_complete(b"INSERT 0 16")
+        + describe_response()
+        + INSERTED
+        + READY_FOR_QUERY
+    )
+    cursor = conn.cursor()
+    cursor.executemany(INSERT, [(i,) for i in range(1041)], rewrite_inserts=True)
+
+    assert cursor.rowcount == 1041
+    assert backend.remaining() == 0
+    binds: typing.List[bytes] = [data for code, data in backend.messages_written() if code == b"B"]
+    assert len(binds) == 3
+    parsed: typing.List[bytes] = [data for code, data in backend.messages_written() if code == b"P"]
+    assert parsed[0].count(b"%s") == 0
+    assert parsed[0].count(b"$") == 1024
+    assert parsed[1].count(b"$") == 16
+    # the statements of all sizes run in a single transaction
+    assert codes_written(backend).count(b"S") == 1
+
+
+def test_executemany_rewrite_inserts_error_reports_first_row_of_statement() -> None:
+    conn, _ = mock_connection(
+        describe_response()
+        + BIND_COMPLETE
+        + command_complete(b"INSERT 0 16")
+        + BIND_COMPLETE
+        + error_response()
+        + READY_FOR_QUERY
+    )
+
+    with pytest.raises(ProgrammingError) as exc_info:
+        conn.cursor().executemany(INSERT, [(i,) for i in range(40)], rewrite_inserts=True)
+    assert exc_info.value.args[0]["parameter_set_index"] == 16
@@ -0,0 +1,161 @@
+import typing
+from datetime import date, datetime
+from decimal import Decimal
+from struct import pack
+
+import pytest  # type: ignore
+
+from redshift_connector import ProgrammingError, ResultBufferMode
+from redshift_connector.utils.oids import RedshiftOID
+from test.unit.mocks.mock_backend import (
+    BIND_COMPLETE,
+    INT4,
+    PORTAL_SUSPENDED,
+    READY_FOR_QUERY,
+    command_complete,
+    data_row,
+    int4_row,
+    mock_connection,
+    prepare_response,
+)
+from test.utils import pyarrow_only
+
+COLUMNS: typing.Tuple[typing.Tuple[str, int], ...] = (
+    ("c_int2", RedshiftOID.SMALLINT),
+    ("c_int8", RedshiftOID.BIGINT),
+    ("c_float8", RedshiftOID.FLOAT),
+    ("c_bool", RedshiftOID.BOOLEAN),
+    ("c_date", RedshiftOID.DATE),
+    ("c_timestamp", RedshiftOID.TIMESTAMP),
+    ("c_varchar", RedshiftOID.VARCHAR),
+    ("c_numeric", RedshiftOID.NUMERIC),
+)
+TYPE_MODIFIERS: typing.List[int] = [-1] * 7 + [(18 << 16) + 2 + 4]
+ROWS: typing.Tuple[bytes, ...] = (
+    data_row(
+        pack("!h", 1),
+        pack("!q", 2),
+        pack("!d", 0.5),
+        b"\x01",
+        pack("!i", 7374),
+        pack("!q", 86400000000),
+        b"redshift",
+        pack("!q", 12345),
+    ),
+    data_row(*([None] * len(COLUMNS))),
+)
+
+
+def select_response(*rows: bytes) -> bytes:
+    return (
+        prepare_response(*COLUMNS, type_modifiers=TYPE_MODIFIERS)
+        + BIND_COMPLETE
+        + b"".join(rows)
+        + command_complete("SELECT {}".format(len(rows)).encode())
+        + READY_FOR_QUERY
+    )
+
+
+@pyarrow_only
+@pytest.mark.parametrize("buffer_mode", ResultBufferMode.list())
+def test_fetch_arrow_table(buffer_mode) -> None:
+    import pyarrow  # type: ignore
+
+    conn, _ = mock_connection(select_response(*ROWS))
+    cursor = conn.cursor()
+    cursor.buffer_mode = buffer_mode
+    cursor.execute("select * from t")
+    table: pyarrow.Table = cursor.fetch_arrow_table()
+
+    assert table.schema.names == [name for name, _ in COLUMNS]
+    assert table.schema.types == [
+        pyarrow.int16(),
+        pyarrow.int64(),
+        pyarrow.float64(),
+        pyarrow.bool_(),
+        pyarrow.date32(),
+        pyarrow.timestamp("us"),
+        pyarrow.string(),
+        pyarrow.decimal128(18, 2),
+    ]
+    assert table.to_pylist() == [
+        {
+            "c_int2": 1,
+            "c_int8": 2,
+            "c_float8": 0.5,
+            "c_bool": True,
+            "c_date": date(2020, 3, 10),
+            "c_timestamp": datetime(2000, 1, 2),
+            "c_varchar": "redshift",
+            "c_numeric": Decimal("123.45"),
+        },
+        {name: None for name, _ in COLUMNS},
+    ]
+    assert cursor.fetchone() is None
+
+
+@pyarrow_only
+def test_fetch_arrow_table_num_rows() -> None:
+    conn, _ = mock_connection(
+        prepare_response(("c1", INT4))
+        + BIND_COMPLETE
+        + int4_row(1)
+        + int4_row(2)
+        + int4_row(3)
+        + command_complete(b"SELECT 3")
+        + READY_FOR_QUERY
+    )
+    cursor = conn.cursor()
+    cursor.buffer_mode = ResultBufferMode.COLUMNAR.value
+    cursor.execute("select c1 from t")
+
+    assert cursor.fetch_arrow_table(2).column("c1").to_pylist() == [1, 2]
+    assert cursor.fetchall() == ([3],)
+
+
+@pyarrow_only
+def test_fetch_arrow_table_empty_result() -> None:
+    import pyarrow  # type: ignore
+
+    conn, _ = mock_connection(select_response())
+    cursor = conn.cursor()
+    cursor.execute("select * from t")
+    table: pyarrow.Table = cursor.fetch_arrow_table()
+
+    assert table.num_rows == 0
+    assert table.schema.names == [name for name, _ in COLUMNS]
+    assert table.schema.field("c_int8").type == pyarrow.int64()
+
+
+@pyarrow_only
+def test_fetch_arrow_batches_one_batch_per_portal_chunk() -> None:
+    conn, backend = mock_connection(
+        prepare_response(("c1", INT4))
+        + BIND_COMPLETE
+        + int4_row(1)
+        + int4_row(2)
+        + PORTAL_SUSPENDED
+        + int4_row(3)
+        + int4_row(None)
+        + PORTAL_SUSPENDED
+        + command_complete(b"SELECT 4")
+        + READY_FOR_QUERY
+    )
+    cursor = conn.cursor()
+    cursor.buffer_mode = ResultBufferMode.COLUMNAR.value
+    cursor.execute("select c1 from t", stream_rows=True, fetch_size=2)
+    batches = cursor.fetch_arrow_batches()
+
+    assert next(batches).column(0).to_pylist() == [1, 2]
+    # the next chunk is requested only once the previous batch was consumed
+    assert len([code for code, _ in backend.messages_written() if code == b"E"]) == 1
+    assert next(batches).column(0).to_pylist() == [3, None]
+    assert next(batches, None) is None
+    assert cursor.rowcount == 4
+
+
+@pyarrow_only
+def test_fetch_arrow_table_without_result_set_raises() -> None:
+    conn, _ = mock_connection()
+    with pytest.raises(ProgrammingError, match="A query hasn't been issued."):
+        conn.cursor().fetch_arrow_table()
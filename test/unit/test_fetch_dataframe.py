@@ -0,0 +1,138 @@
+import typing
+from datetime import datetime
+from decimal import Decimal
+from struct import pack
+
+import pytest  # type: ignore
+
+from redshift_connector import ResultBufferMode
+from redshift_connector.utils.oids import RedshiftOID
+from test.unit.mocks.mock_backend import (
+    BIND_COMPLETE,
+    INT4,
+    PORTAL_SUSPENDED,
+    READY_FOR_QUERY,
+    command_complete,
+    data_row,
+    int4_row,
+    mock_connection,
+    prepare_response,
+)
+from test.utils import pandas_only
+
+COLUMNS: typing.Tuple[typing.Tuple[str, int], ...] = (
+    ("C_INT4", RedshiftOID.INTEGER),
+    ("c_float8", RedshiftOID.FLOAT),
+    ("c_bool", RedshiftOID.BOOLEAN),
+    ("c_date", RedshiftOID.DATE),
+    ("c_timestamp", RedshiftOID.TIMESTAMP),
+    ("c_varchar", RedshiftOID.VARCHAR),
+    ("c_numeric", RedshiftOID.NUMERIC),
+)
+TYPE_MODIFIERS: typing.List[int] = [-1] * 6 + [(18 << 16) + 2 + 4]
+ROW: typing.Tuple[bytes, ...] = (
+    pack("!i", 1),
+    pack("!d", 0.5),
+    b"\x01",
+    pack("!i", 7374),
+    pack("!q", 86400000000),
+    b"redshift",
+    pack("!q", 12345),
+)
+
+
+def select_response(*rows: bytes) -> bytes:
+    return (
+        prepare_response(*COLUMNS, type_modifiers=TYPE_MODIFIERS)
+        + BIND_COMPLETE
+        + b"".join(rows)
+        + command_complete("SELECT {}".format(len(rows)).encode())
+        + READY_FOR_QUERY
+    )
+
+
+def execute(buffer_mode: str, *rows: bytes):
+    conn, _ = mock_connection(select_response(*rows))
+    cursor = conn.cursor()
+    cursor.buffer_mode = buffer_mode
+    cursor.execute("select * from t")
+    return cursor
+
+
+@pandas_only
+@pytest.mark.parametrize("buffer_mode", ResultBufferMode.list())
+def test_fetch_dataframe_typed_columns(buffer_mode) -> None:
+    df = execute(buffer_mode, data_row(*ROW), data_row(*ROW)).fetch_dataframe()
+
+    assert list(df.columns) == ["c_int4", "c_float8", "c_bool", "c_date", "c_timestamp", "c_varchar", "c_numeric"]
+    assert [str(dtype) for dtype in df.dtypes[:5]] == ["int64", "float64", "bool", "datetime64[us]", "datetime64[us]"]
+    assert df.iloc[0].tolist()[:3] == [1, 0.5, True]
+    assert df["c_date"][0] == datetime(2020, 3, 10)
+    assert df["c_timestamp"][0] == datetime(2000, 1, 2)
+    assert df["c_varchar"].tolist() == ["redshift", "redshift"]
+    assert df["c_numeric"].tolist() == [Decimal("123.45"), Decimal("123.45")]
+
+
+@pandas_only
+@pytest.mark.parametrize("buffer_mode", ResultBufferMode.list())
+def test_fetch_dataframe_typed_columns_with_nulls(buffer_mode) -> None:
+    import pandas  # type: ignore
+
+    df = execute(buffer_mode, data_row(*ROW), data_row(*([None] * len(ROW)))).fetch_dataframe()
+
+    assert [str(dtype) for dtype in df.dtypes[:5]] == [
+        "Int64",
+        "float64",
+        "boolean",
+        "datetime64[us]",
+        "datetime64[us]",
+    ]
+    assert df["c_int4"][0] == 1
+    assert df["c_int4"][1] is pandas.NA
+    assert pandas.isna(df["c_float8"][1])
+    assert df["c_bool"][1] is pandas.NA
+    assert pandas.isna(df["c_date"][1])
+    assert pandas.isna(df["c_timestamp"][1])
+    assert pandas.isna(df["c_varchar"][1])
+
+
+@pandas_only
+@pytest.mark.parametrize("buffer_mode", ResultBufferMode.list())
+def test_fetch_dataframe_num_rows(buffer_mode) -> None:
+    cursor = execute(buffer_mode, data_row(*ROW), data_row(*ROW), data_row(*ROW))
+
+    assert len(cursor.fetch_dataframe(2)) == 2
+    assert len(cursor.fetch_dataframe()) == 1
+
+
+@pandas_only
+@pytest.mark.parametrize("buffer_mode", ResultBufferMode.list())
+def test_fetch_dataframe_empty_result(buffer_mode) -> None:
+    df = execute(buffer_mode).fetch_dataframe()
+
+    assert len(df) == 0
+    assert len(df.columns) == len(COLUMNS)
+    assert str(df.dtypes["c_int4"]) == "int64"
+
+
+@pandas_only
+@pytest.mark.parametrize("buffer_mode", ResultBufferMode.list())
+def test_fetch_dataframe_stream_rows(buffer_mode) -> None:
+    conn, _ = mock_connection(
+        prepare_response(("c1", INT4))
+        + BIND_COMPLETE
+        + int4_row(1)
+        + int4_row(2)
+        + PORTAL_SUSPENDED
+        + int4_row(None)
+        + command_complete(b"SELECT 3")
+        + READY_FOR_QUERY
+    )
+    cursor = conn.cursor()
+    cursor.buffer_mode = buffer_mode
+    cursor.execute("select c1 from t", stream_rows=True, fetch_size=2)
+    df = cursor.fetch_dataframe()
+
+    assert str(df.dtypes["c1"]) == "Int64"
+    assert df["c1"].tolist()[:2] == [1, 2]
+    assert cursor.rowcount == 3
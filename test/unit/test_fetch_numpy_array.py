@@ -0,0 +1,153 @@
+import typing
+from struct import pack
+
+import pytest  # type: ignore
+
+from redshift_connector import (
+    InterfaceError,
+    NumpyArrayLayout,
+    ProgrammingError,
+    ResultBufferMode,
+)
+from redshift_connector.utils.oids import RedshiftOID
+from test.unit.mocks.mock_backend import (
+    BIND_COMPLETE,
+    INT4,
+    READY_FOR_QUERY,
+    command_complete,
+    data_row,
+    mock_connection,
+    prepare_response,
+)
+from test.utils import numpy_only
+
+COLUMNS: typing.Tuple[typing.Tuple[str, int], ...] = (
+    ("c_int2", RedshiftOID.SMALLINT),
+    ("c_int8", RedshiftOID.BIGINT),
+    ("c_float8", RedshiftOID.FLOAT),
+    ("c_bool", RedshiftOID.BOOLEAN),
+    ("c_timestamp", RedshiftOID.TIMESTAMP),
+    ("c_varchar", RedshiftOID.VARCHAR),
+)
+ROW: typing.Tuple[bytes, ...] = (
+    pack("!h", 1),
+    pack("!q", 2),
+    pack("!d", 0.5),
+    b"\x01",
+    pack("!q", 86400000000),
+    b"redshift",
+)
+
+
+def execute(buffer_mode: str, *rows: bytes):
+    conn, _ = mock_connection(
+        prepare_response(*COLUMNS)
+        + BIND_COMPLETE
+        + b"".join(rows)
+        + command_complete("SELECT {}".format(len(rows)).encode())
+        + READY_FOR_QUERY
+    )
+    cursor = conn.cursor()
+    cursor.buffer_mode = buffer_mode
+    cursor.execute("select * from t")
+    return cursor
+
+
+@numpy_only
+@pytest.mark.parametrize("buffer_mode", ResultBufferMode.list())
+def test_fetch_numpy_array_columns(buffer_mode) -> None:
+    import numpy  # type: ignore
+
+    arrays = execute(buffer_mode, data_row(*ROW), data_row(*ROW)).fetch_numpy_array(
+        layout=NumpyArrayLayout.COLUMNS.value
+    )
+
+    assert list(arrays) == [name for name, _ in COLUMNS]
+    assert [str(array.dtype) for array in arrays.values()] == [
+        "int64",
+        "int64",
+        "float64",
+        "bool",
+        "datetime64[us]",
+        "object",
+    ]
+    assert arrays["c_int2"].tolist() == [1, 1]
+    assert arrays["c_float8"].tolist() == [0.5, 0.5]
+    assert arrays["c_timestamp"][0] == numpy.datetime64("2000-01-02")
+    assert arrays["c_varchar"].tolist() == ["redshift", "redshift"]
+
+
+@numpy_only
+@pytest.mark.parametrize("buffer_mode", ResultBufferMode.list())
+def test_fetch_numpy_array_columns_with_nulls(buffer_mode) -> None:
+    import numpy  # type: ignore
+
+    arrays = execute(buffer_mode, data_row(*ROW), data_row(*([None] * len(ROW)))).fetch_numpy_array(
+        layout=NumpyArrayLayout.COLUMNS.value
+    )
+
+    assert isinstance(arrays["c_int8"], numpy.ma.MaskedArray)
+    assert arrays["c_int8"].tolist() == [2, None]
+    assert isinstance(arrays["c_bool"], numpy.ma.MaskedArray)
+    assert arrays["c_bool"].mask.tolist() == [False, True]
+    assert numpy.isnan(arrays["c_float8"][1])
+    assert numpy.isnat(arrays["c_timestamp"][1])
+    assert arrays["c_varchar"].tolist() == ["redshift", None]
+
+
+@numpy_only
+@pytest.mark.parametrize("buffer_mode", ResultBufferMode.list())
+def test_fetch_numpy_array_structured(buffer_mode) -> None:
+    import numpy  # type: ignore
+
+    cursor = execute(buffer_mode, data_row(*ROW), data_row(*ROW), data_row(*ROW))
+    result = cursor.fetch_numpy_array(2, layout=NumpyArrayLayout.STRUCTURED.value)
+
+    assert not isinstance(result, numpy.ma.MaskedArray)
+    assert result.dtype.names == tuple(name for name, _ in COLUMNS)
+    assert result.dtype["c_float8"] == numpy.float64
+    assert result.shape == (2,)
+    assert result[0]["c_int8"] == 2
+    assert len(cursor.fetch_numpy_array(layout=NumpyArrayLayout.STRUCTURED.value)) == 1
+
+
+@numpy_only
+def test_fetch_numpy_array_structured_with_nulls() -> None:
+    import numpy  # type: ignore
+
+    result = execute(ResultBufferMode.COLUMNAR.value, data_row(*ROW), data_row(*([None] * len(ROW)))).fetch_numpy_array(
+        layout=NumpyArrayLayout.STRUCTURED.value
+    )
+
+    assert isinstance(result, numpy.ma.MaskedArray)
+    assert result.mask["c_int2"].tolist() == [False, True]
+    assert result.mask["c_float8"].tolist() == [False, False]
+    assert result.data["c_int2"][0] == 1
+
+
+@numpy_only
+def test_fetch_numpy_array_structured_empty_result() -> None:
+    result = execute(ResultBufferMode.ROWS.value).fetch_numpy_array(layout=NumpyArrayLayout.STRUCTURED.value)
+
+    assert result.shape == (0,)
+    assert str(result.dtype["c_int8"]) == "int64"
+
+
+@numpy_only
+def test_fetch_numpy_array_duplicate_labels_raises() -> None:
+    conn, _ = mock_connection(
+        prepare_response(("c1", INT4), ("c1", INT4)) + BIND_COMPLETE + command_complete(b"SELECT 0") + READY_FOR_QUERY
+    )
+    cursor = conn.cursor()
+    cursor.execute("select c1, c1 from t")
+
+    with pytest.raises(ProgrammingError, match="must be unique"):
+        cursor.fetch_numpy_array(layout=NumpyArrayLayout.COLUMNS.value)
+
+
+@numpy_only
+def test_fetch_numpy_array_invalid_layout_raises() -> None:
+    cursor = execute(ResultBufferMode.ROWS.value, data_row(*ROW))
+
+    with pytest.raises(InterfaceError, match="Invalid layout"):
+        cursor.fetch_numpy_array(layout="matrix")
@@ -1,2 +1,32 @@
+import subprocess
+import sys
+
+import pytest  # type: ignore
+
+
 def test_import_redshift_connector() -> None:
     import redshift_connector
+
+
+def test_import_redshift_connector_defers_optional_modules() -> None:
+    modules: str = subprocess.run(
+        [sys.executable, "-c", "import sys, redshift_connector; print(' '.join(sys.modules))"],
+        stdout=subprocess.PIPE,
+        universal_newlines=True,
+        check=True,
+    ).stdout.split()
+
+    for module in ("boto3", "botocore", "scramp", "packaging", "redshift_connector.plugin.browser_idc_auth_plugin"):
+        assert module not in modules
+
+
+def test_plugins_imported_on_access() -> None:
+    from redshift_connector import plugin
+    from redshift_connector.idp_auth_helper import dynamic_plugin_import
+    from redshift_connector.plugin.okta_credentials_provider import OktaCredentialsProvider
+
+    assert plugin.OktaCredentialsProvider is OktaCredentialsProvider
+    assert dynamic_plugin_import("redshift_connector.plugin.OktaCredentialsProvider") is OktaCredentialsProvider
+    assert "IdpTokenAuthPlugin" in dir(plugin)
+    with pytest.raises(AttributeError):
+        plugin.UnknownCredentialsProvider
@@ -0,0 +1,141 @@
+import typing
+from struct import pack
+
+import pytest  # type: ignore
+
+from redshift_connector import ResultBufferMode
+from redshift_connector.utils import LazyRow
+from redshift_connector.utils.oids import RedshiftOID
+from test.unit.mocks.mock_backend import (
+    BIND_COMPLETE,
+    INT4,
+    PORTAL_SUSPENDED,
+    READY_FOR_QUERY,
+    command_complete,
+    data_row,
+    int4_row,
+    mock_connection,
+    prepare_response,
+)
+from test.utils import pandas_only
+
+COLUMNS: typing.Tuple[typing.Tuple[str, int], ...] = (
+    ("c_int4", INT4),
+    ("c_varchar", RedshiftOID.VARCHAR),
+    ("c_int8", RedshiftOID.BIGINT),
+)
+
+
+def row(i: int) -> bytes:
+    return data_row(pack("!i", i), "row{}".format(i).encode(), pack("!q", -i))
+
+
+def execute(*rows: bytes):
+    conn, backend = mock_connection(
+        prepare_response(*COLUMNS)
+        + BIND_COMPLETE
+        + b"".join(rows)
+        + command_complete("SELECT {}".format(len(rows)).encode())
+        + READY_FOR_QUERY
+    )
+    cursor = conn.cursor()
+    cursor.buffer_mode = ResultBufferMode.LAZY.value
+    cursor.execute("select * from t")
+    return cursor
+
+
+def test_lazy_row_decodes_accessed_columns_only() -> None:
+    cursor = execute(row(1))
+    calls: typing.List[int] = []
+    decoders = cursor._cached_rows._decoders
+    cursor._cached_rows._decoders = [
+        lambda data, offset, length, cidx=cidx, func=func: calls.append(cidx) or func(data, offset, length)
+        for cidx, func in enumerate(decoders)
+    ]
+
+    fetched = cursor.fetchone()
+    assert isinstance(fetched, LazyRow)
+    assert fetched[2] == -1
+    assert fetched[-1] == -1
+    assert calls == [2]
+
+
+def test_lazy_rows_equal_decoded_rows() -> None:
+    cursor = execute(row(1), row(2), data_row(None, None, pack("!q", 3)))
+
+    assert cursor.fetchall() == ([1, "row1", -1], [2, "row2", -2], [None, None, 3])
+
+
+def test_lazy_row_sequence_operations() -> None:
+    fetched = execute(data_row(pack("!i", 7), None, pack("!q", 8))).fetchone()
+
+    assert len(fetched) == 3
+    assert fetched[1] is None
+    assert fetched[0:3:2] == [7, 8]
+    assert list(fetched) == [7, None, 8]
+    assert tuple(fetched) == (7, None, 8)
+    assert repr(fetched) == "[7, None, 8]"
+    assert 8 in fetched
+    with pytest.raises(IndexError):
+        fetched[3]
+    with pytest.raises(TypeError):
+        hash(fetched)
+
+
+def test_lazy_rows_fetchmany_and_iteration() -> None:
+    cursor = execute(*(row(i) for i in range(10)))
+
+    assert [r[0] for r in cursor.fetchmany(4)] == [0, 1, 2, 3]
+    assert [r[1] for r in cursor] == ["row{}".format(i) for i in range(4, 10)]
+
+
+def test_lazy_rows_outlive_next_execute() -> None:
+    conn, backend = mock_connection(
+        prepare_response(*COLUMNS)
+        + BIND_COMPLETE
+        + row(4)
+        + command_complete(b"SELECT 1")
+        + READY_FOR_QUERY
+        + prepare_response(("c1", RedshiftOID.BIGINT))
+        + BIND_COMPLETE
+        + data_row(pack("!q", 4294967300))
+        + command_complete(b"SELECT 1")
+        + READY_FOR_QUERY
+    )
+    cursor = conn.cursor()
+    cursor.buffer_mode = ResultBufferMode.LAZY.value
+    first = cursor.execute("select * from t").fetchone()
+    second = cursor.execute("select c1 from t").fetchone()
+
+    # rows are decoded with the decoders of their own statement
+    assert first[2] == -4
+    assert list(first) == [4, "row4", -4]
+    assert list(second) == [4294967300]
+
+
+def test_lazy_rows_stream_rows() -> None:
+    conn, backend = mock_connection(
+        prepare_response(("c1", INT4))
+        + BIND_COMPLETE
+        + int4_row(1)
+        + int4_row(2)
+        + PORTAL_SUSPENDED
+        + int4_row(3)
+        + command_complete(b"SELECT 3")
+        + READY_FOR_QUERY
+    )
+    cursor = conn.cursor()
+    cursor.buffer_mode = ResultBufferMode.LAZY.value
+    cursor.execute("select c1 from t", stream_rows=True, fetch_size=2)
+
+    assert [r[0] for r in cursor] == [1, 2, 3]
+    assert backend.remaining() == 0
+
+
+@pandas_only
+def test_lazy_rows_fetch_dataframe() -> None:
+    df = execute(row(1), data_row(None, None, None)).fetch_dataframe()
+
+    assert list(df.columns) == ["c_int4", "c_varchar", "c_int8"]
+    assert df["c_varchar"].tolist()[0] == "row1"
+    assert df["c_int8"].isna().tolist() == [False, True]
@@ -0,0 +1,192 @@
+import gc
+import typing
+import weakref
+from datetime import date
+from datetime import datetime as Datetime
+from datetime import time
+from datetime import timezone as Timezone
+from decimal import Decimal
+
+import pytest  # type: ignore
+
+from redshift_connector import ArrayContentNotHomogenousError, NotSupportedError, core
+from redshift_connector.config import ClientProtocolVersion
+from redshift_connector.utils import h_pack, i_pack, ii_pack, iii_pack, q_pack
+from redshift_connector.utils.oids import RedshiftOID
+from test.unit.mocks.mock_backend import mock_connection
+from test.utils import numpy_only
+
+
+def oids(params) -> typing.List[int]:
+    return [param[0] for param in params]
+
+
+def test_make_params_reuses_plan_of_same_types() -> None:
+    conn, _ = mock_connection()
+
+    first = conn.make_params(("a", Decimal("1.5"), 1.5, None))
+    assert conn.make_params(("b", Decimal("2"), 2.5, None)) is first
+    assert len(conn._param_plans) == 1
+
+
+def test_make_params_inspects_values_of_value_dependent_types() -> None:
+    conn, _ = mock_connection()
+
+    assert oids(conn.make_params((1, Datetime(2024, 1, 1)))) == [RedshiftOID.SMALLINT, RedshiftOID.TIMESTAMP]
+    assert oids(conn.make_params((1 << 40, Datetime(2024, 1, 1, tzinfo=Timezone.utc)))) == [
+        RedshiftOID.BIGINT,
+        RedshiftOID.TIMESTAMPTZ,
+    ]
+    assert oids(conn.make_params((1 << 70, Datetime(2024, 1, 1)))) == [RedshiftOID.NUMERIC, RedshiftOID.TIMESTAMP]
+    assert len(conn._param_plans) == 1
+
+
+def test_make_params_plans_subclasses() -> None:
+    class Name(str):
+        pass
+
+    class Count(int):
+        pass
+
+    conn, _ = mock_connection()
+
+    assert oids(conn.make_params((Name("a"), Count(1)))) == [RedshiftOID.UNKNOWN, RedshiftOID.SMALLINT]
+    assert oids(conn.make_params((Name("b"), Count(1 << 20)))) == [RedshiftOID.UNKNOWN, RedshiftOID.INTEGER]
+
+
+def test_make_params_plans_discarded_when_py_types_replaced() -> None:
+    conn, _ = mock_connection()
+    conn.make_params((1.5,))
+
+    conn.py_types = dict(conn.py_types)
+    conn.py_types[float] = (RedshiftOID.REAL, 1, conn.py_types[float][2])
+
+    assert oids(conn.make_params((1.5,))) == [RedshiftOID.REAL]
+
+
+def test_make_params_plans_discarded_when_py_types_modified() -> None:
+    conn, _ = mock_connection()
+    assert oids(conn.make_params((1.5,))) == [RedshiftOID.FLOAT]
+
+    conn.py_types[float] = (RedshiftOID.REAL, 1, conn.py_types[float][2])
+    assert oids(conn.make_params((1.5,))) == [RedshiftOID.REAL]
+
+    del conn.py_types[float]
+    with pytest.raises(NotSupportedError, match="not mapped to pg type"):
+        conn.make_params((1.5,))
+
+
+def test_make_params_plans_discarded_when_inspect_funcs_modified() -> None:
+    conn, _ = mock_connection()
+    assert oids(conn.make_params((1,))) == [RedshiftOID.SMALLINT]
+
+    conn.inspect_funcs[int] = lambda value: conn.py_types[RedshiftOID.BIGINT]
+    assert oids(conn.make_params((1,))) == [RedshiftOID.BIGINT]
+
+
+def test_make_params_unsupported_type_raises() -> None:
+    conn, _ = mock_connection()
+
+    with pytest.raises(NotSupportedError, match="not mapped to pg type"):
+        conn.make_params((object(),))
+    assert len(conn._param_plans) == 0
+
+
+def test_make_params_binary_parameters() -> None:
+    conn, _ = mock_connection(binary_parameters=True)
+
+    params = conn.make_params((Decimal("1.5"), date(2000, 1, 2), time(0, 0, 1), "a"))
+    # Decimal parameters stay text
+    assert [param[1] for param in params] == [0, 1, 1, 0]
+    assert params[1][2](date(2000, 1, 2)) == b"\x00\x00\x00\x01"
+
+
+@pytest.mark.parametrize(
+    "protocol, binary_parameters",
+    [(ClientProtocolVersion.BINARY, False), (ClientProtocolVersion.EXTENDED_RESULT_METADATA, True)],
+)
+def test_make_params_text_parameters(protocol, binary_parameters) -> None:
+    conn, _ = mock_connection(protocol=protocol, binary_parameters=binary_parameters)
+
+    params = conn.make_params((Decimal("1.5"), date(2000, 1, 2), time(0, 0, 1)))
+    assert [param[1] for param in params] == [0, 0, 0]
+
+
+def test_make_params_array_encoded_once(mocker) -> None:
+    conn, _ = mock_connection()
+    value: typing.List = [[1, None], [3, 1 << 20]]
+    encoded: bytes = (
+        iii_pack(2, 1, RedshiftOID.INTEGER)
+        + ii_pack(2, 1) * 2
+        + ii_pack(4, 1)
+        + i_pack(-1)
+        + ii_pack(4, 3)
+        + ii_pack(4, 1 << 20)
+    )
+    spy = mocker.spy(core, "array_scan")
+
+    ((oid, fc, send_func),) = conn.make_params((value,))
+    assert (oid, fc) == (1007, 1)
+    assert send_func(value) == encoded
+    assert spy.call_count == 1
+    # the array is encoded again once the encoding of the inspected array was sent
+    assert send_func(value) == encoded
+    assert spy.call_count == 2
+    # another array of the same type is encoded when sent
+    assert send_func([[5, 6], [7, 8]]) == iii_pack(2, 0, RedshiftOID.INTEGER) + ii_pack(2, 1) * 2 + b"".join(
+        ii_pack(4, i) for i in range(5, 9)
+    )
+
+
+def test_make_params_array_send_func_does_not_retain_array() -> None:
+    class Values(list):
+        pass
+
+    conn, _ = mock_connection()
+    value: Values = Values([1, 2, 3])
+    ref: weakref.ref = weakref.ref(value)
+
+    ((_, _, send_func),) = conn.make_params((value,))
+    send_func(value)
+    del value
+    gc.collect()
+
+    # the send function is held by the prepared statement cache, the array is released once it was sent
+    assert ref() is None
+    assert send_func([4, 5, 6]) == iii_pack(1, 0, RedshiftOID.SMALLINT) + ii_pack(3, 1) + b"".join(
+        i_pack(2) + h_pack(i) for i in range(4, 7)
+    )
+
+
+def test_make_params_array_not_homogenous_raises() -> None:
+    conn, _ = mock_connection()
+
+    with pytest.raises(ArrayContentNotHomogenousError):
+        conn.make_params(([1.5, 1],))
+
+
+def test_make_params_text_format_array() -> None:
+    conn, _ = mock_connection()
+    conn.py_types = {**conn.py_types, float: (RedshiftOID.FLOAT, 0, lambda v: b"a b" if v < 0 else str(v).encode())}
+    value: typing.List = [[1.5, None], [-1.0, 2.0]]
+
+    ((oid, fc, send_func),) = conn.make_params((value,))
+    assert (oid, fc) == (1022, 0)
+    assert send_func(value) == b'{{1.5,NULL},{"a b",2.0}}'
+
+
+@numpy_only
+def test_make_params_numpy_array() -> None:
+    import numpy as np
+
+    conn, _ = mock_connection()
+    value = np.arange(6, dtype=np.int64).reshape(2, 3)
+
+    ((oid, fc, send_func),) = conn.make_params((value,))
+    assert (oid, fc) == (1016, 1)
+    assert send_func(value) == iii_pack(2, 0, RedshiftOID.BIGINT) + ii_pack(2, 1) + ii_pack(3, 1) + b"".join(
+        i_pack(8) + q_pack(i) for i in range(6)
+    )
+    # arrays of other dtypes are sent as lists
+    ((oid, _, send_func),) = conn.make_params((np.array([1, 2], dtype=object),))
+    assert oid == 1005
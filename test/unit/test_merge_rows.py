@@ -0,0 +1,133 @@
+import typing
+from unittest.mock import Mock
+
+import pytest  # type: ignore
+
+from redshift_connector import Cursor, InterfaceError, ProgrammingError
+from redshift_connector.cursor import MergeResult
+from test.utils import pandas_only
+
+
+def merge_cursor(
+    mocker, fail_on: typing.Optional[str] = None, null_keys: int = 0
+) -> typing.Tuple[Cursor, typing.List, typing.List]:
+    """
+    Returns a Cursor whose statements are recorded rather than executed, with the rows staged by executemany, and
+    ``null_keys`` staged rows holding NULL in a key column.
+    """
+    executed: typing.List[str] = []
+    staged: typing.List = []
+
+    def execute(cursor: Cursor, operation: str, args=None, **kwargs) -> Cursor:
+        executed.append(operation)
+        if fail_on is not None and operation.startswith(fail_on):
+            raise ProgrammingError("statement failed")
+        cursor._row_count = 2 if operation.startswith("update") else 3
+        return cursor
+
+    def executemany(cursor: Cursor, operation: str, param_sets, rewrite_inserts: bool = False) -> Cursor:
+        assert rewrite_inserts
+        executed.append(operation)
+        staged.extend(param_sets)
+        return cursor
+
+    mocker.patch(
+        "redshift_connector.Cursor.fetchone",
+        side_effect=lambda: [null_keys if executed[-1].startswith("select count(*)") else 1],
+    )
+    mocker.patch("redshift_connector.Cursor.execute", autospec=True, side_effect=execute)
+    mocker.patch("redshift_connector.Cursor.executemany", autospec=True, side_effect=executemany)
+    cursor: Cursor = Cursor.__new__(Cursor)
+    cursor._c = Mock()
+    cursor._c.autocommit = True
+    cursor.paramstyle = "qmark"
+    return cursor, executed, staged
+
+
+def test_merge_rows_updates_and_inserts_through_staging_table(mocker) -> None:
+    cursor, executed, staged = merge_cursor(mocker)
+
+    result: MergeResult = cursor.merge_rows("public.t", iter([(1, "a", 10), (2, "b", 20)]), ["id"], ["id", "v", "w"])
+
+    assert result == MergeResult(updated=2, inserted=3)
+    assert cursor.rowcount == 5
+    assert staged == [(1, "a", 10), (2, "b", 20)]
+    stage: str = executed[2].split()[3]
+    assert stage.startswith("t_merge_")
+    assert executed[2:] == [
+        "create temp table {} as select id, v, w from public.t limit 0".format(stage),
+        "insert into {} values (%s, %s, %s)".format(stage),
+        "select count(*) from {} where id is null".format(stage),
+        "update public.t set v = {s}.v, w = {s}.w from {s} where t.id = {s}.id".format(s=stage),
+        "insert into public.t (id, v, w) select id, v, w from {s} where not exists "
+        "(select 1 from public.t where t.id = {s}.id)".format(s=stage),
+        "drop table {}".format(stage),
+    ]
+    cursor._c.commit.assert_called_once()
+    assert cursor._c.autocommit is True
+    assert cursor.paramstyle == "qmark"
+
+
+def test_merge_rows_failure_rolls_back(mocker) -> None:
+    cursor, executed, _ = merge_cursor(mocker, fail_on="update")
+
+    with pytest.raises(ProgrammingError):
+        cursor.merge_rows("t", [(1, "a")], ["id"], ["id", "v"])
+
+    cursor._c.rollback.assert_called_once()
+    cursor._c.commit.assert_not_called()
+    assert cursor._c.autocommit is True
+    assert not any(statement.startswith("drop") for statement in executed)
+
+
+def test_merge_rows_leaves_transaction_open_without_autocommit(mocker) -> None:
+    cursor, executed, _ = merge_cursor(mocker)
+    cursor._c.autocommit = False
+
+    # rows holding only key columns are inserted when missing, matching rows are left as they are
+    assert cursor.merge_rows("t", [(1, 2)], ["a", "b"], ["a", "b"]) == MergeResult(updated=0, inserted=3)
+
+    assert not any(statement.startswith("update") for statement in executed)
+    cursor._c.commit.assert_not_called()
+    assert cursor._c.autocommit is False
+
+
+def test_merge_rows_rejects_null_keys(mocker) -> None:
+    cursor, executed, _ = merge_cursor(mocker, null_keys=2)
+
+    with pytest.raises(InterfaceError, match="2 rows passed to merge_rows hold NULL in a key column"):
+        cursor.merge_rows("t", [(1, None, "a"), (None, 2, "b")], ["a", "b"], ["a", "b", "v"])
+
+    stage: str = executed[2].split()[3]
+    assert executed[-1] == "select count(*) from {} where a is null or b is null".format(stage)
+    cursor._c.rollback.assert_called_once()
+    cursor._c.commit.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    "args, match",
+    (
+        (([(1,)], ["id"]), "column_names must be given"),
+        (([(1,)], [], ["id"]), "key_columns"),
+        (([(1, 2)], ["k"], ["id", "v"]), "key_columns"),
+    ),
+)
+def test_merge_rows_validates_arguments(mocker, args, match) -> None:
+    cursor, executed, _ = merge_cursor(mocker)
+
+    with pytest.raises(InterfaceError, match=match):
+        cursor.merge_rows("t", *args)
+
+    assert executed == []
+
+
+@pandas_only
+def test_merge_rows_dataframe_columns_in_given_order(mocker) -> None:
+    import pandas as pd
+
+    mocker.patch("redshift_connector.cursor.encode_dataframe", return_value=None)
+    cursor, _, staged = merge_cursor(mocker)
+
+    cursor.merge_rows("t", pd.DataFrame({"v": ["a", "b"], "id": [1, 2]}), ["id"], ["id", "v"])
+
+    assert staged == [[1, "a"], [2, "b"]]
@@ -0,0 +1,136 @@
+import io
+import typing
+
+import pytest  # type: ignore
+
+from redshift_connector import InterfaceError, ProgrammingError
+from redshift_connector.utils import MessageReader
+from test.unit.mocks.mock_backend import (
+    BIND_COMPLETE,
+    INT4,
+    PORTAL_SUSPENDED,
+    READY_FOR_QUERY,
+    command_complete,
+    error_response,
+    int4_row,
+    message,
+    mock_connection,
+    prepare_response,
+)
+
+
+def chunked_reader(data: bytes, chunk_size: int, buffer_size: int = 64) -> MessageReader:
+    stream: io.BytesIO = io.BytesIO(data)
+    return MessageReader(lambda b: stream.readinto(b[:chunk_size]), buffer_size)
+
+
+def select_response(num_rows: int) -> bytes:
+    return (
+        prepare_response(("c1", INT4))
+        + BIND_COMPLETE
+        + b"".join(int4_row(i) for i in range(num_rows))
+        + command_complete("SELECT {}".format(num_rows).encode())
+        + READY_FOR_QUERY
+    )
+
+
+def test_read_messages_frames_all_buffered_messages() -> None:
+    reader: MessageReader = chunked_reader(
+        int4_row(1) + int4_row(2) + READY_FOR_QUERY, chunk_size=1024, buffer_size=1024
+    )
+
+    assert reader.read_messages() == [(b"D", int4_row(1)[5:]), (b"D", int4_row(2)[5:]), (b"Z", b"I")]
+    assert reader.read_messages() == []
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 7, 64])
+def test_read_messages_carries_partial_message_over(chunk_size) -> None:
+    data: bytes = b"".join(int4_row(i) for i in range(20)) + READY_FOR_QUERY
+    reader: MessageReader = chunked_reader(data, chunk_size)
+
+    messages: typing.List[typing.Tuple[bytes, bytes]] = []
+    while len(messages) == 0 or messages[-1][0] != b"Z":
+        received: typing.List[typing.Tuple[bytes, bytes]] = reader.read_messages()
+        assert len(received) > 0
+        messages.extend(received)
+
+    assert messages == [(b"D", int4_row(i)[5:]) for i in range(20)] + [(b"Z", b"I")]
+
+
+def test_read_messages_grows_buffer_for_large_message() -> None:
+    large: bytes = message(b"D", b"x" * 1000)
+    reader: MessageReader = chunked_reader(large + READY_FOR_QUERY, chunk_size=100, buffer_size=16)
+
+    assert reader.read_messages() == [(b"D", b"x" * 1000)]
+    assert reader.read_messages() == [(b"Z", b"I")]
+
+
+def test_read_messages_stops_after_stop_code() -> None:
+    reader: MessageReader = chunked_reader(READY_FOR_QUERY + int4_row(1), chunk_size=1024)
+
+    assert reader.read_messages(frozenset((b"Z",))) == [(b"Z", b"I")]
+    assert len(reader) == len(int4_row(1))
+    # bytes following the stop code remain available to other reads
+    assert reader.read(5) == int4_row(1)[:5]
+
+
+def test_read_returns_fewer_bytes_once_closed() -> None:
+    reader: MessageReader = chunked_reader(b"abc", chunk_size=2)
+
+    assert reader.read(2) == b"ab"
+    assert reader.read(5) == b"c"
+    assert reader.read(5) == b""
+
+
+def test_chunked_socket_read_execute() -> None:
+    conn, backend = mock_connection(select_response(100) + select_response(3))
+    backend.chunk_size = 13
+    cursor = conn.cursor()
+
+    cursor.execute("select c1 from t", chunked_socket_read=True)
+    assert cursor.fetchall() == tuple([i] for i in range(100))
+    assert cursor.rowcount == 100
+
+    # once used, the reader of the connection also serves reads of other statements
+    cursor.execute("select c1 from t2")
+    assert cursor.fetchall() == ([0], [1], [2])
+    assert backend.remaining() == 0
+
+
+def test_chunked_socket_read_stream_rows() -> None:
+    conn, backend = mock_connection(
+        prepare_response(("c1", INT4))
+        + BIND_COMPLETE
+        + int4_row(1)
+        + int4_row(2)
+        + PORTAL_SUSPENDED
+        + int4_row(3)
+        + command_complete(b"SELECT 3")
+        + READY_FOR_QUERY
+    )
+    cursor = conn.cursor()
+    cursor.execute("select c1 from t", stream_rows=True, fetch_size=2, chunked_socket_read=True)
+
+    assert len(cursor._cached_rows) == 2
+    assert [row[0] for row in cursor] == [1, 2, 3]
+    assert cursor.rowcount == 3
+    assert backend.remaining() == 0
+
+
+def test_chunked_socket_read_error_response() -> None:
+    conn, _ = mock_connection(
+        prepare_response(("c1", INT4)) + BIND_COMPLETE + error_response() + READY_FOR_QUERY + select_response(1)
+    )
+    cursor = conn.cursor()
+
+    with pytest.raises(ProgrammingError, match="syntax error"):
+        cursor.execute("select c1 from t", chunked_socket_read=True)
+    cursor.execute("select c1 from t2", chunked_socket_read=True)
+    assert cursor.fetchall() == ([0],)
+
+
+def test_chunked_socket_read_broken_pipe() -> None:
+    conn, _ = mock_connection(prepare_response(("c1", INT4)) + BIND_COMPLETE + int4_row(1))
+
+    with pytest.raises(InterfaceError, match="BrokenPipe"):
+        conn.cursor().execute("select c1 from t", chunked_socket_read=True)
@@ -0,0 +1,218 @@
+import threading
+import typing
+from unittest.mock import MagicMock
+
+import pytest  # type: ignore
+
+import redshift_connector
+from redshift_connector import InterfaceError
+from redshift_connector.pool import ConnectionPool, PoolStats
+from test.unit.mocks.mock_backend import (
+    BIND_COMPLETE,
+    CLOSE_COMPLETE,
+    INT4,
+    PORTAL_SUSPENDED,
+    READY_FOR_QUERY,
+    int4_row,
+    mock_connection,
+    prepare_response,
+)
+
+
+def fake_connect(mocker) -> typing.List[MagicMock]:
+    """
+    Patches redshift_connector.connect to return a new mock connection per call, which are returned in order.
+    """
+    opened: typing.List[MagicMock] = []
+
+    def connect(**kwargs) -> MagicMock:
+        conn: MagicMock = MagicMock()
+        conn.in_transaction = False
+        conn.kwargs = kwargs
+        opened.append(conn)
+        return conn
+
+    mocker.patch.object(redshift_connector, "connect", side_effect=connect)
+    return opened
+
+
+def test_pool_reuses_returned_connections(mocker) -> None:
+    opened = fake_connect(mocker)
+
+    with ConnectionPool(max_size=2, host="h") as pool:
+        with pool.connection() as first:
+            pass
+        with pool.connection() as second:
+            stats: PoolStats = pool.stats
+            assert (stats.in_use, stats.idle) == (1, 0)
+
+    assert first is second
+    assert len(opened) == 1 and opened[0].kwargs == {"host": "h"}
+    # the idle connection was validated when checked out again, and closed with the pool
+    opened[0].ping.assert_called_once()
+    opened[0].close.assert_called_once()
+    assert (pool.stats.created, pool.stats.closed, pool.stats.checkouts) == (1, 1, 2)
+
+
+def test_pool_min_size_opens_connections(mocker) -> None:
+    opened = fake_connect(mocker)
+
+    pool: ConnectionPool = ConnectionPool(min_size=2, max_size=3)
+
+    assert len(opened) == 2
+    assert pool.stats.idle == 2
+    assert pool.stats.average_creation_seconds >= 0
+
+
+def test_pool_wait_timeout(mocker) -> None:
+    fake_connect(mocker)
+    pool: ConnectionPool = ConnectionPool(max_size=1, wait_timeout=0.05)
+    conn = pool.acquire()
+
+    with pytest.raises(InterfaceError, match="Timed out"):
+        pool.acquire()
+
+    stats: PoolStats = pool.stats
+    assert stats.waits == 1 and stats.max_wait_seconds >= 0.05
+    pool.release(conn)
+
+
+def test_pool_waiting_checkout_gets_returned_connection(mocker) -> None:
+    fake_connect(mocker)
+    pool: ConnectionPool = ConnectionPool(max_size=1)
+    conn = pool.acquire()
+    acquired: typing.List = []
+
+    waiter: threading.Thread = threading.Thread(target=lambda: acquired.append(pool.acquire(timeout=5)))
+    waiter.start()
+    # returns the connection once the other thread waits for it
+    waiting: bool = False
+    while not waiting:
+        with pool._lock:
+            waiting = len(pool._lock._waiters) > 0  # type: ignore
+    pool.release(conn)
+    waiter.join()
+
+    assert acquired == [conn]
+    assert pool.stats.waits == 1
+
+
+def test_pool_release_rolls_back_open_transaction(mocker) -> None:
+    opened = fake_connect(mocker)
+    pool: ConnectionPool = ConnectionPool()
+    conn = pool.acquire()
+    conn.in_transaction = True
+
+    pool.release(conn)
+    opened[0].rollback.assert_called_once()
+    assert pool.stats.idle == 1
+
+    conn = pool.acquire()
+    conn.rollback.side_effect = InterfaceError("broken")
+    pool.release(conn)
+    # a connection failing to roll back is closed rather than reused
+    conn.close.assert_called_once()
+    assert pool.stats.idle == 0
+
+
+def test_pool_release_ends_unfinished_results(mocker) -> None:
+    opened = fake_connect(mocker)
+    pool: ConnectionPool = ConnectionPool()
+    conn = pool.acquire()
+    conn.in_transaction = True
+
+    pool.release(conn)
+    # the suspended portal and background read are ended before the transaction is rolled back
+    assert [name for name, _, _ in opened[0].mock_calls] == ["close_portal", "finish_background_read", "rollback"]
+    assert pool.stats.idle == 1
+
+    conn = pool.acquire()
+    conn.finish_background_read.side_effect = InterfaceError("broken")
+    pool.release(conn)
+    conn.close.assert_called_once()
+    assert pool.stats.idle == 0
+
+
+def test_pool_replaces_connections_failing_validation(mocker) -> None:
+    opened = fake_connect(mocker)
+    pool: ConnectionPool = ConnectionPool()
+    pool.release(pool.acquire())
+    opened[0].ping.side_effect = InterfaceError("connection is closed")
+
+    assert pool.acquire() is opened[1]
+    opened[0].close.assert_called_once()
+
+
+def test_pool_closes_expired_connections(mocker) -> None:
+    opened = fake_connect(mocker)
+    clock: typing.List[float] = [100.0]
+    mocker.patch("redshift_connector.pool.time.monotonic", side_effect=lambda: clock[0])
+    pool: ConnectionPool = ConnectionPool(min_size=1, max_idle_time=10, max_lifetime=60)
+    extra = pool.acquire(), pool.acquire()
+    for conn in extra:
+        pool.release(conn)
+
+    clock[0] += 20
+    # the idle connection beyond min_size is closed
+    pool.release(pool.acquire())
+    assert [conn.close.call_count for conn in opened] == [1, 0]
+
+    clock[0] += 60
+    # connections exceeding their lifetime are closed rather than checked out, regardless of min_size
+    pool.release(pool.acquire())
+    assert [conn.close.call_count for conn in opened] == [1, 1, 0]
+
+    # and closed once returned
+    conn = pool.acquire()
+    clock[0] += 61
+    pool.release(conn)
+    assert [conn.close.call_count for conn in opened] == [1, 1, 1]
+    assert pool.stats.idle == 0
+
+
+def test_pool_closed_rejects_checkout(mocker) -> None:
+    opened = fake_connect(mocker)
+    pool: ConnectionPool = ConnectionPool()
+    conn = pool.acquire()
+    pool.close()
+
+    with pytest.raises(InterfaceError, match="closed"):
+        pool.acquire()
+    pool.release(conn)
+    opened[0].close.assert_called_once()
+    with pytest.raises(InterfaceError, match="not checked out"):
+        pool.release(conn)
+
+
+def test_connection_ping_sends_sync() -> None:
+    conn, backend = mock_connection(READY_FOR_QUERY)
+
+    conn.ping()
+
+    assert [code for code, _ in backend.messages_written()] == [b"S"]
+    assert backend.remaining() == 0
+    conn._sock = None
+    with pytest.raises(InterfaceError, match="closed"):
+        conn.ping()
+
+
+def test_connection_ping_closes_suspended_portal() -> None:
+    conn, backend = mock_connection(
+        prepare_response(("c1", INT4))
+        + BIND_COMPLETE
+        + int4_row(1)
+        + PORTAL_SUSPENDED
+        + CLOSE_COMPLETE
+        + READY_FOR_QUERY
+        + READY_FOR_QUERY
+    )
+    cursor = conn.cursor()
+    cursor.execute("select c1 from t", stream_rows=True, fetch_size=1)
+    num_written: int = len(backend.messages_written())
+
+    conn.ping()
+
+    assert conn._suspended_portal_cursor is None
+    # the portal is closed by its own Sync message before the Sync message of the ping
+    assert [code for code, _ in backend.messages_written()[num_written:]] == [b"C", b"H", b"S", b"S"]
+    assert backend.remaining() == 0
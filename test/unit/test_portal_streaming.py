@@ -0,0 +1,143 @@
+import typing
+from struct import pack
+
+import pytest  # type: ignore
+
+from redshift_connector import InterfaceError, ProgrammingError
+from redshift_connector.config import DEFAULT_FETCH_SIZE
+from test.unit.mocks.mock_backend import (
+    BIND_COMPLETE,
+    CLOSE_COMPLETE,
+    INT4,
+    PORTAL_SUSPENDED,
+    READY_FOR_QUERY,
+    command_complete,
+    error_response,
+    int4_row,
+    mock_connection,
+    prepare_response,
+)
+
+
+def execute_messages(backend) -> typing.List[bytes]:
+    return [data for code, data in backend.messages_written() if code == b"E"]
+
+
+def test_stream_rows_fetches_portal_in_chunks() -> None:
+    conn, backend = mock_connection(
+        prepare_response(("c1", INT4))
+        + BIND_COMPLETE
+        + int4_row(1)
+        + int4_row(2)
+        + PORTAL_SUSPENDED
+        + int4_row(3)
+        + int4_row(4)
+        + PORTAL_SUSPENDED
+        + int4_row(5)
+        + command_complete(b"SELECT 5")
+        + READY_FOR_QUERY
+    )
+    cursor = conn.cursor()
+    cursor.execute("select c1 from t", stream_rows=True, fetch_size=2)
+
+    assert len(cursor._cached_rows) == 2
+    assert cursor.rowcount == -1
+    assert conn._suspended_portal_cursor is cursor
+
+    results: typing.List[int] = []
+    for row in cursor:
+        assert len(cursor._cached_rows) < 2
+        results.append(row[0])
+
+    assert results == [1, 2, 3, 4, 5]
+    assert cursor.rowcount == 5
+    assert conn._suspended_portal_cursor is None
+    assert execute_messages(backend) == [b"\x00" + pack("!i", 2)] * 3
+    assert backend.remaining() == 0
+
+
+def test_stream_rows_default_fetch_size() -> None:
+    conn, backend = mock_connection(
+        prepare_response(("c1", INT4)) + BIND_COMPLETE + int4_row(1) + command_complete(b"SELECT 1") + READY_FOR_QUERY
+    )
+    cursor = conn.cursor()
+    cursor.execute("select c1 from t", stream_rows=True)
+
+    assert cursor.fetchall() == ([1],)
+    assert execute_messages(backend) == [b"\x00" + pack("!i", DEFAULT_FETCH_SIZE)]
+
+
+@pytest.mark.parametrize("fetch_size", [0, -1])
+def test_stream_rows_invalid_fetch_size_raises(fetch_size) -> None:
+    conn, _ = mock_connection()
+    with pytest.raises(InterfaceError, match="fetch_size must be greater than 0"):
+        conn.cursor().execute("select 1", stream_rows=True, fetch_size=fetch_size)
+
+
+def test_execute_closes_suspended_portal() -> None:
+    conn, backend = mock_connection(
+        prepare_response(("c1", INT4))
+        + BIND_COMPLETE
+        + int4_row(1)
+        + int4_row(2)
+        + PORTAL_SUSPENDED
+        + CLOSE_COMPLETE
+        + READY_FOR_QUERY
+        + prepare_response(("c2", INT4))
+        + BIND_COMPLETE
+        + int4_row(10)
+        + command_complete(b"SELECT 1")
+        + READY_FOR_QUERY
+    )
+    streaming_cursor = conn.cursor()
+    streaming_cursor.execute("select c1 from t", stream_rows=True, fetch_size=2)
+
+    other_cursor = conn.cursor()
+    other_cursor.execute("select c2 from t")
+    assert other_cursor.fetchall() == ([10],)
+    assert conn._suspended_portal_cursor is None
+    assert (b"C", b"P\x00") in backend.messages_written()
+
+    # rows received before the portal was closed remain available
+    assert streaming_cursor.fetchone() == [1]
+    assert streaming_cursor.fetchone() == [2]
+    with pytest.raises(InterfaceError, match="closed before all rows were fetched"):
+        streaming_cursor.fetchone()
+
+
+def test_cursor_close_closes_suspended_portal() -> None:
+    conn, backend = mock_connection(
+        prepare_response(("c1", INT4))
+        + BIND_COMPLETE
+        + int4_row(1)
+        + PORTAL_SUSPENDED
+        + CLOSE_COMPLETE
+        + READY_FOR_QUERY
+    )
+    cursor = conn.cursor()
+    cursor.execute("select c1 from t", stream_rows=True, fetch_size=1)
+    cursor.close()
+
+    assert conn._suspended_portal_cursor is None
+    assert backend.messages_written()[-3:] == [(b"C", b"P\x00"), (b"H", b""), (b"S", b"")]
+    assert backend.remaining() == 0
+
+
+def test_stream_rows_error_while_fetching_raises() -> None:
+    conn, backend = mock_connection(
+        prepare_response(("c1", INT4))
+        + BIND_COMPLETE
+        + int4_row(1)
+        + PORTAL_SUSPENDED
+        + error_response(msg="division by zero")
+        + READY_FOR_QUERY
+    )
+    cursor = conn.cursor()
+    cursor.execute("select 1 / c1 from t", stream_rows=True, fetch_size=1)
+
+    assert cursor.fetchone() == [1]
+    with pytest.raises(ProgrammingError, match="division by zero"):
+        cursor.fetchone()
+    assert conn._suspended_portal_cursor is None
+    assert backend.messages_written()[-1] == (b"S", b"")
+    assert backend.remaining() == 0
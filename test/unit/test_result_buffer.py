@@ -0,0 +1,148 @@
+import typing
+from collections import deque
+from datetime import date, datetime
+from decimal import Decimal
+from struct import pack
+
+import pytest  # type: ignore
+
+from redshift_connector import InterfaceError, ResultBufferMode
+from redshift_connector.utils import ColumnarResultBuffer
+from redshift_connector.utils.oids import RedshiftOID
+from test.unit.mocks.mock_backend import (
+    BIND_COMPLETE,
+    INT4,
+    PORTAL_SUSPENDED,
+    READY_FOR_QUERY,
+    command_complete,
+    data_row,
+    int4_row,
+    mock_connection,
+    prepare_response,
+)
+
+COLUMNS: typing.Tuple[typing.Tuple[str, int], ...] = (
+    ("c_int2", RedshiftOID.SMALLINT),
+    ("c_int4", RedshiftOID.INTEGER),
+    ("c_int8", RedshiftOID.BIGINT),
+    ("c_float4", RedshiftOID.REAL),
+    ("c_float8", RedshiftOID.FLOAT),
+    ("c_bool", RedshiftOID.BOOLEAN),
+    ("c_date", RedshiftOID.DATE),
+    ("c_timestamp", RedshiftOID.TIMESTAMP),
+    ("c_varchar", RedshiftOID.VARCHAR),
+    ("c_numeric", RedshiftOID.NUMERIC),
+)
+TYPE_MODIFIERS: typing.List[int] = [-1] * 9 + [(18 << 16) + 2 + 4]
+
+ROW: typing.Tuple[bytes, ...] = (
+    pack("!h", -2),
+    pack("!i", 4),
+    pack("!q", 8),
+    pack("!f", 0.5),
+    pack("!d", 1.25),
+    b"\x01",
+    pack("!i", 7374),
+    pack("!q", 0),
+    b"redshift",
+    pack("!q", 12345),
+)
+EXPECTED_ROW: typing.List = [
+    -2,
+    4,
+    8,
+    0.5,
+    1.25,
+    True,
+    date(2020, 3, 10),
+    datetime(2000, 1, 1),
+    "redshift",
+    Decimal("123.45"),
+]
+
+
+def select_response(*rows: bytes) -> bytes:
+    return (
+        prepare_response(*COLUMNS, type_modifiers=TYPE_MODIFIERS)
+        + BIND_COMPLETE
+        + b"".join(rows)
+        + command_complete("SELECT {}".format(len(rows)).encode())
+        + READY_FOR_QUERY
+    )
+
+
+def test_columnar_buffer_mode_returns_same_rows_as_rows_mode() -> None:
+    rows: typing.Tuple[bytes, ...] = (data_row(*ROW), data_row(*([None] * len(ROW))), data_row(*ROW))
+    conn, _ = mock_connection(
+        select_response(*rows) + BIND_COMPLETE + b"".join(rows) + command_complete(b"SELECT 3") + READY_FOR_QUERY
+    )
+
+    cursor = conn.cursor()
+    cursor.buffer_mode = ResultBufferMode.COLUMNAR.value
+    cursor.execute("select * from t")
+
+    assert isinstance(cursor._cached_rows, ColumnarResultBuffer)
+    assert cursor.rowcount == 3
+    columnar_results = cursor.fetchall()
+    assert columnar_results == (EXPECTED_ROW, [None] * len(ROW), EXPECTED_ROW)
+
+    cursor.buffer_mode = ResultBufferMode.ROWS.value
+    cursor.execute("select * from t")
+    assert isinstance(cursor._cached_rows, deque)
+    assert cursor.fetchall() == columnar_results
+
+
+def test_columnar_buffer_mode_stores_fixed_width_columns_as_bytes() -> None:
+    conn, _ = mock_connection(select_response(data_row(*ROW), data_row(*([None] * len(ROW)))))
+    cursor = conn.cursor()
+    cursor.buffer_mode = ResultBufferMode.COLUMNAR.value
+    cursor.execute("select * from t")
+
+    buffer: ColumnarResultBuffer = typing.cast(ColumnarResultBuffer, cursor._cached_rows)
+    assert buffer._columns[1] == bytearray(pack("!i", 4) + bytes(4))
+    assert buffer._columns[7] == bytearray(pack("!q", 0) + bytes(8))
+    assert buffer._columns[8] == ["redshift", None]
+    assert buffer._nulls[1] == bytearray(b"\x00\x01")
+    assert len(buffer) == 2
+
+    assert cursor.fetchone() == EXPECTED_ROW
+    assert len(buffer) == 1
+
+
+def test_columnar_buffer_mode_with_stream_rows() -> None:
+    conn, _ = mock_connection(
+        prepare_response(("c1", INT4))
+        + BIND_COMPLETE
+        + int4_row(1)
+        + int4_row(2)
+        + PORTAL_SUSPENDED
+        + int4_row(3)
+        + command_complete(b"SELECT 3")
+        + READY_FOR_QUERY
+    )
+    cursor = conn.cursor()
+    cursor.buffer_mode = ResultBufferMode.COLUMNAR.value
+    cursor.execute("select c1 from t", stream_rows=True, fetch_size=2)
+
+    assert cursor.fetchone() == [1]
+    assert cursor.fetchone() == [2]
+    assert cursor.fetchone() == [3]
+    assert len(typing.cast(ColumnarResultBuffer, cursor._cached_rows)._columns[0]) == 4
+    assert cursor.fetchone() is None
+    assert cursor.rowcount == 3
+
+
+def test_connection_run_with_columnar_buffer_mode() -> None:
+    conn, _ = mock_connection(
+        prepare_response(("c1", INT4)) + BIND_COMPLETE + int4_row(1) + command_complete(b"SELECT 1") + READY_FOR_QUERY
+    )
+    conn._run_cursor.buffer_mode = ResultBufferMode.COLUMNAR.value
+    assert conn.run("select c1 from t") == ([1],)
+
+
+def test_invalid_buffer_mode_raises() -> None:
+    conn, _ = mock_connection()
+    cursor = conn.cursor()
+    cursor.buffer_mode = "rowz"
+    with pytest.raises(InterfaceError, match="Invalid buffer_mode rowz"):
+        cursor.execute("select 1")
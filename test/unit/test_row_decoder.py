@@ -0,0 +1,101 @@
+import typing
+from datetime import date
+from decimal import Decimal
+from struct import pack
+
+import pytest  # type: ignore
+
+from redshift_connector.utils import (
+    compile_row_decoder,
+    date_recv_binary,
+    numeric_in_binary,
+    numeric_scale,
+    numeric_to_float_binary,
+    text_recv,
+)
+from redshift_connector.utils.type_utils import (
+    bool_recv,
+    float4_recv,
+    float8_recv,
+    int2_recv,
+    int4_recv,
+    int8_recv,
+    oid_recv,
+    timestamp_recv_integer,
+)
+
+
+def data_row(*values: typing.Optional[bytes]) -> bytes:
+    data: bytes = pack("!h", len(values))
+    for value in values:
+        data += pack("!i", -1) if value is None else pack("!i", len(value)) + value
+    return data
+
+
+def decode(funcs: typing.Sequence[typing.Callable], *values: typing.Optional[bytes], type_modifier: int = -1):
+    row_desc: typing.List[typing.Dict] = [{"type_modifier": type_modifier} for _ in funcs]
+    return compile_row_decoder(row_desc, funcs)(data_row(*values))
+
+
+@pytest.mark.parametrize(
+    "func, value, expected",
+    [
+        (int2_recv, pack("!h", -32768), -32768),
+        (int4_recv, pack("!i", 2147483647), 2147483647),
+        (int8_recv, pack("!q", -9223372036854775808), -9223372036854775808),
+        (oid_recv, pack("!I", 4294967295), 4294967295),
+        (float4_recv, pack("!f", 1.5), 1.5),
+        (float8_recv, pack("!d", 1234567.1234567), 1234567.1234567),
+        (bool_recv, b"\x01", True),
+        (bool_recv, b"\x00", False),
+        (text_recv, "abcd¬µ3kt¿".encode("utf8"), "abcd¬µ3kt¿"),
+        (timestamp_recv_integer, pack("!q", 0), timestamp_recv_integer(pack("!q", 0), 0, 8)),
+    ],
+)
+def test_compile_row_decoder_matches_recv_func(func, value, expected) -> None:
+    assert decode((func,), value) == [expected]
+    assert decode((func,), None) == [None]
+
+
+@pytest.mark.parametrize("days", [0, -1, 7374, -141427, -141428, -1000000, 2921939, 2921940, 100000000])
+def test_compile_row_decoder_date_matches_date_recv_binary(days) -> None:
+    value: bytes = pack("!i", days)
+    assert decode((date_recv_binary,), value) == [date_recv_binary(value, 0, 4)]
+
+
+@pytest.mark.parametrize("type_modifier", [-1, (18 << 16) + 4, (38 << 16) + 10 + 4, (10 << 16) + 4])
+@pytest.mark.parametrize(
+    "value", [pack("!q", 123456789123456789), pack("!q", -1), (-(10**30)).to_bytes(16, "big", signed=True)]
+)
+def test_compile_row_decoder_numeric_matches_recv_func(type_modifier, value) -> None:
+    scale: int = numeric_scale(type_modifier)
+
+    result: Decimal = decode((numeric_in_binary,), value, type_modifier=type_modifier)[0]
+    assert result == numeric_in_binary(value, 0, len(value), scale)
+    assert str(result) == str(numeric_in_binary(value, 0, len(value), scale))
+
+    assert decode((numeric_to_float_binary,), value, type_modifier=type_modifier) == [
+        numeric_to_float_binary(value, 0, len(value), scale)
+    ]
+
+
+def test_compile_row_decoder_malformed_numeric_raises() -> None:
+    with pytest.raises(Exception, match="Malformed column value of type numeric received"):
+        decode((numeric_in_binary,), b"\x00\x01")
+
+
+def test_compile_row_decoder_multiple_columns() -> None:
+    funcs: typing.Tuple[typing.Callable, ...] = (int4_recv, text_recv, float8_recv, text_recv, int8_recv)
+    assert decode(funcs, pack("!i", 1), None, pack("!d", 2.5), b"", pack("!q", 3)) == [1, None, 2.5, "", 3]
+
+
+def test_compile_row_decoder_calls_unknown_recv_func() -> None:
+    def custom_recv(data: bytes, offset: int, length: int) -> typing.Tuple[int, int]:
+        return offset, length
+
+    assert decode((int4_recv, custom_recv), pack("!i", 1), b"abc") == [1, (14, 3)]
+
+
+def test_numeric_scale() -> None:
+    assert numeric_scale(-1) == -4 & 0xFFFF
+    assert numeric_scale((38 << 16) + 10 + 4) == 10
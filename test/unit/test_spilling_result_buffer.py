@@ -0,0 +1,118 @@
+import typing
+
+import pytest  # type: ignore
+
+from redshift_connector import InterfaceError, ResultBufferMode
+from redshift_connector.utils import LazyRow, SpillingResultBuffer
+from test.unit.mocks.mock_backend import (
+    BIND_COMPLETE,
+    INT4,
+    READY_FOR_QUERY,
+    command_complete,
+    int4_row,
+    mock_connection,
+    prepare_response,
+)
+from test.utils import pandas_only
+
+# size of the content of the DataRow message of a single INT4 value
+ROW_SIZE: int = len(int4_row(0)) - 5
+
+
+def select_response(num_rows: int) -> bytes:
+    return (
+        prepare_response(("c1", INT4))
+        + BIND_COMPLETE
+        + b"".join(int4_row(i) for i in range(num_rows))
+        + command_complete("SELECT {}".format(num_rows).encode())
+        + READY_FOR_QUERY
+    )
+
+
+def execute(num_rows: int, memory_limit: int, buffer_mode: str = ResultBufferMode.ROWS.value, **kwargs):
+    conn, backend = mock_connection(select_response(num_rows))
+    cursor = conn.cursor()
+    cursor.buffer_mode = buffer_mode
+    cursor.buffer_memory_limit = memory_limit
+    cursor.execute("select c1 from t", **kwargs)
+    return cursor
+
+
+def test_rows_within_memory_limit_are_not_spilled() -> None:
+    cursor = execute(10, 10 * ROW_SIZE)
+
+    assert isinstance(cursor._cached_rows, SpillingResultBuffer)
+    assert cursor._cached_rows._file is None
+    assert cursor.fetchall() == tuple([i] for i in range(10))
+
+
+@pytest.mark.parametrize("memory_limit", [0, 1, 3 * ROW_SIZE])
+def test_rows_past_memory_limit_are_spilled(memory_limit) -> None:
+    cursor = execute(100, memory_limit)
+    buffer: SpillingResultBuffer = typing.cast(SpillingResultBuffer, cursor._cached_rows)
+
+    assert len(buffer._rows) == memory_limit // ROW_SIZE
+    assert buffer._spilled_rows == 100 - memory_limit // ROW_SIZE
+    assert len(buffer) == 100
+    assert list(buffer) == [[i] for i in range(100)]
+    assert cursor.fetchmany(50) == tuple([i] for i in range(50))
+    assert cursor.fetchall() == tuple([i] for i in range(50, 100))
+    assert buffer._spilled_rows == 0
+
+
+def test_rows_held_in_memory_once_spilled_rows_are_fetched() -> None:
+    conn, _ = mock_connection(select_response(10) + select_response(2))
+    cursor = conn.cursor()
+    cursor.buffer_memory_limit = 2 * ROW_SIZE
+    cursor.execute("select c1 from t")
+    assert len(cursor.fetchall()) == 10
+
+    cursor.execute("select c1 from t2")
+    buffer: SpillingResultBuffer = typing.cast(SpillingResultBuffer, cursor._cached_rows)
+    assert len(buffer._rows) == 2
+    assert buffer._spilled_rows == 0
+    assert cursor.fetchall() == ([0], [1])
+
+
+def test_spilled_rows_lazy_buffer_mode() -> None:
+    cursor = execute(5, ROW_SIZE, ResultBufferMode.LAZY.value)
+
+    rows = cursor.fetchall()
+    assert all(isinstance(row, LazyRow) for row in rows)
+    assert [row[0] for row in rows] == list(range(5))
+
+
+def test_spilled_rows_background_read() -> None:
+    conn, backend = mock_connection(select_response(500))
+    backend.chunk_size = 64
+    cursor = conn.cursor()
+    cursor.buffer_memory_limit = 10 * ROW_SIZE
+    cursor.execute("select c1 from t", background_read=True)
+
+    assert [row[0] for row in cursor] == list(range(500))
+
+
+@pandas_only
+def test_spilled_rows_fetch_dataframe() -> None:
+    df = execute(20, 5 * ROW_SIZE).fetch_dataframe()
+
+    assert df["c1"].tolist() == list(range(20))
+
+
+def test_cursor_close_deletes_spill_file() -> None:
+    cursor = execute(10, 0)
+    file = cursor._cached_rows._file
+    cursor.close()
+
+    assert file.closed
+    assert len(cursor._cached_rows) == 0
+
+
+def test_memory_limit_with_columnar_buffer_mode_raises() -> None:
+    with pytest.raises(InterfaceError, match="not supported"):
+        execute(1, 0, ResultBufferMode.COLUMNAR.value)
+
+
+def test_negative_memory_limit_raises() -> None:
+    with pytest.raises(InterfaceError, match="must not be negative"):
+        execute(1, -1)
@@ -0,0 +1,68 @@
+import typing
+
+import pytest  # type: ignore
+
+from redshift_connector import InterfaceError
+from redshift_connector.config import DbApiParamstyle
+from redshift_connector.utils import InsertTemplate, parse_insert_values
+
+
+@pytest.mark.parametrize(
+    "operation, paramstyle, names",
+    [
+        ("INSERT INTO t (a, b) VALUES (%s, %s)", DbApiParamstyle.FORMAT.value, (None, None)),
+        ("insert into s.t values (?, ?, ?);", DbApiParamstyle.QMARK.value, (None, None, None)),
+        ("insert into t(a,b) values(:1,:2)", DbApiParamstyle.NUMERIC.value, (None, None)),
+        ("insert into t (a, b) values (:a, :b)", DbApiParamstyle.NAMED.value, ("a", "b")),
+        ("insert into t (a, b) values (%(a)s, %(b)s)", DbApiParamstyle.PYFORMAT.value, ("a", "b")),
+        ("insert into t (a, b)\nvalues (%s, %s)\n", DbApiParamstyle.PYFORMAT.value, (None, None)),
+    ],
+)
+def test_parse_insert_values(operation, paramstyle, names) -> None:
+    template: typing.Optional[InsertTemplate] = parse_insert_values(operation, paramstyle)
+
+    assert template is not None
+    assert template.names == names
+
+
+@pytest.mark.parametrize(
+    "operation, paramstyle",
+    [
+        ("insert into t (a, b) values (%s, 1)", DbApiParamstyle.FORMAT.value),
+        ("insert into t (a, b) values (%s, upper(%s))", DbApiParamstyle.FORMAT.value),
+        ("insert into t (a, b) values (%s, %s), (%s, %s)", DbApiParamstyle.FORMAT.value),
+        ("insert into t (a) select %s", DbApiParamstyle.FORMAT.value),
+        ("update t set a = %s", DbApiParamstyle.FORMAT.value),
+        ("insert into t (a, b) values (:2, :1)", DbApiParamstyle.NUMERIC.value),
+        ("insert into t (a, b) values (:a, :a)", DbApiParamstyle.NAMED.value),
+        ("insert into t (a, b) values (%s, %(b)s)", DbApiParamstyle.PYFORMAT.value),
+        ("insert into t (a, b) values (?, ?)", DbApiParamstyle.FORMAT.value),
+    ],
+)
+def test_parse_insert_values_not_rewritable(operation, paramstyle) -> None:
+    assert parse_insert_values(operation, paramstyle) is None
+
+
+@pytest.mark.parametrize(
+    "paramstyle, expected",
+    [
+        (DbApiParamstyle.QMARK.value, "insert into t (a, b) values (?, ?), (?, ?)"),
+        (DbApiParamstyle.NUMERIC.value, "insert into t (a, b) values (:1, :2), (:3, :4)"),
+        (DbApiParamstyle.NAMED.value, "insert into t (a, b) values (:p0, :p1), (:p2, :p3)"),
+        (DbApiParamstyle.FORMAT.value, "insert into t (a, b) values (%s, %s), (%s, %s)"),
+    ],
+)
+def test_insert_template_statement(paramstyle, expected) -> None:
+    template: InsertTemplate = InsertTemplate("insert into t (a, b) values", paramstyle, (None, None))
+
+    assert template.statement(2) == expected
+
+
+def test_insert_template_args() -> None:
+    positional: InsertTemplate = InsertTemplate("insert into t values", DbApiParamstyle.FORMAT.value, (None, None))
+    named: InsertTemplate = InsertTemplate("insert into t values", DbApiParamstyle.NAMED.value, ("a", "b"))
+
+    assert positional.args([(1, 2), [3, 4]]) == [1, 2, 3, 4]
+    assert named.args([{"b": 2, "a": 1}]) == {"p0": 1, "p1": 2}
+    with pytest.raises(InterfaceError, match="holds 1 values"):
+        positional.args([(1,)])
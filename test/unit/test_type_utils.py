@@ -70,6 +70,29 @@ def test_numeric_out(_input) -> None:
     assert type_utils.numeric_out(in_val) == exp_val
 
 
+@pytest.mark.parametrize(
+    "_input",
+    [
+        (date(year=2000, month=1, day=1), b"\x00\x00\x00\x00"),
+        (date(year=1999, month=12, day=31), b"\xff\xff\xff\xff"),
+        (date(year=2020, month=1, day=31), b"\x00\x00\x1c\xa7"),
+    ],
+)
+def test_date_send_integer(_input) -> None:
+    in_val, exp_val = _input
+    assert type_utils.date_send_integer(in_val) == exp_val
+    assert type_utils.date_recv_binary(exp_val, 0, 4) == in_val
+
+
+@pytest.mark.parametrize(
+    "_input",
+    [(time(hour=0, minute=0, second=0), 0), (time(hour=12, minute=34, second=56, microsecond=789), 45296000789)],
+)
+def test_time_send_integer(_input) -> None:
+    in_val, exp_val = _input
+    assert type_utils.time_send_integer(in_val) == exp_val.to_bytes(length=8, byteorder="big")
+
+
 timestamp_send_integer_data: typing.List[typing.Tuple[bytes, datetime]] = [
     (b"00000000", datetime.max),
     (b"12345678", datetime.max),
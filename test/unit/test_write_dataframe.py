@@ -0,0 +1,190 @@
+import typing
+from datetime import datetime, timedelta, timezone
+from struct import unpack_from
+
+import pytest  # type: ignore
+
+from redshift_connector import InterfaceError
+from redshift_connector.utils import encode_dataframe
+from redshift_connector.utils.oids import RedshiftOID
+from redshift_connector.utils.type_utils import (
+    d_pack,
+    interval_send_integer,
+    q_pack,
+    timestamp_send_integer,
+    timestamptz_send_integer,
+)
+from test.unit.mocks.mock_backend import (
+    BIND_COMPLETE,
+    INT4,
+    READY_FOR_QUERY,
+    command_complete,
+    describe_response,
+    error_response,
+    int4_row,
+    mock_connection,
+    prepare_response,
+)
+from test.utils import pandas_only
+
+# response to the query checking the table exists
+TABLE_EXISTS: bytes = (
+    prepare_response(("?column?", INT4)) + BIND_COMPLETE + int4_row(1) + command_complete(b"SELECT 1") + READY_FOR_QUERY
+)
+
+
+def parse_oids(data: bytes) -> typing.List[int]:
+    offset: int = data.index(b"\x00", data.index(b"\x00") + 1) + 1
+    (num_params,) = unpack_from("!h", data, offset)
+    return list(unpack_from("!{}i".format(num_params), data, offset + 2))
+
+
+def bind_values(data: bytes) -> typing.List[typing.Optional[bytes]]:
+    offset: int = data.index(b"\x00", data.index(b"\x00") + 1) + 1
+    (num_fcs,) = unpack_from("!h", data, offset)
+    offset += 2 + 2 * num_fcs
+    (num_params,) = unpack_from("!h", data, offset)
+    offset += 2
+    values: typing.List[typing.Optional[bytes]] = []
+    for _ in range(num_params):
+        (length,) = unpack_from("!i", data, offset)
+        offset += 4
+        if length == -1:
+            values.append(None)
+        else:
+            values.append(data[offset : offset + length])
+            offset += length
+    return values
+
+
+def written(backend, code: bytes) -> typing.List[bytes]:
+    # skips the messages of the query checking the table exists
+    return [data for message_code, data in backend.messages_written() if message_code == code][1:]
+
+
+def inserted(num_rows: int) -> bytes:
+    return BIND_COMPLETE + command_complete("INSERT 0 {}".format(num_rows).encode())
+
+
+@pandas_only
+def test_write_dataframe_encodes_columns_by_dtype() -> None:
+    import numpy as np
+    import pandas as pd
+
+    df = pd.DataFrame(
+        {
+            "c_int8": np.array([1, 2], dtype=np.int8),
+            "c_int64": np.array([1 << 40, -1], dtype=np.int64),
+            "c_nullable": pd.array([7, None], dtype="Int32"),
+            "c_float": [1.5, np.nan],
+            "c_bool": [True, False],
+            "c_timestamp": pd.to_datetime(["2024-01-02 03:04:05.000006", None]),
+            "c_timedelta": pd.to_timedelta(["1 day 2 us", "-3 s"]),
+            "c_str": ["a", None],
+        }
+    )
+    conn, backend = mock_connection(TABLE_EXISTS + describe_response() + inserted(1) * 2 + READY_FOR_QUERY)
+    cursor = conn.cursor()
+    cursor.write_dataframe(df, "t")
+
+    assert cursor.rowcount == 2
+    assert backend.remaining() == 0
+    assert written(backend, b"P")[0].count(b"$") == 8
+    assert parse_oids(written(backend, b"P")[0]) == [
+        RedshiftOID.SMALLINT,
+        RedshiftOID.BIGINT,
+        RedshiftOID.INTEGER,
+        RedshiftOID.FLOAT,
+        RedshiftOID.BOOLEAN,
+        RedshiftOID.TIMESTAMP,
+        RedshiftOID.INTERVAL,
+        RedshiftOID.UNKNOWN,
+    ]
+    first, second = map(bind_values, written(backend, b"B"))
+    assert first == [
+        b"\x00\x01",
+        q_pack(1 << 40),
+        b"\x00\x00\x00\x07",
+        d_pack(1.5),
+        b"\x01",
+        timestamp_send_integer(datetime(2024, 1, 2, 3, 4, 5, 6)),
+        interval_send_integer(timedelta(days=1, microseconds=2)),
+        b"a",
+    ]
+    assert second == [
+        b"\x00\x02",
+        q_pack(-1),
+        None,
+        None,
+        b"\x00",
+        None,
+        interval_send_integer(timedelta(seconds=-3)),
+        None,
+    ]
+
+
+@pandas_only
+def test_write_dataframe_uses_multi_row_statements() -> None:
+    import pandas as pd
+
+    conn, backend = mock_connection(
+        TABLE_EXISTS + describe_response() + inserted(16) + describe_response() + inserted(1) * 4 + READY_FOR_QUERY
+    )
+    cursor = conn.cursor()
+    cursor.write_dataframe(pd.DataFrame({"a": range(20), "b": [float(i) for i in range(20)]}), "t")
+
+    assert cursor.rowcount == 20
+    assert backend.remaining() == 0
+    assert [data.count(b"$") for data in written(backend, b"P")] == [32, 2]
+    # the statements of both sizes run in a single transaction
+    assert [code for code, _ in backend.messages_written()].count(b"S") == 3
+    values: typing.List[typing.Optional[bytes]] = [
+        value for data in written(backend, b"B") for value in bind_values(data)
+    ]
+    assert values == [value for i in range(20) for value in (q_pack(i), d_pack(float(i)))]
+
+
+@pandas_only
+def test_write_dataframe_error_raises_interface_error() -> None:
+    import pandas as pd
+
+    conn, _ = mock_connection(TABLE_EXISTS + describe_response() + BIND_COMPLETE + error_response() + READY_FOR_QUERY)
+
+    with pytest.raises(InterfaceError, match="pandas.DataFrame"):
+        conn.cursor().write_dataframe(pd.DataFrame({"a": [1, 2]}), "t")
+
+
+@pandas_only
+def test_encode_dataframe_fixed_width_rows_share_one_buffer() -> None:
+    import pandas as pd
+
+    conn, _ = mock_connection()
+    rows = encode_dataframe(pd.DataFrame({"a": [1, 2, 3], "b": [True, False, True]}), conn.make_params)
+
+    assert rows is not None
+    assert rows.data is not None and rows.row_width == 4 + 8 + 4 + 1
+    assert rows.bind_values(1, 3) == b"".join(
+        b"\x00\x00\x00\x08" + q_pack(i) + b"\x00\x00\x00\x01" + flag for i, flag in ((2, b"\x00"), (3, b"\x01"))
+    )
+
+
+@pandas_only
+def test_encode_dataframe_timezone_aware_timestamps() -> None:
+    import pandas as pd
+
+    value: datetime = datetime(2024, 6, 1, 12, tzinfo=timezone(timedelta(hours=2)))
+    conn, _ = mock_connection()
+    rows = encode_dataframe(pd.DataFrame({"a": pd.to_datetime([value, value])}), conn.make_params)
+
+    assert rows is not None
+    assert rows.param_types == ((RedshiftOID.TIMESTAMPTZ, 1),)
+    assert rows.bind_values(0, 1) == b"\x00\x00\x00\x08" + timestamptz_send_integer(value)
+
+
+@pandas_only
+def test_encode_dataframe_mixed_object_column_returns_none() -> None:
+    import pandas as pd
+
+    conn, _ = mock_connection()
+
+    assert encode_dataframe(pd.DataFrame({"a": pd.Series(["x", 1], dtype=object)}), conn.make_params) is None
@@ -19,6 +19,17 @@ def is_pandas_installed() -> bool:
         return False
 
 
+def is_pyarrow_installed() -> bool:
+    try:
+        import pyarrow  # type: ignore
+
+        return True
+    except ModuleNotFoundError:
+        return False
+
+
 numpy_only = pytest.mark.skipif(not is_numpy_installed(), reason="requires numpy")
 
 pandas_only = pytest.mark.skipif(not is_pandas_installed(), reason="requires pandas")
+
+pyarrow_only = pytest.mark.skipif(not is_pyarrow_installed(), reason="requires pyarrow")